@@ -10,13 +10,16 @@ into registry state once and then drops them.
 
 from __future__ import annotations
 
-import asyncio
 import logging
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 import aiohttp
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 
 from .comfoclime_api import ComfoClimeAPI
 from .config_flow import CONFIG_ENTRY_VERSION, DEFAULT_OPTIONS, LEGACY_ENTITY_OPTION_KEYS
@@ -29,7 +32,7 @@ from .coordinator import (
     ComfoClimeThermalprofileCoordinator,
 )
 from .entity_helper import get_device_model_type_id
-from .infrastructure import AccessTracker
+from .infrastructure import AccessTracker, PollingScheduler
 from .migration import matches, unique_ids_to_disable
 from .services import async_setup_services
 
@@ -42,9 +45,18 @@ PLATFORMS = ["sensor", "switch", "number", "select", "fan", "climate"]
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+# Learned adaptive rate control values survive restarts in .storage
+RATE_CONTROL_STORAGE_VERSION = 1
+RATE_CONTROL_SAVE_INTERVAL = timedelta(minutes=5)
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _rate_control_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the storage holding the learned rate control state of an entry."""
+    return Store(hass, RATE_CONTROL_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.rate_control")
+
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate a config entry to the current version.
 
@@ -126,29 +138,49 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     read_timeout = int(entry.options.get("read_timeout", 10))
     write_timeout = int(entry.options.get("write_timeout", 30))
     polling_interval = int(entry.options.get("polling_interval", 60))
+    poll_slices = int(entry.options.get("poll_slices", 4))
     cache_ttl = int(entry.options.get("cache_ttl", 30))
+    cache_stale_ttl = entry.options.get("cache_stale_ttl", 60.0)
+    write_through_cache = bool(entry.options.get("write_through_cache", False))
     max_retries = int(entry.options.get("max_retries", 3))
     min_request_interval = entry.options.get("min_request_interval", 0.5)
     inter_sensor_delay = entry.options.get("inter_sensor_delay", 0.3)
+    request_budget = float(entry.options.get("request_budget", 60.0))
     write_cooldown = entry.options.get("write_cooldown", 2.0)
     request_debounce = entry.options.get("request_debounce", 0.3)
+    write_combine_window = entry.options.get("write_combine_window", 0.1)
+    adaptive_rate_limiting = bool(entry.options.get("adaptive_rate_limiting", False))
+    adaptive_min_interval = entry.options.get("adaptive_min_interval", 0.1)
+    adaptive_max_interval = entry.options.get("adaptive_max_interval", 5.0)
 
     _LOGGER.debug(
-        "Configuration loaded: read_timeout=%s, write_timeout=%s, polling_interval=%s, "
-        "cache_ttl=%s, max_retries=%s, min_request_interval=%s, inter_sensor_delay=%s, "
-        "write_cooldown=%s, request_debounce=%s",
+        "Configuration loaded: read_timeout=%s, write_timeout=%s, polling_interval=%s, poll_slices=%s, "
+        "cache_ttl=%s, cache_stale_ttl=%s, write_through_cache=%s, max_retries=%s, min_request_interval=%s, "
+        "inter_sensor_delay=%s, request_budget=%s/min, write_cooldown=%s, request_debounce=%s, "
+        "write_combine_window=%s, adaptive_rate_limiting=%s (%s-%ss)",
         read_timeout,
         write_timeout,
         polling_interval,
+        poll_slices,
         cache_ttl,
+        cache_stale_ttl,
+        write_through_cache,
         max_retries,
         min_request_interval,
         inter_sensor_delay,
+        request_budget,
         write_cooldown,
         request_debounce,
+        write_combine_window,
+        adaptive_rate_limiting,
+        adaptive_min_interval,
+        adaptive_max_interval,
     )
 
-    # Stagger coordinator intervals to reduce sustained API pressure on devices.
+    # Refresh intervals of the shared polling schedule: slowly changing data
+    # is refreshed less often. The scheduler staggers the sources and spreads
+    # their reads over the request budget, so the intervals never align into
+    # a burst.
     dashboard_interval = polling_interval
     thermalprofile_interval = polling_interval
     monitoring_interval = polling_interval
@@ -170,6 +202,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Create access tracker for monitoring API access patterns
     access_tracker = AccessTracker()
 
+    # One polling schedule for all coordinators of this entry
+    scheduler = PollingScheduler(request_budget=request_budget)
+
     # Create API instance with configured timeouts, cache TTL, max retries, and rate limiting
     api = ComfoClimeAPI(
         f"http://{host}",
@@ -177,13 +212,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         read_timeout=read_timeout,
         write_timeout=write_timeout,
         cache_ttl=cache_ttl,
+        cache_stale_ttl=cache_stale_ttl,
         max_retries=max_retries,
         min_request_interval=min_request_interval,
         write_cooldown=write_cooldown,
         request_debounce=request_debounce,
+        write_combine_window=write_combine_window,
+        adaptive_rate_limiting=adaptive_rate_limiting,
+        adaptive_min_interval=adaptive_min_interval,
+        adaptive_max_interval=adaptive_max_interval,
+        write_through=write_through_cache,
     )
     _LOGGER.debug("ComfoClimeAPI instance created with base_url: http://%s", host)
 
+    # Resume adaptive rate control where the previous run left off
+    rate_control_store = None
+    if adaptive_rate_limiting:
+        rate_control_store = _rate_control_store(hass, entry)
+        if stored_state := await rate_control_store.async_load():
+            api.restore_rate_control_state(stored_state)
+
     # Get connected devices before creating coordinators
     try:
         devices_response = await api.async_get_connected_devices()
@@ -200,7 +248,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Create Dashboard-Coordinator
     dashboard_coordinator = ComfoClimeDashboardCoordinator(
-        hass, api, dashboard_interval, access_tracker=access_tracker, config_entry=entry
+        hass, api, dashboard_interval, access_tracker=access_tracker, config_entry=entry, scheduler=scheduler
     )
     _LOGGER.debug(
         "Created ComfoClimeDashboardCoordinator with polling_interval=%s",
@@ -214,6 +262,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         thermalprofile_interval,
         access_tracker=access_tracker,
         config_entry=entry,
+        scheduler=scheduler,
     )
     _LOGGER.debug(
         "Created ComfoClimeThermalprofileCoordinator with polling_interval=%s",
@@ -227,6 +276,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         monitoring_interval,
         access_tracker=access_tracker,
         config_entry=entry,
+        scheduler=scheduler,
     )
     _LOGGER.debug(
         "Created ComfoClimeMonitoringCoordinator with polling_interval=%s",
@@ -241,16 +291,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         definition_interval,
         access_tracker=access_tracker,
         config_entry=entry,
+        scheduler=scheduler,
     )
     _LOGGER.debug(
         "Created ComfoClimeDefinitionCoordinator with polling_interval=%s",
         definition_interval,
     )
 
-    # Parallel initialization of all coordinators for faster startup
-    # NOTE: We run them sequentially with a small stagger to prevent simultaneous
-    # bursts of API requests on the first poll cycle after startup.
-    _LOGGER.debug("Starting staggered first refresh of all coordinators")
+    # First refresh of all coordinators. Their reads are paced by the scheduler,
+    # so running them one after another does not burst the device.
+    _LOGGER.debug("Starting first refresh of all coordinators")
     coordinator_init_pairs = [
         (dashboard_coordinator, "dashboard"),
         (thermalprofile_coordinator, "thermalprofile"),
@@ -263,8 +313,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         except Exception as exc:
             _LOGGER.error("Coordinator %s first refresh failed: %s", name, exc)
             raise ConfigEntryNotReady(f"Failed to initialize {name} coordinator: {exc}") from exc
-        # Small stagger between coordinator starts to desynchronize their poll cycles
-        await asyncio.sleep(1)
 
     _LOGGER.debug("Coordinator first refresh completed successfully")
 
@@ -277,6 +325,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         access_tracker=access_tracker,
         config_entry=entry,
         sensor_delay=inter_sensor_delay,
+        scheduler=scheduler,
+        poll_slices=poll_slices,
     )
     _LOGGER.debug(
         "Created ComfoClimeTelemetryCoordinator with polling_interval=%s, sensor_delay=%s",
@@ -292,6 +342,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         access_tracker=access_tracker,
         config_entry=entry,
         sensor_delay=inter_sensor_delay,
+        scheduler=scheduler,
+        poll_slices=poll_slices,
     )
     _LOGGER.debug(
         "Created ComfoClimePropertyCoordinator with polling_interval=%s, sensor_delay=%s",
@@ -299,6 +351,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         inter_sensor_delay,
     )
 
+    # Entities register their values while the platforms are set up; read
+    # them in one sweep afterwards instead of one refresh per platform
+    tlcoordinator.open_registration_window()
+    propcoordinator.open_registration_window()
+
+    # Re-read static values once the device has restarted
+    monitoring_coordinator.add_reboot_listener(tlcoordinator.reset_poll_periods)
+    monitoring_coordinator.add_reboot_listener(propcoordinator.reset_poll_periods)
+
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
         "coordinator": dashboard_coordinator,
@@ -308,6 +369,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "propcoordinator": propcoordinator,
         "definitioncoordinator": definitioncoordinator,
         "access_tracker": access_tracker,
+        "scheduler": scheduler,
+        "rate_control_store": rate_control_store,
         "devices": devices,
         "main_device": next((d for d in devices if get_device_model_type_id(d) == 20), None),
     }
@@ -315,8 +378,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Register update listener to reload integration when options change
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
+    # Start the shared polling timer; it is cancelled when the entry unloads
+    entry.async_create_background_task(hass, scheduler.run(), f"{DOMAIN} polling {entry.entry_id}")
+
+    if rate_control_store is not None:
+
+        @callback
+        def _async_save_rate_control(_now) -> None:
+            """Schedule a save of the learned rate control state."""
+            rate_control_store.async_delay_save(api.rate_control_state)
+
+        entry.async_on_unload(async_track_time_interval(hass, _async_save_rate_control, RATE_CONTROL_SAVE_INTERVAL))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    async def _async_first_sweep() -> None:
+        """Read everything the platforms registered, paced in the background."""
+        await tlcoordinator.async_close_registration_window()
+        await propcoordinator.async_close_registration_window()
+        _LOGGER.info("First full data after %s device requests", api.device_requests)
+
+    entry.async_create_background_task(hass, _async_first_sweep(), f"{DOMAIN} first sweep {entry.entry_id}")
+
     return True
 
 
@@ -335,6 +418,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Close the API session
     if unload_ok and DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
         api = hass.data[DOMAIN][entry.entry_id].get("api")
+        rate_control_store = hass.data[DOMAIN][entry.entry_id].get("rate_control_store")
+        if api and rate_control_store is not None:
+            await rate_control_store.async_save(api.rate_control_state())
         if api:
             await api.close()
 
@@ -342,6 +428,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the learned rate control state when the entry is deleted."""
+    await _rate_control_store(hass, entry).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload the entry after its options changed."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -54,6 +54,8 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -66,7 +68,8 @@ if TYPE_CHECKING:
 from . import DOMAIN
 from .constants import FanSpeed, ScenarioMode, Season, TemperatureProfile
 from .entity_base import ComfoClimeBaseEntity
-from .models import DashboardUpdate, DeviceConfig
+from .infrastructure import DEBOUNCED
+from .models import DashboardUpdate, DashboardUpdateResponse, DeviceConfig
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -163,6 +166,7 @@ async def async_setup_entry(
         api,
         main_device,
         config_entry,
+        optimistic=bool(config_entry.options.get("optimistic_climate", True)),
     )
 
     async_add_entities([climate_entity])
@@ -202,6 +206,7 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
         api: ComfoClimeAPI,
         device: DeviceConfig,
         entry: ConfigEntry,
+        optimistic: bool = True,
     ) -> None:
         """Initialize the ComfoClime climate entity.
 
@@ -211,12 +216,16 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
             api: ComfoClime API instance
             device: Device info dictionary
             entry: Config entry for this integration
+            optimistic: Show the requested state before the write is confirmed
         """
         super().__init__(dashboard_coordinator)
         self._api = api
         self._thermalprofile_coordinator = thermalprofile_coordinator
         self._device = device
         self._entry = entry
+        self._optimistic = optimistic
+        # Data before the first pending write per debounce target: {target: {coordinator: data}}
+        self._write_rollback: dict[str, dict[Any, Any]] = {}
 
         # Entity attributes
         self._attr_unique_id = f"{entry.entry_id}_climate"
@@ -430,32 +439,85 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
                 return Season(season)
         return Season.TRANSITIONAL
 
-    async def _async_refresh_coordinators(self, blocking: bool = True) -> None:
-        """Refresh both dashboard and thermal profile coordinators.
+    async def _async_write_optimistic(
+        self,
+        target: str,
+        write: Callable[[], Awaitable[Any]],
+        dashboard: dict[str, Any] | None = None,
+        thermal_profile: dict[str, Any] | None = None,
+    ) -> None:
+        """Show the expected state right away, send the write and confirm it in the background.
+
+        The expected dashboard and thermal profile values (Python field names,
+        nested models as dicts) are applied to the coordinators' data before
+        the write is sent and rolled back if it fails, to the data before the
+        first write to the same target still pending. The service call only
+        waits for the write; the confirmation read runs afterwards. Without
+        optimistic mode nothing is applied up front and the service call
+        also waits for the confirmation read. The dashboard is not read
+        again if the write's response already reports the written fields.
+        Writes to the same target are debounced: a write
+        replaced by a later one is neither sent nor confirmed.
+        """
+        expected = [
+            (coordinator, update)
+            for coordinator, update in (
+                (self.coordinator, dashboard),
+                (self._thermalprofile_coordinator, thermal_profile),
+            )
+            if update
+        ]
+        # A debounced write is never sent, so the writes replacing it roll back to
+        # the data before it rather than to its optimistic state
+        rollback: dict[Any, Any] = {}
+        if self._optimistic:
+            rollback = self._write_rollback.setdefault(target, {})
+            for coordinator, update in expected:
+                previous = coordinator.async_apply_optimistic(update)
+                rollback.setdefault(coordinator, previous)
+        try:
+            result = await self._api.async_debounced_write(target, write)
+        except BaseException:
+            self._release_rollback(target, rollback)
+            for coordinator, data in rollback.items():
+                coordinator.async_restore_data(data)
+            raise
+        if result is DEBOUNCED:
+            return
+        self._release_rollback(target, rollback)
+        refresh_dashboard = True
+        if isinstance(result, DashboardUpdateResponse):
+            refresh_dashboard = not self.coordinator.async_apply_update_response(result, dashboard or {})
+        confirmation = self._async_confirm_write(expected, refresh_dashboard)
+        if self._optimistic:
+            self.hass.async_create_task(confirmation)
+        else:
+            await confirmation
+
+    def _release_rollback(self, target: str, rollback: dict[Any, Any]) -> None:
+        """Forget the rollback data of a target once its last pending write was sent."""
+        if self._write_rollback.get(target) is rollback:
+            del self._write_rollback[target]
 
-        Args:
-            blocking: If True (default), waits for coordinators to complete refresh.
-                     If False, schedules non-blocking refresh in background.
-
-        When blocking=True (default for "set then fetch" pattern):
-        - Waits for both coordinators to complete refresh
-        - Ensures UI shows actual device state after setting values
-        - Prevents stale state display
-
-        When blocking=False:
-        - Schedules non-blocking refresh for both coordinators
-        - Prevents UI from becoming unresponsive
-        - Updates happen in background
+    async def _async_confirm_write(
+        self,
+        expected: list[tuple[Any, dict[str, Any]]],
+        refresh_dashboard: bool = True,
+    ) -> None:
+        """Read the written state back and log values the device did not take over.
+
+        The refreshed data replaces the optimistic state, so a value the
+        device did not apply is rolled back to what it reports.
         """
-        if blocking:
-            # Blocking mode: Wait for both coordinators to complete
-            # This ensures "set then fetch" behavior - UI reflects actual device state
+        if refresh_dashboard:
             await self._safe_refresh(self.coordinator, "dashboard")
-            await self._safe_refresh(self._thermalprofile_coordinator, "thermal_profile")
-        else:
-            # Non-blocking mode: Schedule refresh as background tasks
-            self.hass.async_create_task(self._safe_refresh(self.coordinator, "dashboard"))
-            self.hass.async_create_task(self._safe_refresh(self._thermalprofile_coordinator, "thermal_profile"))
+        await self._safe_refresh(self._thermalprofile_coordinator, "thermal_profile")
+        for coordinator, update in expected:
+            if not coordinator.last_update_success:
+                # Not confirmed; the next poll reconciles it
+                continue
+            for field, (wanted, actual) in coordinator.mismatches(update).items():
+                _LOGGER.warning("Device did not confirm %s=%s, it reports %s", field, wanted, actual)
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature via dashboard API in manual mode.
@@ -474,14 +536,16 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
             # Setting setPointTemperature should explicitly switch to manual mode (status=0)
             # and replaces seasonProfile/temperatureProfile. We send status=0 to ensure
             # the device leaves automatic preset control when user changes temperature.
-            await self.async_update_dashboard(
-                set_point_temperature=temperature,
-                status=0,
+            await self._async_write_optimistic(
+                "dashboard:set_point_temperature",
+                lambda: self.async_update_dashboard(
+                    set_point_temperature=temperature,
+                    status=0,
+                ),
+                dashboard={"set_point_temperature": temperature, "status": 0},
+                thermal_profile={"temperature": {"manual_temperature": temperature}},
             )
 
-            # Wait for coordinators to refresh (blocking) to ensure UI shows actual device state
-            await self._async_refresh_coordinators(blocking=True)
-
         except TimeoutError, asyncio.CancelledError:
             _LOGGER.exception(
                 "Timeout setting temperature to %s°C. "
@@ -494,7 +558,7 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
         except ValueError, KeyError, TypeError:
             _LOGGER.exception("Invalid data while setting temperature to %s°C", temperature)
 
-    async def async_update_dashboard(self, **kwargs: Any) -> None:
+    async def async_update_dashboard(self, **kwargs: Any) -> DashboardUpdateResponse:
         """Update dashboard settings via API.
 
         Wrapper method that delegates to the API's async_update_dashboard method.
@@ -514,6 +578,9 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
                      - scenario: int
                      - scenario_time_left: int
                      - scenario_start_delay: int
+
+        Returns:
+            The API's response, possibly reporting the new dashboard state.
         """
         # Map hpStandby to hp_standby for backward compatibility
         if "hpStandby" in kwargs:
@@ -521,7 +588,7 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
 
         # Create DashboardUpdate from kwargs
         update = DashboardUpdate(**kwargs)
-        await self._api.async_update_dashboard(update)
+        return await self._api.async_update_dashboard(update)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new HVAC mode by updating season via thermal profile API.
@@ -543,7 +610,11 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
             # OFF mode: Set hpStandby=True via dashboard to turn off the device
             if hvac_mode == HVACMode.OFF:
                 _LOGGER.debug("Setting HVAC mode to OFF - setting hpStandby=True")
-                await self.async_update_dashboard(hpStandby=True)
+                await self._async_write_optimistic(
+                    "dashboard:hvac_mode",
+                    lambda: self.async_update_dashboard(hpStandby=True),
+                    dashboard={"hp_standby": True},
+                )
             else:
                 # Active modes: Use atomic operation to set both season and hpStandby
                 # This prevents race conditions between thermal profile and dashboard updates
@@ -552,10 +623,12 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
                     hvac_mode,
                     season_value,
                 )
-                await self._api.async_set_hvac_season(season=season_value, hpStandby=False)
-
-            # Wait for coordinators to refresh (blocking) to ensure UI shows actual device state
-            await self._async_refresh_coordinators(blocking=True)
+                await self._async_write_optimistic(
+                    "dashboard:hvac_mode",
+                    lambda: self._api.async_set_hvac_season(season=season_value, hpStandby=False),
+                    dashboard={"season": season_value, "hp_standby": False},
+                    thermal_profile={"season": {"season": season_value}},
+                )
 
         except TimeoutError, asyncio.CancelledError:
             _LOGGER.exception(
@@ -583,10 +656,9 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
                 _LOGGER.debug("Switching to manual temperature control mode - user needs to set temperature manually")
                 # Set status=0 to activate manual mode
                 # setPointTemperature should be set separately via async_set_temperature
-                await self.async_update_dashboard(status=0)
-
-                # Wait for coordinators to refresh (blocking) to ensure UI shows actual device state
-                await self._async_refresh_coordinators(blocking=True)
+                await self._async_write_optimistic(
+                    "dashboard:preset_mode", lambda: self.async_update_dashboard(status=0), dashboard={"status": 0}
+                )
                 return
 
             # Check if this is a scenario mode
@@ -611,15 +683,21 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
             # Set both temperatureProfile and seasonProfile to the preset value
             # and activate automatic mode (status=1)
             # This replaces setPointTemperature with preset-based control
-            await self.async_update_dashboard(
-                temperature_profile=profile_value,
-                season_profile=profile_value,
-                status=1,
+            await self._async_write_optimistic(
+                "dashboard:preset_mode",
+                lambda: self.async_update_dashboard(
+                    temperature_profile=profile_value,
+                    season_profile=profile_value,
+                    status=1,
+                ),
+                dashboard={
+                    "temperature_profile": profile_value,
+                    "season_profile": profile_value,
+                    "status": 1,
+                    "set_point_temperature": None,
+                },
             )
 
-            # Wait for coordinators to refresh (blocking) to ensure UI shows actual device state
-            await self._async_refresh_coordinators(blocking=True)
-
         except TimeoutError, asyncio.CancelledError:
             _LOGGER.exception(
                 "Timeout setting preset mode to %s. This may indicate network connectivity issues with the device.",
@@ -648,10 +726,11 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
             fan_speed = FAN_MODE_REVERSE_MAPPING[fan_mode]
 
             # Update fan speed via dashboard API
-            await self.async_update_dashboard(fan_speed=fan_speed)
-
-            # Wait for coordinators to refresh (blocking) to ensure UI shows actual device state
-            await self._async_refresh_coordinators(blocking=True)
+            await self._async_write_optimistic(
+                "dashboard:fan_speed",
+                lambda: self.async_update_dashboard(fan_speed=fan_speed),
+                dashboard={"fan_speed": fan_speed},
+            )
 
         except TimeoutError, asyncio.CancelledError:
             _LOGGER.exception(
@@ -735,16 +814,19 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
                 scenario_start_delay,
             )
 
-            # Update scenario via dashboard API
-            await self.async_update_dashboard(
-                scenario=scenario_value,
-                scenario_time_left=scenario_time_left,
-                scenario_start_delay=scenario_start_delay,
+            # Update scenario via dashboard API; the time left counts down and a
+            # delayed scenario is not active yet, so only an immediately started
+            # scenario itself is expected to be confirmed
+            await self._async_write_optimistic(
+                "dashboard:scenario",
+                lambda: self.async_update_dashboard(
+                    scenario=scenario_value,
+                    scenario_time_left=scenario_time_left,
+                    scenario_start_delay=scenario_start_delay,
+                ),
+                dashboard={"scenario": scenario_value} if scenario_start_delay is None else None,
             )
 
-            # Wait for coordinators to refresh (blocking) to ensure UI shows actual device state
-            await self._async_refresh_coordinators(blocking=True)
-
         except TimeoutError, aiohttp.ClientError, ValueError, KeyError, TypeError:
             _LOGGER.exception("Failed to set scenario mode %s", scenario_mode)
             raise
@@ -800,10 +882,11 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
         """
         try:
             _LOGGER.debug("Turning off climate device - setting hpStandby=True")
-            await self.async_update_dashboard(hpStandby=True)
-
-            # Wait for coordinators to refresh (blocking) to ensure UI shows actual device state
-            await self._async_refresh_coordinators(blocking=True)
+            await self._async_write_optimistic(
+                "dashboard:hvac_mode",
+                lambda: self.async_update_dashboard(hpStandby=True),
+                dashboard={"hp_standby": True},
+            )
 
         except TimeoutError, asyncio.CancelledError:
             _LOGGER.exception(
@@ -822,10 +905,11 @@ class ComfoClimeClimate(ComfoClimeBaseEntity, CoordinatorEntity, ClimateEntity):
         """
         try:
             _LOGGER.debug("Turning on climate device - setting hpStandby=False")
-            await self.async_update_dashboard(hpStandby=False)
-
-            # Wait for coordinators to refresh (blocking) to ensure UI shows actual device state
-            await self._async_refresh_coordinators(blocking=True)
+            await self._async_write_optimistic(
+                "dashboard:hvac_mode",
+                lambda: self.async_update_dashboard(hpStandby=False),
+                dashboard={"hp_standby": False},
+            )
 
         except TimeoutError, asyncio.CancelledError:
             _LOGGER.exception(
@@ -35,10 +35,12 @@ from typing import TYPE_CHECKING, Any
 import aiohttp
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from homeassistant.core import HomeAssistant
 
 from .constants import API_DEFAULTS
-from .infrastructure import RateLimiterCache, api_get, api_put
+from .infrastructure import RateLimiterCache, RequestScheduler, api_get, api_put, current_request_priority
 from .models import (
     ConnectedDevicesResponse,
     DashboardData,
@@ -58,6 +60,10 @@ from .models import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Dashboard fields that act when written even if the device reports the same value
+# (re-sending a scenario restarts its timer)
+_ALWAYS_WRITTEN_DASHBOARD_FIELDS = frozenset({"scenario", "scenario_time_left", "scenario_start_delay"})
+
 
 class ComfoClimeAPI:
     """Async client for ComfoClime device API.
@@ -75,7 +81,10 @@ class ComfoClimeAPI:
         uuid: Device UUID (fetched automatically)
         read_timeout: Timeout for read operations in seconds
         write_timeout: Timeout for write operations in seconds
+        write_deadline: Overall time budget for a write including retries in seconds
         max_retries: Maximum number of retries for failed requests
+        write_through: Whether written property values are stored in the cache
+        suppressed_writes: Writes skipped because the device already had the values
     """
 
     def __init__(
@@ -85,10 +94,17 @@ class ComfoClimeAPI:
         read_timeout: int = API_DEFAULTS.READ_TIMEOUT,
         write_timeout: int = API_DEFAULTS.WRITE_TIMEOUT,
         cache_ttl: int = int(API_DEFAULTS.CACHE_TTL),
+        cache_stale_ttl: float = API_DEFAULTS.CACHE_STALE_TTL,
         max_retries: int = API_DEFAULTS.MAX_RETRIES,
         min_request_interval: float = API_DEFAULTS.MIN_REQUEST_INTERVAL,
         write_cooldown: float = API_DEFAULTS.WRITE_COOLDOWN,
         request_debounce: float = API_DEFAULTS.REQUEST_DEBOUNCE,
+        write_combine_window: float = API_DEFAULTS.WRITE_COMBINE_WINDOW,
+        write_deadline: float = API_DEFAULTS.WRITE_DEADLINE,
+        adaptive_rate_limiting: bool = API_DEFAULTS.ADAPTIVE_RATE_LIMITING,
+        adaptive_min_interval: float = API_DEFAULTS.ADAPTIVE_MIN_INTERVAL,
+        adaptive_max_interval: float = API_DEFAULTS.ADAPTIVE_MAX_INTERVAL,
+        write_through: bool = API_DEFAULTS.WRITE_THROUGH_CACHE,
     ) -> None:
         """Initialize ComfoClime API client.
 
@@ -98,15 +114,25 @@ class ComfoClimeAPI:
             read_timeout: Timeout for read operations (GET) in seconds
             write_timeout: Timeout for write operations (PUT) in seconds
             cache_ttl: Cache time-to-live in seconds for telemetry/property reads
+            cache_stale_ttl: Seconds after expiry during which cached values are
+                served while being refreshed in the background
             max_retries: Maximum number of retries for transient failures
             min_request_interval: Minimum interval between requests in seconds
             write_cooldown: Cooldown period after write operations in seconds
             request_debounce: Debounce time for rapid requests in seconds
+            write_combine_window: Seconds concurrent writes to one endpoint are
+                collected into one request
+            write_deadline: Overall time budget for a write including retries in seconds
+            adaptive_rate_limiting: Learn the request interval from device latency and errors
+            adaptive_min_interval: Lower bound for the learned request interval in seconds
+            adaptive_max_interval: Upper bound for the learned request interval in seconds
+            write_through: Store written property values in the cache (unconfirmed
+                until read back) instead of invalidating the device's cache
         """
         self.base_url = base_url.rstrip("/")
         self.hass = hass
         self.uuid = None
-        self._request_lock = asyncio.Lock()
+        self._scheduler = RequestScheduler()
         self._session = None
 
         # Initialize rate limiter and cache manager
@@ -114,13 +140,29 @@ class ComfoClimeAPI:
             min_request_interval=min_request_interval,
             write_cooldown=write_cooldown,
             request_debounce=request_debounce,
+            write_combine_window=write_combine_window,
             cache_ttl=cache_ttl,
+            cache_stale_ttl=cache_stale_ttl,
+            adaptive=adaptive_rate_limiting,
+            adaptive_min_interval=adaptive_min_interval,
+            adaptive_max_interval=adaptive_max_interval,
         )
 
         # Configurable timeouts and max retries
         self.read_timeout = read_timeout
         self.write_timeout = write_timeout
+        self.write_deadline = write_deadline
         self.max_retries = max_retries
+        self.write_through = write_through
+
+        # Last device-reported state, by DashboardUpdate / ThermalProfileUpdate
+        # field name with the time it was reported, for skipping writes that
+        # would not change anything. Written fields are unknown until the
+        # device reports them again, and reports older than the cache TTL
+        # are not trusted (the device panel may have changed them).
+        self._known_dashboard: dict[str, tuple[Any, float]] = {}
+        self._known_thermal_profile: dict[str, tuple[Any, float]] = {}
+        self.suppressed_writes: int = 0
 
     # -------------------------------------------------------------------------
     # Rate limiting delegation (used by decorators)
@@ -138,6 +180,46 @@ class ComfoClimeAPI:
         """
         await self._rate_limiter.wait_for_rate_limit(is_write=is_write)
 
+    def scale_delay(self, delay: float) -> float:
+        """Scale a configured delay by the adaptively learned request rate.
+
+        Args:
+            delay: Configured delay in seconds (e.g. the inter-sensor delay)
+
+        Returns:
+            The delay scaled like the request interval (unchanged unless adaptive)
+        """
+        return delay * self._rate_limiter.delay_scale
+
+    @property
+    def device_requests(self) -> int:
+        """Number of HTTP requests sent to the device so far."""
+        return self._rate_limiter.device_requests
+
+    def is_property_unconfirmed(self, device_uuid: str, property_path: str) -> bool:
+        """Return whether a written property value has not been read back yet."""
+        return self._rate_limiter.is_property_unconfirmed(device_uuid, property_path)
+
+    async def async_debounced_write(self, target: str, write: Callable[[], Awaitable[Any]]) -> Any:
+        """Send a write unless a later write to the same target follows within the debounce window.
+
+        Args:
+            target: Identifier of the written field (e.g. "dashboard:fan_speed")
+            write: Callable returning the write coroutine
+
+        Returns:
+            Result of the write, or DEBOUNCED if a later write replaced it
+        """
+        return await self._rate_limiter.debounced_request(target, write)
+
+    def rate_control_state(self) -> dict[str, float | None]:
+        """Return learned request interval, write cooldown, latency and error rate."""
+        return self._rate_limiter.rate_control_state()
+
+    def restore_rate_control_state(self, state: dict[str, Any]) -> None:
+        """Restore rate control values saved by rate_control_state."""
+        self._rate_limiter.restore_rate_control_state(state)
+
     # -------------------------------------------------------------------------
     # Session management
     # -------------------------------------------------------------------------
@@ -180,6 +262,7 @@ class ComfoClimeAPI:
             ... finally:
             ...     await api.close()
         """
+        self._rate_limiter.cancel_refreshes()
         if self._session and not self._session.closed:
             await self._session.close()
 
@@ -188,7 +271,7 @@ class ComfoClimeAPI:
         """Internal method to get device UUID from monitoring endpoint.
 
         Uses skip_lock=True because it's called from within other api_get
-        decorated methods where the lock is already held.
+        decorated methods where the request slot is already held.
 
         Args:
             response_data: JSON response from /monitoring/ping endpoint
@@ -204,7 +287,7 @@ class ComfoClimeAPI:
         return self.uuid
 
     async def async_get_uuid(self) -> str | None:
-        """Get device UUID with lock protection.
+        """Get device UUID through the request scheduler.
 
         Public method to fetch the system UUID from the device.
         The UUID is cached after the first call.
@@ -220,7 +303,7 @@ class ComfoClimeAPI:
             >>> uuid = await api.async_get_uuid()
             >>> print(f"Device UUID: {uuid}")
         """
-        async with self._request_lock:
+        async with self._scheduler.slot(current_request_priority()):
             return await self._async_get_uuid_internal()
 
     @api_get("/monitoring/ping")
@@ -250,7 +333,7 @@ class ComfoClimeAPI:
             >>> print(f"Device has been running for {hours:.1f} hours")
 
         Note:
-            The @api_get decorator handles request locking, rate limiting,
+            The @api_get decorator handles request scheduling, rate limiting,
             and session management automatically.
         """
         # Parse the raw dict into a validated MonitoringPing model
@@ -289,10 +372,17 @@ class ComfoClimeAPI:
             ...     print(f"Heating mode: {data['indoorTemperature']}°C")
 
         Note:
-            The @api_get decorator handles request locking, rate limiting,
+            The @api_get decorator handles request scheduling, rate limiting,
             UUID retrieval, session management, and temperature value fixing.
         """
-        return DashboardData(**response_data)
+        data = DashboardData(**response_data)
+        read_at = self._rate_limiter.timestamp()
+        self._known_dashboard = {
+            field: (value, read_at)
+            for field, value in data.model_dump(exclude_unset=True).items()
+            if field in DashboardUpdate.model_fields
+        }
+        return data
 
     @api_get(
         "/system/{uuid}/devices",
@@ -338,7 +428,7 @@ class ComfoClimeAPI:
             DeviceDefinitionData model containing device definition data
 
         The @api_get decorator handles:
-        - Request locking
+        - Request scheduling
         - Rate limiting
         - Session management
         """
@@ -349,7 +439,7 @@ class ComfoClimeAPI:
         """Read raw telemetry data from device.
 
         The @api_get decorator handles:
-        - Request locking
+        - Request scheduling
         - Rate limiting
         - Session management
         - Error handling (returns None on error)
@@ -378,8 +468,11 @@ class ComfoClimeAPI:
         """Read telemetry data for a device with automatic caching.
 
         Fetches telemetry data from a specific device sensor. Results are
-        cached for CACHE_TTL seconds to reduce API load. Supports scaling
-        and signed/unsigned interpretation.
+        cached for CACHE_TTL seconds to reduce API load; for CACHE_STALE_TTL
+        seconds after that the cached value is still returned immediately
+        while it is refreshed in the background. Supports scaling and
+        signed/unsigned interpretation. The cache holds the raw bytes, so
+        readers with different scaling share one device read.
 
         Args:
             device_uuid: UUID of the device
@@ -408,39 +501,55 @@ class ComfoClimeAPI:
             >>> if reading:
             ...     print(f"Temperature: {reading.scaled_value}°C")
         """
-        # Try to get from cache first
-        cache_key = RateLimiterCache.get_cache_key(device_uuid, telemetry_id)
-        cached_value = self._rate_limiter.get_telemetry_from_cache(cache_key)
-        cached_reading = TelemetryReading.from_cached_value(
+        data = await self.async_read_raw_telemetry_for_device(device_uuid, telemetry_id)
+        return TelemetryReading.from_cached_value(
             device_uuid=device_uuid,
             telemetry_id=str(telemetry_id),
-            cached_value=cached_value,
+            cached_value=data,
             faktor=faktor,
             signed=signed,
             byte_count=byte_count,
         )
-        if cached_reading is not None:
-            return cached_reading
 
-        # Not in cache, fetch from API using decorator
-        data = await self._read_telemetry_raw(device_uuid, telemetry_id)
+    async def async_read_raw_telemetry_for_device(self, device_uuid: str, telemetry_id: str) -> bytes | None:
+        """Read the raw bytes of a telemetry value with automatic caching.
 
-        reading = TelemetryReading.from_raw_bytes(
-            device_uuid=device_uuid,
-            telemetry_id=str(telemetry_id),
-            data=data or [],
-            faktor=faktor,
-            signed=signed,
-            byte_count=byte_count,
-        )
+        Caching and the stale window work as in async_read_telemetry_for_device.
+        Callers decoding the same telemetry ID with different parameters use
+        this to read it once and decode it themselves.
 
-        if reading is None:
-            return None
+        Args:
+            device_uuid: UUID of the device
+            telemetry_id: Telemetry sensor ID to read
 
-        # Store scaled value in cache
-        self._rate_limiter.set_telemetry_cache(cache_key, reading.scaled_value)
+        Returns:
+            Raw bytes as returned by the device, or None if the read failed.
+        """
+        # Try to get from cache first; a stale value is served while it is refreshed
+        cached = self._rate_limiter.lookup_telemetry(device_uuid, telemetry_id)
+        if cached is not None:
+            data, stale = cached
+            if stale:
+                self._rate_limiter.schedule_refresh(
+                    device_uuid,
+                    telemetry_id,
+                    lambda: self._fetch_raw_telemetry(device_uuid, telemetry_id),
+                )
+            return data
+
+        # Not in cache, fetch from API
+        return await self._fetch_raw_telemetry(device_uuid, telemetry_id)
+
+    async def _fetch_raw_telemetry(self, device_uuid: str, telemetry_id: str) -> bytes | None:
+        """Read telemetry bytes from the device and store them in the cache."""
+        data = await self._read_telemetry_raw(device_uuid, telemetry_id)
+        if not data:
+            return None
 
-        return reading
+        # Store the raw bytes so any scaling can be decoded from the cache
+        raw = bytes(data)
+        self._rate_limiter.set_telemetry_cache(device_uuid, telemetry_id, raw)
+        return raw
 
     async def async_read_property_for_device(
         self,
@@ -453,8 +562,11 @@ class ComfoClimeAPI:
         """Read property data for a device with automatic caching.
 
         Fetches property data from a device. Results are cached for CACHE_TTL
-        seconds to reduce API load. Supports numeric properties (1-2 bytes)
-        and string properties (3+ bytes).
+        seconds to reduce API load; for CACHE_STALE_TTL seconds after that the
+        cached value is still returned immediately while it is refreshed in
+        the background. Supports numeric properties (1-2 bytes) and string
+        properties (3+ bytes). Numeric properties are cached as raw bytes and
+        decoded with the caller's scaling; strings are cached decoded.
 
         Args:
             device_uuid: UUID of the device
@@ -483,43 +595,83 @@ class ComfoClimeAPI:
             >>> if reading:
             ...     print(f"Value: {reading.scaled_value}")
         """
-        # Try to get from cache first
-        cache_key = RateLimiterCache.get_cache_key(device_uuid, property_path)
-        cached_value = self._rate_limiter.get_property_from_cache(cache_key)
-        cached_reading = PropertyReading.from_cached_value(
+        value = await self.async_read_raw_property_for_device(device_uuid, property_path, byte_count)
+        return PropertyReading.from_cached_value(
             device_uuid=device_uuid,
             path=property_path,
-            cached_value=cached_value,
+            cached_value=value,
             faktor=faktor,
             signed=signed,
             byte_count=byte_count,
         )
-        if cached_reading is not None:
-            return cached_reading
 
-        # Not in cache, fetch from API using decorator
+    async def async_read_raw_property_for_device(
+        self,
+        device_uuid: str,
+        property_path: str,
+        byte_count: int | None = None,
+    ) -> bytes | str | None:
+        """Read the raw value of a property with automatic caching.
+
+        Caching and the stale window work as in async_read_property_for_device.
+        Callers decoding the same property with different parameters use this
+        to read it once and decode it themselves.
+
+        Args:
+            device_uuid: UUID of the device
+            property_path: Property path in format "X/Y/Z" (e.g., "29/1/10")
+            byte_count: Number of bytes (3+ decodes the property as a string
+                on a device read)
+
+        Returns:
+            Raw bytes of a numeric property, the text of a string property,
+            or None if the read failed.
+
+        Raises:
+            ValueError: If byte_count is invalid or data size mismatch.
+        """
+        # Try to get from cache first; a stale value is served while it is refreshed
+        cached = self._rate_limiter.lookup_property(device_uuid, property_path)
+        if cached is not None:
+            value, stale = cached
+            if stale:
+                self._rate_limiter.schedule_refresh(
+                    device_uuid,
+                    property_path,
+                    lambda: self._fetch_raw_property(device_uuid, property_path, byte_count),
+                )
+            return value
+
+        # Not in cache, fetch from API
+        return await self._fetch_raw_property(device_uuid, property_path, byte_count)
+
+    async def _fetch_raw_property(
+        self,
+        device_uuid: str,
+        property_path: str,
+        byte_count: int | None,
+    ) -> bytes | str | None:
+        """Read a property from the device and store its raw bytes or text in the cache."""
         data = await self._read_property_for_device_raw(device_uuid, property_path)
 
         parsed = PropertyReadResult.from_raw_bytes(
             device_uuid=device_uuid,
             path=property_path,
             data=data or [],
-            faktor=faktor,
-            signed=signed,
             byte_count=byte_count,
         )
 
         if parsed.cache_value is not None:
-            self._rate_limiter.set_property_cache(cache_key, parsed.cache_value)
+            self._rate_limiter.set_property_cache(device_uuid, property_path, parsed.cache_value)
 
-        return parsed.reading
+        return parsed.cache_value
 
     @api_get("/device/{device_uuid}/property/{property_path}")
     async def _read_property_for_device_raw(self, response_data, device_uuid: str, property_path: str) -> list | None:
         """Read raw property data from device.
 
         The @api_get decorator handles:
-        - Request locking
+        - Request scheduling
         - Rate limiting
         - Session management
         - Error handling (returns None on error)
@@ -570,7 +722,13 @@ class ComfoClimeAPI:
             The @api_get decorator returns {} on any error to prevent
             integration failures.
         """
-        return ThermalProfileData(**response_data)
+        profile = ThermalProfileData(**response_data)
+        known = ThermalProfileUpdate.from_dict(profile.model_dump(by_alias=True, exclude_unset=True))
+        read_at = self._rate_limiter.timestamp()
+        self._known_thermal_profile = {
+            field: (value, read_at) for field, value in known.model_dump(exclude_none=True).items()
+        }
+        return profile
 
     @api_put("/system/{uuid}/thermalprofile", requires_uuid=True)
     async def _update_thermal_profile(self, **kwargs) -> dict:
@@ -619,7 +777,64 @@ class ComfoClimeAPI:
         """
         return update.to_api_payload(include_timestamp=False)
 
-    async def async_update_dashboard(self, update: DashboardUpdate) -> DashboardUpdateResponse:
+    def _changed_fields(
+        self,
+        endpoint: str,
+        fields: dict[str, Any],
+        known: dict[str, tuple[Any, float]],
+        always_written: frozenset[str] = frozenset(),
+    ) -> dict[str, Any]:
+        """Return the fields whose value differs from the last known device state.
+
+        Fields reported longer than the cache TTL ago count as unknown.
+
+        Args:
+            endpoint: Name of the written endpoint, for logging
+            fields: Fields to write
+            known: Last known device state by field name, with the time it was reported
+            always_written: Fields that are never dropped
+
+        Returns:
+            The fields to send; empty if the write would not change anything
+        """
+        known = {
+            field: value for field, (value, reported_at) in known.items() if self._rate_limiter.is_fresh(reported_at)
+        }
+        changed = {
+            field: value
+            for field, value in fields.items()
+            if field in always_written or field not in known or known[field] != value
+        }
+        if not changed:
+            self.suppressed_writes += 1
+            _LOGGER.debug("Skipping %s write, the device already has %s", endpoint, fields)
+        elif len(changed) < len(fields):
+            _LOGGER.debug("Dropping unchanged %s fields %s", endpoint, sorted(fields.keys() - changed.keys()))
+        return changed
+
+    async def _async_write_dashboard_fields(self, fields: dict[str, Any], force: bool) -> dict:
+        """Send the dashboard fields that change the device state, or all of them if forced."""
+        if not force:
+            fields = self._changed_fields("dashboard", fields, self._known_dashboard, _ALWAYS_WRITTEN_DASHBOARD_FIELDS)
+            if not fields:
+                return {}
+        response_dict = await self._async_update_dashboard_internal(DashboardUpdate(**fields))
+        # The device may not apply a written field (e.g. a set point in automatic mode)
+        for field in fields:
+            self._known_dashboard.pop(field, None)
+        if isinstance(response_dict, dict):
+            reported = DashboardUpdateResponse(**response_dict).dashboard_state()
+            reported_at = self._rate_limiter.timestamp()
+            self._known_dashboard.update(
+                {
+                    field: (value, reported_at)
+                    for field, value in reported.items()
+                    if field in DashboardUpdate.model_fields
+                }
+            )
+        return response_dict
+
+    async def async_update_dashboard(self, update: DashboardUpdate, *, force: bool = False) -> DashboardUpdateResponse:
         """Update dashboard settings via API.
 
         Modern method for dashboard updates. Only fields that are provided
@@ -633,9 +848,18 @@ class ComfoClimeAPI:
         - Retry with exponential backoff
         - Error handling
 
+        Dashboard updates arriving within the write combine window are sent
+        as one request (later values win for fields set more than once) and
+        share its response. Fields the device already reports with the
+        requested value (in the last dashboard read or write response, within
+        the cache TTL) are dropped, and a write left without fields is not
+        sent at all. Written fields count as unknown until reported again;
+        scenario fields are always sent.
+
         Args:
             update: DashboardUpdate model containing the fields to update.
                    Only non-None fields will be included in the payload.
+            force: Send all fields even if the device already has the values
 
         Returns:
             DashboardUpdateResponse model with status and response data.
@@ -645,7 +869,11 @@ class ComfoClimeAPI:
             response = await api.async_update_dashboard(update)
             print(response.status)
         """
-        response_dict = await self._async_update_dashboard_internal(update)
+        response_dict = await self._rate_limiter.combined_write(
+            "dashboard:forced" if force else "dashboard",
+            update.model_dump(exclude_none=True),
+            lambda fields: self._async_write_dashboard_fields(fields, force),
+        )
         # Wrap decorator's dict response to DashboardUpdateResponse
         if isinstance(response_dict, dict):
             response_dict.setdefault("status", 200)
@@ -680,16 +908,35 @@ class ComfoClimeAPI:
             update = ThermalProfileUpdate(**kwargs)
         return update.to_api_payload()
 
+    async def _async_write_thermal_profile_fields(self, fields: dict[str, Any], force: bool) -> dict:
+        """Send the thermal profile fields that change the device state, or all of them if forced."""
+        if not force:
+            fields = self._changed_fields("thermal profile", fields, self._known_thermal_profile)
+            if not fields:
+                return {}
+        response_dict = await self._async_update_thermal_profile(update=ThermalProfileUpdate(**fields))
+        for field in fields:
+            self._known_thermal_profile.pop(field, None)
+        return response_dict
+
     async def async_update_thermal_profile(
         self,
         updates: dict[str, Any] | None = None,
         update: ThermalProfileUpdate | None = None,
+        *,
+        force: bool = False,
         **kwargs,
     ) -> ThermalProfileUpdateResponse:
         """Update thermal profile settings on the device.
 
         Provides backward compatibility with legacy dict-based calls while
         supporting modern kwargs-based calls. Only specified fields are updated.
+        Updates arriving within the write combine window are sent as one
+        request (later values win for fields set more than once) and share
+        its response. Fields the last thermal profile read (within the cache
+        TTL) reports with the requested value are dropped, and a write left
+        without fields is not sent at all. Written fields count as unknown
+        until read again.
 
         Supports two calling styles:
             1. Legacy dict-based: await api.async_update_thermal_profile({"season": {"season": 1}})
@@ -698,6 +945,7 @@ class ComfoClimeAPI:
         Args:
             updates: Optional dict with nested thermal profile structure (legacy style)
             update: Optional ThermalProfileUpdate model (preferred)
+            force: Send all fields even if the device already has the values
             **kwargs: Modern kwargs style parameters:
                 - season_status (int): Season control mode
                 - season_value (int): Season (0=transition, 1=heating, 2=cooling)
@@ -728,13 +976,16 @@ class ComfoClimeAPI:
             >>> # Legacy style
             >>> response = await api.async_update_thermal_profile({"season": {"season": 1}})
         """
-        # If updates dict is provided, convert it to kwargs
+        # If updates dict is provided, convert it to the flat model fields
         if updates is not None:
-            response_dict = await self._convert_dict_to_kwargs_and_update(updates)
-        elif update is not None:
-            response_dict = await self._async_update_thermal_profile(update=update)
-        else:
-            response_dict = await self._async_update_thermal_profile(**kwargs)
+            update = ThermalProfileUpdate.from_dict(updates)
+        elif update is None:
+            update = ThermalProfileUpdate(**kwargs)
+        response_dict = await self._rate_limiter.combined_write(
+            "thermal_profile:forced" if force else "thermal_profile",
+            update.model_dump(exclude_none=True),
+            lambda fields: self._async_write_thermal_profile_fields(fields, force),
+        )
 
         # Wrap the decorator's dict response to ThermalProfileUpdateResponse
         if isinstance(response_dict, dict):
@@ -742,29 +993,12 @@ class ComfoClimeAPI:
             return ThermalProfileUpdateResponse(**response_dict)
         return ThermalProfileUpdateResponse(status=200)
 
-    async def _convert_dict_to_kwargs_and_update(self, updates: dict[str, Any]) -> dict:
-        """Convert legacy dict-based thermal profile updates to kwargs format.
-
-        Internal method that translates nested dict structure to modern
-        kwargs format for calling _async_update_thermal_profile.
-        Uses ThermalProfileUpdate.from_dict() for the conversion.
-
-        Args:
-            updates: Nested dict structure with thermal profile updates
-
-        Returns:
-            Response dict from _async_update_thermal_profile.
-        """
-        # Use ThermalProfileUpdate model to convert dict to kwargs
-        update = ThermalProfileUpdate.from_dict(updates)
-        return await self._async_update_thermal_profile(**update.model_dump(exclude_none=True))
-
     async def async_set_hvac_season(self, season: int, hpStandby: bool = False) -> None:
         """Set HVAC season and heat pump standby state atomically.
 
         Updates both the season (via thermal profile) and hpStandby state
         (via dashboard) in a single atomic operation. The decorators handle
-        all locking internally.
+        all scheduling internally.
 
         Args:
             season: Season value (0=transition, 1=heating, 2=cooling)
@@ -787,7 +1021,7 @@ class ComfoClimeAPI:
             await self.async_update_dashboard(update)
             # Then update thermal profile to set season
             if not hpStandby:  # Only set season if device is active
-                await self._async_update_thermal_profile(season_value=season)
+                await self.async_update_thermal_profile(season_value=season)
 
     @api_put("/device/{device_uuid}/method/{x}/{y}/3")
     async def _set_property_internal(
@@ -801,7 +1035,7 @@ class ComfoClimeAPI:
         """Internal method to build property write payload.
 
         The @api_put decorator handles:
-        - Request locking
+        - Request scheduling
         - Rate limiting (write mode)
         - Session management
         - Retry with exponential backoff
@@ -828,12 +1062,17 @@ class ComfoClimeAPI:
         signed: bool = True,
         faktor: float = 1.0,
         request: PropertyWriteRequest | None = None,
+        force: bool = False,
     ) -> PropertyWriteResponse:
         """Set property value for a device.
 
         Writes a property value to a device. The decorator handles all
-        locking, rate limiting, and retry logic. After successful write,
-        the cache for this device is invalidated.
+        scheduling, rate limiting, and retry logic. After successful write,
+        the cache for this device is invalidated. In write-through mode the
+        written value is cached instead, unconfirmed until it is read back,
+        and only the other properties of its group are invalidated. The write
+        is skipped if a device read within the cache TTL returned the same
+        bytes.
 
         Args:
             device_uuid: UUID of the device
@@ -843,6 +1082,7 @@ class ComfoClimeAPI:
             signed: If True, encode as signed integer (default: True)
             faktor: Scaling factor to divide value by before encoding (default: 1.0)
             request: Optional PropertyWriteRequest model (preferred)
+            force: Write even if the device already has the value
 
         Returns:
             PropertyWriteResponse model with status and response data.
@@ -877,10 +1117,17 @@ class ComfoClimeAPI:
             )
 
         x, y, z, data = request.to_wire_data()
+        if not force and self._rate_limiter.known_property(request.device_uuid, request.path) == bytes(data):
+            self.suppressed_writes += 1
+            _LOGGER.debug("Skipping write of %s, the device already has %s", request.path, request.value)
+            return PropertyWriteResponse(status=200)
 
         response_dict = await self._set_property_internal(request.device_uuid, x, y, z, data)
-        # Invalidate cache for this device after successful write
-        self._rate_limiter.invalidate_cache_for_device(request.device_uuid)
+        if self.write_through:
+            self._rate_limiter.write_through_property(request.device_uuid, request.path, bytes(data))
+        else:
+            # Invalidate cache for this device after successful write
+            self._rate_limiter.invalidate_cache_for_device(request.device_uuid)
 
         # Wrap the decorator's dict response to PropertyWriteResponse
         if isinstance(response_dict, dict):
@@ -908,7 +1155,7 @@ class ComfoClimeAPI:
             >>> await asyncio.sleep(10)
 
         Note:
-            The @api_put decorator handles request locking, rate limiting,
+            The @api_put decorator handles request scheduling, rate limiting,
             session management, and retry with exponential backoff.
         """
         # No payload needed for reset
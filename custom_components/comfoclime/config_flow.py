@@ -39,12 +39,21 @@ CONFIG_ENTRY_VERSION = 2
 DEFAULT_READ_TIMEOUT = API_DEFAULTS.READ_TIMEOUT
 DEFAULT_WRITE_TIMEOUT = API_DEFAULTS.WRITE_TIMEOUT
 DEFAULT_POLLING_INTERVAL = API_DEFAULTS.POLLING_INTERVAL
+DEFAULT_POLL_SLICES = API_DEFAULTS.POLL_SLICES
 DEFAULT_CACHE_TTL = API_DEFAULTS.CACHE_TTL
+DEFAULT_CACHE_STALE_TTL = API_DEFAULTS.CACHE_STALE_TTL
+DEFAULT_WRITE_THROUGH_CACHE = API_DEFAULTS.WRITE_THROUGH_CACHE
 DEFAULT_MAX_RETRIES = API_DEFAULTS.MAX_RETRIES
 DEFAULT_MIN_REQUEST_INTERVAL = API_DEFAULTS.MIN_REQUEST_INTERVAL
 DEFAULT_INTER_SENSOR_DELAY = API_DEFAULTS.INTER_SENSOR_DELAY
+DEFAULT_REQUEST_BUDGET = API_DEFAULTS.REQUEST_BUDGET
 DEFAULT_WRITE_COOLDOWN = API_DEFAULTS.WRITE_COOLDOWN
 DEFAULT_REQUEST_DEBOUNCE = API_DEFAULTS.REQUEST_DEBOUNCE
+DEFAULT_WRITE_COMBINE_WINDOW = API_DEFAULTS.WRITE_COMBINE_WINDOW
+DEFAULT_OPTIMISTIC_CLIMATE = API_DEFAULTS.OPTIMISTIC_CLIMATE
+DEFAULT_ADAPTIVE_RATE_LIMITING = API_DEFAULTS.ADAPTIVE_RATE_LIMITING
+DEFAULT_ADAPTIVE_MIN_INTERVAL = API_DEFAULTS.ADAPTIVE_MIN_INTERVAL
+DEFAULT_ADAPTIVE_MAX_INTERVAL = API_DEFAULTS.ADAPTIVE_MAX_INTERVAL
 
 # Option keys written by the pre-2.x options flow. They are stripped during
 # migration; their values are translated into entity-registry disabled state.
@@ -72,12 +81,21 @@ DEFAULT_OPTIONS: dict[str, Any] = {
     "read_timeout": DEFAULT_READ_TIMEOUT,
     "write_timeout": DEFAULT_WRITE_TIMEOUT,
     "polling_interval": DEFAULT_POLLING_INTERVAL,
+    "poll_slices": DEFAULT_POLL_SLICES,
     "cache_ttl": DEFAULT_CACHE_TTL,
+    "cache_stale_ttl": DEFAULT_CACHE_STALE_TTL,
+    "write_through_cache": DEFAULT_WRITE_THROUGH_CACHE,
     "max_retries": DEFAULT_MAX_RETRIES,
     "min_request_interval": DEFAULT_MIN_REQUEST_INTERVAL,
     "inter_sensor_delay": DEFAULT_INTER_SENSOR_DELAY,
+    "request_budget": DEFAULT_REQUEST_BUDGET,
     "write_cooldown": DEFAULT_WRITE_COOLDOWN,
     "request_debounce": DEFAULT_REQUEST_DEBOUNCE,
+    "write_combine_window": DEFAULT_WRITE_COMBINE_WINDOW,
+    "optimistic_climate": DEFAULT_OPTIMISTIC_CLIMATE,
+    "adaptive_rate_limiting": DEFAULT_ADAPTIVE_RATE_LIMITING,
+    "adaptive_min_interval": DEFAULT_ADAPTIVE_MIN_INTERVAL,
+    "adaptive_max_interval": DEFAULT_ADAPTIVE_MAX_INTERVAL,
 }
 
 
@@ -220,18 +238,26 @@ class ComfoClimeOptionsFlow(OptionsFlow):
         )
 
     async def async_step_polling(self, user_input: dict[str, Any] | None = None) -> FlowResult:
-        """Polling interval, cache lifetime and retry count."""
+        """Polling interval and slices, cache lifetime, stale window, write-through and retry count."""
         if user_input is not None:
             return self._save(user_input)
 
         poll_key, poll_sel = self._seconds("polling_interval", minimum=10, maximum=600)
         cache_key, cache_sel = self._seconds("cache_ttl", minimum=0, maximum=300)
+        stale_key, stale_sel = self._seconds("cache_stale_ttl", minimum=0, maximum=600)
         return self.async_show_form(
             step_id="polling",
             data_schema=vol.Schema(
                 {
                     poll_key: poll_sel,
+                    vol.Optional("poll_slices", default=self._current("poll_slices")): selector.NumberSelector(
+                        selector.NumberSelectorConfig(min=1, max=12, step=1, mode=selector.NumberSelectorMode.BOX)
+                    ),
                     cache_key: cache_sel,
+                    stale_key: stale_sel,
+                    vol.Optional(
+                        "write_through_cache", default=self._current("write_through_cache")
+                    ): selector.BooleanSelector(),
                     vol.Optional("max_retries", default=self._current("max_retries")): selector.NumberSelector(
                         selector.NumberSelectorConfig(min=0, max=10, mode=selector.NumberSelectorMode.BOX)
                     ),
@@ -240,7 +266,15 @@ class ComfoClimeOptionsFlow(OptionsFlow):
         )
 
     async def async_step_rate_limiting(self, user_input: dict[str, Any] | None = None) -> FlowResult:
-        """Request spacing and debouncing, which protect the Airduino board."""
+        """Request spacing, polling budget and debouncing, which protect the Airduino board.
+
+        With adaptive rate limiting the minimum interval is only the starting
+        point: it is learned between the adaptive bounds, and the write
+        cooldown and inter-sensor delay scale along with it. The polling
+        budget caps background reads per minute across all coordinators.
+        Debouncing and write combining delay each write by their window;
+        with optimistic climate updates the requested state shows meanwhile.
+        """
         if user_input is not None:
             return self._save(user_input)
 
@@ -253,5 +287,26 @@ class ComfoClimeOptionsFlow(OptionsFlow):
         ):
             marker, number_selector = self._seconds(key, minimum=0.0, maximum=maximum, step=0.1)
             schema[marker] = number_selector
+        combine_key, combine_sel = self._seconds("write_combine_window", minimum=0.0, maximum=1.0, step=0.05)
+        schema[combine_key] = combine_sel
+        schema[vol.Optional("optimistic_climate", default=self._current("optimistic_climate"))] = (
+            selector.BooleanSelector()
+        )
+
+        schema[vol.Optional("request_budget", default=self._current("request_budget"))] = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=6,
+                max=600,
+                step=1,
+                mode=selector.NumberSelectorMode.BOX,
+                unit_of_measurement="requests/min",
+            )
+        )
+        schema[vol.Optional("adaptive_rate_limiting", default=self._current("adaptive_rate_limiting"))] = (
+            selector.BooleanSelector()
+        )
+        for key in ("adaptive_min_interval", "adaptive_max_interval"):
+            marker, number_selector = self._seconds(key, minimum=0.05, maximum=10.0, step=0.05)
+            schema[marker] = number_selector
 
         return self.async_show_form(step_id="rate_limiting", data_schema=vol.Schema(schema))
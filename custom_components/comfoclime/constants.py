@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from enum import IntEnum
+from enum import IntEnum, StrEnum
 
 from pydantic import BaseModel, Field
 
@@ -134,6 +134,23 @@ class FanSpeed(IntEnum):
         return cls(step)
 
 
+class PollTier(StrEnum):
+    """How fresh a polled telemetry value or property has to be.
+
+    Sets the poll schedule of a value in the telemetry and property
+    coordinators:
+    - FAST: Read every update, never backed off
+    - NORMAL: Read every update, backed off while the value does not change
+    - SLOW: Read at most once every SLOW_POLL_INTERVAL seconds, backed off further while unchanged
+    - STATIC: Read once, then again only after a write or a device restart
+    """
+
+    FAST = "fast"
+    NORMAL = "normal"
+    SLOW = "slow"
+    STATIC = "static"
+
+
 class APIDefaults(BaseModel):
     """Default values for API configuration.
 
@@ -155,15 +172,83 @@ class APIDefaults(BaseModel):
         default=30.0,
         description="Cache time-to-live in seconds for telemetry and property reads",
     )
+    CACHE_STALE_TTL: float = Field(
+        default=60.0,
+        description="Seconds after expiry during which a cached value is still served while it is refreshed",
+    )
+    WRITE_THROUGH_CACHE: bool = Field(
+        default=False,
+        description="Cache written property values until they are read back instead of invalidating the device's cache",
+    )
+    CACHE_MAX_ENTRIES: int = Field(
+        default=512,
+        description="Maximum number of entries per telemetry/property cache (least recently used are evicted)",
+    )
     MAX_RETRIES: int = Field(default=3, description="Number of retries for transient failures")
+    WRITE_DEADLINE: float = Field(
+        default=60.0,
+        description="Overall time budget in seconds for a write including all retries",
+    )
+    RETRY_BACKOFF_MAX: float = Field(default=10.0, description="Upper bound for the retry backoff delay in seconds")
     MIN_REQUEST_INTERVAL: float = Field(default=0.5, description="Minimum interval between API requests in seconds")
     WRITE_COOLDOWN: float = Field(default=2.0, description="Cooldown period after write operations in seconds")
-    REQUEST_DEBOUNCE: float = Field(default=0.3, description="Debounce interval for repeated requests in seconds")
+    REQUEST_DEBOUNCE: float = Field(default=0.3, description="Window for collapsing repeated writes in seconds")
+    WRITE_COMBINE_WINDOW: float = Field(
+        default=0.1, description="Window in seconds in which concurrent writes to one endpoint share a request"
+    )
+    OPTIMISTIC_CLIMATE: bool = Field(
+        default=True,
+        description="Show the requested climate state right away and confirm it in the background",
+    )
     POLLING_INTERVAL: int = Field(default=60, description="Default polling interval for coordinators in seconds")
+    REQUEST_BUDGET: float = Field(
+        default=60.0,
+        description="Background polling reads per minute, spread evenly across all coordinators",
+    )
+    ADAPTIVE_POLL_MAX_INTERVAL: float = Field(
+        default=900.0,
+        description="Longest interval in seconds at which a telemetry value or property that does not change is polled",
+    )
+    POLL_SLICES: int = Field(
+        default=4,
+        description="Slices the telemetry and property registries are polled in, round robin, per polling interval",
+    )
+    SLOW_POLL_INTERVAL: float = Field(
+        default=600.0,
+        description="Shortest interval in seconds at which a value of the slow poll tier is polled",
+    )
     INTER_SENSOR_DELAY: float = Field(
         default=0.3,
         description="Delay in seconds between individual sensor reads in batch coordinator loops (protects Airduino)",
     )
+    ADAPTIVE_RATE_LIMITING: bool = Field(
+        default=False,
+        description="Learn the request interval from device latency and errors instead of using it as-is",
+    )
+    ADAPTIVE_MIN_INTERVAL: float = Field(
+        default=0.1,
+        description="Lower bound in seconds for the adaptively learned request interval",
+    )
+    ADAPTIVE_MAX_INTERVAL: float = Field(
+        default=5.0,
+        description="Upper bound in seconds for the adaptively learned request interval",
+    )
+    ADAPTIVE_LATENCY_THRESHOLD: float = Field(
+        default=2.0,
+        description="Response time in seconds above which the device is considered overloaded",
+    )
+    ADAPTIVE_INCREASE_FACTOR: float = Field(
+        default=2.0,
+        description="Factor the request interval is multiplied by when the device is overloaded",
+    )
+    ADAPTIVE_DECREASE_STEP: float = Field(
+        default=0.01,
+        description="Seconds subtracted from the request interval after each healthy response",
+    )
+    STARVATION_TIMEOUT: float = Field(
+        default=10.0,
+        description="Seconds after which a queued low-priority request is served ahead of higher-priority ones",
+    )
     CIRCUIT_BREAKER_THRESHOLD: int = Field(
         default=5,
         description="Number of consecutive complete update failures before circuit breaker trips",
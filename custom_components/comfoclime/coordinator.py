@@ -25,26 +25,44 @@ Example:
 Note:
     All coordinators poll every 60 seconds by default (DEFAULT_POLLING_INTERVAL_SECONDS)
     to balance freshness and API load. This can be configured per coordinator.
+
+    When given a PollingScheduler, a coordinator does not run its own timer.
+    The scheduler refreshes it at its interval and every device read first
+    waits for a slot of the shared request budget, so all coordinators of a
+    config entry together poll at a flat rate.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import math
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from pydantic import BaseModel, ValidationError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
 
     from .comfoclime_api import ComfoClimeAPI
-    from .infrastructure import AccessTracker
-    from .models import DashboardData, DeviceDefinitionData, MonitoringPing, ThermalProfileData
-
-from .constants import API_DEFAULTS
+    from .infrastructure import AccessTracker, PollingScheduler
+    from .models import (
+        DashboardData,
+        DashboardUpdateResponse,
+        DeviceDefinitionData,
+        MonitoringPing,
+        PropertyWriteRequest,
+        ThermalProfileData,
+    )
+
+from .constants import API_DEFAULTS, PollTier
+from .infrastructure import AdaptivePollPeriod, RequestPriority, current_request_priority
 from .models import PropertyRegistryEntry, TelemetryRegistryEntry
 
 _LOGGER = logging.getLogger(__name__)
@@ -53,11 +71,308 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_POLLING_INTERVAL_SECONDS = API_DEFAULTS.POLLING_INTERVAL
 
 
-class ComfoClimeBaseCoordinator(DataUpdateCoordinator):
+def _release_decoder(
+    registry: dict[str, dict[str, dict[Any, int]]],
+    device_uuid: str,
+    data_id: str,
+    decoder: TelemetryRegistryEntry | PropertyRegistryEntry,
+) -> bool:
+    """Drop one reference to a decoder from a telemetry/property registry.
+
+    Empty decoder sets and devices are removed, so the value stops being
+    fetched once nobody uses it.
+
+    Returns:
+        True if a registration was released, False if none matched.
+    """
+    device_entries = registry.get(device_uuid)
+    decoders = device_entries.get(data_id) if device_entries else None
+    if not decoders or decoder not in decoders:
+        return False
+
+    decoders[decoder] -= 1
+    if decoders[decoder] <= 0:
+        del decoders[decoder]
+    if not decoders:
+        del device_entries[data_id]
+    if not device_entries:
+        del registry[device_uuid]
+    return True
+
+
+def _decode_all(
+    decoders: tuple[TelemetryRegistryEntry | PropertyRegistryEntry, ...],
+    data: Any,
+    kind: str,
+    data_id: str,
+) -> dict[Any, Any]:
+    """Decode one raw value for every registered decoder.
+
+    A decoder whose parameters don't fit the data yields None instead of
+    failing the others.
+    """
+    values = {}
+    for decoder in decoders:
+        try:
+            values[decoder] = decoder.decode(data)
+        except ValueError as e:
+            _LOGGER.debug("Cannot decode %s %s with %s: %s", kind, data_id, decoder, e)
+            values[decoder] = None
+    return values
+
+
+def _updated_model(model: BaseModel, update: dict[str, Any]) -> BaseModel:
+    """Return a copy of a (frozen) model with fields replaced, nested models given as dicts."""
+    changes = {}
+    for field, value in update.items():
+        current = getattr(model, field)
+        if isinstance(value, dict) and isinstance(current, BaseModel):
+            value = _updated_model(current, value)
+        changes[field] = value
+    return model.model_copy(update=changes)
+
+
+def _model_mismatches(model: BaseModel, update: dict[str, Any], prefix: str = "") -> dict[str, tuple[Any, Any]]:
+    """Return {field: (expected, actual)} for the fields of a model not matching an update."""
+    mismatches = {}
+    for field, expected in update.items():
+        actual = getattr(model, field, None)
+        if isinstance(expected, dict) and isinstance(actual, BaseModel):
+            mismatches.update(_model_mismatches(actual, expected, f"{prefix}{field}."))
+        elif actual != expected:
+            mismatches[f"{prefix}{field}"] = (expected, actual)
+    return mismatches
+
+
+def _new_poll_period(
+    cycle: float,
+    default_max_interval: float,
+    poll_tier: PollTier,
+    min_poll_interval: float | None,
+    max_poll_interval: float | None,
+) -> AdaptivePollPeriod:
+    """Create the poll period of a newly registered value.
+
+    The tier supplies the limits not given explicitly: fast values are read
+    every update, slow ones at most once every SLOW_POLL_INTERVAL seconds,
+    static ones once.
+    """
+    if min_poll_interval is None and poll_tier is PollTier.SLOW:
+        min_poll_interval = API_DEFAULTS.SLOW_POLL_INTERVAL
+    if max_poll_interval is None:
+        max_poll_interval = cycle if poll_tier is PollTier.FAST else default_max_interval
+    return AdaptivePollPeriod.from_intervals(
+        cycle,
+        min_poll_interval,
+        max_poll_interval,
+        static=poll_tier is PollTier.STATIC,
+    )
+
+
+def _track_poll_period(
+    periods: dict[str, dict[str, AdaptivePollPeriod]],
+    device_uuid: str,
+    data_id: str,
+    period: AdaptivePollPeriod,
+) -> None:
+    """Add the poll period of a newly registered value, or tighten the existing one.
+
+    When several entities use one value, the shortest floor and ceiling win.
+    """
+    existing = periods.setdefault(device_uuid, {}).get(data_id)
+    if existing is None:
+        periods[device_uuid][data_id] = period
+    else:
+        existing.tighten(period)
+
+
+def _prune_poll_period(
+    periods: dict[str, dict[str, AdaptivePollPeriod]],
+    registry: dict[str, dict[str, dict[Any, int]]],
+    device_uuid: str,
+    data_id: str,
+) -> None:
+    """Forget the poll period of a value no entity is registered for anymore."""
+    if data_id in registry.get(device_uuid, {}):
+        return
+    device_periods = periods.get(device_uuid)
+    if device_periods is not None:
+        device_periods.pop(data_id, None)
+        if not device_periods:
+            del periods[device_uuid]
+
+
+def _reusable_values(
+    period: AdaptivePollPeriod | None,
+    last_values: dict[Any, Any] | None,
+    decoders: tuple[TelemetryRegistryEntry | PropertyRegistryEntry, ...],
+    in_slice: bool,
+) -> dict[Any, Any] | None:
+    """Return the last decoded values of a value that is not read in this update.
+
+    Values outside the current polling slice are reused as they are. For
+    values inside it, the poll period is advanced by one cycle and they are
+    reused while stable and not due. Returns None if the value has to be
+    read: it is due, it has no last values for all of its decoders, or the
+    refresh was requested by the user rather than by polling.
+    """
+    if last_values is None or any(decoder not in last_values for decoder in decoders):
+        return None
+    if current_request_priority() != RequestPriority.POLL:
+        return None
+    if in_slice and (period is None or period.tick()):
+        return None
+    return {decoder: last_values[decoder] for decoder in decoders}
+
+
+def _next_slice(
+    registry_snapshot: dict[str, dict[str, Any]],
+    start: int,
+    slices: int,
+) -> tuple[set[tuple[str, str]] | None, int]:
+    """Pick the registered values polled in this update.
+
+    With ``slices`` > 1 each update polls the next ``1 / slices`` of the
+    registry, round robin, so every value is still polled once per polling
+    interval but the reads are spread over it.
+
+    Args:
+        registry_snapshot: Registered values {device_uuid: {id: decoders}}
+        start: Position of the first value of this slice
+        slices: Number of slices the registry is split into
+
+    Returns:
+        The (device_uuid, id) pairs of this slice (None for all values) and
+        the start of the next slice.
+    """
+    keys = [(device_uuid, data_id) for device_uuid, items in registry_snapshot.items() for data_id in items]
+    if slices <= 1 or not keys:
+        return None, 0
+    start %= len(keys)
+    size = math.ceil(len(keys) / slices)
+    return {keys[(start + offset) % len(keys)] for offset in range(size)}, (start + size) % len(keys)
+
+
+def _read_byte_count(decoders: tuple[PropertyRegistryEntry, ...]) -> int | None:
+    """Return the byte count to read a property with for all of its decoders.
+
+    The largest byte count wins, so a string decoder (3+ bytes) gets the text
+    decoded and length-checked on a device read.
+    """
+    return max(decoder.byte_count or 0 for decoder in decoders) or None
+
+
+def _update_interval(polling_interval: float, scheduler: PollingScheduler | None) -> timedelta | None:
+    """Return the coordinator's own refresh interval, or None if a scheduler polls it."""
+    return None if scheduler is not None else timedelta(seconds=polling_interval)
+
+
+def _value_at(values: Any, key: str) -> Any:
+    """Look up a dot-separated key (e.g. "season.status") in nested dicts."""
+    for part in key.split("."):
+        if not isinstance(values, dict):
+            return None
+        values = values.get(part)
+    return values
+
+
+class _KeyedDispatchMixin:
+    """Notify only the entities whose value changed.
+
+    Entities listen with a context naming the value they show. A listener
+    with a context is notified when that value changed, when it was added
+    since the last notification, on a refresh above POLL priority (e.g. the
+    confirmation read after a write) and whenever availability changes.
+    Listeners without a context are notified on every update. Skipped
+    notifications are counted in ``suppressed_updates`` and reported to the
+    access tracker.
+    """
+
+    _coordinator_name: str
+    _access_tracker: AccessTracker | None
+    last_update_success: bool
+    _listeners: dict[Callable[[], None], tuple[Callable[[], None], object | None]]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Listener notifications skipped because their value did not change
+        self.suppressed_updates = 0
+        # Contexts added since they were last notified
+        self._unpublished: set[Any] = set()
+        # last_update_success and keyed values at the last notification
+        self._published_success = True
+        self._published_values: dict[str, Any] = {}
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None], context: Any = None) -> Callable[[], None]:
+        """Listen for updates; a listener with a context first gets the current value."""
+        if context is not None:
+            self._unpublished.add(context)
+        return super().async_add_listener(update_callback, context)
+
+    def _keyed_values(self) -> dict[str, Any] | None:
+        """Return the current data as nested dicts that listener contexts point into.
+
+        None if the listeners with a context are notified while the update
+        runs instead.
+        """
+        return None
+
+    def _changed_contexts(self) -> set[Any] | None:
+        """Return the listener contexts whose value changed since the last notification."""
+        values = self._keyed_values()
+        if values is None:
+            return None
+        previous, self._published_values = self._published_values, values
+        return {
+            context
+            for _, context in self._listeners.values()
+            if context is not None and _value_at(previous, context) != _value_at(values, context)
+        }
+
+    @callback
+    def _notify_keyed(self, changed: set[Any], in_scope: Callable[[Any], bool] | None = None) -> None:
+        """Notify the listeners with a context (within ``in_scope``) that need it."""
+        # A refresh above POLL priority confirms a write: notify even unchanged values
+        confirm = current_request_priority() != RequestPriority.POLL
+        suppressed = 0
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or (in_scope is not None and not in_scope(context)):
+                continue
+            if confirm or context in changed or context in self._unpublished:
+                self._unpublished.discard(context)
+                update_callback()
+            else:
+                suppressed += 1
+        if suppressed:
+            self.suppressed_updates += suppressed
+            if self._access_tracker:
+                self._access_tracker.record_suppressed_updates(self._coordinator_name, suppressed)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners without a context and those whose value changed."""
+        availability_changed = self.last_update_success != self._published_success
+        self._published_success = self.last_update_success
+        changed = self._changed_contexts()
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or availability_changed:
+                update_callback()
+        if availability_changed:
+            self._unpublished.clear()
+        if changed is not None and not availability_changed:
+            self._notify_keyed(changed)
+
+
+class ComfoClimeBaseCoordinator(_KeyedDispatchMixin, DataUpdateCoordinator):
     """Base coordinator with shared init and update pattern.
 
     Subclasses only need to set ``_coordinator_name`` and implement
     ``_fetch_data()`` to return the result of the appropriate API call.
+
+    Entities showing a single value listen with its key (e.g.
+    ``"indoorTemperature"`` or ``"season.status"``) as context and are only
+    notified when that value changed.
     """
 
     _coordinator_name: str = "Base"
@@ -70,23 +385,62 @@ class ComfoClimeBaseCoordinator(DataUpdateCoordinator):
         polling_interval: int = DEFAULT_POLLING_INTERVAL_SECONDS,
         access_tracker: AccessTracker | None = None,
         config_entry=None,
+        scheduler: PollingScheduler | None = None,
     ) -> None:
         super().__init__(
             hass,
             _LOGGER,
             name=name,
-            update_interval=timedelta(seconds=polling_interval),
+            update_interval=_update_interval(polling_interval, scheduler),
             config_entry=config_entry,
         )
         self.api = api
         self._access_tracker = access_tracker
+        self._scheduler = scheduler
         self.last_update_success_time: datetime | None = None
+        if scheduler is not None:
+            scheduler.add_source(self._coordinator_name, polling_interval, self.async_refresh)
 
     async def _fetch_data(self):
         """Fetch data from the API. Override in subclasses."""
         raise NotImplementedError
 
+    def _keyed_values(self) -> dict[str, Any]:
+        if isinstance(self.data, BaseModel):
+            return self.data.model_dump(by_alias=True)
+        return self.data if isinstance(self.data, dict) else {}
+
+    @callback
+    def async_apply_optimistic(self, update: dict[str, Any]) -> Any:
+        """Apply the expected result of a write to ``data`` before it is confirmed.
+
+        Fields are given by their Python names, fields of nested models as
+        nested dicts. Listeners of the changed values are notified.
+
+        Returns:
+            The previous data, for async_restore_data if the write fails.
+        """
+        previous = self.data
+        if isinstance(previous, BaseModel):
+            self.data = _updated_model(previous, update)
+            self.async_update_listeners()
+        return previous
+
+    @callback
+    def async_restore_data(self, data: Any) -> None:
+        """Restore data replaced by async_apply_optimistic and notify listeners."""
+        self.data = data
+        self.async_update_listeners()
+
+    def mismatches(self, update: dict[str, Any]) -> dict[str, tuple[Any, Any]]:
+        """Return {field: (expected, actual)} for the fields of ``data`` not matching an update."""
+        if not isinstance(self.data, BaseModel):
+            return {}
+        return _model_mismatches(self.data, update)
+
     async def _async_update_data(self):
+        if self._scheduler is not None:
+            await self._scheduler.pace()
         try:
             result = await self._fetch_data()
             self.last_update_success_time = datetime.now(UTC)
@@ -103,6 +457,29 @@ class ComfoClimeDashboardCoordinator(ComfoClimeBaseCoordinator):
 
     _coordinator_name = "Dashboard"
 
+    @callback
+    def async_apply_update_response(self, response: DashboardUpdateResponse, update: dict[str, Any]) -> bool:
+        """Merge the dashboard state reported by a dashboard PUT into ``data``.
+
+        Args:
+            response: Response of the dashboard update
+            update: Fields (by Python name) the update was expected to change
+
+        Returns:
+            True if the response reports all of these fields, so no
+            confirmation read is needed.
+        """
+        state = response.dashboard_state()
+        if not state or not isinstance(self.data, BaseModel):
+            return False
+        try:
+            self.data = self.data.model_validate({**self.data.model_dump(), **state})
+        except ValidationError as e:
+            _LOGGER.debug("Ignoring dashboard update response %s: %s", state, e)
+            return False
+        self.async_update_listeners()
+        return all(field in state for field in update)
+
     def __init__(
         self,
         hass,
@@ -110,6 +487,7 @@ class ComfoClimeDashboardCoordinator(ComfoClimeBaseCoordinator):
         polling_interval=DEFAULT_POLLING_INTERVAL_SECONDS,
         access_tracker: AccessTracker | None = None,
         config_entry=None,
+        scheduler: PollingScheduler | None = None,
     ):
         super().__init__(
             hass,
@@ -118,6 +496,7 @@ class ComfoClimeDashboardCoordinator(ComfoClimeBaseCoordinator):
             polling_interval=polling_interval,
             access_tracker=access_tracker,
             config_entry=config_entry,
+            scheduler=scheduler,
         )
 
     async def _fetch_data(self) -> DashboardData:
@@ -129,6 +508,9 @@ class ComfoClimeMonitoringCoordinator(ComfoClimeBaseCoordinator):
 
     _coordinator_name = "Monitoring"
 
+    # Boot times derived from uptime jitter by a few seconds between pings
+    _REBOOT_TOLERANCE = timedelta(seconds=60)
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -136,6 +518,7 @@ class ComfoClimeMonitoringCoordinator(ComfoClimeBaseCoordinator):
         polling_interval: int = DEFAULT_POLLING_INTERVAL_SECONDS,
         access_tracker: AccessTracker | None = None,
         config_entry=None,
+        scheduler: PollingScheduler | None = None,
     ) -> None:
         super().__init__(
             hass,
@@ -144,14 +527,32 @@ class ComfoClimeMonitoringCoordinator(ComfoClimeBaseCoordinator):
             polling_interval=polling_interval,
             access_tracker=access_tracker,
             config_entry=config_entry,
+            scheduler=scheduler,
         )
+        self._boot_time: datetime | None = None
+        self._reboot_listeners: list[Callable[[], None]] = []
+
+    def add_reboot_listener(self, listener: Callable[[], None]) -> None:
+        """Call ``listener`` whenever a ping shows that the device restarted."""
+        self._reboot_listeners.append(listener)
 
     async def _fetch_data(self) -> MonitoringPing:
         _LOGGER.debug("MonitoringCoordinator: Fetching monitoring data from API")
         result = await self.api.async_get_monitoring_ping()
         _LOGGER.debug("MonitoringCoordinator: Received data: %s", result)
+        self._detect_reboot(result.boot_time)
         return result
 
+    def _detect_reboot(self, boot_time: datetime | None) -> None:
+        """Notify the reboot listeners if the device booted since the last ping."""
+        if boot_time is None:
+            return
+        previous, self._boot_time = self._boot_time, boot_time
+        if previous is not None and boot_time - previous > self._REBOOT_TOLERANCE:
+            _LOGGER.info("Device restart detected (booted at %s)", boot_time)
+            for listener in self._reboot_listeners:
+                listener()
+
 
 class ComfoClimeThermalprofileCoordinator(ComfoClimeBaseCoordinator):
     """Coordinator for fetching thermal profile configuration data."""
@@ -165,6 +566,7 @@ class ComfoClimeThermalprofileCoordinator(ComfoClimeBaseCoordinator):
         polling_interval: int = DEFAULT_POLLING_INTERVAL_SECONDS,
         access_tracker: AccessTracker | None = None,
         config_entry=None,
+        scheduler: PollingScheduler | None = None,
     ) -> None:
         super().__init__(
             hass,
@@ -173,13 +575,341 @@ class ComfoClimeThermalprofileCoordinator(ComfoClimeBaseCoordinator):
             polling_interval=polling_interval,
             access_tracker=access_tracker,
             config_entry=config_entry,
+            scheduler=scheduler,
         )
 
     async def _fetch_data(self) -> ThermalProfileData:
         return await self.api.async_get_thermal_profile()
 
 
-class ComfoClimeTelemetryCoordinator(DataUpdateCoordinator):
+class _DevicePublishingMixin(_KeyedDispatchMixin):
+    """Publish the values of each device as soon as they have been read.
+
+    Mixed into the batching coordinators, which only provide their registry
+    and ``_read_raw``; polling, poll-period backoff, round-robin slices and
+    the circuit breaker are shared here. Their entities listen with the
+    context ``(device_uuid, id)``. While an update runs, the values of each
+    device are published once it has been read and the entities of that
+    device are notified as described in ``_KeyedDispatchMixin``. At the end
+    of the update only listeners without a context are notified.
+
+    Values registered after the last update are queued and read on their
+    own by ``async_fetch_pending``, without a full update. Updates and
+    these reads take turns, so neither overwrites the other's values.
+
+    While a registration window is open (during the setup of the config
+    entry) nothing is read. Closing it reads everything registered in the
+    meantime in one sweep.
+    """
+
+    data: dict[str, dict[str, dict[Any, Any]]] | None
+    api: ComfoClimeAPI
+    _kind: str
+    _registry_lock: asyncio.Lock
+    _scheduler: PollingScheduler | None
+    _poll_periods: dict[str, dict[str, AdaptivePollPeriod]]
+    _poll_slices: int
+    _slice_start: int
+    _sensor_delay: float
+    _circuit_breaker_threshold: int
+    _circuit_breaker_cooldown: int
+    _consecutive_failures: int
+    _circuit_open_until: datetime | None
+    last_update_success_time: datetime | None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Registered (device_uuid, id) pairs not read yet
+        self._pending_reads: set[tuple[str, str]] = set()
+        # Held by updates and pending reads while they read and publish
+        self._read_lock = asyncio.Lock()
+        self._registration_window_open = False
+        # Values read back after a write since the current update started
+        self._read_back: set[tuple[str, str]] = set()
+        # Written values published before they were read back
+        self._unconfirmed: set[tuple[str, str]] = set()
+        # Unconfirmed values written before the current update started, which its reads confirm
+        self._confirmable: set[tuple[str, str]] = set()
+
+    def _registry(self) -> dict[str, dict[str, dict[Any, int]]]:
+        """Return the registry {device_uuid: {id: {decoder: refcount}}}."""
+        raise NotImplementedError
+
+    async def _read_raw(self, device_uuid: str, data_id: str, decoders: tuple[Any, ...]) -> Any:
+        """Read the raw value of one registered ID from the device."""
+        raise NotImplementedError
+
+    async def _async_poll_registry(self) -> dict[str, dict[str, dict[Any, Any]]]:
+        """Fetch all registered values due in this update in a batched manner.
+
+        Iterates through all registered values and reads those due from the
+        API. Failed reads are logged but don't fail the entire update.
+        Reads are spaced by the scheduler's request budget, or by the
+        inter-sensor delay without a scheduler, and a circuit breaker
+        protects the Airduino from request overload.
+
+        Returns:
+            Nested dictionary: {device_uuid: {id: {decoder: value}}}
+            Values are None if read failed.
+        """
+        # Circuit breaker: skip update if device is in cooldown
+        if self._circuit_open_until is not None:
+            if datetime.now(UTC) < self._circuit_open_until:
+                remaining = (self._circuit_open_until - datetime.now(UTC)).seconds
+                _LOGGER.warning(
+                    "%s circuit breaker open, skipping update (cooldown: %ds remaining)",
+                    self._coordinator_name,
+                    remaining,
+                )
+                return self.data or {}
+            # Cooldown expired, reset circuit breaker
+            _LOGGER.info("%s circuit breaker reset, resuming polling", self._coordinator_name)
+            self._circuit_open_until = None
+            self._consecutive_failures = 0
+
+        result: dict[str, dict[str, dict[Any, Any]]] = {}
+        cycle_had_any_read = False
+        cycle_had_any_success = False
+        previous = self.data or {}
+
+        async with self._registry_lock:
+            # Create a snapshot of the registry while holding the lock
+            registry_snapshot = {
+                device_uuid: {data_id: tuple(decoders) for data_id, decoders in items.items()}
+                for device_uuid, items in self._registry().items()
+            }
+        in_slice, self._slice_start = _next_slice(registry_snapshot, self._slice_start, self._poll_slices)
+
+        # Now iterate over the snapshot without holding the lock
+        for device_uuid, items in registry_snapshot.items():
+            result[device_uuid] = {}
+
+            for data_id, decoders in items.items():
+                reused = _reusable_values(
+                    self._poll_periods.get(device_uuid, {}).get(data_id),
+                    previous.get(device_uuid, {}).get(data_id),
+                    decoders,
+                    in_slice is None or (device_uuid, data_id) in in_slice,
+                )
+                if reused is not None:
+                    # Value is polled in another slice, or is stable and not due yet
+                    result[device_uuid][data_id] = reused
+                    continue
+
+                cycle_had_any_read = True
+                if self._scheduler is not None:
+                    # The request budget spaces the reads, no inter-sensor delay on top
+                    await self._scheduler.pace()
+                values = await self._async_try_read_values(device_uuid, data_id, decoders)
+                if values is None:
+                    result[device_uuid][data_id] = dict.fromkeys(decoders)
+                else:
+                    result[device_uuid][data_id] = values
+                    cycle_had_any_success = True
+                    if (device_uuid, data_id) in self._confirmable:
+                        # Read after the write was sent (its read-back failed)
+                        self._confirmable.discard((device_uuid, data_id))
+                        self._unconfirmed.discard((device_uuid, data_id))
+
+                # Inter-sensor delay without a scheduler: spread requests to protect
+                # Airduino, scaled with the adaptively learned request interval
+                if self._scheduler is None and self._sensor_delay > 0:
+                    await asyncio.sleep(self.api.scale_delay(self._sensor_delay))
+
+            self._publish_device(result, device_uuid)
+
+        # Circuit breaker: count consecutive complete-failure cycles (a cycle that
+        # only reused stable values neither counts as failure nor resets the count)
+        if cycle_had_any_read and not cycle_had_any_success:
+            self._consecutive_failures += 1
+            _LOGGER.warning(
+                "%s update: all reads failed (consecutive failures: %d/%d)",
+                self._coordinator_name,
+                self._consecutive_failures,
+                self._circuit_breaker_threshold,
+            )
+            if self._consecutive_failures >= self._circuit_breaker_threshold:
+                self._circuit_open_until = datetime.now(UTC) + timedelta(seconds=self._circuit_breaker_cooldown)
+                _LOGGER.error(
+                    "%s circuit breaker tripped after %d consecutive failures. "
+                    "Pausing %s polling for %d seconds to protect device.",
+                    self._coordinator_name,
+                    self._consecutive_failures,
+                    self._kind,
+                    self._circuit_breaker_cooldown,
+                )
+        elif cycle_had_any_success:
+            self._consecutive_failures = 0
+
+        self.last_update_success_time = datetime.now(UTC)
+        for device_uuid in result:
+            self._keep_newer_values(result, device_uuid)
+        return result
+
+    def _observe(self, device_uuid: str, data_id: str, raw: Any) -> None:
+        """Adapt the poll period of a value to the raw value just read."""
+        period = self._poll_periods.get(device_uuid, {}).get(data_id)
+        if period is not None:
+            period.observe(raw)
+
+    def reset_poll_periods(self) -> None:
+        """Read every registered value on the next update, including static ones.
+
+        Called after the device restarted, as its values may have changed.
+        """
+        for device_periods in self._poll_periods.values():
+            for period in device_periods.values():
+                period.reset()
+
+    async def _async_update_data(self) -> dict[str, dict[str, dict[Any, Any]]]:
+        if self._registration_window_open:
+            return self.data or {}
+        async with self._read_lock:
+            self._read_back.clear()
+            self._confirmable = set(self._unconfirmed)
+            return await self._async_poll_registry()
+
+    async def async_request_refresh(self) -> None:
+        """Request a debounced refresh, unless the registration window is open."""
+        if self._registration_window_open:
+            # The sweep closing the window reads everything registered
+            return
+        await super().async_request_refresh()
+
+    def open_registration_window(self) -> None:
+        """Collect registrations without reading them until the window is closed."""
+        self._registration_window_open = True
+
+    async def async_close_registration_window(self) -> None:
+        """Close the registration window and read everything registered in one sweep."""
+        self._registration_window_open = False
+        await self.async_fetch_pending()
+
+    def _queue_read(self, device_uuid: str, data_id: str, decoder: Any) -> None:
+        """Queue a newly registered value for async_fetch_pending unless it is known already."""
+        if decoder not in (self.data or {}).get(device_uuid, {}).get(data_id, {}):
+            self._pending_reads.add((device_uuid, data_id))
+
+    async def async_fetch_pending(self) -> None:
+        """Read the values registered since the last update right away.
+
+        Only the queued values are read. They are merged into ``data`` and
+        their entities are notified, the other values are left as they are.
+        Values a full update has read in the meantime are skipped, and
+        nothing is read while the registration window is open.
+        """
+        if self._registration_window_open:
+            return
+        async with self._read_lock:
+            async with self._registry_lock:
+                registry = self._registry()
+                pending = {
+                    (device_uuid, data_id): tuple(registry[device_uuid][data_id])
+                    for device_uuid, data_id in self._pending_reads
+                    if data_id in registry.get(device_uuid, {})
+                }
+                self._pending_reads.clear()
+            previous = self.data or {}
+            pending = {
+                key: decoders
+                for key, decoders in pending.items()
+                if any(decoder not in previous.get(key[0], {}).get(key[1], {}) for decoder in decoders)
+            }
+            if not pending or self._circuit_open_until is not None:
+                # Nothing new, or the next update after the cooldown reads it
+                return
+
+            values = {}
+            for (device_uuid, data_id), decoders in pending.items():
+                if self._scheduler is not None:
+                    await self._scheduler.pace()
+                values[device_uuid, data_id] = await self._async_read_values(device_uuid, data_id, decoders)
+            self._publish_values(values)
+
+    async def async_read_back(self, device_uuid: str, data_id: str) -> None:
+        """Read one registered value again right after it was written.
+
+        Only this value is read (the API waits for the write cooldown first).
+        It is merged into ``data`` and its entities are notified. An update
+        running meanwhile keeps this value instead of its own older read.
+        If the read fails, the value shown so far is kept until the next poll.
+        """
+        async with self._registry_lock:
+            decoders = tuple(self._registry().get(device_uuid, {}).get(data_id, ()))
+        if not decoders:
+            return
+        values = await self._async_try_read_values(device_uuid, data_id, decoders)
+        if values is None:
+            return
+        self._read_back.add((device_uuid, data_id))
+        self._unconfirmed.discard((device_uuid, data_id))
+        self._publish_values({(device_uuid, data_id): values})
+
+    def is_value_unconfirmed(self, device_uuid: str, data_id: str) -> bool:
+        """Return whether a written value was published but not read back yet."""
+        return (device_uuid, data_id) in self._unconfirmed
+
+    async def _async_read_values(self, device_uuid: str, data_id: str, decoders: tuple[Any, ...]) -> dict[Any, Any]:
+        """Read one value and decode it for every decoder (all None if the read failed)."""
+        values = await self._async_try_read_values(device_uuid, data_id, decoders)
+        return dict.fromkeys(decoders) if values is None else values
+
+    async def _async_try_read_values(
+        self, device_uuid: str, data_id: str, decoders: tuple[Any, ...]
+    ) -> dict[Any, Any] | None:
+        """Read one value and decode it for every decoder, or return None if the read failed."""
+        try:
+            raw = await self._read_raw(device_uuid, data_id, decoders)
+        except (TimeoutError, aiohttp.ClientError) as e:
+            _LOGGER.debug("Error fetching %s %s for device %s: %s", self._kind, data_id, device_uuid, e)
+            return None
+        self._observe(device_uuid, data_id, raw)
+        self.last_update_success_time = datetime.now(UTC)
+        if self._access_tracker:
+            self._access_tracker.record_access(self._coordinator_name)
+        return _decode_all(decoders, raw, self._kind, data_id)
+
+    @callback
+    def _publish_values(self, values: dict[tuple[str, str], dict[Any, Any]]) -> None:
+        """Merge values read outside of an update into ``data`` and notify their entities."""
+        data = dict(self.data or {})
+        for (device_uuid, data_id), decoded in values.items():
+            data[device_uuid] = {**data.get(device_uuid, {}), data_id: decoded}
+        self.data = data
+        self._notify_keyed(set(values), lambda context: context in values)
+
+    @callback
+    def _publish_device(
+        self,
+        result: dict[str, dict[str, dict[Any, Any]]],
+        device_uuid: str,
+    ) -> None:
+        """Publish the values read so far and notify the entities of one device.
+
+        Only this device is merged into the current ``data``, so values
+        published outside of this update for other devices are kept.
+        """
+        self._keep_newer_values(result, device_uuid)
+        last_values = (self.data or {}).get(device_uuid, {})
+        changed = {
+            (device_uuid, data_id)
+            for data_id, values in result[device_uuid].items()
+            if values != last_values.get(data_id)
+        }
+        self.data = {**(self.data or {}), device_uuid: result[device_uuid]}
+        self._notify_keyed(changed, lambda context: context[0] == device_uuid)
+
+    def _keep_newer_values(self, result: dict[str, dict[str, dict[Any, Any]]], device_uuid: str) -> None:
+        """Replace reads of one device with the values published while this update ran."""
+        # Values read back after a write while this update ran, and written values
+        # not read back yet, are newer than the reads of this update
+        current = (self.data or {}).get(device_uuid, {})
+        for newer_device, data_id in self._read_back | self._unconfirmed:
+            if newer_device == device_uuid and data_id in result[device_uuid] and data_id in current:
+                result[device_uuid][data_id] = current[data_id]
+
+
+class ComfoClimeTelemetryCoordinator(_DevicePublishingMixin, DataUpdateCoordinator):
     """Coordinator for batching telemetry requests from all devices.
 
     Instead of each sensor making individual API calls, this coordinator
@@ -190,6 +920,23 @@ class ComfoClimeTelemetryCoordinator(DataUpdateCoordinator):
     the coordinator fetches all values during each update. Sensors then
     retrieve their values using get_telemetry_value().
 
+    Each telemetry ID is read once per update, however many sensors use it.
+    The raw bytes are decoded for every registered set of decode parameters
+    (faktor, signed, byte_count), so sensors may interpret the same value
+    differently without extra device requests.
+
+    Each telemetry ID has its own adaptive poll period: while its raw value
+    does not change it is read every 2, 4, 8... cycles up to a ceiling
+    (``max_poll_interval``), and every cycle again once it changes.
+    Refreshes requested by the user always read every ID.
+
+    With ``poll_slices`` > 1 the coordinator updates that many times per
+    polling interval and each update reads the next slice of the registered
+    IDs, so the reads and entity updates are spread over the interval
+    instead of arriving in one burst. Within an update, the values of each
+    device are published as soon as they have been read, notifying only the
+    sensors whose value changed.
+
     Attributes:
         api: ComfoClimeAPI instance for device communication
         devices: List of connected devices
@@ -209,6 +956,9 @@ class ComfoClimeTelemetryCoordinator(DataUpdateCoordinator):
         >>> value = coordinator.get_telemetry_value("abc123", "100")
     """
 
+    _coordinator_name = "Telemetry"
+    _kind = "telemetry"
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -220,6 +970,9 @@ class ComfoClimeTelemetryCoordinator(DataUpdateCoordinator):
         sensor_delay: float = 0.3,
         circuit_breaker_threshold: int = 5,
         circuit_breaker_cooldown: int = 300,
+        scheduler: PollingScheduler | None = None,
+        max_poll_interval: float = API_DEFAULTS.ADAPTIVE_POLL_MAX_INTERVAL,
+        poll_slices: int = 1,
     ) -> None:
         """Initialize the telemetry data coordinator.
 
@@ -229,23 +982,40 @@ class ComfoClimeTelemetryCoordinator(DataUpdateCoordinator):
             devices: List of connected devices
             polling_interval: Update interval in seconds (default: 60)
             access_tracker: Optional access tracker for monitoring API calls
-            sensor_delay: Seconds to sleep between individual sensor reads (protects Airduino)
+            sensor_delay: Seconds to sleep between individual sensor reads without a
+                scheduler (protects Airduino)
             circuit_breaker_threshold: Consecutive failures before circuit breaker trips
             circuit_breaker_cooldown: Seconds to pause polling after circuit breaker trips
+            scheduler: Optional polling scheduler that refreshes this coordinator
+                and paces its reads instead of an own timer
+            max_poll_interval: Longest interval in seconds at which a telemetry
+                value that does not change is read (default ceiling)
+            poll_slices: Number of updates per polling interval, each polling
+                the next slice of the registered values (default: 1, all at once)
         """
         super().__init__(
             hass,
             _LOGGER,
             name="ComfoClime Telemetry",
-            update_interval=timedelta(seconds=polling_interval),
+            update_interval=_update_interval(polling_interval / poll_slices, scheduler),
             config_entry=config_entry,
         )
         self.api = api
         self.devices = devices or []
         self._access_tracker = access_tracker
+        self._scheduler = scheduler
         self.last_update_success_time: datetime | None = None
-        # Registry of telemetry requests: {device_uuid: {telemetry_id: TelemetryRegistryEntry}}
-        self._telemetry_registry: dict[str, dict[str, TelemetryRegistryEntry]] = {}
+        if scheduler is not None:
+            scheduler.add_source("Telemetry", polling_interval / poll_slices, self.async_refresh)
+        # Registry of telemetry requests: {device_uuid: {telemetry_id: {decoder: refcount}}}
+        self._telemetry_registry: dict[str, dict[str, dict[TelemetryRegistryEntry, int]]] = {}
+        # Adaptive poll period per registered value: {device_uuid: {id: AdaptivePollPeriod}}
+        self._poll_periods: dict[str, dict[str, AdaptivePollPeriod]] = {}
+        self._polling_interval = polling_interval
+        self._max_poll_interval = max_poll_interval
+        # Round-robin polling: slices per interval and start of the next slice
+        self._poll_slices = poll_slices
+        self._slice_start = 0
         # Lock to prevent concurrent modifications during iteration
         self._registry_lock = asyncio.Lock()
         # Device protection: inter-sensor delay and circuit breaker
@@ -262,6 +1032,9 @@ class ComfoClimeTelemetryCoordinator(DataUpdateCoordinator):
         faktor: float = 1.0,
         signed: bool = True,
         byte_count: int | None = None,
+        min_poll_interval: float | None = None,
+        max_poll_interval: float | None = None,
+        poll_tier: PollTier = PollTier.NORMAL,
     ) -> None:
         """Register a telemetry sensor to be fetched during updates.
 
@@ -275,6 +1048,11 @@ class ComfoClimeTelemetryCoordinator(DataUpdateCoordinator):
             faktor: Scaling factor to multiply the raw value by (default: 1.0)
             signed: If True, interpret as signed integer (default: True)
             byte_count: Number of bytes to read (1 or 2, auto-detected if None)
+            min_poll_interval: Shortest interval in seconds at which the value is
+                read (default: every update)
+            max_poll_interval: Longest interval in seconds at which the value is
+                read while it does not change (default: the coordinator's)
+            poll_tier: How fresh the value has to be (default: NORMAL)
 
         Example:
             >>> await coordinator.register_telemetry(
@@ -285,154 +1063,107 @@ class ComfoClimeTelemetryCoordinator(DataUpdateCoordinator):
             ...     byte_count=2
             ... )
         """
-        async with self._registry_lock:
-            if device_uuid not in self._telemetry_registry:
-                self._telemetry_registry[device_uuid] = {}
+        decoder = TelemetryRegistryEntry(faktor=faktor, signed=signed, byte_count=byte_count)
 
-            self._telemetry_registry[device_uuid][str(telemetry_id)] = TelemetryRegistryEntry(
-                faktor=faktor,
-                signed=signed,
-                byte_count=byte_count,
+        async with self._registry_lock:
+            decoders = self._telemetry_registry.setdefault(device_uuid, {}).setdefault(str(telemetry_id), {})
+            decoders[decoder] = decoders.get(decoder, 0) + 1
+            self._unpublished.add((device_uuid, str(telemetry_id)))
+            self._queue_read(device_uuid, str(telemetry_id), decoder)
+            _track_poll_period(
+                self._poll_periods,
+                device_uuid,
+                str(telemetry_id),
+                _new_poll_period(
+                    self._polling_interval,
+                    self._max_poll_interval,
+                    poll_tier,
+                    min_poll_interval,
+                    max_poll_interval,
+                ),
             )
             _LOGGER.debug("Registered telemetry %s for device %s", telemetry_id, device_uuid)
 
-    async def unregister_telemetry(self, device_uuid: str, telemetry_id: str) -> None:
+    async def unregister_telemetry(
+        self,
+        device_uuid: str,
+        telemetry_id: str,
+        faktor: float = 1.0,
+        signed: bool = True,
+        byte_count: int | None = None,
+    ) -> None:
         """Stop fetching a telemetry value.
 
         Called when an entity is removed from Home Assistant, including when
         the user disables it in the entity registry. Dropping the registration
         is what makes disabling an entity actually reduce load on the device.
 
+        A telemetry ID may be shared by several entities, so registrations are
+        reference counted per set of decode parameters, which must match the
+        ones passed to register_telemetry(). The ID is only dropped from the
+        update once the last entity using it has gone.
+
         Args:
             device_uuid: UUID of the device the telemetry belongs to
             telemetry_id: Telemetry sensor ID to stop fetching
+            faktor: Scaling factor the telemetry was registered with
+            signed: Signedness the telemetry was registered with
+            byte_count: Byte count the telemetry was registered with
         """
+        decoder = TelemetryRegistryEntry(faktor=faktor, signed=signed, byte_count=byte_count)
+
         async with self._registry_lock:
-            device_entries = self._telemetry_registry.get(device_uuid)
-            if not device_entries:
-                return
-            if device_entries.pop(str(telemetry_id), None) is None:
+            if not _release_decoder(self._telemetry_registry, device_uuid, str(telemetry_id), decoder):
                 return
-            if not device_entries:
-                del self._telemetry_registry[device_uuid]
+            _prune_poll_period(self._poll_periods, self._telemetry_registry, device_uuid, str(telemetry_id))
             _LOGGER.debug("Unregistered telemetry %s for device %s", telemetry_id, device_uuid)
 
-    async def _async_update_data(self) -> dict[str, DeviceDefinitionData]:
-        """Fetch all registered telemetry data in a batched manner.
-
-        Iterates through all registered telemetry sensors and fetches
-        their values from the API. Failed reads are logged but don't
-        fail the entire update. Includes inter-sensor delay and circuit
-        breaker to protect the Airduino from request overload.
-
-        Returns:
-            Nested dictionary: {device_uuid: {telemetry_id: value}}
-            Values are None if read failed.
-        """
-        # Circuit breaker: skip update if device is in cooldown
-        if self._circuit_open_until is not None:
-            if datetime.now(UTC) < self._circuit_open_until:
-                remaining = (self._circuit_open_until - datetime.now(UTC)).seconds
-                _LOGGER.warning(
-                    "Telemetry circuit breaker open, skipping update (cooldown: %ds remaining)",
-                    remaining,
-                )
-                return self.data or {}
-            # Cooldown expired, reset circuit breaker
-            _LOGGER.info("Telemetry circuit breaker reset, resuming polling")
-            self._circuit_open_until = None
-            self._consecutive_failures = 0
-
-        result: dict[str, dict[str, Any]] = {}
-        cycle_had_any_success = False
-
-        async with self._registry_lock:
-            # Create a snapshot of the registry while holding the lock
-            registry_snapshot = {
-                device_uuid: dict(telemetry_items) for device_uuid, telemetry_items in self._telemetry_registry.items()
-            }
-
-        # Now iterate over the snapshot without holding the lock
-        for device_uuid, telemetry_items in registry_snapshot.items():
-            result[device_uuid] = {}
+    def _registry(self) -> dict[str, dict[str, dict[TelemetryRegistryEntry, int]]]:
+        return self._telemetry_registry
 
-            for telemetry_id, params in telemetry_items.items():
-                try:
-                    reading = await self.api.async_read_telemetry_for_device(
-                        device_uuid=device_uuid,
-                        telemetry_id=telemetry_id,
-                        faktor=params.faktor,
-                        signed=params.signed,
-                        byte_count=params.byte_count,
-                    )
-                    # Store the scaled value for backward compatibility with sensors
-                    result[device_uuid][telemetry_id] = reading.scaled_value if reading else None
-                    cycle_had_any_success = True
-                    # Track each individual API call
-                    if self._access_tracker:
-                        self._access_tracker.record_access("Telemetry")
-                except (TimeoutError, aiohttp.ClientError) as e:
-                    _LOGGER.debug(
-                        "Error fetching telemetry %s for device %s: %s",
-                        telemetry_id,
-                        device_uuid,
-                        e,
-                    )
-                    result[device_uuid][telemetry_id] = None
-
-                # Inter-sensor delay: spread requests to protect Airduino
-                if self._sensor_delay > 0:
-                    await asyncio.sleep(self._sensor_delay)
-
-        # Circuit breaker: count consecutive complete-failure cycles
-        if not cycle_had_any_success and registry_snapshot:
-            self._consecutive_failures += 1
-            _LOGGER.warning(
-                "Telemetry update: all reads failed (consecutive failures: %d/%d)",
-                self._consecutive_failures,
-                self._circuit_breaker_threshold,
-            )
-            if self._consecutive_failures >= self._circuit_breaker_threshold:
-                self._circuit_open_until = datetime.now(UTC) + timedelta(seconds=self._circuit_breaker_cooldown)
-                _LOGGER.error(
-                    "Telemetry circuit breaker tripped after %d consecutive failures. "
-                    "Pausing telemetry polling for %d seconds to protect device.",
-                    self._consecutive_failures,
-                    self._circuit_breaker_cooldown,
-                )
-        else:
-            self._consecutive_failures = 0
+    async def _read_raw(self, device_uuid: str, data_id: str, decoders: tuple[TelemetryRegistryEntry, ...]) -> bytes:
+        return await self.api.async_read_raw_telemetry_for_device(device_uuid=device_uuid, telemetry_id=data_id)
 
-        self.last_update_success_time = datetime.now(UTC)
-        return result
-
-    def get_telemetry_value(self, device_uuid: str, telemetry_id: str | int) -> Any:
+    def get_telemetry_value(
+        self,
+        device_uuid: str,
+        telemetry_id: str | int,
+        faktor: float = 1.0,
+        signed: bool = True,
+        byte_count: int | None = None,
+    ) -> Any:
         """Get a cached telemetry value from the last update.
 
         Retrieves a telemetry value that was fetched during the last
-        coordinator update. Returns None if the value doesn't exist or
+        coordinator update, decoded with the given parameters (the ones it
+        was registered with). Returns None if the value doesn't exist or
         if the read failed.
 
         Args:
             device_uuid: UUID of the device
             telemetry_id: Telemetry sensor ID (string or int)
+            faktor: Scaling factor the telemetry was registered with
+            signed: Signedness the telemetry was registered with
+            byte_count: Byte count the telemetry was registered with
 
         Returns:
             The cached telemetry value, or None if not found/failed.
 
         Example:
-            >>> temp = coordinator.get_telemetry_value("abc123", "100")
+            >>> temp = coordinator.get_telemetry_value("abc123", "100", faktor=0.1, signed=True, byte_count=2)
             >>> if temp is not None:
             ...     print(f"Temperature: {temp}°C")
         """
         if not self.data:
             return None
 
-        device_data = self.data.get(device_uuid, {})
-        return device_data.get(str(telemetry_id))
+        values = self.data.get(device_uuid, {}).get(str(telemetry_id))
+        if not values:
+            return None
+        return values.get(TelemetryRegistryEntry(faktor=faktor, signed=signed, byte_count=byte_count))
 
 
-class ComfoClimePropertyCoordinator(DataUpdateCoordinator):
+class ComfoClimePropertyCoordinator(_DevicePublishingMixin, DataUpdateCoordinator):
     """Coordinator for batching property requests from all devices.
 
     Instead of each sensor/number/select making individual API calls,
@@ -444,6 +1175,15 @@ class ComfoClimePropertyCoordinator(DataUpdateCoordinator):
     the coordinator fetches all values during each update. Entities then
     retrieve their values using get_property_value().
 
+    Each property is read once per update, however many sensors, numbers
+    and selects use it. The raw value is decoded for every registered set
+    of decode parameters (faktor, signed, byte_count).
+
+    Like telemetry, each property backs off its poll period while its raw
+    value is stable, up to ``max_poll_interval``, and the registered
+    properties can be polled in ``poll_slices`` round-robin slices and are
+    published per device as they are read.
+
     Attributes:
         api: ComfoClimeAPI instance for device communication
         devices: List of connected devices
@@ -462,6 +1202,9 @@ class ComfoClimePropertyCoordinator(DataUpdateCoordinator):
         >>> value = coordinator.get_property_value("abc123", "29/1/10")
     """
 
+    _coordinator_name = "Property"
+    _kind = "property"
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -473,6 +1216,9 @@ class ComfoClimePropertyCoordinator(DataUpdateCoordinator):
         sensor_delay: float = 0.3,
         circuit_breaker_threshold: int = 5,
         circuit_breaker_cooldown: int = 300,
+        scheduler: PollingScheduler | None = None,
+        max_poll_interval: float = API_DEFAULTS.ADAPTIVE_POLL_MAX_INTERVAL,
+        poll_slices: int = 1,
     ) -> None:
         """Initialize the property data coordinator.
 
@@ -482,25 +1228,40 @@ class ComfoClimePropertyCoordinator(DataUpdateCoordinator):
             devices: List of connected devices
             polling_interval: Update interval in seconds (default: 60)
             access_tracker: Optional access tracker for monitoring API calls
-            sensor_delay: Seconds to sleep between individual property reads (protects Airduino)
+            sensor_delay: Seconds to sleep between individual property reads without a
+                scheduler (protects Airduino)
             circuit_breaker_threshold: Consecutive failures before circuit breaker trips
             circuit_breaker_cooldown: Seconds to pause polling after circuit breaker trips
+            scheduler: Optional polling scheduler that refreshes this coordinator
+                and paces its reads instead of an own timer
+            max_poll_interval: Longest interval in seconds at which a property
+                that does not change is read (default ceiling)
+            poll_slices: Number of updates per polling interval, each polling
+                the next slice of the registered values (default: 1, all at once)
         """
         super().__init__(
             hass,
             _LOGGER,
             name="ComfoClime Properties",
-            update_interval=timedelta(seconds=polling_interval),
+            update_interval=_update_interval(polling_interval / poll_slices, scheduler),
             config_entry=config_entry,
         )
         self.api = api
         self.devices = devices or []
         self._access_tracker = access_tracker
+        self._scheduler = scheduler
         self.last_update_success_time: datetime | None = None
-        # Registry of property requests: {device_uuid: {path: PropertyRegistryEntry}}
-        self._property_registry: dict[str, dict[str, PropertyRegistryEntry]] = {}
-        # How many entities want each path, so the last one out clears it.
-        self._property_refcounts: dict[str, dict[str, int]] = {}
+        if scheduler is not None:
+            scheduler.add_source("Property", polling_interval / poll_slices, self.async_refresh)
+        # Registry of property requests: {device_uuid: {path: {decoder: refcount}}}
+        self._property_registry: dict[str, dict[str, dict[PropertyRegistryEntry, int]]] = {}
+        # Adaptive poll period per registered value: {device_uuid: {id: AdaptivePollPeriod}}
+        self._poll_periods: dict[str, dict[str, AdaptivePollPeriod]] = {}
+        self._polling_interval = polling_interval
+        self._max_poll_interval = max_poll_interval
+        # Round-robin polling: slices per interval and start of the next slice
+        self._poll_slices = poll_slices
+        self._slice_start = 0
         # Lock to prevent concurrent modifications during iteration
         self._registry_lock = asyncio.Lock()
         # Device protection: inter-sensor delay and circuit breaker
@@ -517,6 +1278,9 @@ class ComfoClimePropertyCoordinator(DataUpdateCoordinator):
         faktor: float = 1.0,
         signed: bool = True,
         byte_count: int | None = None,
+        min_poll_interval: float | None = None,
+        max_poll_interval: float | None = None,
+        poll_tier: PollTier = PollTier.NORMAL,
     ) -> None:
         """Register a property to be fetched during updates.
 
@@ -530,6 +1294,11 @@ class ComfoClimePropertyCoordinator(DataUpdateCoordinator):
             faktor: Scaling factor to multiply numeric values by (default: 1.0)
             signed: If True, interpret numeric values as signed (default: True)
             byte_count: Number of bytes (1-2 for numeric, 3+ for string)
+            min_poll_interval: Shortest interval in seconds at which the value is
+                read (default: every update)
+            max_poll_interval: Longest interval in seconds at which the value is
+                read while it does not change (default: the coordinator's)
+            poll_tier: How fresh the value has to be (default: NORMAL)
 
         Example:
             >>> await coordinator.register_property(
@@ -540,32 +1309,35 @@ class ComfoClimePropertyCoordinator(DataUpdateCoordinator):
             ...     byte_count=2
             ... )
         """
-        entry = PropertyRegistryEntry(faktor=faktor, signed=signed, byte_count=byte_count)
+        decoder = PropertyRegistryEntry(faktor=faktor, signed=signed, byte_count=byte_count)
 
         async with self._registry_lock:
-            device_entries = self._property_registry.setdefault(device_uuid, {})
-            refcounts = self._property_refcounts.setdefault(device_uuid, {})
-
-            existing = device_entries.get(property_path)
-            if existing is not None and existing != entry:
-                # Two entity definitions disagree about how to decode the same
-                # property. Whichever registered last would silently win, so
-                # make the mismatch visible instead of guessing.
-                _LOGGER.warning(
-                    "Conflicting decode parameters registered for property %s on device %s: "
-                    "%s vs %s - keeping the first registration",
-                    property_path,
-                    device_uuid,
-                    existing,
-                    entry,
-                )
-            elif existing is None:
-                device_entries[property_path] = entry
-
-            refcounts[property_path] = refcounts.get(property_path, 0) + 1
+            decoders = self._property_registry.setdefault(device_uuid, {}).setdefault(property_path, {})
+            decoders[decoder] = decoders.get(decoder, 0) + 1
+            self._unpublished.add((device_uuid, property_path))
+            self._queue_read(device_uuid, property_path, decoder)
+            _track_poll_period(
+                self._poll_periods,
+                device_uuid,
+                property_path,
+                _new_poll_period(
+                    self._polling_interval,
+                    self._max_poll_interval,
+                    poll_tier,
+                    min_poll_interval,
+                    max_poll_interval,
+                ),
+            )
             _LOGGER.debug("Registered property %s for device %s", property_path, device_uuid)
 
-    async def unregister_property(self, device_uuid: str, property_path: str) -> None:
+    async def unregister_property(
+        self,
+        device_uuid: str,
+        property_path: str,
+        faktor: float = 1.0,
+        signed: bool = True,
+        byte_count: int | None = None,
+    ) -> None:
         """Stop fetching a property value.
 
         Called when an entity is removed from Home Assistant, including when
@@ -573,151 +1345,103 @@ class ComfoClimePropertyCoordinator(DataUpdateCoordinator):
         is what makes disabling an entity actually reduce load on the device.
 
         A path may be shared by several entities (a read-only sensor and a
-        writable number, say), so the registration is reference counted and
-        only removed once the last entity using it has gone.
+        writable number, say), so registrations are reference counted per set
+        of decode parameters, which must match the ones passed to
+        register_property(). The path is only dropped from the update once
+        the last entity using it has gone.
 
         Args:
             device_uuid: UUID of the device the property belongs to
             property_path: Property path in format "X/Y/Z"
+            faktor: Scaling factor the property was registered with
+            signed: Signedness the property was registered with
+            byte_count: Byte count the property was registered with
         """
-        async with self._registry_lock:
-            device_entries = self._property_registry.get(device_uuid)
-            if not device_entries or property_path not in device_entries:
-                return
+        decoder = PropertyRegistryEntry(faktor=faktor, signed=signed, byte_count=byte_count)
 
-            remaining = self._property_refcounts.get(device_uuid, {}).get(property_path, 1) - 1
-            if remaining > 0:
-                self._property_refcounts[device_uuid][property_path] = remaining
+        async with self._registry_lock:
+            if not _release_decoder(self._property_registry, device_uuid, property_path, decoder):
                 return
-
-            self._property_refcounts.get(device_uuid, {}).pop(property_path, None)
-            del device_entries[property_path]
-            if not device_entries:
-                del self._property_registry[device_uuid]
+            _prune_poll_period(self._poll_periods, self._property_registry, device_uuid, property_path)
             _LOGGER.debug("Unregistered property %s for device %s", property_path, device_uuid)
 
-    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
-        """Fetch all registered property data in a batched manner.
-
-        Iterates through all registered properties and fetches their
-        values from the API. Failed reads are logged but don't fail
-        the entire update. Includes inter-sensor delay and circuit
-        breaker to protect the Airduino from request overload.
+    def _registry(self) -> dict[str, dict[str, dict[PropertyRegistryEntry, int]]]:
+        return self._property_registry
 
-        Returns:
-            Nested dictionary: {device_uuid: {property_path: value}}
-            Values are None if read failed.
-        """
-        # Circuit breaker: skip update if device is in cooldown
-        if self._circuit_open_until is not None:
-            if datetime.now(UTC) < self._circuit_open_until:
-                remaining = (self._circuit_open_until - datetime.now(UTC)).seconds
-                _LOGGER.warning(
-                    "Property circuit breaker open, skipping update (cooldown: %ds remaining)",
-                    remaining,
-                )
-                return self.data or {}
-            # Cooldown expired, reset circuit breaker
-            _LOGGER.info("Property circuit breaker reset, resuming polling")
-            self._circuit_open_until = None
-            self._consecutive_failures = 0
-
-        result: dict[str, dict[str, Any]] = {}
-        cycle_had_any_success = False
-
-        async with self._registry_lock:
-            # Create a snapshot of the registry while holding the lock
-            registry_snapshot = {
-                device_uuid: dict(property_items) for device_uuid, property_items in self._property_registry.items()
-            }
-
-        # Now iterate over the snapshot without holding the lock
-        for device_uuid, property_items in registry_snapshot.items():
-            result[device_uuid] = {}
-
-            for property_path, params in property_items.items():
-                try:
-                    reading = await self.api.async_read_property_for_device(
-                        device_uuid=device_uuid,
-                        property_path=property_path,
-                        faktor=params.faktor,
-                        signed=params.signed,
-                        byte_count=params.byte_count,
-                    )
-                    # Store the scaled value for backward compatibility with sensors
-                    result[device_uuid][property_path] = reading.scaled_value if reading else None
-                    cycle_had_any_success = True
-                    # Track each individual API call
-                    if self._access_tracker:
-                        self._access_tracker.record_access("Property")
-                except (TimeoutError, aiohttp.ClientError) as e:
-                    _LOGGER.debug(
-                        "Error fetching property %s for device %s: %s",
-                        property_path,
-                        device_uuid,
-                        e,
-                    )
-                    result[device_uuid][property_path] = None
-
-                # Inter-sensor delay: spread requests to protect Airduino
-                if self._sensor_delay > 0:
-                    await asyncio.sleep(self._sensor_delay)
-
-        # Circuit breaker: count consecutive complete-failure cycles
-        if not cycle_had_any_success and registry_snapshot:
-            self._consecutive_failures += 1
-            _LOGGER.warning(
-                "Property update: all reads failed (consecutive failures: %d/%d)",
-                self._consecutive_failures,
-                self._circuit_breaker_threshold,
-            )
-            if self._consecutive_failures >= self._circuit_breaker_threshold:
-                self._circuit_open_until = datetime.now(UTC) + timedelta(seconds=self._circuit_breaker_cooldown)
-                _LOGGER.error(
-                    "Property circuit breaker tripped after %d consecutive failures. "
-                    "Pausing property polling for %d seconds to protect device.",
-                    self._consecutive_failures,
-                    self._circuit_breaker_cooldown,
-                )
-        else:
-            self._consecutive_failures = 0
+    async def _read_raw(self, device_uuid: str, data_id: str, decoders: tuple[PropertyRegistryEntry, ...]) -> Any:
+        return await self.api.async_read_raw_property_for_device(
+            device_uuid=device_uuid,
+            property_path=data_id,
+            byte_count=_read_byte_count(decoders),
+        )
 
-        self.last_update_success_time = datetime.now(UTC)
-        return result
+    @callback
+    def publish_written_value(self, request: PropertyWriteRequest) -> None:
+        """Publish a written property value right away (write-through mode).
 
-    def get_property_value(self, device_uuid: str, property_path: str) -> Any:
+        The value is decoded from the bytes sent to the device and stays
+        unconfirmed until async_read_back reads it from the device, or an
+        update started after the write reads it if the read-back failed.
+        Updates running meanwhile keep it instead of their own older reads.
+        """
+        if not self.api.write_through:
+            return
+        decoders = tuple(self._property_registry.get(request.device_uuid, {}).get(request.path, ()))
+        if not decoders:
+            return
+        raw = bytes(request.to_wire_data()[3])
+        key = (request.device_uuid, request.path)
+        self._unconfirmed.add(key)
+        self._confirmable.discard(key)
+        self._publish_values({key: _decode_all(decoders, raw, self._kind, request.path)})
+
+    def get_property_value(
+        self,
+        device_uuid: str,
+        property_path: str,
+        faktor: float = 1.0,
+        signed: bool = True,
+        byte_count: int | None = None,
+    ) -> Any:
         """Get a cached property value from the last update.
 
         Retrieves a property value that was fetched during the last
-        coordinator update. Returns None if the value doesn't exist or
+        coordinator update, decoded with the given parameters (the ones it
+        was registered with). Returns None if the value doesn't exist or
         if the read failed.
 
         Args:
             device_uuid: UUID of the device
             property_path: Property path (e.g., "29/1/10")
+            faktor: Scaling factor the property was registered with
+            signed: Signedness the property was registered with
+            byte_count: Byte count the property was registered with
 
         Returns:
             The cached property value (float or string), or None if not found/failed.
 
         Example:
-            >>> value = coordinator.get_property_value("abc123", "29/1/10")
+            >>> value = coordinator.get_property_value("abc123", "29/1/10", faktor=0.1, byte_count=2)
             >>> if value is not None:
             ...     print(f"Property value: {value}")
         """
         if not self.data:
             return None
 
-        device_data = self.data.get(device_uuid, {})
-        return device_data.get(property_path)
+        values = self.data.get(device_uuid, {}).get(property_path)
+        if not values:
+            return None
+        return values.get(PropertyRegistryEntry(faktor=faktor, signed=signed, byte_count=byte_count))
 
 
-class ComfoClimeDefinitionCoordinator(DataUpdateCoordinator):
+class ComfoClimeDefinitionCoordinator(_KeyedDispatchMixin, DataUpdateCoordinator):
     """Coordinator for fetching device definition data.
 
     Fetches definition data for connected devices, particularly useful
     for ComfoAirQ devices (modelTypeId=1) which provide detailed sensor
     and control point definitions. ComfoClime devices provide less useful
-    definition data and are skipped.
+    definition data and are skipped. Entities listen with the device UUID
+    as context and are only notified when its definition changed.
 
     Attributes:
         api: ComfoClimeAPI instance for device communication
@@ -729,6 +1453,8 @@ class ComfoClimeDefinitionCoordinator(DataUpdateCoordinator):
         >>> definition = coordinator.get_definition_data("abc123")
     """
 
+    _coordinator_name = "Definition"
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -737,6 +1463,7 @@ class ComfoClimeDefinitionCoordinator(DataUpdateCoordinator):
         polling_interval: int = DEFAULT_POLLING_INTERVAL_SECONDS,
         access_tracker: AccessTracker | None = None,
         config_entry=None,
+        scheduler: PollingScheduler | None = None,
     ) -> None:
         """Initialize the device definition coordinator.
 
@@ -746,18 +1473,23 @@ class ComfoClimeDefinitionCoordinator(DataUpdateCoordinator):
             devices: List of connected devices
             polling_interval: Update interval in seconds (default: 60)
             access_tracker: Optional access tracker for monitoring API calls
+            scheduler: Optional polling scheduler that refreshes this coordinator
+                and paces its reads instead of an own timer
         """
         super().__init__(
             hass,
             _LOGGER,
             name="ComfoClime Device Definition",
-            update_interval=timedelta(seconds=polling_interval),
+            update_interval=_update_interval(polling_interval, scheduler),
             config_entry=config_entry,
         )
         self.api = api
         self.devices = devices or []
         self._access_tracker = access_tracker
+        self._scheduler = scheduler
         self.last_update_success_time: datetime | None = None
+        if scheduler is not None:
+            scheduler.add_source("Definition", polling_interval, self.async_refresh)
 
     async def _async_update_data(self) -> dict[str, dict[str, Any]]:
         """Fetch definition data for ComfoAirQ devices.
@@ -791,12 +1523,14 @@ class ComfoClimeDefinitionCoordinator(DataUpdateCoordinator):
                 )
                 continue
 
+            if self._scheduler is not None:
+                await self._scheduler.pace()
             try:
                 definition_data = await self.api.async_get_device_definition(device_uuid=device_uuid)
                 result[device_uuid] = definition_data
                 # Track each individual API call
                 if self._access_tracker:
-                    self._access_tracker.record_access("Definition")
+                    self._access_tracker.record_access(self._coordinator_name)
                 _LOGGER.debug("Successfully fetched definition for device %s", device_uuid)
             except (TimeoutError, aiohttp.ClientError) as e:
                 _LOGGER.debug("Error fetching definition for device %s: %s", device_uuid, e)
@@ -827,3 +1561,6 @@ class ComfoClimeDefinitionCoordinator(DataUpdateCoordinator):
             return None
 
         return self.data.get(device_uuid)
+
+    def _keyed_values(self) -> dict[str, DeviceDefinitionData | None]:
+        return dict(self.data or {})
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from pydantic import Field
 
+from ..constants import PollTier
 from .base_definitions import EntityDefinitionBase, KeyEntityDefinitionBase
 
 
@@ -40,6 +41,7 @@ class PropertyNumberDefinition(EntityDefinitionBase):
         faktor: Multiplication factor for the raw value.
         signed: Whether the raw value is a signed integer.
         byte_count: Number of bytes to read/write.
+        poll_tier: How fresh the value has to be (fast/normal/slow/static).
     """
 
     property: str = Field(..., description="Property path in format 'X/Y/Z'")
@@ -48,12 +50,9 @@ class PropertyNumberDefinition(EntityDefinitionBase):
     step: float = Field(..., description="Step increment")
     unit: str | None = Field(default=None, description="Optional unit of measurement")
     faktor: float = Field(default=1.0, description="Multiplication factor for the raw value")
-    signed: bool = Field(
-        default=False,
-        description="Whether the raw value is a signed integer. Must match the sensor definition "
-        "for the same path, since both share one coordinator registration.",
-    )
+    signed: bool = Field(default=False, description="Whether the raw value is a signed integer")
     byte_count: int = Field(default=1, description="Number of bytes to read/write")
+    poll_tier: PollTier = Field(default=PollTier.NORMAL, description="How fresh the value has to be")
 
 
 NUMBER_ENTITIES = [
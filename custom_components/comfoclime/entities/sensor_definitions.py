@@ -6,6 +6,7 @@ from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import EntityCategory
 from pydantic import ConfigDict, Field
 
+from ..constants import PollTier
 from .base_definitions import EntityDefinitionBase, KeyEntityDefinitionBase
 
 
@@ -53,6 +54,9 @@ class TelemetrySensorDefinition(EntityDefinitionBase):
         icon: MDI icon name.
         suggested_display_precision: Decimal places for display.
         diagnose: Whether this is a diagnostic sensor (experimental/unknown).
+        min_poll_interval: Shortest interval in seconds at which the value is read.
+        max_poll_interval: Longest interval in seconds at which an unchanged value is read.
+        poll_tier: How fresh the value has to be (fast/normal/slow/static).
     """
 
     model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
@@ -73,6 +77,14 @@ class TelemetrySensorDefinition(EntityDefinitionBase):
         default=False,
         description="Whether this is a diagnostic sensor (experimental/unknown)",
     )
+    min_poll_interval: float | None = Field(
+        default=None, description="Shortest interval in seconds at which the value is read (default: every update)"
+    )
+    max_poll_interval: float | None = Field(
+        default=None,
+        description="Longest interval in seconds at which an unchanged value is read (default: coordinator's)",
+    )
+    poll_tier: PollTier = Field(default=PollTier.NORMAL, description="How fresh the value has to be")
 
 
 class PropertySensorDefinition(EntityDefinitionBase):
@@ -91,6 +103,9 @@ class PropertySensorDefinition(EntityDefinitionBase):
         entity_category: Entity category (None, diagnostic, config).
         icon: MDI icon name.
         suggested_display_precision: Decimal places for display.
+        min_poll_interval: Shortest interval in seconds at which the value is read.
+        max_poll_interval: Longest interval in seconds at which an unchanged value is read.
+        poll_tier: How fresh the value has to be (fast/normal/slow/static).
     """
 
     model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
@@ -107,6 +122,14 @@ class PropertySensorDefinition(EntityDefinitionBase):
     )
     icon: str | None = Field(default=None, description="MDI icon name")
     suggested_display_precision: int | None = Field(default=None, description="Decimal places for display")
+    min_poll_interval: float | None = Field(
+        default=None, description="Shortest interval in seconds at which the value is read (default: every update)"
+    )
+    max_poll_interval: float | None = Field(
+        default=None,
+        description="Longest interval in seconds at which an unchanged value is read (default: coordinator's)",
+    )
+    poll_tier: PollTier = Field(default=PollTier.NORMAL, description="How fresh the value has to be")
 
 
 class AccessTrackingSensorDefinition(EntityDefinitionBase):
@@ -114,7 +137,8 @@ class AccessTrackingSensorDefinition(EntityDefinitionBase):
 
     Attributes:
         coordinator: Name of the coordinator to track (None for total).
-        metric: Metric type (per_minute, per_hour, total_per_minute, total_per_hour).
+        metric: Metric type (per_minute, per_hour, total_per_minute, total_per_hour,
+            suppressed_updates).
         name: Display name for the sensor (fallback if translation missing).
         translation_key: Key for i18n translations.
         state_class: Home Assistant state class.
@@ -130,7 +154,7 @@ class AccessTrackingSensorDefinition(EntityDefinitionBase):
     coordinator: str | None = Field(..., description="Name of the coordinator to track (None for total)")
     metric: str = Field(
         ...,
-        description="Metric type (per_minute, per_hour, total_per_minute, total_per_hour)",
+        description="Metric type (per_minute, per_hour, total_per_minute, total_per_hour, suppressed_updates)",
     )
     state_class: SensorStateClass | str | None = Field(default=None, description="Home Assistant state class")
     entity_category: EntityCategory | str | None = Field(
@@ -142,6 +166,33 @@ class AccessTrackingSensorDefinition(EntityDefinitionBase):
     suggested_display_precision: int | None = Field(default=None, description="Decimal places for display")
 
 
+class RateControlSensorDefinition(EntityDefinitionBase):
+    """Definition for adaptive rate control sensors.
+
+    Attributes:
+        metric: Key in ComfoClimeAPI.rate_control_state() (request_interval,
+            write_cooldown, latency, error_rate).
+        name: Display name for the sensor (fallback if translation missing).
+        translation_key: Key for i18n translations.
+        unit: Unit of measurement (e.g., "s", "%").
+        device_class: Home Assistant device class.
+        state_class: Home Assistant state class.
+        entity_category: Entity category (None, diagnostic, config).
+        suggested_display_precision: Decimal places for display.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    metric: str = Field(..., description="Key in ComfoClimeAPI.rate_control_state()")
+    unit: str | None = Field(default=None, description="Unit of measurement (e.g., 's', '%')")
+    device_class: SensorDeviceClass | str | None = Field(default=None, description="Home Assistant device class")
+    state_class: SensorStateClass | str | None = Field(default=None, description="Home Assistant state class")
+    entity_category: EntityCategory | str | None = Field(
+        default=None, description="Entity category (None, diagnostic, config)"
+    )
+    suggested_display_precision: int | None = Field(default=None, description="Decimal places for display")
+
+
 # Dashboard sensor definitions using Pydantic models
 DASHBOARD_SENSORS = [
     SensorDefinition(
@@ -703,6 +754,7 @@ CONNECTED_DEVICE_SENSORS = {
             entity_category=EntityCategory.DIAGNOSTIC,
             telemetry_id=192,
             byte_count=2,
+            poll_tier=PollTier.SLOW,
         ),
     ],
 }
@@ -720,6 +772,7 @@ CONNECTED_DEVICE_PROPERTIES = {
             faktor=0.1,
             signed=True,
             byte_count=2,
+            poll_tier=PollTier.SLOW,
         ),
         PropertySensorDefinition(
             name="HP Min. Supply Temperature Cooling",
@@ -732,6 +785,7 @@ CONNECTED_DEVICE_PROPERTIES = {
             faktor=0.1,
             signed=True,
             byte_count=2,
+            poll_tier=PollTier.SLOW,
         ),
         PropertySensorDefinition(
             name="HP Max. Supply Temperature Heating",
@@ -744,6 +798,7 @@ CONNECTED_DEVICE_PROPERTIES = {
             faktor=0.1,
             signed=False,
             byte_count=2,
+            poll_tier=PollTier.SLOW,
         ),
         PropertySensorDefinition(
             name="HP Min. Comfort Temperature Cooling",
@@ -756,6 +811,7 @@ CONNECTED_DEVICE_PROPERTIES = {
             faktor=0.1,
             signed=True,
             byte_count=2,
+            poll_tier=PollTier.SLOW,
         ),
         PropertySensorDefinition(
             name="HP Maximum Power",
@@ -767,6 +823,7 @@ CONNECTED_DEVICE_PROPERTIES = {
             faktor=1.0,
             signed=False,
             byte_count=1,
+            poll_tier=PollTier.SLOW,
         ),
         PropertySensorDefinition(
             name="HP Hysteresis Heating",
@@ -779,6 +836,7 @@ CONNECTED_DEVICE_PROPERTIES = {
             faktor=0.1,
             signed=False,
             byte_count=2,
+            poll_tier=PollTier.SLOW,
         ),
         PropertySensorDefinition(
             name="HP Hysteresis Cooling",
@@ -791,6 +849,7 @@ CONNECTED_DEVICE_PROPERTIES = {
             faktor=0.1,
             signed=False,
             byte_count=2,
+            poll_tier=PollTier.SLOW,
         ),
     ],
     1: [
@@ -976,4 +1035,55 @@ ACCESS_TRACKING_SENSORS = [
         coordinator=None,
         metric="total_per_hour",
     ),
+    AccessTrackingSensorDefinition(
+        name="Suppressed Entity Updates",
+        translation_key="suppressed_entity_updates",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category="diagnostic",
+        coordinator=None,
+        metric="suppressed_updates",
+    ),
+]
+
+# Rate control sensors exposing the learned request spacing and device health
+RATE_CONTROL_SENSORS = [
+    RateControlSensorDefinition(
+        name="Adaptive Request Interval",
+        translation_key="adaptive_request_interval",
+        metric="request_interval",
+        unit="s",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category="diagnostic",
+        suggested_display_precision=2,
+    ),
+    RateControlSensorDefinition(
+        name="Adaptive Write Cooldown",
+        translation_key="adaptive_write_cooldown",
+        metric="write_cooldown",
+        unit="s",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category="diagnostic",
+        suggested_display_precision=2,
+    ),
+    RateControlSensorDefinition(
+        name="API Response Latency",
+        translation_key="api_response_latency",
+        metric="latency",
+        unit="s",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category="diagnostic",
+        suggested_display_precision=2,
+    ),
+    RateControlSensorDefinition(
+        name="API Error Rate",
+        translation_key="api_error_rate",
+        metric="error_rate",
+        unit="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category="diagnostic",
+        suggested_display_precision=1,
+    ),
 ]
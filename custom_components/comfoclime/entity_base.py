@@ -20,6 +20,7 @@ from .entity_helper import (
     get_device_uuid,
     get_device_version,
 )
+from .infrastructure import RequestPriority, request_priority
 
 if TYPE_CHECKING:
     from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
@@ -146,23 +147,42 @@ class ComfoClimeBaseEntity:
     async def _async_unregister_data_source(self) -> None:
         """Unregister from a batching coordinator. No-op unless overridden."""
 
-    async def _async_request_coordinator_refresh(self) -> None:
-        """Ask the coordinator for fresh data after a registration change.
+    async def _async_fetch_registered_value(self) -> None:
+        """Read the value just registered without a full coordinator update.
 
-        ``async_request_refresh`` is debounced, so a whole platform's worth of
-        entities registering during startup collapses into a single fetch.
+        The batching coordinators read only the newly registered values, so a
+        whole platform's worth of entities registering during startup does not
+        sweep the registry again and again.
         """
         coordinator = getattr(self, "coordinator", None)
-        if coordinator is not None:
-            await self._safe_refresh(coordinator, type(self).__name__)
+        if coordinator is None:
+            return
+        try:
+            with request_priority(RequestPriority.POLL):
+                await coordinator.async_fetch_pending()
+        except Exception:
+            _LOGGER.exception("Fetching the registered value failed for %s", type(self).__name__)
 
     # ------------------------------------------------------------------
     # Safe coordinator refresh
     # ------------------------------------------------------------------
 
-    async def _safe_refresh(self, coordinator: DataUpdateCoordinator, name: str = "") -> None:
-        """Refresh a coordinator, swallowing exceptions to avoid entity crashes."""
+    async def _safe_refresh(
+        self,
+        coordinator: DataUpdateCoordinator,
+        name: str = "",
+        priority: RequestPriority = RequestPriority.USER_READ,
+    ) -> None:
+        """Refresh a coordinator, swallowing exceptions to avoid entity crashes.
+
+        Reads issued by the refresh are scheduled at ``priority``; the default
+        treats it as a user-initiated confirmation read after a write. The
+        refresh runs right away rather than through the coordinator's
+        debouncer, which may run it later in another caller's context and
+        so at that caller's priority.
+        """
         try:
-            await coordinator.async_request_refresh()
+            with request_priority(priority):
+                await coordinator.async_refresh()
         except Exception:
             _LOGGER.exception("Background refresh failed for %s", name)
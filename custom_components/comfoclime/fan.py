@@ -46,6 +46,7 @@ if TYPE_CHECKING:
 from . import DOMAIN
 from .constants import FanSpeed
 from .entity_base import ComfoClimeBaseEntity
+from .infrastructure import DEBOUNCED
 from .models import DashboardUpdate, DeviceConfig
 
 _LOGGER = logging.getLogger(__name__)
@@ -91,11 +92,18 @@ class ComfoClimeFan(ComfoClimeBaseEntity, CoordinatorEntity, FanEntity):
         fan_speed = FanSpeed.from_percentage(percentage)
         try:
             update = DashboardUpdate(fan_speed=fan_speed)
-            await self._api.async_update_dashboard(update)
+            response = await self._api.async_debounced_write(
+                "dashboard:fan_speed", lambda: self._api.async_update_dashboard(update)
+            )
+            if response is DEBOUNCED:
+                # A later speed replaced this one while the slider was moving
+                return
             self._current_speed = fan_speed
             self.async_write_ha_state()
 
-            self._hass.async_create_task(self._safe_refresh(self.coordinator, "fan"))
+            # Read the dashboard again unless the response reported the new fan speed
+            if not self.coordinator.async_apply_update_response(response, {"fan_speed": fan_speed}):
+                self._hass.async_create_task(self._safe_refresh(self.coordinator, "fan"))
         except (TimeoutError, aiohttp.ClientError) as err:
             _LOGGER.exception("Error setting fan speed")
             raise HomeAssistantError(f"Failed to set fan speed: {err}") from err
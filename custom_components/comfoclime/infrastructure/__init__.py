@@ -2,6 +2,8 @@
 
 This package contains core infrastructure components:
 - API utilities (decorators, rate limiting, caching)
+- Priority request scheduling
+- Device-wide polling schedule and request budget
 - Validation logic
 - Error definitions
 - Access tracking
@@ -9,14 +11,21 @@ This package contains core infrastructure components:
 
 # Re-export commonly used components for backward compatibility
 from .api import (
+    DEBOUNCED,
+    DEFAULT_ADAPTIVE_MAX_INTERVAL,
+    DEFAULT_ADAPTIVE_MIN_INTERVAL,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_STALE_TTL,
     DEFAULT_CACHE_TTL,
     DEFAULT_MIN_REQUEST_INTERVAL,
     DEFAULT_REQUEST_DEBOUNCE,
     DEFAULT_WRITE_COOLDOWN,
+    DEFAULT_WRITE_DEADLINE,
     RateLimiterCache,
     api_get,
     api_put,
 )
+from .cache import DeviceCache
 from .errors import (
     ComfoClimeAPIError,
     ComfoClimeConnectionError,
@@ -24,6 +33,14 @@ from .errors import (
     ComfoClimeTimeoutError,
     ComfoClimeValidationError,
 )
+from .polling import DEFAULT_ADAPTIVE_POLL_MAX_INTERVAL, DEFAULT_REQUEST_BUDGET, AdaptivePollPeriod, PollingScheduler
+from .scheduler import (
+    DEFAULT_STARVATION_TIMEOUT,
+    RequestPriority,
+    RequestScheduler,
+    current_request_priority,
+    request_priority,
+)
 from .tracking import AccessTracker
 from .validation import (
     validate_byte_value,
@@ -33,23 +50,44 @@ from .validation import (
 )
 
 __all__ = [
+    # Debouncing
+    "DEBOUNCED",
+    # Adaptive rate control
+    "DEFAULT_ADAPTIVE_MAX_INTERVAL",
+    "DEFAULT_ADAPTIVE_MIN_INTERVAL",
+    "DEFAULT_ADAPTIVE_POLL_MAX_INTERVAL",
+    "DEFAULT_CACHE_MAX_ENTRIES",
+    "DEFAULT_CACHE_STALE_TTL",
     "DEFAULT_CACHE_TTL",
     # API constants
     "DEFAULT_MIN_REQUEST_INTERVAL",
+    # Polling
+    "DEFAULT_REQUEST_BUDGET",
     "DEFAULT_REQUEST_DEBOUNCE",
+    # Scheduling
+    "DEFAULT_STARVATION_TIMEOUT",
     "DEFAULT_WRITE_COOLDOWN",
+    "DEFAULT_WRITE_DEADLINE",
     # Tracking
     "AccessTracker",
+    "AdaptivePollPeriod",
     "ComfoClimeAPIError",
     "ComfoClimeConnectionError",
     # Errors
     "ComfoClimeError",
     "ComfoClimeTimeoutError",
     "ComfoClimeValidationError",
+    # Caching
+    "DeviceCache",
+    "PollingScheduler",
     "RateLimiterCache",
+    "RequestPriority",
+    "RequestScheduler",
     # API decorators and utilities
     "api_get",
     "api_put",
+    "current_request_priority",
+    "request_priority",
     "validate_byte_value",
     "validate_duration",
     # Validation
@@ -1,10 +1,12 @@
 """API infrastructure for ComfoClime integration.
 
 This module consolidates API-related functionality:
-- Rate limiting and caching (RateLimiterCache class)
+- Rate limiting and caching (RateLimiterCache class, see cache.py)
 - API decorators for unified endpoint patterns (api_get, api_put, api_post)
-- Write operation priority management
+- Priority scheduling of requests (see scheduler.py)
 - Request debouncing and cooldown periods
+- Single-flight coalescing of identical concurrent reads
+- Adaptive (AIMD) request spacing driven by device latency and errors
 """
 
 from __future__ import annotations
@@ -14,15 +16,18 @@ import contextlib
 import functools
 import inspect
 import logging
+import random
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
 from ..constants import API_DEFAULTS
 from ..models import fix_signed_temperatures_in_dict
+from .cache import DeviceCache, property_group
+from .scheduler import RequestPriority, current_request_priority, request_priority
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable, Iterator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,24 +35,84 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_MIN_REQUEST_INTERVAL = API_DEFAULTS.MIN_REQUEST_INTERVAL
 DEFAULT_WRITE_COOLDOWN = API_DEFAULTS.WRITE_COOLDOWN
 DEFAULT_REQUEST_DEBOUNCE = API_DEFAULTS.REQUEST_DEBOUNCE
+DEFAULT_WRITE_COMBINE_WINDOW = API_DEFAULTS.WRITE_COMBINE_WINDOW
 DEFAULT_CACHE_TTL = API_DEFAULTS.CACHE_TTL
+DEFAULT_CACHE_STALE_TTL = API_DEFAULTS.CACHE_STALE_TTL
+DEFAULT_CACHE_MAX_ENTRIES = API_DEFAULTS.CACHE_MAX_ENTRIES
+DEFAULT_WRITE_DEADLINE = API_DEFAULTS.WRITE_DEADLINE
+DEFAULT_RETRY_BACKOFF_MAX = API_DEFAULTS.RETRY_BACKOFF_MAX
+DEFAULT_ADAPTIVE_MIN_INTERVAL = API_DEFAULTS.ADAPTIVE_MIN_INTERVAL
+DEFAULT_ADAPTIVE_MAX_INTERVAL = API_DEFAULTS.ADAPTIVE_MAX_INTERVAL
+DEFAULT_ADAPTIVE_LATENCY_THRESHOLD = API_DEFAULTS.ADAPTIVE_LATENCY_THRESHOLD
+
+# Smoothing factor for the latency and error rate moving averages
+_EWMA_ALPHA = 0.2
+
+# Returned by debounced_request to a caller whose request a later one replaced
+DEBOUNCED = object()
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Return True if a request error indicates an overloaded device.
+
+    Timeouts, connection failures and 5xx responses count as overload. Client
+    errors such as a 404 for an unknown property mean the device answered
+    fine and must not slow down polling.
+
+    Args:
+        error: Exception raised by the request
+
+    Returns:
+        True if the error should back off the request rate
+    """
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500
+    return isinstance(error, (TimeoutError, aiohttp.ClientError))
 
 
 class RateLimiterCache:
     """Manages rate limiting and caching for API requests.
 
     This class provides:
-    - Rate limiting to prevent overwhelming the API
-    - Write priority mechanism to ensure writes always succeed before reads
+    - Rate limiting to prevent overwhelming the API, using per-class send time
+      reservations so waiters sleep without holding the device slot
     - Write cooldown to ensure reads after writes are stable
     - Request debouncing to prevent rapid successive calls
-    - TTL-based caching for telemetry and property reads
+    - Bounded (LRU) TTL-based caching for telemetry and property reads,
+      indexed by device so a device, property group or single entry can be
+      invalidated without scanning the cache, with a
+      stale window: expired values are still served for cache_stale_ttl
+      seconds while schedule_refresh revalidates them in the background
+    - Write-through of written properties: write_through_property stores the
+      written value as unconfirmed and only invalidates its property group.
+      Polls are served the unconfirmed value, reads above poll priority (the
+      read-back after the write) go to the device and confirm it
+    - Optional adaptive rate control: response latency and overload errors
+      are tracked, and the request interval grows multiplicatively when the
+      device struggles and shrinks additively while it is healthy (AIMD),
+      bounded by adaptive_min_interval and adaptive_max_interval. The write
+      cooldown (and, through delay_scale, the coordinators' inter-sensor
+      delay) scale with the learned interval.
 
     Attributes:
-        min_request_interval: Minimum seconds between any requests
+        min_request_interval: Minimum seconds between any requests (learned in adaptive mode)
         write_cooldown: Seconds to wait after write before allowing reads
         request_debounce: Debounce time for rapid successive requests
+        write_combine_window: Seconds concurrent writes to one endpoint are collected into one request
         cache_ttl: Cache time-to-live in seconds (0 = disabled)
+        cache_stale_ttl: Seconds after expiry during which stale values are served
+        cache_max_entries: Maximum number of entries per cache
+        cache_hits: Lookups answered with a fresh value
+        cache_misses: Lookups that found no usable value
+        cache_stale_hits: Lookups answered with a stale value
+        cache_evictions: Entries evicted to stay within cache_max_entries
+        adaptive: Whether the request interval adapts to device health
+        adaptive_min_interval: Lower bound for the learned request interval
+        adaptive_max_interval: Upper bound for the learned request interval
+        latency_threshold: Response time in seconds treated as overload
+        latency: Moving average of response times in seconds (None until the first response)
+        error_rate: Moving average of the fraction of requests failing with overload errors
+        device_requests: HTTP requests sent to the device
     """
 
     def __init__(
@@ -56,32 +121,84 @@ class RateLimiterCache:
         write_cooldown: float = DEFAULT_WRITE_COOLDOWN,
         request_debounce: float = DEFAULT_REQUEST_DEBOUNCE,
         cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_stale_ttl: float = DEFAULT_CACHE_STALE_TTL,
+        cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        adaptive: bool = False,
+        adaptive_min_interval: float = DEFAULT_ADAPTIVE_MIN_INTERVAL,
+        adaptive_max_interval: float = DEFAULT_ADAPTIVE_MAX_INTERVAL,
+        latency_threshold: float = DEFAULT_ADAPTIVE_LATENCY_THRESHOLD,
+        write_combine_window: float = DEFAULT_WRITE_COMBINE_WINDOW,
     ):
         """Initialize the RateLimiterCache.
 
         Args:
-            min_request_interval: Minimum seconds between any requests
+            min_request_interval: Minimum seconds between any requests; the
+                starting point of the learned interval in adaptive mode
             write_cooldown: Seconds to wait after write before allowing reads
             request_debounce: Debounce time for rapid successive requests
             cache_ttl: Cache time-to-live in seconds (0 = disabled)
+            cache_stale_ttl: Seconds after expiry during which stale values are
+                served while being refreshed (0 = never serve stale values)
+            cache_max_entries: Maximum number of entries per cache
+            adaptive: Adapt the request interval to device latency and errors
+            adaptive_min_interval: Lower bound for the learned request interval
+            adaptive_max_interval: Upper bound for the learned request interval
+            latency_threshold: Response time in seconds treated as overload
+            write_combine_window: Seconds concurrent writes to one endpoint are
+                collected into one request (0 = send each write on its own)
         """
         self.min_request_interval = min_request_interval
         self.write_cooldown = write_cooldown
         self.request_debounce = request_debounce
+        self.write_combine_window = write_combine_window
         self.cache_ttl = cache_ttl
+        self.cache_stale_ttl = cache_stale_ttl
+        self.cache_max_entries = cache_max_entries
+
+        # Adaptive rate control state
+        self.adaptive = adaptive
+        self.adaptive_min_interval = adaptive_min_interval
+        self.adaptive_max_interval = max(adaptive_max_interval, adaptive_min_interval)
+        self.latency_threshold = latency_threshold
+        self.latency: float | None = None
+        self.error_rate: float = 0.0
+        self.device_requests: int = 0
+        self._last_backoff_time: float = float("-inf")
+        if adaptive:
+            self.min_request_interval = self._clamp_interval(min_request_interval)
+        # Configured values the learned interval is scaled against
+        self._base_request_interval = self.min_request_interval
+        self._base_write_cooldown = write_cooldown
 
         # Rate limiting state
         self._last_request_time: float = 0.0
         self._last_write_time: float = 0.0
-        self._pending_requests: dict[str, asyncio.Task] = {}
-
-        # Write priority mechanism
-        # When a write is pending, reads should yield to allow the write to proceed
-        self._pending_writes: int = 0
-
-        # Cache storage: {cache_key: (value, timestamp)}
-        self._telemetry_cache: dict[str, tuple] = {}
-        self._property_cache: dict[str, tuple] = {}
+        self._next_send_time: dict[RequestPriority, float] = dict.fromkeys(RequestPriority, 0.0)
+        # Debounced requests waiting for their window to pass: {key: replaced event}
+        self._pending_requests: dict[str, asyncio.Event] = {}
+        self.debounced_requests: int = 0
+        # Combined writes collecting fields: {key: (merged fields, task sending them)}
+        self._pending_writes: dict[str, tuple[dict[str, Any], asyncio.Task]] = {}
+        self.combined_writes: int = 0
+
+        # Single-flight state: {request_key: in-flight task}
+        self._inflight_reads: dict[str, asyncio.Task] = {}
+        self._inflight_waiters: dict[str, int] = {}
+        self.coalesced_requests: int = 0
+
+        # Cache storage indexed by device: {device_uuid: {data_id: entry}}
+        self._telemetry_cache = DeviceCache(cache_max_entries)
+        self._property_cache = DeviceCache(cache_max_entries)
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+        self.cache_stale_hits: int = 0
+        self.cache_evictions: int = 0
+
+        # Background revalidation of stale cache entries: {(device_uuid, data_id): task}
+        self._refresh_tasks: dict[tuple[str, str], asyncio.Task] = {}
+
+        # Written property values not read back from the device yet
+        self._unconfirmed_properties: set[tuple[str, str]] = set()
 
     # -------------------------------------------------------------------------
     # Time utilities
@@ -91,225 +208,588 @@ class RateLimiterCache:
         """Get current monotonic time for rate limiting."""
         return asyncio.get_event_loop().time()
 
+    def timestamp(self) -> float:
+        """Return the current time, for values checked with is_fresh later."""
+        return self._get_current_time()
+
+    def is_fresh(self, stored: float) -> bool:
+        """Return whether a value stored at ``stored`` is still within the cache TTL."""
+        return self._get_current_time() - stored < self.cache_ttl
+
     # -------------------------------------------------------------------------
-    # Write priority methods
+    # Rate limiting methods
     # -------------------------------------------------------------------------
 
-    def signal_write_pending(self) -> None:
-        """Signal that a write operation is pending.
+    def _time_until_allowed(self, is_write: bool) -> float:
+        """Seconds until a request may be sent, based on the last actual sends."""
+        current_time = self._get_current_time()
+        wait_time = self._last_request_time + self.min_request_interval - current_time
+        # Write operations skip the cooldown check - they always have priority
+        if not is_write:
+            wait_time = max(wait_time, self._last_write_time + self.write_cooldown - current_time)
+        return max(wait_time, 0.0)
+
+    def reserve(self, is_write: bool = False) -> float:
+        """Reserve the next send time for the current request class.
 
-        This should be called before acquiring the lock for a write operation.
-        Read operations will check this flag and yield priority to writes.
-        """
-        self._pending_writes += 1
-        _LOGGER.debug("Write pending signaled (count: %d)", self._pending_writes)
+        Each class (writes, and reads per request priority) hands out time
+        slots spaced by ``min_request_interval``, so queued requests of one
+        class are spread out instead of racing for the same instant. Classes
+        do not wait for each other's reservations; the scheduler decides the
+        order and ``claim_send`` enforces the spacing at the device.
 
-    def signal_write_complete(self) -> None:
-        """Signal that a write operation has completed.
+        Args:
+            is_write: True if this is a write operation
 
-        This should be called after a write operation is done.
+        Returns:
+            Event loop time at which the request may be sent
         """
-        self._pending_writes = max(0, self._pending_writes - 1)
-        _LOGGER.debug("Write complete signaled (count: %d)", self._pending_writes)
+        request_class = RequestPriority.WRITE if is_write else current_request_priority()
+        send_time = max(
+            self._get_current_time() + self._time_until_allowed(is_write),
+            self._next_send_time[request_class],
+        )
+        self._next_send_time[request_class] = send_time + self.min_request_interval
+        return send_time
+
+    async def wait_for_rate_limit(self, is_write: bool = False) -> None:
+        """Wait for a reserved send time to respect rate limits.
 
-    def has_pending_writes(self) -> bool:
-        """Check if there are pending write operations.
+        This is awaited *before* entering the request scheduler, so any
+        number of requests can sleep towards their reservations concurrently
+        without holding the device slot.
 
-        Returns:
-            True if there are write operations waiting to be processed.
+        For write operations: Only applies minimum request interval.
+        For read operations: Also waits for write cooldown period.
+
+        Args:
+            is_write: True if this is a write operation
         """
-        return self._pending_writes > 0
+        wait_time = self.reserve(is_write) - self._get_current_time()
+        if wait_time > 0:
+            _LOGGER.debug(
+                "Rate limiting (%s): waiting %.2fs before request",
+                "write" if is_write else "read",
+                wait_time,
+            )
+            await asyncio.sleep(wait_time)
 
-    async def yield_to_writes(self, max_wait: float = 0.5) -> None:
-        """Yield to pending write operations.
+    async def claim_send(self, is_write: bool = False, may_defer: bool = True) -> bool:
+        """Claim the right to send now, called while holding the device slot.
 
-        Read operations call this to allow pending writes to proceed first.
-        This ensures writes always have priority over reads.
+        Reservations are made before scheduling, so another request (typically
+        a write) may have been sent in the meantime. Short remaining waits of
+        at most ``min_request_interval`` are slept here; a read that would have
+        to sit out a write cooldown is deferred instead, so it can release the
+        slot and wait outside of it.
 
         Args:
-            max_wait: Maximum time to wait for writes in seconds (default: 0.5)
+            is_write: True if this is a write operation
+            may_defer: False if the caller cannot release the slot (skip_lock)
+
+        Returns:
+            True if the request was recorded and may be sent now, False if the
+            caller should release the slot and call wait_for_rate_limit again.
         """
-        if not self.has_pending_writes():
-            return
+        wait_time = self._time_until_allowed(is_write)
+        if may_defer and wait_time > self.min_request_interval:
+            _LOGGER.debug("Deferring %s request for %.2fs", "write" if is_write else "read", wait_time)
+            return False
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
 
-        _LOGGER.debug("Read yielding to %d pending writes", self._pending_writes)
-        # Give writes a short window to acquire the lock
-        await asyncio.sleep(min(max_wait, 0.1))
+        # Record the actual send
+        self._last_request_time = self._get_current_time()
+        if is_write:
+            self._last_write_time = self._last_request_time
+        return True
 
     # -------------------------------------------------------------------------
-    # Rate limiting methods
+    # Adaptive rate control
     # -------------------------------------------------------------------------
 
-    async def wait_for_rate_limit(self, is_write: bool = False) -> None:
-        """Wait if necessary to respect rate limits.
+    def _clamp_interval(self, interval: float) -> float:
+        """Clamp a request interval to the adaptive bounds."""
+        return min(max(interval, self.adaptive_min_interval), self.adaptive_max_interval)
 
-        For write operations: Only applies minimum request interval.
-        For read operations: Also waits for write cooldown period.
+    @property
+    def delay_scale(self) -> float:
+        """Factor by which the learned interval differs from the configured one.
 
-        Write operations have priority - they skip write cooldown checks.
+        Used to scale the write cooldown and the coordinators' inter-sensor
+        delay along with the request interval. Always 1.0 unless adaptive.
+        """
+        if not self.adaptive or self._base_request_interval <= 0:
+            return 1.0
+        return self.min_request_interval / self._base_request_interval
+
+    def _set_interval(self, interval: float) -> None:
+        """Apply a learned request interval and scale the write cooldown with it."""
+        self.min_request_interval = self._clamp_interval(interval)
+        self.write_cooldown = self._base_write_cooldown * self.delay_scale
+
+    @contextlib.contextmanager
+    def track_request(self) -> Iterator[None]:
+        """Measure the enclosed HTTP request and feed it to rate control.
+
+        Example:
+            with self._rate_limiter.track_request():
+                async with session.get(url) as response:
+                    ...
+        """
+        self.device_requests += 1
+        sent_at = self._get_current_time()
+        try:
+            yield
+        except (TimeoutError, aiohttp.ClientError) as e:
+            self.record_result(self._get_current_time() - sent_at, not is_overload_error(e), sent_at)
+            raise
+        self.record_result(self._get_current_time() - sent_at, True, sent_at)
+
+    def record_result(self, latency: float, success: bool, sent_at: float | None = None) -> None:
+        """Record the outcome of a request and adapt the request interval.
+
+        Latency and error rate are always tracked. In adaptive mode a failed
+        or slow request multiplies the interval by ADAPTIVE_INCREASE_FACTOR,
+        while each healthy response subtracts ADAPTIVE_DECREASE_STEP. Only
+        requests sent after the previous increase can trigger another one, so
+        a burst of requests failing together counts as a single overload.
 
         Args:
-            is_write: True if this is a write operation (will set cooldown after)
+            latency: Seconds from sending the request until it completed or failed
+            success: False if the request failed with an overload error
+            sent_at: Event loop time the request was sent (defaults to now - latency)
         """
-        current_time = self._get_current_time()
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += _EWMA_ALPHA * (latency - self.latency)
+        self.error_rate += _EWMA_ALPHA * ((0.0 if success else 1.0) - self.error_rate)
 
-        # Calculate minimum wait time
-        time_since_last_request = current_time - self._last_request_time
-        time_since_last_write = current_time - self._last_write_time
+        if not self.adaptive:
+            return
 
-        wait_time = 0.0
+        if success and latency <= self.latency_threshold:
+            self._set_interval(self.min_request_interval - API_DEFAULTS.ADAPTIVE_DECREASE_STEP)
+            return
 
-        # Ensure minimum interval between requests
-        if time_since_last_request < self.min_request_interval:
-            wait_time = max(wait_time, self.min_request_interval - time_since_last_request)
+        if sent_at is None:
+            sent_at = self._get_current_time() - latency
+        if sent_at < self._last_backoff_time:
+            return
+        self._last_backoff_time = self._get_current_time()
+        previous = self.min_request_interval
+        self._set_interval(previous * API_DEFAULTS.ADAPTIVE_INCREASE_FACTOR)
+        if self.min_request_interval != previous:
+            _LOGGER.info(
+                "Device %s (latency %.2fs), increasing request interval from %.2fs to %.2fs",
+                "slow" if success else "failing",
+                latency,
+                previous,
+                self.min_request_interval,
+            )
 
-        # If this is a read and we recently wrote, wait for cooldown
-        # Write operations skip this check - they always have priority
-        if not is_write and time_since_last_write < self.write_cooldown:
-            wait_time = max(wait_time, self.write_cooldown - time_since_last_write)
+    def rate_control_state(self) -> dict[str, float | None]:
+        """Return the learned rate control values (for sensors and persistence)."""
+        return {
+            "request_interval": self.min_request_interval,
+            "write_cooldown": self.write_cooldown,
+            "latency": self.latency,
+            "error_rate": self.error_rate,
+        }
 
-        if wait_time > 0:
-            _LOGGER.debug(
-                "Rate limiting (%s): waiting %.2fs before request",
-                "write" if is_write else "read",
-                wait_time,
-            )
-            await asyncio.sleep(wait_time)
+    def restore_rate_control_state(self, state: dict[str, Any]) -> None:
+        """Restore values saved by rate_control_state, e.g. after a restart.
 
-        # Update last request time
-        self._last_request_time = self._get_current_time()
+        Only the request interval is taken over when adaptive; it is clamped
+        to the current bounds in case the options changed in between.
 
-        # If this is a write, update write time
-        if is_write:
-            self._last_write_time = self._get_current_time()
+        Args:
+            state: Dictionary as returned by rate_control_state
+        """
+        try:
+            if state.get("latency") is not None:
+                self.latency = float(state["latency"])
+            self.error_rate = float(state.get("error_rate", 0.0))
+            if self.adaptive and state.get("request_interval") is not None:
+                self._set_interval(float(state["request_interval"]))
+        except TypeError, ValueError:
+            _LOGGER.warning("Ignoring invalid stored rate control state: %s", state)
+            return
+        _LOGGER.debug("Restored rate control state: %s", self.rate_control_state())
 
     async def debounced_request(
         self,
         key: str,
-        coro_factory,
+        coro_factory: Callable[[], Awaitable[Any]],
         debounce_time: float | None = None,
-    ):
-        """Execute a request with debouncing to prevent rapid successive calls.
+    ) -> Any:
+        """Execute a request once no other request with the same key followed within debounce_time.
 
-        If the same request (identified by key) is called again within debounce_time,
-        the previous pending request is cancelled and a new one is scheduled.
+        Latest wins: a request with the same key arriving inside the window
+        replaces the waiting one, whose caller returns DEBOUNCED right away.
+        Rapid successive writes to one target (e.g. a slider being dragged)
+        reach the device as a single write of the last value. A request
+        arriving while the previous one is being sent starts a new window.
 
         Args:
-            key: Unique identifier for this request type
+            key: Identifier of the request target (e.g. the written field)
             coro_factory: Callable that returns the coroutine to execute
-            debounce_time: Time to wait before executing (allows cancellation)
+            debounce_time: Quiet period before executing (default: request_debounce)
 
         Returns:
-            Result of the request
+            Result of the request, or DEBOUNCED if a later request replaced it
         """
         if debounce_time is None:
             debounce_time = self.request_debounce
+        if debounce_time <= 0:
+            return await coro_factory()
+
+        if (previous := self._pending_requests.get(key)) is not None:
+            previous.set()
+        replaced = asyncio.Event()
+        self._pending_requests[key] = replaced
+        try:
+            await asyncio.wait_for(replaced.wait(), debounce_time)
+        except TimeoutError:
+            pass
+        else:
+            self.debounced_requests += 1
+            _LOGGER.debug("Request %s replaced by a later one", key)
+            return DEBOUNCED
+        finally:
+            if self._pending_requests.get(key) is replaced:
+                del self._pending_requests[key]
+
+        return await coro_factory()
 
-        # Cancel any pending request with the same key
-        if key in self._pending_requests:
-            pending_task = self._pending_requests[key]
-            if not pending_task.done():
-                pending_task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await pending_task
+    async def combined_write(
+        self,
+        key: str,
+        fields: dict[str, Any],
+        send: Callable[[dict[str, Any]], Awaitable[Any]],
+        window: float | None = None,
+    ) -> Any:
+        """Send fields together with those of other writes with the same key in one request.
+
+        The first caller opens a batch that is sent once the window has
+        passed; writes arriving meanwhile merge their fields into it, later
+        values winning for fields set more than once. All callers receive
+        the shared result (or exception). A write arriving while the batch
+        is being sent opens a new one. Cancelling a caller does not withdraw
+        its fields, since the batch is sent for the others as well.
 
-        # Wait for debounce time
-        await asyncio.sleep(debounce_time)
+        Args:
+            key: Identifier of the written endpoint (e.g. "dashboard")
+            fields: Fields to write
+            send: Callable sending the merged fields and returning the result
+            window: Seconds to collect writes (default: write_combine_window)
 
-        # Execute the actual request
-        return await coro_factory()
+        Returns:
+            Result of the shared request
+        """
+        if window is None:
+            window = self.write_combine_window
+        if window <= 0:
+            return await send(fields)
+
+        if (pending := self._pending_writes.get(key)) is not None:
+            batch, task = pending
+            batch.update(fields)
+            self.combined_writes += 1
+            _LOGGER.debug("Combining write to %s with pending write: %s", key, batch)
+        else:
+            batch = dict(fields)
+
+            async def _send_batch() -> Any:
+                try:
+                    await asyncio.sleep(window)
+                finally:
+                    if self._pending_writes.get(key, (None,))[0] is batch:
+                        del self._pending_writes[key]
+                return await send(batch)
+
+            task = asyncio.ensure_future(_send_batch())
+            self._pending_writes[key] = (batch, task)
+
+        return await asyncio.shield(task)
+
+    async def single_flight(self, key: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Execute a read once for all concurrent callers with the same key.
+
+        The first caller starts the request; callers arriving while it is
+        still in flight await the same result (or exception) instead of
+        queuing a duplicate request. The request is only cancelled when
+        every waiting caller has been cancelled.
+
+        Args:
+            key: Unique identifier of the request (e.g. the resolved URL)
+            coro_factory: Callable that returns the coroutine to execute
+
+        Returns:
+            Result of the shared request
+        """
+        task = self._inflight_reads.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_factory())
+            self._inflight_reads[key] = task
+            self._inflight_waiters[key] = 0
+
+            def _cleanup(done: asyncio.Task) -> None:
+                if self._inflight_reads.get(key) is done:
+                    del self._inflight_reads[key]
+                    del self._inflight_waiters[key]
+
+            task.add_done_callback(_cleanup)
+        else:
+            self.coalesced_requests += 1
+            _LOGGER.debug("Coalescing request %s with in-flight request", key)
+
+        self._inflight_waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # Only cancel the shared request once nobody is waiting for it anymore
+            if not task.done() and self._inflight_reads.get(key) is task:
+                self._inflight_waiters[key] -= 1
+                if self._inflight_waiters[key] <= 0:
+                    task.cancel()
+            raise
 
     # -------------------------------------------------------------------------
     # Cache utilities
     # -------------------------------------------------------------------------
 
-    @staticmethod
-    def get_cache_key(device_uuid: str, data_id: str) -> str:
-        """Generate a cache key from device UUID and data ID.
+    def _cache_lookup(
+        self,
+        cache: DeviceCache,
+        device_uuid: str,
+        data_id: str,
+        allow_stale: bool = True,
+    ) -> tuple[Any, bool] | None:
+        """Look up a cache entry and update LRU order and counters.
 
         Args:
+            cache: Cache to look in
             device_uuid: UUID of the device
             data_id: Telemetry ID or property path
+            allow_stale: Return values inside the stale window (otherwise a miss)
 
         Returns:
-            Cache key string
+            (value, is_stale) or None if not found or past the stale window
         """
-        return f"{device_uuid}:{data_id}"
+        now = self._get_current_time()
+        entry = cache.get(device_uuid, data_id, now)
+        if entry is not None:
+            age = now - entry.stored
+            if self.cache_ttl == 0 or age >= self.cache_ttl + self.cache_stale_ttl:
+                # Cache disabled or past the stale window, remove it
+                cache.discard(device_uuid, data_id)
+            elif age < self.cache_ttl:
+                self.cache_hits += 1
+                return entry.value, False
+            elif allow_stale:
+                self.cache_stale_hits += 1
+                return entry.value, True
+        self.cache_misses += 1
+        return None
 
-    def _is_cache_valid(self, timestamp: float) -> bool:
-        """Check if a cached value is still valid.
+    def _cache_store(self, cache: DeviceCache, device_uuid: str, data_id: str, value) -> None:
+        """Store a value with the current timestamp, evicting least recently used entries."""
+        evictions = cache.evictions
+        cache.set(device_uuid, data_id, value, self._get_current_time())
+        self.cache_evictions += cache.evictions - evictions
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return cache hit, miss, stale hit and eviction counters."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "stale_hits": self.cache_stale_hits,
+            "evictions": self.cache_evictions,
+            "entries": len(self._telemetry_cache) + len(self._property_cache),
+        }
+
+    def schedule_refresh(self, device_uuid: str, data_id: str, coro_factory: Callable[[], Awaitable[Any]]) -> None:
+        """Revalidate a stale cache entry in the background.
+
+        At most one refresh per key runs at a time. Refreshes are background
+        work and always run at polling priority, even when the stale value was
+        served to a user-initiated read. Failures are logged and otherwise
+        ignored: the stale value keeps being served until its window ends.
 
         Args:
-            timestamp: Timestamp when the value was cached
+            device_uuid: UUID of the device
+            data_id: Telemetry ID or property path of the stale entry
+            coro_factory: Callable that returns a coroutine re-reading and caching the value
+        """
+        key = (device_uuid, data_id)
+        if key in self._refresh_tasks:
+            return
 
-        Returns:
-            True if cache is still valid, False otherwise
+        async def _refresh() -> None:
+            with request_priority(RequestPriority.POLL):
+                try:
+                    await coro_factory()
+                except (TimeoutError, aiohttp.ClientError) as e:
+                    _LOGGER.debug("Background refresh of %s:%s failed: %s", device_uuid, data_id, e)
+
+        task = asyncio.ensure_future(_refresh())
+        self._refresh_tasks[key] = task
+
+        def _cleanup(done: asyncio.Task) -> None:
+            if self._refresh_tasks.get(key) is done:
+                del self._refresh_tasks[key]
+
+        task.add_done_callback(_cleanup)
+
+    def cancel_refreshes(self) -> None:
+        """Cancel all pending background cache refreshes."""
+        for task in self._refresh_tasks.values():
+            task.cancel()
+        self._refresh_tasks.clear()
+
+    def _cancel_refreshes_where(self, predicate: Callable[[str, str], bool]) -> None:
+        """Cancel pending refreshes whose (device_uuid, data_id) match predicate.
+
+        Only stale entries have a refresh, so this scans a handful of tasks at
+        most, not the cache.
         """
-        if self.cache_ttl == 0:
-            return False  # Cache disabled
-        return (self._get_current_time() - timestamp) < self.cache_ttl
+        for key in [k for k in self._refresh_tasks if predicate(*k)]:
+            self._refresh_tasks.pop(key).cancel()
 
     # -------------------------------------------------------------------------
     # Telemetry cache methods
     # -------------------------------------------------------------------------
 
-    def get_telemetry_from_cache(self, cache_key: str):
+    def lookup_telemetry(self, device_uuid: str, telemetry_id: str) -> tuple[Any, bool] | None:
+        """Get a telemetry value from cache, including stale values.
+
+        Args:
+            device_uuid: UUID of the device
+            telemetry_id: Telemetry ID
+
+        Returns:
+            (value, is_stale) or None if not found/past the stale window
+        """
+        return self._cache_lookup(self._telemetry_cache, device_uuid, telemetry_id)
+
+    def get_telemetry_from_cache(self, device_uuid: str, telemetry_id: str):
         """Get a telemetry value from cache if it's still valid.
 
         Args:
-            cache_key: Cache key (use get_cache_key to generate)
+            device_uuid: UUID of the device
+            telemetry_id: Telemetry ID
 
         Returns:
             Cached value or None if not found/expired
         """
-        if cache_key in self._telemetry_cache:
-            value, timestamp = self._telemetry_cache[cache_key]
-            if self._is_cache_valid(timestamp):
-                _LOGGER.debug(f"Telemetry cache hit for {cache_key}")
-                return value
-            # Cache expired, remove it
-            del self._telemetry_cache[cache_key]
-        return None
+        entry = self._cache_lookup(self._telemetry_cache, device_uuid, telemetry_id, allow_stale=False)
+        if entry is None:
+            return None
+        _LOGGER.debug("Telemetry cache hit for %s:%s", device_uuid, telemetry_id)
+        return entry[0]
 
-    def set_telemetry_cache(self, cache_key: str, value) -> None:
+    def set_telemetry_cache(self, device_uuid: str, telemetry_id: str, value) -> None:
         """Store a telemetry value in cache with current timestamp.
 
         Args:
-            cache_key: Cache key (use get_cache_key to generate)
+            device_uuid: UUID of the device
+            telemetry_id: Telemetry ID
             value: Value to cache
         """
-        self._telemetry_cache[cache_key] = (value, self._get_current_time())
+        self._cache_store(self._telemetry_cache, device_uuid, telemetry_id, value)
 
     # -------------------------------------------------------------------------
     # Property cache methods
     # -------------------------------------------------------------------------
 
-    def get_property_from_cache(self, cache_key: str):
+    def lookup_property(self, device_uuid: str, property_path: str) -> tuple[Any, bool] | None:
+        """Get a property value from cache, including stale values.
+
+        An unconfirmed write-through value is a miss for reads above poll
+        priority, so the read-back after a write reaches the device.
+
+        Args:
+            device_uuid: UUID of the device
+            property_path: Property path (X/Y/Z)
+
+        Returns:
+            (value, is_stale) or None if not found/past the stale window
+        """
+        unconfirmed = (device_uuid, property_path) in self._unconfirmed_properties
+        if unconfirmed and current_request_priority() != RequestPriority.POLL:
+            self.cache_misses += 1
+            return None
+        return self._cache_lookup(self._property_cache, device_uuid, property_path)
+
+    def get_property_from_cache(self, device_uuid: str, property_path: str):
         """Get a property value from cache if it's still valid.
 
         Args:
-            cache_key: Cache key (use get_cache_key to generate)
+            device_uuid: UUID of the device
+            property_path: Property path (X/Y/Z)
 
         Returns:
             Cached value or None if not found/expired
         """
-        if cache_key in self._property_cache:
-            value, timestamp = self._property_cache[cache_key]
-            if self._is_cache_valid(timestamp):
-                _LOGGER.debug(f"Property cache hit for {cache_key}")
-                return value
-            # Cache expired, remove it
-            del self._property_cache[cache_key]
-        return None
+        entry = self._cache_lookup(self._property_cache, device_uuid, property_path, allow_stale=False)
+        if entry is None:
+            return None
+        _LOGGER.debug("Property cache hit for %s:%s", device_uuid, property_path)
+        return entry[0]
 
-    def set_property_cache(self, cache_key: str, value) -> None:
+    def set_property_cache(self, device_uuid: str, property_path: str, value) -> None:
         """Store a property value in cache with current timestamp.
 
         Args:
-            cache_key: Cache key (use get_cache_key to generate)
+            device_uuid: UUID of the device
+            property_path: Property path (X/Y/Z)
             value: Value to cache
         """
-        self._property_cache[cache_key] = (value, self._get_current_time())
+        self._cache_store(self._property_cache, device_uuid, property_path, value)
+        self._unconfirmed_properties.discard((device_uuid, property_path))
+
+    def known_property(self, device_uuid: str, property_path: str) -> Any:
+        """Return a property value read from the device within the cache TTL.
+
+        Unlike a lookup, this does not count as a cache hit or miss.
+
+        Args:
+            device_uuid: UUID of the device
+            property_path: Property path (X/Y/Z)
+
+        Returns:
+            Cached value, or None if it is expired, unconfirmed or not cached
+        """
+        if (device_uuid, property_path) in self._unconfirmed_properties:
+            return None
+        now = self._get_current_time()
+        entry = self._property_cache.get(device_uuid, property_path, now)
+        if entry is None or now - entry.stored >= self.cache_ttl:
+            return None
+        return entry.value
+
+    def write_through_property(self, device_uuid: str, property_path: str, value: bytes) -> None:
+        """Store a written property value as unconfirmed.
+
+        The other properties of its group ``X/Y`` may have changed with it
+        and are invalidated, the rest of the device's cache is kept.
+
+        Args:
+            device_uuid: UUID of the device
+            property_path: Property path (X/Y/Z)
+            value: Raw bytes as sent to the device
+        """
+        group = property_group(property_path)
+        if group is not None:
+            self.invalidate_property_group(device_uuid, group)
+        self._cache_store(self._property_cache, device_uuid, property_path, value)
+        self._unconfirmed_properties.add((device_uuid, property_path))
+
+    def is_property_unconfirmed(self, device_uuid: str, property_path: str) -> bool:
+        """Return whether a written property value has not been read back yet."""
+        return (device_uuid, property_path) in self._unconfirmed_properties
 
     # -------------------------------------------------------------------------
     # Cache invalidation
@@ -321,22 +801,43 @@ class RateLimiterCache:
         Args:
             device_uuid: UUID of the device
         """
-        # Remove telemetry cache entries for this device
-        keys_to_remove = [k for k in self._telemetry_cache if k.startswith(f"{device_uuid}:")]
-        for k in keys_to_remove:
-            del self._telemetry_cache[k]
+        self._telemetry_cache.discard_device(device_uuid)
+        self._property_cache.discard_device(device_uuid)
+        self._unconfirmed_properties = {key for key in self._unconfirmed_properties if key[0] != device_uuid}
+        # Drop refreshes that may still store a value read before the invalidation
+        self._cancel_refreshes_where(lambda uuid, _: uuid == device_uuid)
+        _LOGGER.debug("Invalidated all cache entries for device %s", device_uuid)
+
+    def invalidate_property_group(self, device_uuid: str, group: str) -> None:
+        """Invalidate all cached properties X/Y/* of one property group.
+
+        Args:
+            device_uuid: UUID of the device
+            group: Property group path (X/Y)
+        """
+        self._property_cache.discard_group(device_uuid, group)
+        self._unconfirmed_properties = {
+            key for key in self._unconfirmed_properties if key[0] != device_uuid or property_group(key[1]) != group
+        }
+        self._cancel_refreshes_where(lambda uuid, data_id: uuid == device_uuid and property_group(data_id) == group)
+        _LOGGER.debug("Invalidated property group %s for device %s", group, device_uuid)
 
-        # Remove property cache entries for this device
-        keys_to_remove = [k for k in self._property_cache if k.startswith(f"{device_uuid}:")]
-        for k in keys_to_remove:
-            del self._property_cache[k]
+    def invalidate_property(self, device_uuid: str, property_path: str) -> None:
+        """Invalidate a single cached property.
 
-        _LOGGER.debug(f"Invalidated all cache entries for device {device_uuid}")
+        Args:
+            device_uuid: UUID of the device
+            property_path: Property path (X/Y/Z)
+        """
+        self._property_cache.discard(device_uuid, property_path)
+        self._unconfirmed_properties.discard((device_uuid, property_path))
+        self._cancel_refreshes_where(lambda uuid, data_id: uuid == device_uuid and data_id == property_path)
 
     def clear_all_caches(self) -> None:
         """Clear all cached values."""
         self._telemetry_cache.clear()
         self._property_cache.clear()
+        self._unconfirmed_properties.clear()
         _LOGGER.debug("Cleared all caches")
 
 
@@ -344,13 +845,14 @@ class RateLimiterCache:
 # API Decorators
 # ============================================================================
 # The following section provides decorators for unified API method patterns,
-# handling common patterns like locking, rate limiting, session management,
-# error handling, and write operation priority.
+# handling common patterns like request scheduling, rate limiting, session
+# management, error handling, and write operation priority.
 #
-# Write Priority Mechanism:
-#     Write operations (PUT) always have priority over read operations (GET).
-#     Before a write acquires the lock, it signals its intent. Read operations
-#     check for pending writes and yield priority to allow writes to proceed first.
+# Request Scheduling:
+#     Every request passes the API's RequestScheduler, which serves one request
+#     at a time. Writes (PUT) are served first, then user-initiated reads, then
+#     background polling reads. The read class is taken from the current
+#     request_priority() context (default: POLL).
 #
 # Usage:
 #     @api_get("/system/{uuid}/dashboard", requires_uuid=True, fix_temperatures=True)
@@ -363,6 +865,23 @@ class RateLimiterCache:
 # ============================================================================
 
 
+def retry_backoff(attempt: int) -> float:
+    """Return the jittered backoff before retrying after failed attempt ``attempt``.
+
+    Uses exponential backoff (2s, 4s, 8s, ... capped at RETRY_BACKOFF_MAX) with
+    equal jitter: half of the delay is fixed, the other half random. This keeps
+    retries of concurrent writes from hitting the device in lockstep.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    delay = min(DEFAULT_RETRY_BACKOFF_MAX, 2 ** (attempt + 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
 def api_get(
     url_template: str,
     *,
@@ -376,14 +895,15 @@ def api_get(
     """Decorator for GET API endpoints.
 
     Handles:
-    - Request locking (unless skip_lock=True)
+    - Request scheduling at the current read priority (unless skip_lock=True)
     - Rate limiting
     - Session management
     - UUID retrieval (if requires_uuid=True)
     - Temperature value fixing (if fix_temperatures=True)
     - Response key extraction (if response_key is specified)
     - Error handling (if on_error is specified)
-    - Yielding to pending write operations (write priority)
+    - Coalescing of concurrent calls for the same resolved URL (single-flight);
+      late callers await the in-flight request's result instead of queuing a duplicate
 
     Args:
         url_template: URL template with placeholders (e.g., "/system/{uuid}/dashboard")
@@ -393,7 +913,7 @@ def api_get(
         response_key: Optional key to extract from response (e.g., "devices" returns data["devices"]).
         response_default: Default value when response_key is not found (default: None, uses empty dict).
         on_error: Value to return on error instead of raising exception (e.g., {} for empty dict).
-        skip_lock: Skip lock acquisition (for methods called from within locked context).
+        skip_lock: Skip scheduling (for methods called while the caller already holds the slot).
 
     Example:
         @api_get("/system/{uuid}/dashboard", requires_uuid=True, fix_temperatures=True)
@@ -402,7 +922,7 @@ def api_get(
 
         @api_get("/monitoring/ping", skip_lock=True)
         async def _async_get_uuid_internal(self, response_data):
-            # Called from within api_get decorated methods, lock already held
+            # Called from within api_get decorated methods, slot already held
             return response_data
     """
 
@@ -420,9 +940,7 @@ def api_get(
                     url_kwargs[param_name] = arg
 
             async def _execute():
-                """Execute the API call (with or without lock)."""
-                await self._wait_for_rate_limit(is_write=False)
-
+                """Execute the API call (with or without scheduling)."""
                 # Get UUID if required
                 if requires_uuid and not self.uuid:
                     await self._async_get_uuid_internal()
@@ -433,9 +951,10 @@ def api_get(
                 # Make request
                 timeout = aiohttp.ClientTimeout(total=self.read_timeout)
                 session = await self._get_session()
-                async with session.get(url, timeout=timeout) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+                with self._rate_limiter.track_request():
+                    async with session.get(url, timeout=timeout) as response:
+                        response.raise_for_status()
+                        data = await response.json()
 
                 _LOGGER.debug("API GET %s returned data: %s", url, data)
 
@@ -451,18 +970,30 @@ def api_get(
                 # Call the original function with the response data and remaining args/kwargs
                 return await func(self, data, *args, **kwargs)
 
+            priority = current_request_priority()
+
+            async def _scheduled_execute():
+                """Execute the API call once the scheduler grants the device slot."""
+                while True:
+                    # Sleep towards the reserved send time without holding the slot
+                    await self._wait_for_rate_limit(is_write=False)
+                    async with self._scheduler.slot(priority):
+                        if await self._rate_limiter.claim_send(is_write=False):
+                            return await _execute()
+
             try:
                 if skip_lock:
-                    # Execute without acquiring lock (lock already held by caller)
+                    # Execute without scheduling (slot already held by caller)
+                    # Never coalesced: joining a request that waits for the slot we hold would deadlock
+                    await self._wait_for_rate_limit(is_write=False)
+                    await self._rate_limiter.claim_send(is_write=False, may_defer=False)
                     return await _execute()
 
-                # Yield to pending writes before trying to acquire lock
-                # This ensures write operations always have priority
-                await self._rate_limiter.yield_to_writes()
-
-                # Execute with lock acquisition
-                async with self._request_lock:
-                    return await _execute()
+                # Coalesce concurrent calls for the same resolved URL and priority into one
+                # request; joining a queued lower-priority read would wait at its priority
+                url = url_template.format(uuid=self.uuid, **url_kwargs)
+                request_key = f"{func.__qualname__} {priority.name} {url}"
+                return await self._rate_limiter.single_flight(request_key, _scheduled_execute)
 
             except (TimeoutError, aiohttp.ClientError) as e:
                 if on_error is not None:
@@ -486,12 +1017,13 @@ def api_put(
     """Decorator for PUT API endpoints.
 
     Handles:
-    - Write priority signaling (writes always have priority over reads)
-    - Request locking (unless skip_lock=True)
+    - Request scheduling with write priority (unless skip_lock=True)
     - Rate limiting (write mode)
     - Session management
     - UUID retrieval (if requires_uuid=True)
-    - Retry with exponential backoff
+    - Retry with jittered exponential backoff, bounded by max_retries and
+      the per-write deadline (self.write_deadline). The device slot is released
+      between attempts; each retry is rescheduled with write priority.
     - Timestamp addition (if is_dashboard=True)
     - Error handling
 
@@ -500,7 +1032,7 @@ def api_put(
                      Supports {uuid} for system UUID and any kwarg names for other params.
         requires_uuid: Whether the endpoint requires the system UUID to be fetched first.
         is_dashboard: Whether this is a dashboard update (adds timestamp and headers).
-        skip_lock: Skip lock acquisition (for methods called from within locked context).
+        skip_lock: Skip scheduling (for methods called while the caller already holds the slot).
         allow_empty_payload: If True, still perform the PUT request even when the
             decorated function returns an empty/falsy payload (e.g. {}). Useful for
             endpoints like /system/reset that require no body.
@@ -533,10 +1065,24 @@ def api_put(
                     param_name = params[i + 1]
                     url_kwargs[param_name] = arg
 
-            async def _execute():
-                """Execute the API call (with or without lock)."""
-                await self._wait_for_rate_limit(is_write=True)
+            # Call the decorated function to get payload. An empty payload is
+            # skipped before it reserves a send time or enters the scheduler.
+            payload = await func(self, *args, **kwargs)
+
+            if not payload and not allow_empty_payload:
+                _LOGGER.debug("No fields to update (empty payload) - skipping PUT.")
+                return {} if is_dashboard else True
+
+            if payload is None:
+                payload = {}
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.write_deadline
+            # Request state built on the first attempt: (url, headers)
+            prepared: tuple[str, dict | None] | None = None
 
+            async def _prepare() -> tuple[str, dict | None]:
+                """Resolve URL and headers, called while holding the device slot."""
                 # Get UUID if required
                 if requires_uuid and not self.uuid:
                     await self._async_get_uuid_internal()
@@ -544,16 +1090,6 @@ def api_put(
                 # Build URL from template
                 url = self.base_url + url_template.format(uuid=self.uuid, **url_kwargs)
 
-                # Call the decorated function to get payload
-                payload = await func(self, *args, **kwargs)
-
-                if not payload and not allow_empty_payload:
-                    _LOGGER.debug("No fields to update (empty payload) - skipping PUT.")
-                    return {} if is_dashboard else True
-
-                if payload is None:
-                    payload = {}
-
                 # Prepare headers and add timestamp for dashboard updates
                 headers = None
                 if is_dashboard:
@@ -566,73 +1102,80 @@ def api_put(
                     payload["timestamp"] = datetime.now(tz).isoformat()
                     headers = {"content-type": "application/json; charset=utf-8"}
 
-                # Retry logic
-                last_exception = None
-                for attempt in range(self.max_retries + 1):
-                    try:
-                        timeout = aiohttp.ClientTimeout(total=self.write_timeout)
-                        session = await self._get_session()
-                        _LOGGER.debug(
-                            "PUT attempt %d/%d, timeout=%ds, payload=%s",
+                return url, headers
+
+            async def _execute(attempt: int):
+                """Execute a single PUT attempt (with or without scheduling)."""
+                nonlocal prepared
+                if prepared is None:
+                    prepared = await _prepare()
+                url, headers = prepared
+
+                await self._rate_limiter.claim_send(is_write=True, may_defer=False)
+
+                # Never let a single attempt run past the write deadline
+                attempt_timeout = min(self.write_timeout, max(deadline - loop.time(), 0.1))
+                timeout = aiohttp.ClientTimeout(total=attempt_timeout)
+                session = await self._get_session()
+                _LOGGER.debug(
+                    "PUT attempt %d/%d, timeout=%.1fs, payload=%s",
+                    attempt + 1,
+                    self.max_retries + 1,
+                    attempt_timeout,
+                    payload,
+                )
+                with self._rate_limiter.track_request():
+                    async with session.put(url, json=payload, headers=headers, timeout=timeout) as response:
+                        response.raise_for_status()
+                        if is_dashboard:
+                            try:
+                                resp_json = await response.json()
+                            except aiohttp.ContentTypeError, ValueError:
+                                resp_json = {"text": await response.text()}
+                            _LOGGER.debug("Update OK response=%s", resp_json)
+                            return resp_json
+                        _LOGGER.debug("Update OK status=%d", response.status)
+                        return response.status == 200
+
+            # Retry logic: every attempt re-enters the scheduler with write priority,
+            # and the backoff sleep happens without holding the device slot so reads
+            # can proceed while a flaky write waits for its next attempt.
+            attempt = 0
+            while True:
+                try:
+                    # Sleep towards the reserved send time without holding the slot
+                    await self._wait_for_rate_limit(is_write=True)
+                    if skip_lock:
+                        # Execute without scheduling (slot already held by caller)
+                        return await _execute(attempt)
+                    async with self._scheduler.slot(RequestPriority.WRITE):
+                        return await _execute(attempt)
+
+                except asyncio.CancelledError:
+                    # CancelledError should not be retried - it means the task was cancelled
+                    # Re-raise immediately to propagate cancellation
+                    raise
+                except (TimeoutError, aiohttp.ClientError) as e:
+                    wait_time = retry_backoff(attempt)
+                    remaining = deadline - loop.time()
+                    if attempt >= self.max_retries or remaining <= wait_time:
+                        _LOGGER.exception(
+                            "Update failed after %d attempts (%.1fs left of write deadline): %s",
                             attempt + 1,
-                            self.max_retries + 1,
-                            self.write_timeout,
-                            payload,
+                            max(remaining, 0.0),
+                            type(e).__name__,
                         )
-                        async with session.put(url, json=payload, headers=headers, timeout=timeout) as response:
-                            response.raise_for_status()
-                            if is_dashboard:
-                                try:
-                                    resp_json = await response.json()
-                                except aiohttp.ContentTypeError, ValueError:
-                                    resp_json = {"text": await response.text()}
-                                _LOGGER.debug("Update OK response=%s", resp_json)
-                                return resp_json
-                            _LOGGER.debug("Update OK status=%d", response.status)
-                            return response.status == 200
-
-                    except asyncio.CancelledError:
-                        # CancelledError should not be retried - it means the task was cancelled
-                        # Re-raise immediately to propagate cancellation
                         raise
-                    except (TimeoutError, aiohttp.ClientError) as e:
-                        last_exception = e
-                        if attempt < self.max_retries:
-                            wait_time = 2 ** (attempt + 1)
-                            _LOGGER.warning(
-                                "Update failed (attempt %d/%d), retrying in %ds: %s: %s",
-                                attempt + 1,
-                                self.max_retries + 1,
-                                wait_time,
-                                type(e).__name__,
-                                e,
-                            )
-                            await asyncio.sleep(wait_time)
-                        else:
-                            _LOGGER.exception(
-                                "Update failed after %d attempts: %s",
-                                self.max_retries + 1,
-                                type(e).__name__,
-                            )
-
-                if last_exception:
-                    raise last_exception
-                raise RuntimeError("Update failed with unknown error")
-
-            if skip_lock:
-                # Execute without acquiring lock (lock already held by caller)
-                return await _execute()
-
-            # Signal write intent before acquiring lock
-            # This allows read operations to yield priority to this write
-            self._rate_limiter.signal_write_pending()
-            try:
-                # Execute with lock acquisition
-                async with self._request_lock:
-                    return await _execute()
-            finally:
-                # Signal write complete
-                self._rate_limiter.signal_write_complete()
+                    _LOGGER.warning(
+                        "Update failed (attempt %d/%d), retrying in %.1fs: %s: %s",
+                        attempt + 1,
+                        self.max_retries + 1,
+                        wait_time,
+                        type(e).__name__,
+                        e,
+                    )
+                    await asyncio.sleep(wait_time)
+                    attempt += 1
 
         return wrapper
 
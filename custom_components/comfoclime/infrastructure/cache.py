@@ -0,0 +1,192 @@
+"""Device-indexed value cache for ComfoClime integration.
+
+Telemetry and property values are cached per connected device. Entries are
+stored in a two-level index ``{device_uuid: {data_id: entry}}`` instead of a
+flat dict keyed by ``f"{device_uuid}:{data_id}"``, so that:
+
+- lookups need no key construction (two dict lookups on existing strings)
+- a whole device is invalidated by dropping its index (O(1))
+- a property group ``X/Y`` is invalidated through a secondary group index
+  without scanning unrelated entries
+- a single entry is invalidated directly (O(1))
+
+The cache is bounded: when it holds more than ``max_entries`` entries the
+least recently used one is evicted. Each device keeps its entries in LRU
+order, so finding the global victim only compares one head per device.
+
+Expiry is not handled here; ``RateLimiterCache`` decides whether an entry is
+fresh, stale or expired based on its ``stored`` timestamp.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class CacheEntry:
+    """A cached value with the time it was stored and last used."""
+
+    __slots__ = ("stored", "used", "value")
+
+    def __init__(self, value: Any, stored: float) -> None:
+        self.value = value
+        self.stored = stored
+        self.used = stored
+
+
+def property_group(data_id: str) -> str | None:
+    """Return the ``X/Y`` group of a property path ``X/Y/Z`` (None for telemetry IDs)."""
+    group, sep, _ = data_id.rpartition("/")
+    return group if sep else None
+
+
+class DeviceCache:
+    """Bounded LRU cache of values indexed by device UUID and data ID.
+
+    Attributes:
+        max_entries: Maximum number of entries across all devices
+        evictions: Number of entries evicted to stay within max_entries
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize the DeviceCache.
+
+        Args:
+            max_entries: Maximum number of entries across all devices
+        """
+        self.max_entries = max_entries
+        self.evictions: int = 0
+        self._devices: dict[str, OrderedDict[str, CacheEntry]] = {}
+        # Secondary index of property groups: {device_uuid: {"X/Y": {data_id, ...}}}
+        self._groups: dict[str, dict[str, set[str]]] = {}
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return self._size
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        """Return True if ``(device_uuid, data_id)`` is cached."""
+        device_uuid, data_id = key
+        entries = self._devices.get(device_uuid)
+        return entries is not None and data_id in entries
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        """Iterate over ``(device_uuid, data_id)`` keys, per device in LRU order."""
+        for device_uuid, entries in self._devices.items():
+            for data_id in entries:
+                yield device_uuid, data_id
+
+    # -------------------------------------------------------------------------
+    # Lookup and store
+    # -------------------------------------------------------------------------
+
+    def get(self, device_uuid: str, data_id: str, now: float) -> CacheEntry | None:
+        """Return the entry for a key and mark it as most recently used.
+
+        Args:
+            device_uuid: UUID of the device
+            data_id: Telemetry ID or property path
+            now: Current time, recorded as the entry's last use
+
+        Returns:
+            The cache entry, or None if not cached
+        """
+        entries = self._devices.get(device_uuid)
+        if entries is None:
+            return None
+        entry = entries.get(data_id)
+        if entry is not None:
+            entries.move_to_end(data_id)
+            entry.used = now
+        return entry
+
+    def set(self, device_uuid: str, data_id: str, value: Any, now: float) -> None:
+        """Store a value, evicting the least recently used entries if full.
+
+        Args:
+            device_uuid: UUID of the device
+            data_id: Telemetry ID or property path
+            value: Value to cache
+            now: Current time, recorded as the entry's store time
+        """
+        entries = self._devices.get(device_uuid)
+        if entries is None:
+            entries = self._devices[device_uuid] = OrderedDict()
+        if data_id not in entries:
+            self._size += 1
+            group = property_group(data_id)
+            if group is not None:
+                self._groups.setdefault(device_uuid, {}).setdefault(group, set()).add(data_id)
+        entries[data_id] = CacheEntry(value, now)
+        entries.move_to_end(data_id)
+
+        while self._size > self.max_entries:
+            self._evict_one()
+
+    def _evict_one(self) -> None:
+        """Evict the globally least recently used entry."""
+        device_uuid = min(
+            (uuid for uuid, entries in self._devices.items() if entries),
+            key=lambda uuid: next(iter(self._devices[uuid].values())).used,
+        )
+        data_id, _ = self._devices[device_uuid].popitem(last=False)
+        self._unindex(device_uuid, data_id)
+        self.evictions += 1
+
+    # -------------------------------------------------------------------------
+    # Invalidation
+    # -------------------------------------------------------------------------
+
+    def discard(self, device_uuid: str, data_id: str) -> None:
+        """Remove a single entry if present."""
+        entries = self._devices.get(device_uuid)
+        if entries is not None and entries.pop(data_id, None) is not None:
+            self._unindex(device_uuid, data_id)
+
+    def discard_group(self, device_uuid: str, group: str) -> None:
+        """Remove all properties ``X/Y/*`` of a group on one device."""
+        groups = self._groups.get(device_uuid)
+        if not groups:
+            return
+        data_ids = groups.pop(group, None)
+        if not data_ids:
+            return
+        entries = self._devices[device_uuid]
+        for data_id in data_ids:
+            del entries[data_id]
+        self._size -= len(data_ids)
+        if not entries:
+            del self._devices[device_uuid]
+
+    def discard_device(self, device_uuid: str) -> None:
+        """Remove all entries of one device."""
+        entries = self._devices.pop(device_uuid, None)
+        if entries is not None:
+            self._size -= len(entries)
+        self._groups.pop(device_uuid, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._devices.clear()
+        self._groups.clear()
+        self._size = 0
+
+    def _unindex(self, device_uuid: str, data_id: str) -> None:
+        """Update size and indexes after an entry was removed from its device."""
+        self._size -= 1
+        group = property_group(data_id)
+        if group is not None:
+            groups = self._groups[device_uuid]
+            members = groups[group]
+            members.discard(data_id)
+            if not members:
+                del groups[group]
+            if not groups:
+                del self._groups[device_uuid]
+        if not self._devices[device_uuid]:
+            del self._devices[device_uuid]
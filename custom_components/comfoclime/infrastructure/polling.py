@@ -0,0 +1,272 @@
+"""Device-wide polling schedule for ComfoClime integration.
+
+Every coordinator used to run its own Home Assistant timer at a multiple of
+the polling interval (1x dashboard, thermal profile and monitoring, 2x
+telemetry, 3x property, 4x definition). Those timers fire in lock-step, so
+every twelfth interval all of them poll at once and the Airduino receives a
+burst of requests.
+
+``PollingScheduler`` owns polling for one config entry instead:
+
+- A single timer refreshes each coordinator at its own interval. The first
+  refreshes are staggered over the intervals so sources don't line up.
+- Every background read waits for a slot from a shared request budget
+  (requests per minute). Reads of all coordinators are thereby interleaved
+  at a flat rate instead of arriving in bursts.
+
+Coordinators keep their data and entity-facing API but no longer schedule
+themselves; they call ``pace()`` before each device read.
+
+Only background polling is paced. Reads issued under a higher
+``request_priority`` (e.g. the confirmation refresh after a write) and writes
+bypass the budget, so a write waits for at most the one poll read in flight.
+
+``AdaptivePollPeriod`` reduces how much there is to poll in the first place:
+many telemetry values and properties (firmware counters, filter hours,
+settings) never change, so each one backs off its own poll period while its
+value is stable and returns to the shortest period as soon as it changes.
+Static values (see ``PollTier``) are read once and then only when forced or
+after ``reset()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from typing import TYPE_CHECKING, Any
+
+from ..constants import API_DEFAULTS
+from .scheduler import RequestPriority, current_request_priority
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_REQUEST_BUDGET = API_DEFAULTS.REQUEST_BUDGET
+DEFAULT_ADAPTIVE_POLL_MAX_INTERVAL = API_DEFAULTS.ADAPTIVE_POLL_MAX_INTERVAL
+
+_UNSET = object()
+
+
+class AdaptivePollPeriod:
+    """Poll period of one value that backs off while the value is stable.
+
+    Periods are counted in coordinator update cycles. Every read whose value
+    equals the previous one doubles the period up to ``ceiling``; a changed
+    value resets it to ``floor``. A failed read (no ``observe()``) leaves the
+    value due, so it is retried on the next cycle.
+
+    A static value is due only until its first successful read.
+
+    Attributes:
+        floor: Shortest period in cycles (used after a change)
+        ceiling: Longest period in cycles (reached while stable)
+        period: Current period in cycles
+        static: Whether the value is read once only
+    """
+
+    __slots__ = ("_last", "_remaining", "ceiling", "floor", "period", "static")
+
+    def __init__(self, floor: int = 1, ceiling: int = 1, static: bool = False) -> None:
+        """Initialize the AdaptivePollPeriod.
+
+        Args:
+            floor: Shortest period in cycles (used after a change)
+            ceiling: Longest period in cycles (reached while stable)
+            static: Whether the value is read once only
+        """
+        self.floor = max(1, floor)
+        self.ceiling = max(self.floor, ceiling)
+        self.static = static
+        self.period = self.floor
+        # Cycles left to skip before the next read
+        self._remaining = 0
+        self._last: Any = _UNSET
+
+    @classmethod
+    def from_intervals(
+        cls,
+        cycle: float,
+        min_interval: float | None = None,
+        max_interval: float | None = None,
+        static: bool = False,
+    ) -> AdaptivePollPeriod:
+        """Create a poll period from intervals in seconds.
+
+        Args:
+            cycle: Seconds between two coordinator update cycles
+            min_interval: Shortest interval in seconds (default: every cycle);
+                rounded up to whole cycles
+            max_interval: Longest interval in seconds (default: every cycle);
+                rounded down to whole cycles
+            static: Whether the value is read once only
+        """
+        floor = math.ceil(min_interval / cycle) if min_interval else 1
+        ceiling = int(max_interval // cycle) if max_interval else 1
+        return cls(floor, ceiling, static)
+
+    def tighten(self, other: AdaptivePollPeriod) -> None:
+        """Adopt the shorter floor and ceiling of another registration.
+
+        The value stays static only if both registrations are static.
+        """
+        self.floor = min(self.floor, other.floor)
+        self.ceiling = min(self.ceiling, other.ceiling)
+        self.static = self.static and other.static
+        self.period = min(self.period, self.ceiling)
+        self._remaining = min(self._remaining, self.period - 1)
+
+    def reset(self) -> None:
+        """Forget the last value, so it is read on the next cycle (e.g. after a device restart)."""
+        self.period = self.floor
+        self._remaining = 0
+        self._last = _UNSET
+
+    def tick(self) -> bool:
+        """Advance by one cycle and return True if the value is due to be read."""
+        if self.static:
+            return self._last is _UNSET
+        if self._remaining > 0:
+            self._remaining -= 1
+            return False
+        return True
+
+    def observe(self, value: Any) -> None:
+        """Record a read value and schedule the next read.
+
+        Args:
+            value: Raw value read from the device (compared to the previous one)
+        """
+        if value == self._last:
+            self.period = min(self.period * 2, self.ceiling)
+        else:
+            self.period = self.floor
+        self._last = value
+        self._remaining = self.period - 1
+
+
+class _PollSource:
+    """A coordinator refresh polled by the scheduler."""
+
+    __slots__ = ("due", "interval", "name", "refresh", "task")
+
+    def __init__(self, name: str, interval: float, refresh: Callable[[], Awaitable[Any]]) -> None:
+        self.name = name
+        self.interval = interval
+        self.refresh = refresh
+        self.due: float = 0.0
+        self.task: asyncio.Task | None = None
+
+
+class PollingScheduler:
+    """Shared polling timer and request budget for one device.
+
+    Attributes:
+        request_budget: Background reads per minute across all coordinators
+    """
+
+    def __init__(self, request_budget: float = DEFAULT_REQUEST_BUDGET) -> None:
+        """Initialize the PollingScheduler.
+
+        Args:
+            request_budget: Background reads per minute across all coordinators
+        """
+        self.request_budget = request_budget
+        self._sources: list[_PollSource] = []
+        # Loop time at which the next background read may start
+        self._next_slot: float = 0.0
+
+    @property
+    def spacing(self) -> float:
+        """Seconds between two background reads."""
+        return 60.0 / self.request_budget
+
+    def add_source(self, name: str, interval: float, refresh: Callable[[], Awaitable[Any]]) -> None:
+        """Refresh a coordinator every ``interval`` seconds once the scheduler runs.
+
+        Sources must be added before ``run()`` is started.
+
+        Args:
+            name: Name used in log messages
+            interval: Seconds between two refreshes
+            refresh: Coroutine function performing the refresh
+        """
+        self._sources.append(_PollSource(name, interval, refresh))
+
+    # -------------------------------------------------------------------------
+    # Request budget
+    # -------------------------------------------------------------------------
+
+    async def pace(self) -> None:
+        """Wait for the next slot of the request budget.
+
+        Slots are reserved on entry, so reads of concurrently refreshing
+        coordinators are interleaved one ``spacing`` apart. Reads issued
+        with a priority above ``RequestPriority.POLL`` are not paced.
+        """
+        if current_request_priority() != RequestPriority.POLL:
+            return
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.spacing
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    # -------------------------------------------------------------------------
+    # Timer
+    # -------------------------------------------------------------------------
+
+    async def run(self) -> None:
+        """Refresh all sources on schedule until cancelled.
+
+        A refresh runs as its own task so slow sources (many telemetry reads)
+        do not hold back the others; their reads share the budget through
+        ``pace()``. A source whose previous refresh is still running skips
+        its turn.
+        """
+        if not self._sources:
+            return
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for index, source in enumerate(self._sources):
+            # Source i first fires (i + 1) / n into its interval
+            source.due = start + source.interval * (index + 1) / len(self._sources)
+        _LOGGER.debug(
+            "Polling %d sources with a budget of %s requests/min",
+            len(self._sources),
+            self.request_budget,
+        )
+
+        try:
+            while True:
+                source = min(self._sources, key=lambda s: s.due)
+                delay = source.due - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                source.due += source.interval
+                if source.due < loop.time():
+                    # Fell behind (e.g. event loop was blocked), don't catch up in a burst
+                    source.due = loop.time() + source.interval
+
+                if source.task is not None and not source.task.done():
+                    _LOGGER.debug("Skipping %s refresh, previous refresh still running", source.name)
+                    continue
+                source.task = asyncio.create_task(self._refresh(source), name=f"comfoclime {source.name} refresh")
+        finally:
+            for source in self._sources:
+                if source.task is not None:
+                    source.task.cancel()
+
+    @staticmethod
+    async def _refresh(source: _PollSource) -> None:
+        """Run one refresh, logging instead of propagating failures."""
+        try:
+            await source.refresh()
+        except Exception:
+            _LOGGER.exception("Scheduled %s refresh failed", source.name)
@@ -0,0 +1,205 @@
+"""Priority request scheduling for ComfoClime integration.
+
+The ComfoClime (Airduino) can only handle one request at a time, so every
+request has to pass a single gate. A plain ``asyncio.Lock`` serves waiters
+in arrival order, which lets a user's fan-speed change queue up behind an
+entire telemetry polling cycle. ``RequestScheduler`` replaces that lock with
+a priority gate:
+
+- ``RequestPriority.WRITE``: user-initiated writes (PUT)
+- ``RequestPriority.USER_READ``: user-initiated reads, e.g. post-write confirmation
+- ``RequestPriority.POLL``: background coordinator polling
+
+Waiters are served by priority and in FIFO order within a class. To prevent
+starvation, any waiter that has been queued longer than ``starvation_timeout``
+is served before newer higher-priority waiters.
+
+The priority of reads is taken from a context variable so that coordinator
+refreshes triggered by a user action inherit it without threading a parameter
+through Home Assistant's coordinator machinery:
+
+    with request_priority(RequestPriority.USER_READ):
+        await coordinator.async_request_refresh()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import logging
+from collections import deque
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+from ..constants import API_DEFAULTS
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_STARVATION_TIMEOUT = API_DEFAULTS.STARVATION_TIMEOUT
+
+
+class RequestPriority(IntEnum):
+    """Request classes in descending priority (lower value is served first)."""
+
+    WRITE = 0
+    USER_READ = 1
+    POLL = 2
+
+
+_request_priority: ContextVar[RequestPriority] = ContextVar("comfoclime_request_priority", default=RequestPriority.POLL)
+
+
+def current_request_priority() -> RequestPriority:
+    """Return the read priority of the current context (default: POLL)."""
+    return _request_priority.get()
+
+
+@contextlib.contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Run reads issued in this context (and tasks created from it) at ``priority``.
+
+    Args:
+        priority: Priority class for reads issued inside the block
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+class _Waiter:
+    """A queued request waiting for the device."""
+
+    __slots__ = ("enqueued", "future", "priority", "sequence")
+
+    def __init__(self, priority: RequestPriority, sequence: int, enqueued: float, future: asyncio.Future) -> None:
+        self.priority = priority
+        self.sequence = sequence
+        self.enqueued = enqueued
+        self.future = future
+
+
+class RequestScheduler:
+    """Single-slot priority gate in front of the device.
+
+    Only one request holds the slot at a time. When the slot is released it
+    is handed directly to the next waiter, so a newly arriving low-priority
+    request can never overtake a queued write.
+
+    Attributes:
+        starvation_timeout: Seconds after which a queued request is served
+            regardless of its priority class
+    """
+
+    def __init__(self, starvation_timeout: float = DEFAULT_STARVATION_TIMEOUT) -> None:
+        """Initialize the RequestScheduler.
+
+        Args:
+            starvation_timeout: Seconds after which a queued request is served
+                regardless of its priority class
+        """
+        self.starvation_timeout = starvation_timeout
+        self._queues: dict[RequestPriority, deque[_Waiter]] = {priority: deque() for priority in RequestPriority}
+        self._sequence = itertools.count()
+        self._busy = False
+
+    # -------------------------------------------------------------------------
+    # State
+    # -------------------------------------------------------------------------
+
+    def locked(self) -> bool:
+        """Return True if a request currently holds the slot."""
+        return self._busy
+
+    def pending(self, priority: RequestPriority | None = None) -> int:
+        """Return the number of queued requests (optionally for one class)."""
+        if priority is not None:
+            return len(self._queues[priority])
+        return sum(len(queue) for queue in self._queues.values())
+
+    def has_pending_writes(self) -> bool:
+        """Return True if writes are queued for the device."""
+        return bool(self._queues[RequestPriority.WRITE])
+
+    # -------------------------------------------------------------------------
+    # Slot handling
+    # -------------------------------------------------------------------------
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """Hold the device slot for the duration of the block.
+
+        Args:
+            priority: Priority class of the request
+
+        Example:
+            async with scheduler.slot(RequestPriority.WRITE):
+                await session.put(...)
+        """
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: RequestPriority) -> None:
+        """Wait until the slot is granted to a request of class ``priority``."""
+        if not self._busy and not self.pending():
+            self._busy = True
+            return
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(priority, next(self._sequence), loop.time(), loop.create_future())
+        self._queues[priority].append(waiter)
+        _LOGGER.debug("Queued %s request (pending: %d)", priority.name, self.pending())
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Slot was handed to us right before cancellation, pass it on
+                self.release()
+            elif waiter in self._queues[priority]:
+                self._queues[priority].remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Release the slot and hand it to the next waiter, if any.
+
+        Waiters cancelled before their turn came are dropped, like
+        ``asyncio.Lock`` does, so the slot is never handed to nobody.
+        """
+        while (waiter := self._next_waiter()) is not None:
+            if not waiter.future.done():
+                # Slot stays busy and is transferred to the waiter
+                waiter.future.set_result(None)
+                return
+        self._busy = False
+
+    def _next_waiter(self) -> _Waiter | None:
+        """Pop the next waiter: starved requests first, then by priority and FIFO."""
+        heads = [queue[0] for queue in self._queues.values() if queue]
+        if not heads:
+            return None
+
+        now = asyncio.get_running_loop().time()
+        starved = [w for w in heads if now - w.enqueued >= self.starvation_timeout]
+        if starved:
+            waiter = min(starved, key=lambda w: w.sequence)
+            if waiter.priority != min(w.priority for w in heads):
+                _LOGGER.debug(
+                    "Serving starved %s request after %.1fs",
+                    waiter.priority.name,
+                    now - waiter.enqueued,
+                )
+        else:
+            waiter = min(heads, key=lambda w: w.priority)
+
+        self._queues[waiter.priority].popleft()
+        return waiter
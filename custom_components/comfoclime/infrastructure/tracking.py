@@ -5,6 +5,7 @@ This module provides the AccessTracker class that tracks:
 - Access counts per coordinator per minute and per hour
 - Last access timestamp per coordinator
 - Total API request counts
+- Entity updates skipped because their value did not change
 
 This information is exposed via diagnostic sensors to help monitor
 and optimize API access patterns to the Airduino board.
@@ -91,6 +92,7 @@ class AccessTracker:
     def __init__(self):
         """Initialize the access tracker."""
         self._coordinators: dict[str, CoordinatorStats] = {}
+        self._suppressed_updates: dict[str, int] = {}
 
     def _get_current_time(self) -> float:
         """Get current monotonic time for rate limiting."""
@@ -112,6 +114,34 @@ class AccessTracker:
 
         _LOGGER.debug(f"Recorded access for {coordinator_name}, total={stats.total_count}")
 
+    def record_suppressed_updates(self, coordinator_name: str, count: int) -> None:
+        """Record entity updates a coordinator skipped because nothing changed.
+
+        Args:
+            coordinator_name: Name of the coordinator that skipped the updates.
+            count: Number of entity updates skipped.
+        """
+        self._suppressed_updates[coordinator_name] = self._suppressed_updates.get(coordinator_name, 0) + count
+
+    def get_suppressed_updates(self, coordinator_name: str) -> int:
+        """Get the number of entity updates a coordinator skipped since startup.
+
+        Args:
+            coordinator_name: Name of the coordinator.
+
+        Returns:
+            Number of skipped entity updates.
+        """
+        return self._suppressed_updates.get(coordinator_name, 0)
+
+    def get_total_suppressed_updates(self) -> int:
+        """Get the number of entity updates skipped across all coordinators.
+
+        Returns:
+            Total number of skipped entity updates since startup.
+        """
+        return sum(self._suppressed_updates.values())
+
     def _cleanup_old_entries(self, stats: CoordinatorStats, current_time: float) -> None:
         """Remove entries older than the hour window.
 
@@ -208,5 +238,6 @@ class AccessTracker:
                 "per_minute": self.get_accesses_per_minute(name),
                 "per_hour": self.get_accesses_per_hour(name),
                 "total": self.get_total_accesses(name),
+                "suppressed_updates": self.get_suppressed_updates(name),
             }
         return summary
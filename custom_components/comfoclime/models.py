@@ -27,14 +27,14 @@ class ComfoClimeModel(BaseModel):
 
 
 # Utility functions for byte and temperature value processing
-def bytes_to_signed_int(data: list, byte_count: int | None = None, signed: bool = True) -> int:
+def bytes_to_signed_int(data: list | bytes, byte_count: int | None = None, signed: bool = True) -> int:
     """Convert raw bytes to a signed or unsigned integer value.
 
     Converts a list of bytes (little-endian) to an integer value.
     Supports 1-byte and 2-byte conversions with optional signed interpretation.
 
     Args:
-        data: List of bytes (integers 0-255) in little-endian order
+        data: List of bytes (integers 0-255) or bytes object in little-endian order
         byte_count: Number of bytes to read. If None, calculated from data length
         signed: If True, interpret as signed integer; if False, unsigned
 
@@ -50,7 +50,7 @@ def bytes_to_signed_int(data: list, byte_count: int | None = None, signed: bool
         >>> bytes_to_signed_int([0, 1], 2, signed=False)
         256
     """
-    if not isinstance(data, list):
+    if not isinstance(data, (list, bytes)):
         raise ValueError("'data' is not a list")
 
     if byte_count is None:
@@ -91,6 +91,16 @@ def signed_int_to_bytes(data: int, byte_count: int = 2, signed: bool = False) ->
     return list(data.to_bytes(byte_count, byteorder="little", signed=signed))
 
 
+def bytes_to_text(data: list | bytes) -> str:
+    """Decode a string property from raw bytes, dropping NUL padding.
+
+    Example:
+        >>> bytes_to_text([65, 0, 66])
+        'AB'
+    """
+    return "".join(chr(byte) for byte in data if byte != 0)
+
+
 def fix_signed_temperature(api_value: float) -> float:
     """Fix temperature value by converting through signed 16-bit integer.
 
@@ -318,40 +328,24 @@ class TelemetryReading(ComfoClimeModel):
         *,
         device_uuid: str,
         telemetry_id: str,
-        cached_value: int | float | None,
+        cached_value: bytes | None,
         faktor: float = 1.0,
         signed: bool = True,
         byte_count: int | None = None,
     ) -> TelemetryReading | None:
-        """Create a telemetry reading from a cached scaled value.
+        """Create a telemetry reading from cached raw bytes.
 
-        Returns None when the cached value is missing or non-numeric.
-        """
-        if cached_value is None or not isinstance(cached_value, (int, float)):
-            return None
+        The cache holds the bytes returned by the device, so the reading is
+        decoded exactly as on a fresh read, with the caller's own scaling.
 
-        if faktor == 0:
+        Returns None when the cached value is missing or not raw bytes.
+        """
+        if not isinstance(cached_value, bytes):
             return None
-
-        if byte_count is None:
-            byte_count = 2
-
-        # Calculate estimated raw value (as signed interpretation)
-        estimated_raw_signed = round(cached_value / faktor)
-
-        # Convert to unsigned representation (raw bytes)
-        # If signed, convert the signed value to its unsigned byte representation
-        if signed and estimated_raw_signed < 0:
-            # Convert to bytes and back as unsigned to get the raw byte representation
-            bytes_data = estimated_raw_signed.to_bytes(byte_count, byteorder="little", signed=True)
-            raw_value = int.from_bytes(bytes_data, byteorder="little", signed=False)
-        else:
-            raw_value = estimated_raw_signed
-
-        return cls(
+        return cls.from_raw_bytes(
             device_uuid=device_uuid,
-            telemetry_id=str(telemetry_id),
-            raw_value=raw_value,
+            telemetry_id=telemetry_id,
+            data=cached_value,
             faktor=faktor,
             signed=signed,
             byte_count=byte_count,
@@ -363,7 +357,7 @@ class TelemetryReading(ComfoClimeModel):
         *,
         device_uuid: str,
         telemetry_id: str,
-        data: list,
+        data: list | bytes,
         faktor: float = 1.0,
         signed: bool = True,
         byte_count: int | None = None,
@@ -441,40 +435,46 @@ class PropertyReading(ComfoClimeModel):
         *,
         device_uuid: str,
         path: str,
-        cached_value: int | float | None,
+        cached_value: bytes | str | None,
         faktor: float = 1.0,
         signed: bool = True,
         byte_count: int | None = None,
     ) -> PropertyReading | None:
-        """Create a property reading from a cached value.
+        """Create a property reading from cached raw bytes.
 
-        Returns None when the cached value is missing or non-numeric.
+        Returns None when the cached value is missing or a decoded string.
         """
-        if cached_value is None or not isinstance(cached_value, (int, float)):
-            return None
-
-        if faktor == 0:
+        if not isinstance(cached_value, bytes):
             return None
+        return cls.from_raw_bytes(
+            device_uuid=device_uuid,
+            path=path,
+            data=cached_value,
+            faktor=faktor,
+            signed=signed,
+            byte_count=byte_count,
+        )
 
+    @classmethod
+    def from_raw_bytes(
+        cls,
+        *,
+        device_uuid: str,
+        path: str,
+        data: list | bytes,
+        faktor: float = 1.0,
+        signed: bool = True,
+        byte_count: int | None = None,
+    ) -> PropertyReading:
+        """Create a numeric (1-2 byte) property reading from raw API bytes."""
         if byte_count is None:
-            byte_count = 2
-
-        # Calculate estimated raw value (as signed interpretation)
-        estimated_raw_signed = round(cached_value / faktor)
-
-        # Convert to unsigned representation (raw bytes)
-        # If signed, convert the signed value to its unsigned byte representation
-        if signed and estimated_raw_signed < 0:
-            # Convert to bytes and back as unsigned to get the raw byte representation
-            bytes_data = estimated_raw_signed.to_bytes(byte_count, byteorder="little", signed=True)
-            raw_value = int.from_bytes(bytes_data, byteorder="little", signed=False)
-        else:
-            raw_value = estimated_raw_signed
+            byte_count = len(data)
 
+        # Always store raw_value as unsigned (the raw byte representation)
         return cls(
             device_uuid=device_uuid,
             path=path,
-            raw_value=raw_value,
+            raw_value=bytes_to_signed_int(data, byte_count, signed=False),
             faktor=faktor,
             signed=signed,
             byte_count=byte_count,
@@ -482,12 +482,19 @@ class PropertyReading(ComfoClimeModel):
 
 
 class PropertyReadResult(ComfoClimeModel):
-    """Parsed result for a property read operation."""
+    """Parsed result for a property read operation.
+
+    Attributes:
+        reading: Numeric reading (None for string properties).
+        cache_value: Value to cache: the raw bytes of numeric properties (so
+            they can be decoded with any scaling on a hit) or the decoded text
+            of string properties.
+    """
 
     model_config = {"frozen": True}
 
     reading: PropertyReading | None = Field(default=None)
-    cache_value: int | float | str | None = Field(default=None)
+    cache_value: bytes | str | None = Field(default=None)
 
     @classmethod
     def from_raw_bytes(
@@ -495,7 +502,7 @@ class PropertyReadResult(ComfoClimeModel):
         *,
         device_uuid: str,
         path: str,
-        data: list,
+        data: list | bytes,
         faktor: float = 1.0,
         signed: bool = True,
         byte_count: int | None = None,
@@ -508,21 +515,20 @@ class PropertyReadResult(ComfoClimeModel):
             byte_count = len(data)
 
         if byte_count in (1, 2):
-            reading = PropertyReading(
+            reading = PropertyReading.from_raw_bytes(
                 device_uuid=device_uuid,
                 path=path,
-                raw_value=bytes_to_signed_int(data, byte_count, signed),
+                data=data,
                 faktor=faktor,
                 signed=signed,
                 byte_count=byte_count,
             )
-            return cls(reading=reading, cache_value=reading.scaled_value)
+            return cls(reading=reading, cache_value=bytes(data))
 
         if byte_count > 2:
             if len(data) != byte_count:
                 raise ValueError(f"Unerwartete Byte-Anzahl: erwartet {byte_count}, erhalten {len(data)}")
-            result = "".join(chr(byte) for byte in data if byte != 0)
-            return cls(reading=None, cache_value=result)
+            return cls(reading=None, cache_value=bytes_to_text(data))
 
         raise ValueError(f"Nicht unterstützte Byte-Anzahl: {byte_count}")
 
@@ -1016,6 +1022,22 @@ class DashboardUpdateResponse(ComfoClimeModel):
 
     status: int | str | None = Field(default=200, description="HTTP status code from API")
 
+    def dashboard_state(self) -> dict[str, Any]:
+        """Return the dashboard fields the device reported, by DashboardData field name.
+
+        Temperatures are fixed like those of a dashboard read. ``status`` is
+        the control mode only if it is 0 or 1, otherwise it is the HTTP status.
+        """
+        reported = fix_signed_temperatures_in_dict(dict(self.model_extra or {}))
+        if self.status in (0, 1):
+            reported["status"] = self.status
+        names = {}
+        for name, field in DashboardData.model_fields.items():
+            names[name] = name
+            if field.alias:
+                names[field.alias] = name
+        return {names[key]: value for key, value in reported.items() if key in names}
+
 
 class ThermalProfileUpdateResponse(ComfoClimeModel):
     """Response model from thermal profile update endpoint.
@@ -1117,6 +1139,22 @@ class TelemetryRegistryEntry(ComfoClimeModel):
     signed: bool = Field(default=True, description="Whether to interpret raw values as signed")
     byte_count: int | None = Field(default=None, description="Number of bytes to read (1, 2, or None)")
 
+    def decode(self, data: bytes | None) -> float | None:
+        """Decode raw telemetry bytes with these parameters.
+
+        Several entities may read the same telemetry ID with different
+        parameters; the coordinator reads it once and decodes it per entry.
+
+        Returns:
+            The scaled value, or None if no data was read.
+
+        Raises:
+            ValueError: If the data cannot be decoded with this byte count.
+        """
+        if not data:
+            return None
+        return bytes_to_signed_int(data, self.byte_count, signed=self.signed) * self.faktor
+
 
 class PropertyRegistryEntry(ComfoClimeModel):
     """Single property metadata entry in the property registry.
@@ -1143,6 +1181,29 @@ class PropertyRegistryEntry(ComfoClimeModel):
     signed: bool = Field(default=True, description="Whether to interpret numeric values as signed")
     byte_count: int | None = Field(default=None, description="Number of bytes (1-2 for numeric, 3+ for string)")
 
+    def decode(self, value: bytes | str | None) -> float | str | None:
+        """Decode a cached property value with these parameters.
+
+        Args:
+            value: Raw bytes of the property, or its text if it was already
+                decoded as a string property
+
+        Returns:
+            The scaled number, the text of a string property (byte_count > 2),
+            or None if nothing was read or a number is wanted from text.
+
+        Raises:
+            ValueError: If the data cannot be decoded with this byte count.
+        """
+        if not value:
+            return None
+        if isinstance(value, str):
+            return value if self.byte_count is None or self.byte_count > 2 else None
+        byte_count = self.byte_count or len(value)
+        if byte_count > 2:
+            return bytes_to_text(value)
+        return bytes_to_signed_int(value, byte_count, signed=self.signed) * self.faktor
+
 
 class TelemetryRegistry(ComfoClimeModel):
     """Full telemetry registry for the coordinator.
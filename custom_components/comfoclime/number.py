@@ -31,6 +31,7 @@ from .entity_helper import (
     get_device_model_type_id,
     get_device_uuid,
 )
+from .infrastructure import DEBOUNCED, RequestPriority, request_priority
 from .models import DeviceConfig, PropertyWriteRequest
 
 _LOGGER = logging.getLogger(__name__)
@@ -214,9 +215,16 @@ class ComfoClimeTemperatureNumber(ComfoClimeBaseEntity, CoordinatorEntity, Numbe
 
         param_name = param_mapping[key_str]
         try:
-            await self._api.async_update_thermal_profile(**{param_name: value})
+            result = await self._api.async_debounced_write(
+                f"thermal_profile:{param_name}",
+                lambda: self._api.async_update_thermal_profile(**{param_name: value}),
+            )
+            if result is DEBOUNCED:
+                return
             self._value = value
-            await self.coordinator.async_request_refresh()
+            # Refresh directly: a debounced refresh may run at another caller's priority
+            with request_priority(RequestPriority.USER_READ):
+                await self.coordinator.async_refresh()
         except TimeoutError, aiohttp.ClientError:
             _LOGGER.exception("Error setting number entity %s", self._name)
             raise HomeAssistantError(f"Error setting {self._name}") from None
@@ -235,7 +243,9 @@ class ComfoClimePropertyNumber(ComfoClimeBaseEntity, CoordinatorEntity, NumberEn
         entry: ConfigEntry,
         device_uuid: str | None = None,
     ) -> None:
-        super().__init__(coordinator)
+        device_uuid = device_uuid or get_device_uuid(device)
+        # The coordinator notifies this entity only when its own value was read
+        super().__init__(coordinator, context=(device_uuid, config.property))
         self._hass = hass
         self._api = api
         self._config = config
@@ -256,7 +266,7 @@ class ComfoClimePropertyNumber(ComfoClimeBaseEntity, CoordinatorEntity, NumberEn
         self._faktor = config.faktor
         self._byte_count = config.byte_count
         self._signed = config.signed
-        self._device_uuid = device_uuid or get_device_uuid(device)
+        self._device_uuid = device_uuid
 
         _LOGGER.debug(
             "ComfoClimePropertyNumber initialized: path=%s, device=%s, unique_id=%s",
@@ -275,13 +285,20 @@ class ComfoClimePropertyNumber(ComfoClimeBaseEntity, CoordinatorEntity, NumberEn
             faktor=self._faktor,
             signed=self._signed,
             byte_count=self._byte_count,
+            poll_tier=self._config.poll_tier,
         )
-        await self._async_request_coordinator_refresh()
+        await self._async_fetch_registered_value()
 
     async def _async_unregister_data_source(self) -> None:
         """Stop polling this property once the entity goes away."""
         if self._device_uuid:
-            await self.coordinator.unregister_property(self._device_uuid, self._property_path)
+            await self.coordinator.unregister_property(
+                self._device_uuid,
+                self._property_path,
+                faktor=self._faktor,
+                signed=self._signed,
+                byte_count=self._byte_count,
+            )
 
     @property
     def name(self):
@@ -295,7 +312,13 @@ class ComfoClimePropertyNumber(ComfoClimeBaseEntity, CoordinatorEntity, NumberEn
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         try:
-            value = self.coordinator.get_property_value(get_device_uuid(self._device), self._property_path)
+            value = self.coordinator.get_property_value(
+                get_device_uuid(self._device),
+                self._property_path,
+                faktor=self._faktor,
+                signed=self._signed,
+                byte_count=self._byte_count,
+            )
             _LOGGER.debug("Property %s updated from coordinator: %s", self._property_path, value)
             self._value = value
         except (KeyError, TypeError, ValueError) as e:
@@ -312,10 +335,17 @@ class ComfoClimePropertyNumber(ComfoClimeBaseEntity, CoordinatorEntity, NumberEn
                 byte_count=self._byte_count,
                 faktor=self._faktor,
             )
-            await self._api.async_set_property_for_device(request=request)
+            result = await self._api.async_debounced_write(
+                f"property:{request.device_uuid}:{request.path}",
+                lambda: self._api.async_set_property_for_device(request=request),
+            )
+            if result is DEBOUNCED:
+                return
+            self.coordinator.publish_written_value(request)
             self._value = value
-            # Trigger coordinator refresh to update all entities
-            await self.coordinator.async_request_refresh()
+            # Read back only the written value and update its entities
+            with request_priority(RequestPriority.USER_READ):
+                await self.coordinator.async_read_back(get_device_uuid(self._device), self._property_path)
         except TimeoutError, aiohttp.ClientError:
             _LOGGER.exception("Error writing property %s", self._property_path)
             raise HomeAssistantError(f"Error writing property {self._property_path}") from None
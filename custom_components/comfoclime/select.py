@@ -31,10 +31,14 @@ from .entity_helper import (
     get_device_model_type_id,
     get_device_uuid,
 )
+from .infrastructure import DEBOUNCED, RequestPriority, request_priority
 from .models import DeviceConfig, PropertyWriteRequest
 
 _LOGGER = logging.getLogger(__name__)
 
+# Property selects hold a single unsigned option byte
+_SELECT_DECODER = {"faktor": 1.0, "signed": False, "byte_count": 1}
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     data = hass.data[DOMAIN][entry.entry_id]
@@ -149,7 +153,12 @@ class ComfoClimeSelect(ComfoClimeBaseEntity, CoordinatorEntity, SelectEntity):
                 return
 
             param_name = param_mapping[self._key]
-            await self._api.async_update_thermal_profile(**{param_name: value})
+            result = await self._api.async_debounced_write(
+                f"thermal_profile:{param_name}",
+                lambda: self._api.async_update_thermal_profile(**{param_name: value}),
+            )
+            if result is DEBOUNCED:
+                return
 
             self._current = option
             self._hass.async_create_task(self._safe_refresh(self.coordinator, "select"))
@@ -171,7 +180,9 @@ class ComfoClimePropertySelect(ComfoClimeBaseEntity, CoordinatorEntity, SelectEn
         entry: ConfigEntry | None = None,
         device_uuid: str | None = None,
     ) -> None:
-        super().__init__(coordinator)
+        device_uuid = device_uuid or get_device_uuid(device)
+        # The coordinator notifies this entity only when its own value was read
+        super().__init__(coordinator, context=(device_uuid, conf.path))
         self._hass = hass
         self._api = api
         self._name = conf.name
@@ -185,7 +196,7 @@ class ComfoClimePropertySelect(ComfoClimeBaseEntity, CoordinatorEntity, SelectEn
         self._attr_unique_id = f"{entry.entry_id}_select_{conf.path.replace('/', '_')}"
         self._attr_translation_key = conf.translation_key
         self._attr_has_entity_name = True
-        self._device_uuid = device_uuid or get_device_uuid(device)
+        self._device_uuid = device_uuid
 
     async def _async_register_data_source(self) -> None:
         """Start polling this property now that the entity is live."""
@@ -194,16 +205,14 @@ class ComfoClimePropertySelect(ComfoClimeBaseEntity, CoordinatorEntity, SelectEn
         await self.coordinator.register_property(
             device_uuid=self._device_uuid,
             property_path=self._path,
-            faktor=1.0,
-            signed=False,
-            byte_count=1,
+            **_SELECT_DECODER,
         )
-        await self._async_request_coordinator_refresh()
+        await self._async_fetch_registered_value()
 
     async def _async_unregister_data_source(self) -> None:
         """Stop polling this property once the entity goes away."""
         if self._device_uuid:
-            await self.coordinator.unregister_property(self._device_uuid, self._path)
+            await self.coordinator.unregister_property(self._device_uuid, self._path, **_SELECT_DECODER)
 
     @property
     def options(self):
@@ -217,7 +226,7 @@ class ComfoClimePropertySelect(ComfoClimeBaseEntity, CoordinatorEntity, SelectEn
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         try:
-            val = self.coordinator.get_property_value(get_device_uuid(self._device), self._path)
+            val = self.coordinator.get_property_value(get_device_uuid(self._device), self._path, **_SELECT_DECODER)
             self._current = self._options_map.get(val)
         except (KeyError, TypeError, ValueError) as e:
             _LOGGER.debug("Error loading %s: %s", self._name, e)
@@ -237,10 +246,17 @@ class ComfoClimePropertySelect(ComfoClimeBaseEntity, CoordinatorEntity, SelectEn
                 byte_count=1,
                 faktor=1.0,
             )
-            await self._api.async_set_property_for_device(request=request)
+            result = await self._api.async_debounced_write(
+                f"property:{request.device_uuid}:{request.path}",
+                lambda: self._api.async_set_property_for_device(request=request),
+            )
+            if result is DEBOUNCED:
+                return
+            self.coordinator.publish_written_value(request)
             self._current = option
-            # Trigger coordinator refresh to update all entities
-            await self.coordinator.async_request_refresh()
+            # Read back only the written value and update its entities
+            with request_priority(RequestPriority.USER_READ):
+                await self.coordinator.async_read_back(get_device_uuid(self._device), self._path)
         except TimeoutError, aiohttp.ClientError:
             _LOGGER.exception("Error setting select %s", self._name)
             raise HomeAssistantError(f"Error setting {self._name}") from None
@@ -12,6 +12,7 @@ The sensor platform supports multiple sensor types:
     - Property Sensors: Device-specific property values
     - Definition Sensors: Device definition data
     - Access Tracking Sensors: API call statistics
+    - Rate Control Sensors: Learned request spacing, latency and error rate
 
 Every sensor this integration knows about is created. Which of them are
 visible is Home Assistant's business, not ours: standard sensors start
@@ -50,6 +51,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from pydantic import BaseModel
 
 from . import DOMAIN
+from .constants import PollTier
 from .coordinator import (
     ComfoClimeDashboardCoordinator,
     ComfoClimeDefinitionCoordinator,
@@ -66,6 +68,7 @@ from .entities.sensor_definitions import (
     CONNECTED_DEVICE_SENSORS,
     DASHBOARD_SENSORS,
     MONITORING_SENSORS,
+    RATE_CONTROL_SENSORS,
     THERMALPROFILE_SENSORS,
 )
 from .entity_base import ComfoClimeBaseEntity
@@ -106,6 +109,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         - Property: Device-specific property values (batched)
         - Definition: Device definition data
         - Access Tracking: API call statistics
+        - Rate Control: Learned request spacing, latency and error rate
 
     Nothing is filtered here. Definitions carry an entity category, and
     anything categorised as config or diagnostic is registered disabled so
@@ -176,6 +180,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                     faktor=sensor_def.faktor,
                     signed=sensor_def.signed,
                     byte_count=sensor_def.byte_count,
+                    min_poll_interval=sensor_def.min_poll_interval,
+                    max_poll_interval=sensor_def.max_poll_interval,
+                    poll_tier=sensor_def.poll_tier,
                     device_class=sensor_def.device_class,
                     device=device,
                     state_class=sensor_def.state_class,
@@ -198,6 +205,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                     faktor=prop_def.faktor,
                     signed=prop_def.signed,
                     byte_count=prop_def.byte_count,
+                    min_poll_interval=prop_def.min_poll_interval,
+                    max_poll_interval=prop_def.max_poll_interval,
+                    poll_tier=prop_def.poll_tier,
                     mapping_key="",
                     device_class=prop_def.device_class,
                     state_class=prop_def.state_class,
@@ -246,6 +256,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             )
         )
 
+    for sensor_def in RATE_CONTROL_SENSORS:
+        sensors.append(
+            ComfoClimeRateControlSensor(
+                api=api,
+                metric=sensor_def.metric,
+                name=sensor_def.name,
+                translation_key=sensor_def.translation_key,
+                unit=sensor_def.unit,
+                device_class=sensor_def.device_class,
+                state_class=sensor_def.state_class,
+                entity_category=entity_category_for(sensor_def),
+                suggested_display_precision=sensor_def.suggested_display_precision,
+                device=main_device,
+                entry=entry,
+                entity_registry_enabled_default=enabled_by_default(sensor_def),
+            )
+        )
+
     # Entities that are enabled register their telemetry/property needs in
     # async_added_to_hass and then ask for a (debounced) coordinator refresh,
     # so there is nothing to prefetch here.
@@ -272,7 +300,8 @@ class ComfoClimeSensor(ComfoClimeBaseEntity, CoordinatorEntity, SensorEntity):
         entry: ConfigEntry | None = None,
         entity_registry_enabled_default: bool = True,
     ) -> None:
-        super().__init__(coordinator)
+        # The coordinator notifies this entity only when its own value changed
+        super().__init__(coordinator, context=sensor_type)
         self._hass = hass
         self._api = api
         self._type = sensor_type
@@ -360,6 +389,9 @@ class ComfoClimeTelemetrySensor(ComfoClimeBaseEntity, CoordinatorEntity, SensorE
         faktor: float = 1.0,
         signed: bool = True,
         byte_count: int | None = None,
+        min_poll_interval: float | None = None,
+        max_poll_interval: float | None = None,
+        poll_tier: PollTier = PollTier.NORMAL,
         device_class: str | None = None,
         state_class: str | None = None,
         entity_category: str | None = None,
@@ -368,13 +400,17 @@ class ComfoClimeTelemetrySensor(ComfoClimeBaseEntity, CoordinatorEntity, SensorE
         entry: ConfigEntry | None = None,
         entity_registry_enabled_default: bool = True,
     ) -> None:
-        super().__init__(coordinator)
+        # The coordinator notifies this entity only when its own value was read
+        super().__init__(coordinator, context=(override_device_uuid, str(telemetry_id)))
         self._hass = hass
         self._id = str(telemetry_id)
         self._name = name
         self._faktor = faktor
         self._byte_count = byte_count
         self._signed = signed
+        self._min_poll_interval = min_poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._poll_tier = poll_tier
         self._state = None
         self._attr_native_unit_of_measurement = unit
         self._attr_device_class = SensorDeviceClass(device_class) if device_class else None
@@ -403,13 +439,22 @@ class ComfoClimeTelemetrySensor(ComfoClimeBaseEntity, CoordinatorEntity, SensorE
             faktor=self._faktor,
             signed=self._signed,
             byte_count=self._byte_count,
+            min_poll_interval=self._min_poll_interval,
+            max_poll_interval=self._max_poll_interval,
+            poll_tier=self._poll_tier,
         )
-        await self._async_request_coordinator_refresh()
+        await self._async_fetch_registered_value()
 
     async def _async_unregister_data_source(self) -> None:
         """Stop polling this telemetry ID once the entity goes away."""
         if self._override_uuid:
-            await self.coordinator.unregister_telemetry(self._override_uuid, self._id)
+            await self.coordinator.unregister_telemetry(
+                self._override_uuid,
+                self._id,
+                faktor=self._faktor,
+                signed=self._signed,
+                byte_count=self._byte_count,
+            )
 
     @property
     def native_value(self):
@@ -419,7 +464,13 @@ class ComfoClimeTelemetrySensor(ComfoClimeBaseEntity, CoordinatorEntity, SensorE
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         try:
-            value = self.coordinator.get_telemetry_value(self._override_uuid, self._id)
+            value = self.coordinator.get_telemetry_value(
+                self._override_uuid,
+                self._id,
+                faktor=self._faktor,
+                signed=self._signed,
+                byte_count=self._byte_count,
+            )
             self._state = value
         except KeyError, TypeError, ValueError:
             _LOGGER.debug("Error updating telemetry %s", self._id, exc_info=True)
@@ -442,6 +493,9 @@ class ComfoClimePropertySensor(ComfoClimeBaseEntity, CoordinatorEntity, SensorEn
         faktor: float = 1.0,
         signed: bool = True,
         byte_count: int | None = None,
+        min_poll_interval: float | None = None,
+        max_poll_interval: float | None = None,
+        poll_tier: PollTier = PollTier.NORMAL,
         device_class: str | None = None,
         state_class: str | None = None,
         entity_category: str | None = None,
@@ -451,13 +505,17 @@ class ComfoClimePropertySensor(ComfoClimeBaseEntity, CoordinatorEntity, SensorEn
         entry: ConfigEntry,
         entity_registry_enabled_default: bool = True,
     ) -> None:
-        super().__init__(coordinator)
+        # The coordinator notifies this entity only when its own value was read
+        super().__init__(coordinator, context=(override_device_uuid, path))
         self._hass = hass
         self._path = path
         self._name = name
         self._faktor = faktor
         self._byte_count = byte_count
         self._signed = signed
+        self._min_poll_interval = min_poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._poll_tier = poll_tier
         self._attr_native_unit_of_measurement = unit
         self._attr_device_class = SensorDeviceClass(device_class) if device_class else None
         self._attr_state_class = SensorStateClass(state_class) if state_class else None
@@ -486,13 +544,22 @@ class ComfoClimePropertySensor(ComfoClimeBaseEntity, CoordinatorEntity, SensorEn
             faktor=self._faktor,
             signed=self._signed,
             byte_count=self._byte_count,
+            min_poll_interval=self._min_poll_interval,
+            max_poll_interval=self._max_poll_interval,
+            poll_tier=self._poll_tier,
         )
-        await self._async_request_coordinator_refresh()
+        await self._async_fetch_registered_value()
 
     async def _async_unregister_data_source(self) -> None:
         """Stop polling this property once the entity goes away."""
         if self._override_uuid:
-            await self.coordinator.unregister_property(self._override_uuid, self._path)
+            await self.coordinator.unregister_property(
+                self._override_uuid,
+                self._path,
+                faktor=self._faktor,
+                signed=self._signed,
+                byte_count=self._byte_count,
+            )
 
     @property
     def native_value(self):
@@ -502,7 +569,13 @@ class ComfoClimePropertySensor(ComfoClimeBaseEntity, CoordinatorEntity, SensorEn
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         try:
-            value = self.coordinator.get_property_value(self._override_uuid, self._path)
+            value = self.coordinator.get_property_value(
+                self._override_uuid,
+                self._path,
+                faktor=self._faktor,
+                signed=self._signed,
+                byte_count=self._byte_count,
+            )
             if self._mapping_key and self._mapping_key in VALUE_MAPPINGS:
                 self._state = VALUE_MAPPINGS[self._mapping_key].get(value, value)
             else:
@@ -533,7 +606,8 @@ class ComfoClimeDefinitionSensor(ComfoClimeBaseEntity, CoordinatorEntity, Sensor
         entry: ConfigEntry,
         entity_registry_enabled_default: bool = True,
     ) -> None:
-        super().__init__(coordinator)
+        # The coordinator notifies this entity only when its device's definition changed
+        super().__init__(coordinator, context=override_device_uuid)
         self._hass = hass
         self._key = key
         self._name = name
@@ -642,6 +716,8 @@ class ComfoClimeAccessTrackingSensor(ComfoClimeBaseEntity, SensorEntity):
                 self._state = self._access_tracker.get_total_accesses_per_minute()
             elif self._metric == "total_per_hour":
                 self._state = self._access_tracker.get_total_accesses_per_hour()
+            elif self._metric == "suppressed_updates":
+                self._state = self._access_tracker.get_total_suppressed_updates()
             else:
                 self._state = 0
         except KeyError, TypeError, ValueError:
@@ -661,3 +737,66 @@ class ComfoClimeAccessTrackingSensor(ComfoClimeBaseEntity, SensorEntity):
             "metric": self._metric,
             "summary": self._access_tracker.get_summary(),
         }
+
+
+class ComfoClimeRateControlSensor(ComfoClimeBaseEntity, SensorEntity):
+    """Sensor exposing a value learned by the API client's rate control."""
+
+    def __init__(
+        self,
+        api: ComfoClimeAPI,
+        metric: str,
+        name: str,
+        translation_key: str | bool,
+        *,
+        unit: str | None = None,
+        device_class: str | None = None,
+        state_class: str | None = None,
+        entity_category: str | None = None,
+        suggested_display_precision: int | None = None,
+        device: DeviceConfig | None = None,
+        entry: ConfigEntry,
+        entity_registry_enabled_default: bool = True,
+    ) -> None:
+        self._api = api
+        self._metric = metric
+        self._name = name
+        self._state = None
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = SensorDeviceClass(device_class) if device_class else None
+        self._attr_state_class = SensorStateClass(state_class) if state_class else None
+        self._attr_entity_category = EntityCategory(entity_category) if entity_category else None
+        self._attr_suggested_display_precision = suggested_display_precision
+        self._attr_entity_registry_enabled_default = entity_registry_enabled_default
+        self._device = device
+        self._entry = entry
+        self._attr_config_entry_id = entry.entry_id
+        self._attr_unique_id = f"{entry.entry_id}_rate_control_{metric}"
+
+        if not translation_key:
+            self._attr_name = name
+        else:
+            self._attr_translation_key = translation_key
+        self._attr_has_entity_name = True
+
+    @property
+    def native_value(self):
+        """Return the current value of the sensor."""
+        return self._state
+
+    @property
+    def should_poll(self) -> bool:
+        """Return True as rate control values change with every request."""
+        return True
+
+    async def async_update(self) -> None:
+        """Update the sensor state from the API client's rate control."""
+        value = self._api.rate_control_state().get(self._metric)
+        if value is not None and self._metric == "error_rate":
+            value *= 100
+        self._state = value
+
+    @property
+    def extra_state_attributes(self):
+        """Return the rate control metric this sensor reports."""
+        return {"metric": self._metric}
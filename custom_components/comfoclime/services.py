@@ -70,6 +70,7 @@ def async_setup_services(hass: HomeAssistant, domain: str = DOMAIN) -> None:
         byte_count = call.data["byte_count"]
         signed = call.data.get("signed", True)
         faktor = call.data.get("faktor", 1.0)
+        force = call.data.get("force", False)
 
         # Validate property path format
         is_valid, error_message = validate_property_path(path)
@@ -116,7 +117,7 @@ def async_setup_services(hass: HomeAssistant, domain: str = DOMAIN) -> None:
                 signed=signed,
                 faktor=faktor,
             )
-            await api.async_set_property_for_device(request=request)
+            await api.async_set_property_for_device(request=request, force=force)
             _LOGGER.info("Property %s auf %s gesetzt für %s", path, value, device_uuid)
         except (TimeoutError, aiohttp.ClientError) as e:
             _LOGGER.exception("Fehler beim Setzen von Property %s", path)
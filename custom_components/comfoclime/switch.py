@@ -13,6 +13,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from . import DOMAIN
 from .entities.switch_definitions import SWITCHES
 from .entity_base import ComfoClimeBaseEntity
+from .infrastructure import DEBOUNCED, RequestPriority, request_priority
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -160,17 +161,31 @@ class ComfoClimeSwitch(ComfoClimeBaseEntity, CoordinatorEntity, SwitchEntity):
 
         param_name = param_mapping[key_str]
         _LOGGER.debug("Setting %s: value=%s", self._name, value)
-        await self._api.async_update_thermal_profile(**{param_name: value})
+        result = await self._api.async_debounced_write(
+            f"thermal_profile:{param_name}",
+            lambda: self._api.async_update_thermal_profile(**{param_name: value}),
+        )
+        if result is DEBOUNCED:
+            return
         self._state = value == 1
-        await self.coordinator.async_request_refresh()
+        # Refresh directly: a debounced refresh may run at another caller's priority
+        with request_priority(RequestPriority.USER_READ):
+            await self.coordinator.async_refresh()
 
     async def _set_dashboard_status(self, value: int) -> None:
         """Set dashboard switch status via API."""
         _LOGGER.debug("Setting %s: %s=%s", self._name, self._key, value)
-        await self._api.async_update_dashboard(**{self._key: value})
+        result = await self._api.async_debounced_write(
+            f"dashboard:{self._key}",
+            lambda: self._api.async_update_dashboard(**{self._key: value}),
+        )
+        if result is DEBOUNCED:
+            return
         # Update state based on inverted logic
         if self._invert:
             self._state = value == 0
         else:
             self._state = value == 1
-        await self.coordinator.async_request_refresh()
+        # Refresh directly: a debounced refresh may run at another caller's priority
+        with request_priority(RequestPriority.USER_READ):
+            await self.coordinator.async_refresh()
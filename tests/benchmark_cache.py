@@ -0,0 +1,86 @@
+"""Microbenchmark of the device-indexed telemetry/property cache.
+
+Fills the caches of a RateLimiterCache with thousands of entries spread over
+several devices, then times cache hits, stores and the three invalidation
+granularities (one device, one property group, one property). Invalidation
+cost should not grow with the number of cached entries of other devices.
+
+Run from the repository root:
+    python -m tests.benchmark_cache
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+DEVICES = 8
+TELEMETRY_PER_DEVICE = 1000
+GROUPS_PER_DEVICE = 50
+PROPERTIES_PER_GROUP = 20
+ROUNDS = 5
+
+
+def _device(index: int) -> str:
+    return f"device-{index:02d}-0000-0000-0000-000000000000"
+
+
+def _fill(limiter: RateLimiterCache, devices: list[str], telemetry_ids: list[str], paths: list[str]) -> None:
+    for device_uuid in devices:
+        for telemetry_id in telemetry_ids:
+            limiter.set_telemetry_cache(device_uuid, telemetry_id, 1.0)
+        for path in paths:
+            limiter.set_property_cache(device_uuid, path, 1)
+
+
+def _timed(func, setup=None) -> float:
+    """Return the best time of func in microseconds over ROUNDS runs (setup is not timed)."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+async def main() -> None:
+    """Run the benchmark and print per-operation timings."""
+    devices = [_device(i) for i in range(DEVICES)]
+    telemetry_ids = [str(4000 + i) for i in range(TELEMETRY_PER_DEVICE)]
+    paths = [f"{x}/1/{z}" for x in range(GROUPS_PER_DEVICE) for z in range(PROPERTIES_PER_GROUP)]
+    entries = DEVICES * (len(telemetry_ids) + len(paths))
+
+    limiter = RateLimiterCache(cache_ttl=3600, cache_max_entries=entries)
+    _fill(limiter, devices, telemetry_ids, paths)
+    reads = [(device_uuid, telemetry_id) for device_uuid in devices for telemetry_id in telemetry_ids]
+
+    def _lookups() -> None:
+        for device_uuid, telemetry_id in reads:
+            limiter.lookup_telemetry(device_uuid, telemetry_id)
+
+    def _stores() -> None:
+        for device_uuid, telemetry_id in reads:
+            limiter.set_telemetry_cache(device_uuid, telemetry_id, 2.0)
+
+    def _refill() -> None:
+        _fill(limiter, devices[:1], telemetry_ids, paths)
+
+    results = {
+        "lookup (hit)": _timed(_lookups) / len(reads),
+        "store (update)": _timed(_stores) / len(reads),
+        "invalidate device": _timed(lambda: limiter.invalidate_cache_for_device(devices[0]), _refill),
+        "invalidate group": _timed(lambda: limiter.invalidate_property_group(devices[0], "7/1"), _refill),
+        "invalidate property": _timed(lambda: limiter.invalidate_property(devices[0], "8/1/3"), _refill),
+    }
+
+    print(f"{entries} entries across {DEVICES} devices, best of {ROUNDS} rounds")
+    for metric, micros in results.items():
+        print(f"  {metric:20s} {micros:10.3f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
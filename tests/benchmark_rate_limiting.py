@@ -0,0 +1,101 @@
+"""Benchmark request scheduling and rate limiting against the fake device.
+
+Simulates one polling cycle of several coordinators running concurrently
+(sequential telemetry and property reads plus a dashboard read) while the
+user changes the fan speed mid-cycle and a confirmation read follows.
+
+Reports end-to-end cycle time, write latency, confirmation latency and the
+smallest spacing between two requests observed by the device (which must
+never drop below ``min_request_interval``).
+
+Run from the repository root:
+    python -m tests.benchmark_rate_limiting
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import statistics
+from unittest.mock import MagicMock
+
+from custom_components.comfoclime.comfoclime_api import ComfoClimeAPI
+from custom_components.comfoclime.infrastructure import RequestPriority, request_priority
+from custom_components.comfoclime.models import DashboardUpdate
+
+from .fake_device import FAKE_DEVICE_UUID, FAKE_SYSTEM_UUID, FakeComfoClimeDevice
+
+MIN_REQUEST_INTERVAL = 0.1
+WRITE_COOLDOWN = 0.4
+TELEMETRY_READS = 20
+PROPERTY_READS = 10
+WRITE_AT = 0.3
+ROUNDS = 3
+
+
+async def _poll_telemetry(api: ComfoClimeAPI) -> None:
+    for telemetry_id in range(TELEMETRY_READS):
+        await api.async_read_telemetry_for_device(FAKE_DEVICE_UUID, str(4000 + telemetry_id), byte_count=2)
+
+
+async def _poll_properties(api: ComfoClimeAPI) -> None:
+    for z in range(PROPERTY_READS):
+        await api.async_read_property_for_device(FAKE_DEVICE_UUID, f"29/1/{z + 1}", byte_count=2)
+
+
+async def _user_write(api: ComfoClimeAPI, loop: asyncio.AbstractEventLoop) -> tuple[float, float]:
+    await asyncio.sleep(WRITE_AT)
+    start = loop.time()
+    await api.async_update_dashboard(DashboardUpdate(fan_speed=3))
+    written = loop.time()
+    with request_priority(RequestPriority.USER_READ):
+        await api.async_get_dashboard_data()
+    return written - start, loop.time() - start
+
+
+async def run_cycle() -> dict[str, float]:
+    """Run one polling cycle with a concurrent user write and return timings."""
+    async with FakeComfoClimeDevice(latency=0.02, jitter=0.01, single_request=True, seed=1) as device:
+        api = ComfoClimeAPI(
+            device.base_url,
+            min_request_interval=MIN_REQUEST_INTERVAL,
+            write_cooldown=WRITE_COOLDOWN,
+            cache_ttl=0,
+        )
+        api.uuid = FAKE_SYSTEM_UUID
+        api.hass = MagicMock()
+        api.hass.config.time_zone = "UTC"
+        loop = asyncio.get_running_loop()
+        try:
+            start = loop.time()
+            _, _, _, (write_latency, confirm_latency) = await asyncio.gather(
+                _poll_telemetry(api),
+                _poll_properties(api),
+                api.async_get_dashboard_data(),
+                _user_write(api, loop),
+            )
+            cycle_time = loop.time() - start
+        finally:
+            await api.close()
+
+    starts = sorted(record.started for record in device.stats.records)
+    spacing = min((b - a for a, b in itertools.pairwise(starts)), default=0.0)
+    return {
+        "cycle_time": cycle_time,
+        "write_latency": write_latency,
+        "confirm_latency": confirm_latency,
+        "requests": float(device.stats.total_requests),
+        "min_spacing": spacing,
+    }
+
+
+async def main() -> None:
+    """Run the benchmark and print median timings."""
+    results = [await run_cycle() for _ in range(ROUNDS)]
+    print(f"{ROUNDS} rounds, min_request_interval={MIN_REQUEST_INTERVAL}s, write_cooldown={WRITE_COOLDOWN}s")
+    for metric in ("cycle_time", "write_latency", "confirm_latency", "min_spacing", "requests"):
+        print(f"  {metric:16s} {statistics.median(r[metric] for r in results):8.3f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -77,6 +77,13 @@ class MockComfoClimeAPI:
         self.async_update_thermal_profile = AsyncMock(side_effect=self._async_update_thermal_profile)
         self.async_set_property_for_device = AsyncMock(side_effect=self._async_set_property_for_device)
 
+    def scale_delay(self, delay: float) -> float:
+        return delay
+
+    async def async_debounced_write(self, target: str, write: Any) -> Any:
+        # No debounce window in tests: every write is sent right away
+        return await write()
+
     def _record_call(self, method: str, *args: Any, **kwargs: Any) -> None:
         """Record a method call for verification."""
         self._call_history.append((method, args, kwargs))
@@ -188,6 +195,27 @@ class MockComfoClimeAPI:
             byte_count=kwargs.get("byte_count", 2),
         )
 
+    async def async_read_raw_telemetry_for_device(self, device_uuid: str, telemetry_id: str) -> bytes:
+        self._record_call(
+            "async_read_raw_telemetry_for_device",
+            device_uuid=device_uuid,
+            telemetry_id=telemetry_id,
+        )
+        raw_value = int(self.responses.telemetry_data.get(device_uuid, {}).get(str(telemetry_id), 0))
+        return raw_value.to_bytes(2, byteorder="little", signed=raw_value < 0)
+
+    async def async_read_raw_property_for_device(self, device_uuid: str, property_path: str, byte_count=None):
+        self._record_call(
+            "async_read_raw_property_for_device",
+            device_uuid=device_uuid,
+            property_path=property_path,
+            byte_count=byte_count,
+        )
+        raw_value = self.responses.property_data.get(device_uuid, {}).get(property_path, 0)
+        if isinstance(raw_value, str):
+            return raw_value
+        return int(raw_value).to_bytes(2, byteorder="little", signed=raw_value < 0)
+
     async def _async_set_property_for_device(
         self,
         device_uuid: str | None = None,
@@ -322,6 +350,7 @@ def mock_coordinator():
         supply_air_flow=200,
     )
     coordinator.async_request_refresh = AsyncMock()
+    coordinator.async_refresh = AsyncMock()
     coordinator.async_config_entry_first_refresh = AsyncMock()
     coordinator.async_add_listener = MagicMock(return_value=lambda: None)
     coordinator.last_update_success = True
@@ -345,6 +374,7 @@ def mock_thermalprofile_coordinator():
         temperature_profile=0,
     )
     coordinator.async_request_refresh = AsyncMock()
+    coordinator.async_refresh = AsyncMock()
     coordinator.async_config_entry_first_refresh = AsyncMock()
     coordinator.async_add_listener = MagicMock(return_value=lambda: None)
     coordinator.last_update_success = True
@@ -363,11 +393,13 @@ def mock_telemetry_coordinator():
         }
     }
     coordinator.async_request_refresh = AsyncMock()
+    coordinator.async_refresh = AsyncMock()
     coordinator.async_config_entry_first_refresh = AsyncMock()
     coordinator.async_add_listener = MagicMock(return_value=lambda: None)
     coordinator.last_update_success = True
     coordinator.last_update_success_time = datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC)
     coordinator.register_telemetry = AsyncMock()
+    coordinator.async_fetch_pending = AsyncMock()
     coordinator.get_telemetry_value = MagicMock(return_value=25.5)
     return coordinator
 
@@ -383,11 +415,14 @@ def mock_property_coordinator():
         }
     }
     coordinator.async_request_refresh = AsyncMock()
+    coordinator.async_refresh = AsyncMock()
     coordinator.async_config_entry_first_refresh = AsyncMock()
     coordinator.async_add_listener = MagicMock(return_value=lambda: None)
     coordinator.last_update_success = True
     coordinator.last_update_success_time = datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC)
     coordinator.register_property = AsyncMock()
+    coordinator.async_fetch_pending = AsyncMock()
+    coordinator.async_read_back = AsyncMock()
     coordinator.get_property_value = MagicMock(return_value=100)
     return coordinator
 
@@ -406,6 +441,7 @@ def mock_definition_coordinator():
         )
     }
     coordinator.async_request_refresh = AsyncMock()
+    coordinator.async_refresh = AsyncMock()
     coordinator.async_config_entry_first_refresh = AsyncMock()
     coordinator.async_add_listener = MagicMock(return_value=lambda: None)
     coordinator.last_update_success = True
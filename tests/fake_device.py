@@ -0,0 +1,465 @@
+"""In-process fake ComfoClime device for integration and load testing.
+
+The fake device is a small aiohttp server that speaks the same local HTTP
+API as a real ComfoClime unit (Airduino board). It lets ``ComfoClimeAPI`` and
+the coordinators run against a real socket instead of mocks, so poll-cycle
+duration, lock contention and request rates can actually be measured.
+
+Supported endpoints:
+    - GET  /monitoring/ping
+    - GET  /system/{uuid}/dashboard
+    - PUT  /system/{uuid}/dashboard
+    - GET  /system/{uuid}/thermalprofile
+    - PUT  /system/{uuid}/thermalprofile
+    - GET  /system/{uuid}/devices
+    - GET  /device/{uuid}/definition
+    - GET  /device/{uuid}/telemetry/{id}
+    - GET  /device/{uuid}/property/{x}/{y}/{z}
+    - PUT  /device/{uuid}/method/{x}/{y}/3
+    - PUT  /system/reset
+
+Behaviour knobs:
+    - ``latency`` / ``jitter``: per-request service time in seconds
+    - ``single_request``: serve one request at a time, like the real device
+    - ``inject_fault()``: make matching requests time out or return 5xx
+
+Example:
+    >>> async with FakeComfoClimeDevice(latency=0.05, single_request=True) as device:
+    ...     api = ComfoClimeAPI(device.base_url, min_request_interval=0)
+    ...     await api.async_get_dashboard_data()
+    ...     print(device.stats.total_requests, device.stats.max_concurrency)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import random
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+FAKE_SYSTEM_UUID = "fake-system-uuid"
+FAKE_DEVICE_UUID = "fake-device-uuid"
+
+FAULT_TIMEOUT = "timeout"
+FAULT_ERROR = "error"
+
+
+@dataclass
+class RequestRecord:
+    """A single request served by the fake device."""
+
+    method: str
+    path: str
+    received: float
+    started: float
+    finished: float
+    status: int
+
+    @property
+    def queue_time(self) -> float:
+        """Time the request waited for the device to become free."""
+        return self.started - self.received
+
+    @property
+    def service_time(self) -> float:
+        """Time spent handling the request once it was admitted."""
+        return self.finished - self.started
+
+
+@dataclass
+class FakeDeviceStats:
+    """Request statistics collected by the fake device."""
+
+    records: list[RequestRecord] = field(default_factory=list)
+    in_flight: int = 0
+    max_concurrency: int = 0
+    _recorded: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    def add(self, record: RequestRecord) -> None:
+        """Record a finished request and wake up wait_for callers."""
+        self.records.append(record)
+        self._recorded.set()
+
+    async def wait_for(self, method: str | None = None, path: str | None = None, count: int = 1) -> None:
+        """Wait until ``count`` requests matching method and path regex have finished."""
+        while self.count(method, path) < count:
+            self._recorded.clear()
+            await self._recorded.wait()
+
+    @property
+    def total_requests(self) -> int:
+        """Number of requests received (including failed ones)."""
+        return len(self.records)
+
+    def count(self, method: str | None = None, path: str | None = None) -> int:
+        """Count requests matching a method and/or a path regex."""
+        return sum(
+            1
+            for record in self.records
+            if (method is None or record.method == method) and (path is None or re.search(path, record.path))
+        )
+
+    @property
+    def duration(self) -> float:
+        """Wall time between the first request received and the last one finished."""
+        if not self.records:
+            return 0.0
+        return max(r.finished for r in self.records) - min(r.received for r in self.records)
+
+    @property
+    def requests_per_second(self) -> float:
+        """Average request rate over the recorded window."""
+        duration = self.duration
+        return self.total_requests / duration if duration > 0 else 0.0
+
+    def reset(self) -> None:
+        """Forget all recorded requests."""
+        self.records.clear()
+        self.max_concurrency = self.in_flight
+
+
+@dataclass
+class _Fault:
+    """An injected fault for requests matching ``method`` and ``path``."""
+
+    kind: str
+    method: str | None
+    path: re.Pattern[str]
+    status: int
+    remaining: int | None
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.remaining is not None and self.remaining <= 0:
+            return False
+        return (self.method is None or self.method == method) and bool(self.path.search(path))
+
+
+def _default_dashboard() -> dict[str, Any]:
+    return {
+        "indoorTemperature": 22.5,
+        "outdoorTemperature": 15.0,
+        "exhaustAirFlow": 200,
+        "supplyAirFlow": 200,
+        "fanSpeed": 2,
+        "seasonProfile": 0,
+        "temperatureProfile": 0,
+        "season": 1,
+        "schedule": 0,
+        "status": 1,
+        "heatPumpStatus": 3,
+        "hpStandby": False,
+        "freeCoolingEnabled": False,
+        "caqFreeCoolingAvailable": False,
+    }
+
+
+def _default_thermal_profile() -> dict[str, Any]:
+    return {
+        "season": {
+            "status": 1,
+            "season": 1,
+            "heatingThresholdTemperature": 14.0,
+            "coolingThresholdTemperature": 17.0,
+        },
+        "temperature": {"status": 1, "manualTemperature": 22.0},
+        "temperatureProfile": 0,
+        "heatingThermalProfileSeasonData": {
+            "comfortTemperature": 21.5,
+            "kneePointTemperature": 12.5,
+            "reductionDeltaTemperature": 1.5,
+        },
+        "coolingThermalProfileSeasonData": {
+            "comfortTemperature": 24.0,
+            "kneePointTemperature": 18.0,
+            "temperatureLimit": 26.0,
+        },
+    }
+
+
+class FakeComfoClimeDevice:
+    """In-process stand-in for a ComfoClime device.
+
+    Telemetry and property values are stored as raw little-endian byte lists,
+    exactly as the device returns them. Unknown telemetry IDs and properties
+    answer with zero bytes so large registries can be polled without seeding
+    every key.
+
+    Attributes:
+        uuid: System UUID reported by /monitoring/ping
+        device_uuid: UUID of the single connected device
+        latency: Base service time per request in seconds
+        jitter: Maximum random extra service time per request in seconds
+        single_request: If True, requests are served strictly one at a time
+        stats: Collected request statistics
+    """
+
+    def __init__(
+        self,
+        *,
+        uuid: str = FAKE_SYSTEM_UUID,
+        device_uuid: str = FAKE_DEVICE_UUID,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        single_request: bool = False,
+        timeout_delay: float = 60.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the fake device.
+
+        Args:
+            uuid: System UUID reported by /monitoring/ping
+            device_uuid: UUID of the connected device listed under /devices
+            latency: Base service time per request in seconds
+            jitter: Maximum random extra service time per request in seconds
+            single_request: Serve one request at a time like the real Airduino
+            timeout_delay: How long an injected timeout stalls before answering
+            seed: Optional seed for reproducible jitter
+        """
+        self.uuid = uuid
+        self.device_uuid = device_uuid
+        self.latency = latency
+        self.jitter = jitter
+        self.single_request = single_request
+        self.timeout_delay = timeout_delay
+        self.stats = FakeDeviceStats()
+
+        self.dashboard: dict[str, Any] = _default_dashboard()
+        self.thermal_profile: dict[str, Any] = _default_thermal_profile()
+        self.devices: list[dict[str, Any]] = [
+            {
+                "uuid": device_uuid,
+                "modelTypeId": 20,
+                "displayName": "ComfoClime 36",
+                "version": "R1.5.5",
+                "@modelType": "ComfoClime",
+            }
+        ]
+        self.telemetry: dict[tuple[str, str], list[int]] = {}
+        self.properties: dict[tuple[str, str], list[int]] = {}
+        self.dashboard_writes: list[dict[str, Any]] = []
+        self.thermal_profile_writes: list[dict[str, Any]] = []
+        self.property_writes: list[tuple[str, str, list[int]]] = []
+        self.reset_count = 0
+
+        self._faults: list[_Fault] = []
+        self._random = random.Random(seed)
+        self._device_lock = asyncio.Lock()
+        self._server: TestServer | None = None
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    async def start(self) -> str:
+        """Start the HTTP server on a free localhost port.
+
+        Returns:
+            Base URL of the running fake device.
+        """
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/monitoring/ping", self._handle_ping)
+        app.router.add_get("/system/{uuid}/dashboard", self._handle_get_dashboard)
+        app.router.add_put("/system/{uuid}/dashboard", self._handle_put_dashboard)
+        app.router.add_get("/system/{uuid}/thermalprofile", self._handle_get_thermal_profile)
+        app.router.add_put("/system/{uuid}/thermalprofile", self._handle_put_thermal_profile)
+        app.router.add_get("/system/{uuid}/devices", self._handle_devices)
+        app.router.add_put("/system/reset", self._handle_reset)
+        app.router.add_get("/device/{device_uuid}/definition", self._handle_definition)
+        app.router.add_get("/device/{device_uuid}/telemetry/{telemetry_id}", self._handle_telemetry)
+        app.router.add_get("/device/{device_uuid}/property/{x}/{y}/{z}", self._handle_get_property)
+        app.router.add_put("/device/{device_uuid}/method/{x}/{y}/3", self._handle_put_property)
+
+        self._server = TestServer(app, host="127.0.0.1")
+        await self._server.start_server()
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop the HTTP server."""
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    async def __aenter__(self) -> FakeComfoClimeDevice:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the running server (without trailing slash)."""
+        if self._server is None:
+            raise RuntimeError("Fake device is not running")
+        return str(self._server.make_url("")).rstrip("/")
+
+    # -------------------------------------------------------------------------
+    # State seeding
+    # -------------------------------------------------------------------------
+
+    def set_telemetry(self, telemetry_id: str | int, data: list[int], device_uuid: str | None = None) -> None:
+        """Seed the raw bytes returned for a telemetry ID."""
+        self.telemetry[(device_uuid or self.device_uuid, str(telemetry_id))] = list(data)
+
+    def set_property(self, path: str, data: list[int], device_uuid: str | None = None) -> None:
+        """Seed the raw bytes returned for a property path ("X/Y/Z")."""
+        self.properties[(device_uuid or self.device_uuid, path)] = list(data)
+
+    # -------------------------------------------------------------------------
+    # Fault injection
+    # -------------------------------------------------------------------------
+
+    def inject_fault(
+        self,
+        kind: str = FAULT_ERROR,
+        *,
+        path: str = ".*",
+        method: str | None = None,
+        status: int = 500,
+        count: int | None = 1,
+    ) -> None:
+        """Make matching requests fail.
+
+        Args:
+            kind: FAULT_ERROR answers with ``status``; FAULT_TIMEOUT stalls for
+                ``timeout_delay`` seconds so the client hits its own timeout.
+            path: Regex searched in the request path
+            method: Optional HTTP method filter ("GET"/"PUT")
+            status: HTTP status for FAULT_ERROR
+            count: Number of requests to fail (None = until cleared)
+        """
+        if kind not in (FAULT_ERROR, FAULT_TIMEOUT):
+            raise ValueError(f"Unknown fault kind: {kind}")
+        self._faults.append(_Fault(kind, method, re.compile(path), status, count))
+
+    def clear_faults(self) -> None:
+        """Remove all injected faults."""
+        self._faults.clear()
+
+    def _take_fault(self, method: str, path: str) -> _Fault | None:
+        for fault in self._faults:
+            if fault.matches(method, path):
+                if fault.remaining is not None:
+                    fault.remaining -= 1
+                return fault
+        return None
+
+    # -------------------------------------------------------------------------
+    # Request pipeline
+    # -------------------------------------------------------------------------
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        loop = asyncio.get_running_loop()
+        received = loop.time()
+        status = 500
+
+        if self.single_request:
+            await self._device_lock.acquire()
+        started = loop.time()
+        self.stats.in_flight += 1
+        self.stats.max_concurrency = max(self.stats.max_concurrency, self.stats.in_flight)
+        try:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            fault = self._take_fault(request.method, request.path)
+            if fault is not None and fault.kind == FAULT_TIMEOUT:
+                await asyncio.sleep(self.timeout_delay)
+                status = 504
+                return web.Response(status=status)
+            if fault is not None:
+                status = fault.status
+                return web.Response(status=status, text="Injected fault")
+
+            response = await handler(request)
+            status = response.status
+            return response
+        except web.HTTPException as err:
+            status = err.status
+            raise
+        finally:
+            self.stats.in_flight -= 1
+            if self.single_request:
+                self._device_lock.release()
+            self.stats.add(RequestRecord(request.method, request.path, received, started, loop.time(), status))
+
+    def _check_system_uuid(self, request: web.Request) -> None:
+        if request.match_info["uuid"] != self.uuid:
+            raise web.HTTPNotFound
+
+    # -------------------------------------------------------------------------
+    # Handlers
+    # -------------------------------------------------------------------------
+
+    async def _handle_ping(self, request: web.Request) -> web.Response:
+        return web.json_response({"uuid": self.uuid, "uptime": 12345, "timestamp": "2025-01-01T00:00:00Z"})
+
+    async def _handle_get_dashboard(self, request: web.Request) -> web.Response:
+        self._check_system_uuid(request)
+        return web.json_response(self.dashboard)
+
+    async def _handle_put_dashboard(self, request: web.Request) -> web.Response:
+        self._check_system_uuid(request)
+        payload = await request.json()
+        self.dashboard_writes.append(payload)
+        self.dashboard.update({k: v for k, v in payload.items() if k != "timestamp"})
+        return web.json_response(self.dashboard)
+
+    async def _handle_get_thermal_profile(self, request: web.Request) -> web.Response:
+        self._check_system_uuid(request)
+        return web.json_response(self.thermal_profile)
+
+    async def _handle_put_thermal_profile(self, request: web.Request) -> web.Response:
+        self._check_system_uuid(request)
+        payload = await request.json()
+        self.thermal_profile_writes.append(payload)
+        for key, value in payload.items():
+            if isinstance(value, dict) and isinstance(self.thermal_profile.get(key), dict):
+                self.thermal_profile[key].update(value)
+            else:
+                self.thermal_profile[key] = value
+        return web.Response(status=200)
+
+    async def _handle_devices(self, request: web.Request) -> web.Response:
+        self._check_system_uuid(request)
+        return web.json_response({"devices": copy.deepcopy(self.devices)})
+
+    async def _handle_reset(self, request: web.Request) -> web.Response:
+        self.reset_count += 1
+        return web.Response(status=200)
+
+    async def _handle_definition(self, request: web.Request) -> web.Response:
+        device_uuid = request.match_info["device_uuid"]
+        device = next((d for d in self.devices if d["uuid"] == device_uuid), None)
+        if device is None:
+            raise web.HTTPNotFound
+        return web.json_response(
+            {"indoorTemperature": 22.5, "outdoorTemperature": 15.0, "exhaustAirFlow": 200, "supplyAirFlow": 200}
+        )
+
+    async def _handle_telemetry(self, request: web.Request) -> web.Response:
+        key = (request.match_info["device_uuid"], request.match_info["telemetry_id"])
+        return web.json_response({"data": self.telemetry.get(key, [0, 0])})
+
+    async def _handle_get_property(self, request: web.Request) -> web.Response:
+        info = request.match_info
+        key = (info["device_uuid"], f"{info['x']}/{info['y']}/{info['z']}")
+        return web.json_response({"data": self.properties.get(key, [0, 0])})
+
+    async def _handle_put_property(self, request: web.Request) -> web.Response:
+        info = request.match_info
+        payload = await request.json()
+        data = payload.get("data")
+        if not isinstance(data, list) or not data:
+            raise web.HTTPBadRequest
+        path = f"{info['x']}/{info['y']}/{data[0]}"
+        self.property_writes.append((info["device_uuid"], path, list(data[1:])))
+        self.properties[(info["device_uuid"], path)] = list(data[1:])
+        return web.Response(status=200)
@@ -123,6 +123,18 @@ class TestAccessTracker:
         assert "per_minute" in summary["Dashboard"]
         assert "per_hour" in summary["Dashboard"]
 
+    def test_suppressed_updates(self):
+        """Test counting entity updates skipped by the coordinators."""
+        tracker = AccessTracker()
+
+        tracker.record_suppressed_updates("Dashboard", 3)
+        tracker.record_suppressed_updates("Telemetry", 2)
+        tracker.record_suppressed_updates("Dashboard", 1)
+
+        assert tracker.get_suppressed_updates("Dashboard") == 4
+        assert tracker.get_suppressed_updates("Property") == 0
+        assert tracker.get_total_suppressed_updates() == 6
+
     def test_old_entries_cleanup(self):
         """Test that old entries are cleaned up after the hour window."""
         AccessTracker()
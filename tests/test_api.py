@@ -1,5 +1,6 @@
 """Tests for ComfoClime API."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -44,6 +45,7 @@ class TestComfoClimeAPI:
             min_request_interval=0.2,
             write_cooldown=3.0,
             request_debounce=0.5,
+            write_combine_window=0.05,
         )
 
         assert api.base_url == "http://192.168.1.100"
@@ -54,6 +56,7 @@ class TestComfoClimeAPI:
         assert api._rate_limiter.min_request_interval == 0.2
         assert api._rate_limiter.write_cooldown == 3.0
         assert api._rate_limiter.request_debounce == 0.5
+        assert api._rate_limiter.write_combine_window == 0.05
 
     def test_api_initialization_strips_trailing_slash(self):
         """Test API initialization strips trailing slash."""
@@ -467,6 +470,575 @@ class TestComfoClimeAPIRateLimiting:
         assert api._rate_limiter._last_write_time > 0.0
 
 
+class TestRateLimiterReservations:
+    """Test send time reservations and in-slot send claims."""
+
+    def test_reservations_are_spaced_per_class(self):
+        """Test that consecutive reservations of one class are spaced by the interval."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache(min_request_interval=0.5, write_cooldown=0)
+        limiter._get_current_time = MagicMock(return_value=100.0)
+
+        assert [limiter.reserve() for _ in range(3)] == [100.0, 100.5, 101.0]
+
+    def test_write_not_queued_behind_read_reservations(self):
+        """Test that writes do not wait for reservations handed out to reads."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache(min_request_interval=0.5, write_cooldown=0)
+        limiter._get_current_time = MagicMock(return_value=100.0)
+        for _ in range(10):
+            limiter.reserve()
+
+        assert limiter.reserve(is_write=True) == 100.0
+
+    def test_user_reads_have_own_reservations(self):
+        """Test that user reads do not queue behind polling reservations."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache, RequestPriority, request_priority
+
+        limiter = RateLimiterCache(min_request_interval=0.5, write_cooldown=0)
+        limiter._get_current_time = MagicMock(return_value=100.0)
+        for _ in range(10):
+            limiter.reserve()
+
+        with request_priority(RequestPriority.USER_READ):
+            assert limiter.reserve() == 100.0
+
+    def test_read_reservation_respects_write_cooldown(self):
+        """Test that reads are reserved after the write cooldown."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache(min_request_interval=0.5, write_cooldown=2.0)
+        limiter._get_current_time = MagicMock(return_value=100.0)
+        limiter._last_request_time = 99.5
+        limiter._last_write_time = 99.5
+
+        assert limiter.reserve() == 101.5
+        assert limiter.reserve(is_write=True) == 100.0
+
+    @pytest.mark.asyncio
+    async def test_claim_send_records_request(self):
+        """Test that claim_send records the send time."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache(min_request_interval=0, write_cooldown=0)
+
+        assert await limiter.claim_send(is_write=True) is True
+        assert limiter._last_request_time > 0
+        assert limiter._last_write_time == limiter._last_request_time
+
+    @pytest.mark.asyncio
+    async def test_claim_send_defers_read_during_write_cooldown(self):
+        """Test that a read inside the write cooldown is deferred instead of sleeping in the slot."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache(min_request_interval=0.1, write_cooldown=2.0)
+        await limiter.claim_send(is_write=True)
+        last_request = limiter._last_request_time
+
+        assert await limiter.claim_send(is_write=False) is False
+        assert limiter._last_request_time == last_request
+
+    @pytest.mark.asyncio
+    async def test_claim_send_without_defer_waits(self):
+        """Test that may_defer=False sleeps out the remaining wait."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache(min_request_interval=0.05, write_cooldown=0.1)
+        await limiter.claim_send(is_write=True)
+
+        assert await limiter.claim_send(is_write=False, may_defer=False) is True
+        assert limiter._last_request_time - limiter._last_write_time >= 0.1
+
+
+class TestRateLimiterSingleFlight:
+    """Test single-flight coalescing of identical concurrent reads."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        """Test that concurrent callers with the same key share one execution."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache()
+        calls = []
+
+        async def fetch():
+            calls.append(True)
+            await asyncio.sleep(0.01)
+            return {"value": 1}
+
+        results = await asyncio.gather(*(limiter.single_flight("GET /a", fetch) for _ in range(3)))
+
+        assert results == [{"value": 1}] * 3
+        assert len(calls) == 1
+        assert limiter.coalesced_requests == 2
+        assert limiter._inflight_reads == {}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_not_coalesced(self):
+        """Test that different keys execute independently."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache()
+        calls = []
+
+        async def fetch():
+            calls.append(True)
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(limiter.single_flight("GET /a", fetch), limiter.single_flight("GET /b", fetch))
+
+        assert len(calls) == 2
+        assert limiter.coalesced_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_coalesced(self):
+        """Test that a finished request is not reused by later callers."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache()
+        fetch = AsyncMock(side_effect=[1, 2])
+
+        assert await limiter.single_flight("GET /a", fetch) == 1
+        assert await limiter.single_flight("GET /a", fetch) == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_all_waiters(self):
+        """Test that all coalesced callers receive the shared exception."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise TimeoutError
+
+        results = await asyncio.gather(
+            limiter.single_flight("GET /a", fetch),
+            limiter.single_flight("GET /a", fetch),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, TimeoutError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_request(self):
+        """Test that one cancelled caller does not abort the request for others."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.create_task(limiter.single_flight("GET /a", fetch))
+        second = asyncio.create_task(limiter.single_flight("GET /a", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestRateLimiterDebounce:
+    """Test latest-wins debouncing of writes to the same target."""
+
+    @pytest.mark.asyncio
+    async def test_rapid_writes_collapse_into_last(self):
+        """Test that only the last of several rapid writes is sent."""
+        from custom_components.comfoclime.infrastructure import DEBOUNCED, RateLimiterCache
+
+        limiter = RateLimiterCache(request_debounce=0.05)
+        sent = []
+
+        def write(value):
+            async def send():
+                sent.append(value)
+                return value
+
+            return send
+
+        results = await asyncio.gather(*(limiter.debounced_request("dashboard:fan_speed", write(v)) for v in (1, 2, 3)))
+
+        assert results == [DEBOUNCED, DEBOUNCED, 3]
+        assert sent == [3]
+        assert limiter.debounced_requests == 2
+        assert limiter._pending_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_different_targets_not_debounced(self):
+        """Test that writes to different targets are all sent."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache(request_debounce=0.01)
+        write = AsyncMock(side_effect=[1, 2])
+
+        results = await asyncio.gather(
+            limiter.debounced_request("dashboard:fan_speed", write),
+            limiter.debounced_request("dashboard:scenario", write),
+        )
+
+        assert sorted(results) == [1, 2]
+        assert limiter.debounced_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_zero_window_sends_immediately(self):
+        """Test that a disabled debounce window sends every write."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache(request_debounce=0)
+        write = AsyncMock(return_value="ok")
+
+        assert await limiter.debounced_request("dashboard:fan_speed", write) == "ok"
+        assert await limiter.debounced_request("dashboard:fan_speed", write) == "ok"
+        assert write.await_count == 2
+
+
+class TestRateLimiterWriteCombining:
+    """Test combining concurrent writes to one endpoint into one request."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_one_request(self):
+        """Test that fields written within the window are merged, later values winning."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache(write_combine_window=0.01)
+        send = AsyncMock(return_value={"status": 200})
+
+        results = await asyncio.gather(
+            limiter.combined_write("dashboard", {"fan_speed": 1, "status": 0}, send),
+            limiter.combined_write("dashboard", {"status": 1, "season_profile": 2}, send),
+            limiter.combined_write("dashboard", {"scenario": 4}, send),
+        )
+
+        send.assert_awaited_once_with({"fan_speed": 1, "status": 1, "season_profile": 2, "scenario": 4})
+        assert results == [{"status": 200}] * 3
+        assert limiter.combined_writes == 2
+        assert limiter._pending_writes == {}
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_all_writers(self):
+        """Test that all combined writers receive the shared exception."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache(write_combine_window=0.01)
+        send = AsyncMock(side_effect=TimeoutError)
+
+        results = await asyncio.gather(
+            limiter.combined_write("dashboard", {"fan_speed": 1}, send),
+            limiter.combined_write("dashboard", {"status": 1}, send),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, TimeoutError) for r in results)
+        send.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sequential_writes_not_combined(self):
+        """Test that a write after the batch was sent opens a new one."""
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        limiter = RateLimiterCache(write_combine_window=0.01)
+        send = AsyncMock(side_effect=[1, 2])
+
+        assert await limiter.combined_write("dashboard", {"fan_speed": 1}, send) == 1
+        assert await limiter.combined_write("dashboard", {"fan_speed": 2}, send) == 2
+        assert limiter.combined_writes == 0
+
+    @pytest.mark.asyncio
+    async def test_api_combines_dashboard_updates(self):
+        """Test that concurrent dashboard updates reach the device as one PUT."""
+        api = ComfoClimeAPI("http://192.168.1.100")
+        api.uuid = "test-uuid"
+        api.hass = MagicMock()
+        api.hass.config.time_zone = "Europe/Berlin"
+
+        mock_response = AsyncMock()
+        mock_response.json = AsyncMock(return_value={})
+        mock_response.raise_for_status = MagicMock()
+        mock_session = AsyncMock()
+        mock_session.put = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response)))
+
+        with patch.object(api, "_get_session", AsyncMock(return_value=mock_session)):
+            await asyncio.gather(
+                api.async_update_dashboard(DashboardUpdate(fan_speed=2)),
+                api.async_update_dashboard(DashboardUpdate(temperature_profile=1, season_profile=1, status=1)),
+            )
+
+        mock_session.put.assert_called_once()
+        payload = mock_session.put.call_args.kwargs["json"]
+        assert payload["fanSpeed"] == 2
+        assert payload["temperatureProfile"] == 1
+        assert payload["status"] == 1
+
+
+class TestComfoClimeAPINoOpWrites:
+    """Test skipping writes the device state already satisfies."""
+
+    @staticmethod
+    async def _read(api, read, response_data):
+        mock_response = AsyncMock()
+        mock_response.json = AsyncMock(return_value=response_data)
+        mock_response.raise_for_status = MagicMock()
+        mock_session = AsyncMock()
+        mock_session.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response)))
+        with patch.object(api, "_get_session", AsyncMock(return_value=mock_session)):
+            await read()
+
+    async def _read_dashboard(self, api, dashboard):
+        await self._read(api, api.async_get_dashboard_data, dashboard)
+
+    @staticmethod
+    def _make_api():
+        api = ComfoClimeAPI("http://192.168.1.100", cache_ttl=30)
+        api.uuid = "test-uuid"
+        api._rate_limiter.write_combine_window = 0
+        api._async_update_dashboard_internal = AsyncMock(return_value={})
+        api._async_update_thermal_profile = AsyncMock(return_value={})
+        api._set_property_internal = AsyncMock(return_value={})
+        return api
+
+    @pytest.mark.asyncio
+    async def test_unchanged_dashboard_write_skipped(self):
+        """Test that re-asserting the read dashboard state sends nothing."""
+        api = self._make_api()
+        await self._read_dashboard(api, {"fanSpeed": 2, "status": 1, "hpStandby": False})
+
+        response = await api.async_update_dashboard(DashboardUpdate(fan_speed=2, hp_standby=False))
+
+        api._async_update_dashboard_internal.assert_not_awaited()
+        assert response.status == 200
+        assert api.suppressed_writes == 1
+
+    @pytest.mark.asyncio
+    async def test_dashboard_write_sent_when_known_state_is_stale(self):
+        """Test that a dashboard state read longer than the cache TTL ago does not suppress a write."""
+        api = self._make_api()
+        await self._read_dashboard(api, {"fanSpeed": 2, "status": 1})
+
+        # The fan speed may have been changed on the device panel since
+        now = api._rate_limiter._get_current_time()
+        with patch.object(api._rate_limiter, "_get_current_time", return_value=now + 31):
+            await api.async_update_dashboard(DashboardUpdate(fan_speed=2))
+
+        api._async_update_dashboard_internal.assert_awaited_once_with(DashboardUpdate(fan_speed=2))
+        assert api.suppressed_writes == 0
+
+    @pytest.mark.asyncio
+    async def test_only_changed_dashboard_fields_sent(self):
+        """Test that fields the device already reports are dropped from a write."""
+        api = self._make_api()
+        await self._read_dashboard(api, {"fanSpeed": 2, "status": 1})
+
+        await api.async_update_dashboard(DashboardUpdate(fan_speed=3, status=1))
+
+        api._async_update_dashboard_internal.assert_awaited_once_with(DashboardUpdate(fan_speed=3))
+
+    @pytest.mark.asyncio
+    async def test_written_dashboard_fields_unknown_until_reported(self):
+        """Test that a repeated write is sent unless the device reported the written value."""
+        api = self._make_api()
+        await self._read_dashboard(api, {"setPointTemperature": 21.0, "status": 1})
+
+        # The device may ignore a set point in automatic mode, so the write is repeated
+        await api.async_update_dashboard(DashboardUpdate(set_point_temperature=22.0))
+        await api.async_update_dashboard(DashboardUpdate(set_point_temperature=22.0))
+        assert api._async_update_dashboard_internal.await_count == 2
+
+        # A response reporting the written value confirms it
+        api._async_update_dashboard_internal.return_value = {"setPointTemperature": 22.0}
+        await api.async_update_dashboard(DashboardUpdate(set_point_temperature=22.0))
+        await api.async_update_dashboard(DashboardUpdate(set_point_temperature=22.0))
+        assert api._async_update_dashboard_internal.await_count == 3
+        assert api.suppressed_writes == 1
+
+    @pytest.mark.asyncio
+    async def test_forced_and_scenario_writes_always_sent(self):
+        """Test that forced writes and scenario fields are sent even if nothing changes."""
+        api = self._make_api()
+        await self._read_dashboard(api, {"fanSpeed": 2, "scenario": 4})
+
+        await api.async_update_dashboard(DashboardUpdate(fan_speed=2), force=True)
+        await api.async_update_dashboard(DashboardUpdate(scenario=4, scenario_time_left=1800))
+
+        assert api._async_update_dashboard_internal.await_count == 2
+        assert api.suppressed_writes == 0
+
+    @pytest.mark.asyncio
+    async def test_unchanged_thermal_profile_write_skipped(self):
+        """Test that thermal profile fields the last read reports are not written again."""
+        api = self._make_api()
+        await self._read(
+            api,
+            api.async_get_thermal_profile,
+            {"season": {"status": 1, "season": 1}, "temperature": {"status": 0, "manualTemperature": 22.0}},
+        )
+
+        await api.async_update_thermal_profile(season_value=1, manual_temperature=22.0)
+        await api.async_update_thermal_profile({"season": {"season": 1}})
+        assert api._async_update_thermal_profile.await_count == 0
+
+        # A forced write is sent, and its fields are unknown until the next read
+        await api.async_update_thermal_profile(season_value=1, force=True)
+        await api.async_update_thermal_profile(season_value=1)
+        assert api._async_update_thermal_profile.await_count == 2
+        assert api.suppressed_writes == 2
+
+    @pytest.mark.asyncio
+    async def test_property_write_skipped_when_read_value_matches(self):
+        """Test that a property is not written if a fresh read returned the same bytes."""
+        api = self._make_api()
+        api._rate_limiter.set_property_cache("device-1", "29/1/10", bytes([225, 0]))
+
+        await api.async_set_property_for_device("device-1", "29/1/10", value=22.5, byte_count=2, faktor=0.1)
+        api._set_property_internal.assert_not_awaited()
+
+        await api.async_set_property_for_device("device-1", "29/1/10", value=23.0, byte_count=2, faktor=0.1)
+        api._set_property_internal.assert_awaited_once()
+
+
+class TestRateLimiterAdaptiveRateControl:
+    """Test adaptive (AIMD) request spacing."""
+
+    @staticmethod
+    def _limiter(**kwargs):
+        from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+        params = {
+            "min_request_interval": 0.5,
+            "write_cooldown": 2.0,
+            "adaptive": True,
+            "adaptive_min_interval": 0.1,
+            "adaptive_max_interval": 4.0,
+        }
+        params.update(kwargs)
+        limiter = RateLimiterCache(**params)
+        limiter._get_current_time = MagicMock(return_value=100.0)
+        return limiter
+
+    def test_static_without_adaptive_mode(self):
+        """Test that failures only update statistics when adaptive mode is off."""
+        limiter = self._limiter(adaptive=False)
+
+        limiter.record_result(5.0, success=False)
+
+        assert limiter.min_request_interval == 0.5
+        assert limiter.write_cooldown == 2.0
+        assert limiter.latency == 5.0
+        assert limiter.error_rate == pytest.approx(0.2)
+        assert limiter.delay_scale == 1.0
+
+    def test_failure_increases_interval_multiplicatively(self):
+        """Test that a failure doubles the interval and scales the write cooldown."""
+        limiter = self._limiter()
+
+        limiter.record_result(0.2, success=False)
+
+        assert limiter.min_request_interval == pytest.approx(1.0)
+        assert limiter.write_cooldown == pytest.approx(4.0)
+        assert limiter.delay_scale == pytest.approx(2.0)
+
+    def test_slow_response_counts_as_overload(self):
+        """Test that a response above the latency threshold backs off."""
+        limiter = self._limiter(latency_threshold=1.0)
+
+        limiter.record_result(1.5, success=True)
+
+        assert limiter.min_request_interval == pytest.approx(1.0)
+        assert limiter.error_rate == 0.0
+
+    def test_healthy_responses_decrease_interval_additively(self):
+        """Test that healthy responses shrink the interval down to the lower bound."""
+        limiter = self._limiter()
+
+        limiter.record_result(0.1, success=True)
+        assert limiter.min_request_interval == pytest.approx(0.49)
+
+        for _ in range(100):
+            limiter.record_result(0.1, success=True)
+        assert limiter.min_request_interval == pytest.approx(0.1)
+
+    def test_interval_bounded_by_max(self):
+        """Test that repeated overload never exceeds the upper bound."""
+        limiter = self._limiter()
+
+        for step in range(10):
+            limiter._get_current_time.return_value = 100.0 + step
+            limiter.record_result(0.2, success=False, sent_at=100.0 + step)
+
+        assert limiter.min_request_interval == 4.0
+
+    def test_burst_of_failures_backs_off_once(self):
+        """Test that requests sent before the last increase do not increase again."""
+        limiter = self._limiter()
+
+        limiter.record_result(0.2, success=False, sent_at=99.0)
+        limiter.record_result(0.2, success=False, sent_at=99.5)
+
+        assert limiter.min_request_interval == pytest.approx(1.0)
+
+    def test_initial_interval_clamped_to_bounds(self):
+        """Test that a configured interval outside the bounds is clamped."""
+        assert self._limiter(min_request_interval=0).min_request_interval == 0.1
+        assert self._limiter(min_request_interval=10).min_request_interval == 4.0
+
+    def test_state_round_trip(self):
+        """Test that a learned state is restored and clamped to the current bounds."""
+        limiter = self._limiter()
+        limiter.record_result(0.3, success=False)
+        state = limiter.rate_control_state()
+
+        restored = self._limiter(adaptive_max_interval=0.8)
+        restored.restore_rate_control_state(state)
+
+        assert state["request_interval"] == pytest.approx(1.0)
+        assert restored.min_request_interval == 0.8
+        assert restored.latency == pytest.approx(0.3)
+        assert restored.error_rate == pytest.approx(state["error_rate"])
+
+    def test_restore_ignores_invalid_state(self):
+        """Test that a corrupted stored state is ignored."""
+        limiter = self._limiter()
+
+        limiter.restore_rate_control_state({"request_interval": "fast"})
+
+        assert limiter.min_request_interval == 0.5
+
+    def test_track_request_classifies_errors(self):
+        """Test that timeouts back off while client errors like 404 do not."""
+        import aiohttp
+
+        limiter = self._limiter()
+        not_found = aiohttp.ClientResponseError(MagicMock(), (), status=404)
+
+        with pytest.raises(aiohttp.ClientResponseError), limiter.track_request():
+            raise not_found
+        assert limiter.min_request_interval == pytest.approx(0.49)
+
+        with pytest.raises(TimeoutError), limiter.track_request():
+            raise TimeoutError
+        assert limiter.min_request_interval == pytest.approx(0.98)
+        # Failed requests reached the device, too
+        assert limiter.device_requests == 2
+
+    def test_api_scales_delays(self):
+        """Test that the API scales coordinator delays with the learned interval."""
+        api = ComfoClimeAPI(
+            "http://192.168.1.100",
+            min_request_interval=0.5,
+            adaptive_rate_limiting=True,
+        )
+        api._rate_limiter._get_current_time = MagicMock(return_value=100.0)
+
+        api._rate_limiter.record_result(0.2, success=False)
+
+        assert api.scale_delay(0.3) == pytest.approx(0.6)
+        assert api.rate_control_state()["request_interval"] == pytest.approx(1.0)
+
+
 class TestComfoClimeAPIByteConversion:
     """Test byte conversion utility methods."""
 
@@ -1,36 +1,49 @@
 """Tests for API decorators."""
 
+import contextlib
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from custom_components.comfoclime.infrastructure import (
+    RequestPriority,
     api_get,
     api_put,
+    request_priority,
 )
 
 
 class MockRateLimiter:
     """Mock rate limiter for testing."""
 
-    def __init__(self):
-        self._pending_writes = 0
+    async def single_flight(self, key, coro_factory):
+        """Execute the request without coalescing."""
+        return await coro_factory()
+
+    async def claim_send(self, is_write=False, may_defer=True):
+        """Always allow sending immediately."""
+        return True
 
-    def signal_write_pending(self):
-        """Signal that a write operation is pending."""
-        self._pending_writes += 1
+    def track_request(self):
+        """Do not track request outcomes."""
+        return contextlib.nullcontext()
 
-    def signal_write_complete(self):
-        """Signal that a write operation has completed."""
-        self._pending_writes = max(0, self._pending_writes - 1)
 
-    def has_pending_writes(self):
-        """Check if there are pending write operations."""
-        return self._pending_writes > 0
+class MockScheduler:
+    """Mock request scheduler recording granted slots."""
+
+    def __init__(self):
+        self.acquired = []
+        self.released = 0
 
-    async def yield_to_writes(self, max_wait: float = 0.5):
-        """Yield to pending write operations."""
-        pass
+    @contextlib.asynccontextmanager
+    async def slot(self, priority):
+        """Grant the slot immediately and record its priority."""
+        self.acquired.append(priority)
+        try:
+            yield
+        finally:
+            self.released += 1
 
 
 class MockAPI:
@@ -42,10 +55,7 @@ class MockAPI:
         self.read_timeout = 10
         self.write_timeout = 30
         self.max_retries = 3
-        self._request_lock = MagicMock()
-        self._request_lock.__aenter__ = AsyncMock()
-        # __aexit__ must return None/False to not suppress exceptions
-        self._request_lock.__aexit__ = AsyncMock(return_value=None)
+        self._scheduler = MockScheduler()
         self._wait_for_rate_limit = AsyncMock()
         self._async_get_uuid_internal = AsyncMock()
         self.async_get_uuid = AsyncMock()
@@ -219,7 +229,7 @@ async def test_api_get_preserves_function_metadata():
 
 @pytest.mark.asyncio
 async def test_api_get_skip_lock():
-    """Test api_get decorator with skip_lock=True doesn't acquire lock."""
+    """Test api_get decorator with skip_lock=True doesn't go through the scheduler."""
     mock_response = {"uuid": "test-uuid-123"}
 
     @api_get("/monitoring/ping", skip_lock=True)
@@ -241,9 +251,8 @@ async def test_api_get_skip_lock():
     result = await test_method(api)
 
     assert result == mock_response
-    # With skip_lock=True, lock should NOT be acquired
-    api._request_lock.__aenter__.assert_not_called()
-    api._request_lock.__aexit__.assert_not_called()
+    # With skip_lock=True, no scheduler slot should be requested
+    assert api._scheduler.acquired == []
     # But rate limiting should still be called
     api._wait_for_rate_limit.assert_called_once_with(is_write=False)
 
@@ -255,13 +264,11 @@ class MockAPIForPut:
         self.base_url = "http://test.local"
         self.uuid = "test-uuid"
         self.write_timeout = 30
+        self.write_deadline = 60
         self.max_retries = 3
         self.hass = MagicMock()
         self.hass.config.time_zone = "UTC"
-        self._request_lock = MagicMock()
-        self._request_lock.__aenter__ = AsyncMock()
-        # __aexit__ must return None/False to not suppress exceptions
-        self._request_lock.__aexit__ = AsyncMock(return_value=None)
+        self._scheduler = MockScheduler()
         self._wait_for_rate_limit = AsyncMock()
         self._get_session = AsyncMock()
         self._async_get_uuid_internal = AsyncMock()
@@ -373,12 +380,16 @@ async def test_api_put_empty_payload():
 
     api = MockAPIForPut()
     api._get_session = AsyncMock()  # Should not be called
+    api._rate_limiter.claim_send = AsyncMock()  # Should not be called
 
     result = await test_method(api)
 
-    # Should return True without making any request
+    # Should return True without reserving a send time, taking the slot or recording a write
     assert result is True
     api._get_session.assert_not_called()
+    api._wait_for_rate_limit.assert_not_awaited()
+    assert api._scheduler.acquired == []
+    api._rate_limiter.claim_send.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -450,8 +461,8 @@ async def test_api_put_with_url_parameters():
 
 
 @pytest.mark.asyncio
-async def test_api_put_signals_write_pending():
-    """Test that api_put signals write pending before acquiring lock."""
+async def test_api_put_uses_write_priority():
+    """Test that api_put is scheduled with write priority."""
     mock_response = MagicMock()
     mock_response.status = 200
     mock_response.raise_for_status = MagicMock()
@@ -462,22 +473,6 @@ async def test_api_put_signals_write_pending():
 
     api = MockAPIForPut()
 
-    # Track signal calls
-    signal_calls = []
-    original_pending = api._rate_limiter.signal_write_pending
-    original_complete = api._rate_limiter.signal_write_complete
-
-    def track_pending():
-        signal_calls.append("pending")
-        original_pending()
-
-    def track_complete():
-        signal_calls.append("complete")
-        original_complete()
-
-    api._rate_limiter.signal_write_pending = track_pending
-    api._rate_limiter.signal_write_complete = track_complete
-
     # Mock session and response
     mock_session = MagicMock()
     mock_context = MagicMock()
@@ -486,15 +481,17 @@ async def test_api_put_signals_write_pending():
     mock_session.put = MagicMock(return_value=mock_context)
     api._get_session = AsyncMock(return_value=mock_session)
 
-    await test_method(api)
+    # Even inside a polling context, writes keep write priority
+    with request_priority(RequestPriority.POLL):
+        await test_method(api)
 
-    # Verify signals were called in order
-    assert signal_calls == ["pending", "complete"]
+    assert api._scheduler.acquired == [RequestPriority.WRITE]
+    assert api._scheduler.released == 1
 
 
 @pytest.mark.asyncio
-async def test_api_put_signals_complete_on_error():
-    """Test that api_put signals write complete even on error."""
+async def test_api_put_releases_slot_on_error():
+    """Test that api_put releases its scheduler slot even on error."""
     import aiohttp
 
     @api_put("/test/endpoint")
@@ -504,22 +501,6 @@ async def test_api_put_signals_complete_on_error():
     api = MockAPIForPut()
     api.max_retries = 0  # No retries - fail after first attempt
 
-    # Track signal calls
-    signal_calls = []
-    original_pending = api._rate_limiter.signal_write_pending
-    original_complete = api._rate_limiter.signal_write_complete
-
-    def track_pending():
-        signal_calls.append("pending")
-        original_pending()
-
-    def track_complete():
-        signal_calls.append("complete")
-        original_complete()
-
-    api._rate_limiter.signal_write_pending = track_pending
-    api._rate_limiter.signal_write_complete = track_complete
-
     # Mock session to raise error
     mock_session = MagicMock()
     mock_context = MagicMock()
@@ -528,39 +509,15 @@ async def test_api_put_signals_complete_on_error():
     mock_session.put = MagicMock(return_value=mock_context)
     api._get_session = AsyncMock(return_value=mock_session)
 
-    # The error will be raised after retries are exhausted
-    try:
+    with pytest.raises(aiohttp.ClientError):
         await test_method(api)
-        # If no exception was raised, that's unexpected
-        pytest.fail("Expected ClientError to be raised")
-    except aiohttp.ClientError:
-        pass  # Expected
 
-    # Verify complete was still called even on error
-    assert "pending" in signal_calls
-    assert "complete" in signal_calls
+    assert api._scheduler.acquired == [RequestPriority.WRITE]
+    assert api._scheduler.released == 1
 
 
-@pytest.mark.asyncio
-async def test_api_get_yields_to_pending_writes():
-    """Test that api_get yields to pending writes."""
-    mock_response = {"key": "value"}
-
-    @api_get("/test/endpoint")
-    async def test_method(self, response_data):
-        return response_data
-
-    api = MockAPI()
-
-    # Track yield_to_writes calls
-    yield_called = []
-
-    async def track_yield(max_wait: float = 0.5):
-        yield_called.append(True)
-
-    api._rate_limiter.yield_to_writes = track_yield
-
-    # Mock session and response
+def _mock_get_session(api, mock_response):
+    """Attach a session returning mock_response to api."""
     mock_session = MagicMock()
     mock_context = MagicMock()
     mock_context.__aenter__ = AsyncMock(
@@ -570,44 +527,37 @@ async def test_api_get_yields_to_pending_writes():
     mock_session.get = MagicMock(return_value=mock_context)
     api._get_session = AsyncMock(return_value=mock_session)
 
-    result = await test_method(api)
-
-    assert result == mock_response
-    # Verify yield_to_writes was called
-    assert len(yield_called) == 1
-
 
 @pytest.mark.asyncio
-async def test_api_get_skip_lock_does_not_yield():
-    """Test that api_get with skip_lock=True does not yield to writes."""
-    mock_response = {"key": "value"}
+async def test_api_get_defaults_to_poll_priority():
+    """Test that api_get is scheduled as background polling by default."""
 
-    @api_get("/test/endpoint", skip_lock=True)
+    @api_get("/test/endpoint")
     async def test_method(self, response_data):
         return response_data
 
     api = MockAPI()
+    _mock_get_session(api, {"key": "value"})
 
-    # Track yield_to_writes calls
-    yield_called = []
+    result = await test_method(api)
 
-    async def track_yield(max_wait: float = 0.5):
-        yield_called.append(True)
+    assert result == {"key": "value"}
+    assert api._scheduler.acquired == [RequestPriority.POLL]
+    assert api._scheduler.released == 1
 
-    api._rate_limiter.yield_to_writes = track_yield
 
-    # Mock session and response
-    mock_session = MagicMock()
-    mock_context = MagicMock()
-    mock_context.__aenter__ = AsyncMock(
-        return_value=MagicMock(raise_for_status=MagicMock(), json=AsyncMock(return_value=mock_response))
-    )
-    mock_context.__aexit__ = AsyncMock()
-    mock_session.get = MagicMock(return_value=mock_context)
-    api._get_session = AsyncMock(return_value=mock_session)
+@pytest.mark.asyncio
+async def test_api_get_uses_context_priority():
+    """Test that api_get honours the request_priority context."""
 
-    result = await test_method(api)
+    @api_get("/test/endpoint")
+    async def test_method(self, response_data):
+        return response_data
 
-    assert result == mock_response
-    # With skip_lock=True, yield_to_writes should NOT be called
-    assert len(yield_called) == 0
+    api = MockAPI()
+    _mock_get_session(api, {"key": "value"})
+
+    with request_priority(RequestPriority.USER_READ):
+        await test_method(api)
+
+    assert api._scheduler.acquired == [RequestPriority.USER_READ]
@@ -8,9 +8,12 @@ import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from custom_components.comfoclime.comfoclime_api import ComfoClimeAPI
+from custom_components.comfoclime.infrastructure import DeviceCache
 from custom_components.comfoclime.sensor import (
     ComfoClimeTelemetrySensor,
 )
@@ -19,20 +22,23 @@ from custom_components.comfoclime.sensor import (
 def test_cache_initialization():
     """Test that cache is properly initialized."""
     api = ComfoClimeAPI("http://test")
-    assert isinstance(api._rate_limiter._telemetry_cache, dict)
-    assert isinstance(api._rate_limiter._property_cache, dict)
+    assert isinstance(api._rate_limiter._telemetry_cache, DeviceCache)
+    assert isinstance(api._rate_limiter._property_cache, DeviceCache)
     assert len(api._rate_limiter._telemetry_cache) == 0
     assert len(api._rate_limiter._property_cache) == 0
     print("✅ Cache initialization test passed")
 
 
-def test_cache_key_generation():
-    """Test cache key generation."""
-    from custom_components.comfoclime.infrastructure import RateLimiterCache
+def test_cache_keys_are_device_indexed():
+    """Test that entries are keyed by (device_uuid, data_id)."""
+    cache = DeviceCache(max_entries=10)
+    cache.set("device-123", "telemetry-456", 1, now=0.0)
 
-    key = RateLimiterCache.get_cache_key("device-123", "telemetry-456")
-    assert key == "device-123:telemetry-456"
-    print("✅ Cache key generation test passed")
+    assert ("device-123", "telemetry-456") in cache
+    assert list(cache) == [("device-123", "telemetry-456")]
+    assert cache.get("device-123", "telemetry-456", now=1.0).value == 1
+    assert cache.get("device-1", "telemetry-456", now=1.0) is None
+    print("✅ Cache key test passed")
 
 
 def test_cache_ttl_constant():
@@ -114,14 +120,41 @@ async def test_property_cache():
     print("✅ Second property call used cache")
 
 
+async def test_cached_bytes_shared_across_scaling():
+    """Test that readers with different scaling share one device read."""
+    api = ComfoClimeAPI("http://test")
+    api._read_telemetry_raw = AsyncMock(return_value=[0xFB, 0xFF])
+
+    raw = await api.async_read_telemetry_for_device("device-1", "123", faktor=1.0, signed=False, byte_count=2)
+    scaled = await api.async_read_telemetry_for_device("device-1", "123", faktor=0.1, signed=True, byte_count=2)
+
+    assert api._read_telemetry_raw.call_count == 1
+    assert raw.scaled_value == 0xFFFB
+    assert scaled.scaled_value == pytest.approx(-0.5)
+
+
+async def test_string_property_cached_decoded():
+    """Test that a string property is decoded once and not re-read on a cache hit."""
+    api = ComfoClimeAPI("http://test")
+    api._read_property_for_device_raw = AsyncMock(return_value=[65, 0, 66])
+
+    first = await api.async_read_property_for_device("device-1", "30/1/1", byte_count=3)
+    second = await api.async_read_property_for_device("device-1", "30/1/1", byte_count=3)
+
+    assert first is None
+    assert second is None
+    assert api._read_property_for_device_raw.call_count == 1
+    assert api._rate_limiter.get_property_from_cache("device-1", "30/1/1") == "AB"
+
+
 async def test_cache_invalidation():
     """Test that cache is invalidated for a device."""
     api = ComfoClimeAPI("http://test")
 
     # Manually add some cache entries via the rate_limiter
-    api._rate_limiter.set_telemetry_cache("device-1:telemetry-1", 100)
-    api._rate_limiter.set_telemetry_cache("device-1:telemetry-2", 200)
-    api._rate_limiter.set_telemetry_cache("device-2:telemetry-1", 300)
+    api._rate_limiter.set_telemetry_cache("device-1", "telemetry-1", 100)
+    api._rate_limiter.set_telemetry_cache("device-1", "telemetry-2", 200)
+    api._rate_limiter.set_telemetry_cache("device-2", "telemetry-1", 300)
 
     assert len(api._rate_limiter._telemetry_cache) == 3
 
@@ -130,10 +163,166 @@ async def test_cache_invalidation():
 
     # Should have removed device-1 entries
     assert len(api._rate_limiter._telemetry_cache) == 1
-    assert "device-2:telemetry-1" in str(api._rate_limiter._telemetry_cache)
+    assert ("device-2", "telemetry-1") in api._rate_limiter._telemetry_cache
     print("✅ Cache invalidation test passed")
 
 
+async def test_cache_lru_eviction():
+    """Test that the least recently used entry is evicted when the cache is full."""
+    from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+    limiter = RateLimiterCache(cache_ttl=30, cache_max_entries=2)
+    limiter.set_telemetry_cache("device-1", "1", 10)
+    limiter.set_telemetry_cache("device-1", "2", 20)
+    # Touch the oldest entry so that "2" becomes least recently used
+    assert limiter.get_telemetry_from_cache("device-1", "1") == 10
+    limiter.set_telemetry_cache("device-1", "3", 30)
+
+    assert list(limiter._telemetry_cache) == [("device-1", "1"), ("device-1", "3")]
+    assert limiter.cache_evictions == 1
+
+
+def test_cache_stale_window():
+    """Test fresh, stale and expired lookups and their counters."""
+    from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+    limiter = RateLimiterCache(cache_ttl=30, cache_stale_ttl=60)
+    limiter._get_current_time = MagicMock(return_value=100.0)
+    limiter.set_property_cache("device-1", "29/1/10", 75)
+
+    limiter._get_current_time.return_value = 120.0
+    assert limiter.lookup_property("device-1", "29/1/10") == (75, False)
+
+    limiter._get_current_time.return_value = 150.0
+    assert limiter.lookup_property("device-1", "29/1/10") == (75, True)
+    # Fresh-only lookups treat a stale value as a miss but keep it
+    assert limiter.get_property_from_cache("device-1", "29/1/10") is None
+    assert ("device-1", "29/1/10") in limiter._property_cache
+
+    limiter._get_current_time.return_value = 190.0
+    assert limiter.lookup_property("device-1", "29/1/10") is None
+    assert ("device-1", "29/1/10") not in limiter._property_cache
+
+    assert limiter.cache_stats() == {"hits": 1, "misses": 2, "stale_hits": 1, "evictions": 0, "entries": 0}
+
+
+async def test_stale_value_served_while_refreshing():
+    """Test that a stale telemetry value is returned immediately and refreshed in the background."""
+    api = ComfoClimeAPI("http://test", cache_ttl=30, cache_stale_ttl=60)
+    api.uuid = "test-uuid"
+    refreshed = asyncio.Event()
+
+    async def _slow_read(device_uuid, telemetry_id):
+        await refreshed.wait()
+        return [42]
+
+    api._read_telemetry_raw = AsyncMock(side_effect=_slow_read)
+    api._rate_limiter._get_current_time = MagicMock(return_value=100.0)
+    api._rate_limiter.set_telemetry_cache("device-1", "123", bytes([100]))
+    api._rate_limiter._get_current_time.return_value = 145.0
+
+    result = await api.async_read_telemetry_for_device("device-1", "123", signed=False, byte_count=1)
+    # A second stale read does not schedule another refresh
+    await api.async_read_telemetry_for_device("device-1", "123", signed=False, byte_count=1)
+
+    await asyncio.sleep(0)  # let the background refresh start
+    assert result.scaled_value == 100
+    assert api._read_telemetry_raw.call_count == 1
+
+    refreshed.set()
+    await asyncio.gather(*api._rate_limiter._refresh_tasks.values())
+    assert api._rate_limiter.get_telemetry_from_cache("device-1", "123") == bytes([42])
+
+
+async def test_refresh_cancelled_on_invalidation():
+    """Test that invalidating a device drops its pending background refreshes."""
+    api = ComfoClimeAPI("http://test")
+    never = asyncio.Event()
+    api._rate_limiter.schedule_refresh("device-1", "123", never.wait)
+    api._rate_limiter.schedule_refresh("device-2", "123", never.wait)
+
+    api._rate_limiter.invalidate_cache_for_device("device-1")
+
+    assert list(api._rate_limiter._refresh_tasks) == [("device-2", "123")]
+    await api.close()
+    assert api._rate_limiter._refresh_tasks == {}
+
+
+def test_cache_lru_eviction_across_devices():
+    """Test that eviction picks the least recently used entry of any device."""
+    cache = DeviceCache(max_entries=3)
+    cache.set("device-1", "1", 10, now=1.0)
+    cache.set("device-2", "1", 20, now=2.0)
+    cache.set("device-1", "2", 30, now=3.0)
+    cache.get("device-1", "1", now=4.0)
+    cache.set("device-3", "1", 40, now=5.0)
+
+    assert ("device-2", "1") not in cache
+    assert len(cache) == 3
+    assert cache.evictions == 1
+
+
+async def test_invalidate_property_group_and_single_property():
+    """Test invalidating one property group and one property of a device."""
+    from custom_components.comfoclime.infrastructure import RateLimiterCache
+
+    limiter = RateLimiterCache(cache_ttl=30)
+    for path in ("29/1/10", "29/1/11", "29/2/1", "30/1/1"):
+        limiter.set_property_cache("device-1", path, 1)
+    limiter.set_property_cache("device-2", "29/1/10", 2)
+    limiter.set_telemetry_cache("device-1", "4145", 3)
+
+    limiter.invalidate_property_group("device-1", "29/1")
+    assert list(limiter._property_cache) == [("device-1", "29/2/1"), ("device-1", "30/1/1"), ("device-2", "29/1/10")]
+
+    limiter.invalidate_property("device-1", "30/1/1")
+    assert list(limiter._property_cache) == [("device-1", "29/2/1"), ("device-2", "29/1/10")]
+    assert len(limiter._property_cache) == 2
+    assert limiter.get_telemetry_from_cache("device-1", "4145") == 3
+
+    # Re-adding after a group invalidation indexes the entry again
+    limiter.set_property_cache("device-1", "29/1/10", 4)
+    limiter.invalidate_property_group("device-1", "29/1")
+    assert ("device-1", "29/1/10") not in limiter._property_cache
+
+
+def test_write_through_property():
+    """Test that a written property is cached unconfirmed and only its group is invalidated."""
+    from custom_components.comfoclime.infrastructure import RateLimiterCache, RequestPriority, request_priority
+
+    limiter = RateLimiterCache(cache_ttl=30)
+    for path in ("29/1/10", "29/1/11", "30/1/1"):
+        limiter.set_property_cache("device-1", path, bytes([1]))
+    limiter.set_telemetry_cache("device-1", "4145", bytes([3]))
+
+    limiter.write_through_property("device-1", "29/1/10", bytes([7]))
+
+    assert list(limiter._property_cache) == [("device-1", "30/1/1"), ("device-1", "29/1/10")]
+    assert limiter.get_telemetry_from_cache("device-1", "4145") == bytes([3])
+    assert limiter.is_property_unconfirmed("device-1", "29/1/10")
+    # Polls are served the written value, the read-back has to go to the device
+    assert limiter.lookup_property("device-1", "29/1/10") == (bytes([7]), False)
+    with request_priority(RequestPriority.USER_READ):
+        assert limiter.lookup_property("device-1", "29/1/10") is None
+
+    # Reading the value back confirms it
+    limiter.set_property_cache("device-1", "29/1/10", bytes([7]))
+    assert not limiter.is_property_unconfirmed("device-1", "29/1/10")
+
+
+async def test_property_write_keeps_cache_in_write_through_mode():
+    """Test that a write stores the sent bytes instead of invalidating the device's cache."""
+    api = ComfoClimeAPI("http://test", cache_ttl=30, write_through=True)
+    api._set_property_internal = AsyncMock(return_value={"status": 200})
+    api._rate_limiter.set_property_cache("device-1", "30/1/1", bytes([1]))
+
+    await api.async_set_property_for_device("device-1", "29/1/10", value=22.5, byte_count=2, faktor=0.1)
+
+    assert api._rate_limiter.get_property_from_cache("device-1", "29/1/10") == bytes([225, 0])
+    assert api._rate_limiter.get_property_from_cache("device-1", "30/1/1") == bytes([1])
+    assert api.is_property_unconfirmed("device-1", "29/1/10")
+
+
 def test_sensor_with_caching():
     """Test that sensor uses coordinator with caching."""
     mock_coordinator = MagicMock()
@@ -167,7 +356,7 @@ async def main():
 
     # Synchronous tests
     test_cache_initialization()
-    test_cache_key_generation()
+    test_cache_keys_are_device_indexed()
     test_cache_ttl_constant()
     test_sensor_with_caching()
 
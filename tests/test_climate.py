@@ -1,7 +1,8 @@
 """Tests for ComfoClime climate entity."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
+import aiohttp
 import pytest
 from homeassistant.components.climate import (
     FAN_HIGH,
@@ -19,7 +20,8 @@ from custom_components.comfoclime.climate import (
     ComfoClimeClimate,
     async_setup_entry,
 )
-from custom_components.comfoclime.models import DashboardData
+from custom_components.comfoclime.infrastructure import DEBOUNCED
+from custom_components.comfoclime.models import DashboardData, DashboardUpdateResponse
 
 
 class TestComfoClimeClimate:
@@ -417,6 +419,179 @@ class TestComfoClimeClimate:
         update = call_args[0]
         assert update.fan_speed == 3
 
+        # The expected state is shown right away and confirmed in the background
+        mock_coordinator.async_apply_optimistic.assert_called_once_with({"fan_speed": 3})
+        mock_coordinator.async_refresh.assert_not_awaited()
+        mock_hass.async_create_task.assert_called_once()
+        mock_hass.async_create_task.call_args[0][0].close()
+
+    @pytest.mark.asyncio
+    async def test_climate_without_optimistic_mode_waits_for_confirmation(
+        self,
+        mock_hass,
+        mock_coordinator,
+        mock_thermalprofile_coordinator,
+        mock_api,
+        mock_device,
+        mock_config_entry,
+    ):
+        """Test that with optimistic mode off the state is only taken from the confirmation read."""
+        mock_hass.async_create_task = MagicMock()
+
+        climate = ComfoClimeClimate(
+            dashboard_coordinator=mock_coordinator,
+            thermalprofile_coordinator=mock_thermalprofile_coordinator,
+            api=mock_api,
+            device=mock_device,
+            entry=mock_config_entry,
+            optimistic=False,
+        )
+        climate.hass = mock_hass
+
+        await climate.async_set_fan_mode(FAN_HIGH)
+
+        mock_api.async_update_dashboard.assert_called_once()
+        mock_coordinator.async_apply_optimistic.assert_not_called()
+        mock_thermalprofile_coordinator.async_refresh.assert_awaited_once()
+        mock_hass.async_create_task.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_climate_skips_dashboard_read_after_authoritative_response(
+        self,
+        mock_hass,
+        mock_coordinator,
+        mock_thermalprofile_coordinator,
+        mock_api,
+        mock_device,
+        mock_config_entry,
+    ):
+        """Test that a PUT response reporting the written fields replaces the dashboard read."""
+        mock_hass.async_create_task = MagicMock()
+        response = DashboardUpdateResponse(status=1, fanSpeed=3)
+        mock_api.async_update_dashboard = AsyncMock(return_value=response)
+        mock_coordinator.async_apply_update_response.return_value = True
+
+        climate = ComfoClimeClimate(
+            dashboard_coordinator=mock_coordinator,
+            thermalprofile_coordinator=mock_thermalprofile_coordinator,
+            api=mock_api,
+            device=mock_device,
+            entry=mock_config_entry,
+        )
+        climate.hass = mock_hass
+
+        await climate.async_set_fan_mode(FAN_HIGH)
+        await mock_hass.async_create_task.call_args[0][0]
+
+        mock_coordinator.async_apply_update_response.assert_called_once_with(response, {"fan_speed": 3})
+        mock_coordinator.async_refresh.assert_not_awaited()
+        mock_thermalprofile_coordinator.async_refresh.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_climate_superseded_write_is_not_confirmed(
+        self,
+        mock_hass,
+        mock_coordinator,
+        mock_thermalprofile_coordinator,
+        mock_api,
+        mock_device,
+        mock_config_entry,
+    ):
+        """Test that a write replaced by a later one keeps the optimistic state and is not confirmed."""
+        mock_hass.async_create_task = MagicMock()
+        mock_api.async_debounced_write = AsyncMock(return_value=DEBOUNCED)
+
+        climate = ComfoClimeClimate(
+            dashboard_coordinator=mock_coordinator,
+            thermalprofile_coordinator=mock_thermalprofile_coordinator,
+            api=mock_api,
+            device=mock_device,
+            entry=mock_config_entry,
+        )
+        climate.hass = mock_hass
+
+        await climate.async_set_fan_mode(FAN_HIGH)
+
+        assert mock_api.async_debounced_write.call_args[0][0] == "dashboard:fan_speed"
+        mock_api.async_update_dashboard.assert_not_called()
+        mock_coordinator.async_apply_optimistic.assert_called_once_with({"fan_speed": 3})
+        mock_coordinator.async_restore_data.assert_not_called()
+        mock_hass.async_create_task.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_climate_failed_write_rolls_back_optimistic_state(
+        self,
+        mock_hass,
+        mock_coordinator,
+        mock_thermalprofile_coordinator,
+        mock_api,
+        mock_device,
+        mock_config_entry,
+    ):
+        """Test that a failed write restores the previous state and skips the confirmation."""
+        mock_hass.async_create_task = MagicMock()
+        mock_api.async_update_dashboard = AsyncMock(side_effect=aiohttp.ClientError)
+        previous_dashboard = mock_coordinator.data
+        previous_thermal_profile = mock_thermalprofile_coordinator.data
+        mock_coordinator.async_apply_optimistic.return_value = previous_dashboard
+        mock_thermalprofile_coordinator.async_apply_optimistic.return_value = previous_thermal_profile
+
+        climate = ComfoClimeClimate(
+            dashboard_coordinator=mock_coordinator,
+            thermalprofile_coordinator=mock_thermalprofile_coordinator,
+            api=mock_api,
+            device=mock_device,
+            entry=mock_config_entry,
+        )
+        climate.hass = mock_hass
+
+        await climate.async_set_temperature(temperature=23.5)
+
+        mock_thermalprofile_coordinator.async_apply_optimistic.assert_called_once_with(
+            {"temperature": {"manual_temperature": 23.5}}
+        )
+        mock_coordinator.async_restore_data.assert_called_once_with(previous_dashboard)
+        mock_thermalprofile_coordinator.async_restore_data.assert_called_once_with(previous_thermal_profile)
+        mock_hass.async_create_task.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_climate_failed_write_rolls_back_past_superseded_write(
+        self,
+        mock_hass,
+        mock_coordinator,
+        mock_thermalprofile_coordinator,
+        mock_api,
+        mock_device,
+        mock_config_entry,
+    ):
+        """Test that a failed write restores the data before a write it replaced, not that write's state."""
+        mock_hass.async_create_task = MagicMock()
+        mock_api.async_debounced_write = AsyncMock(side_effect=[DEBOUNCED, aiohttp.ClientError])
+        original = mock_coordinator.data
+        superseded = MagicMock()
+        mock_coordinator.async_apply_optimistic.side_effect = [original, superseded]
+
+        climate = ComfoClimeClimate(
+            dashboard_coordinator=mock_coordinator,
+            thermalprofile_coordinator=mock_thermalprofile_coordinator,
+            api=mock_api,
+            device=mock_device,
+            entry=mock_config_entry,
+        )
+        climate.hass = mock_hass
+
+        await climate.async_set_fan_mode(FAN_HIGH)
+        await climate.async_set_fan_mode(FAN_MEDIUM)
+
+        mock_coordinator.async_restore_data.assert_called_once_with(original)
+        mock_hass.async_create_task.assert_not_called()
+
+        # The next write to the target takes a fresh snapshot
+        mock_api.async_debounced_write = AsyncMock(side_effect=aiohttp.ClientError)
+        mock_coordinator.async_apply_optimistic.side_effect = [superseded]
+        await climate.async_set_fan_mode(FAN_HIGH)
+        mock_coordinator.async_restore_data.assert_called_with(superseded)
+
     @pytest.mark.asyncio
     async def test_climate_turn_off(
         self,
@@ -161,7 +161,13 @@ async def test_options_menu_offers_only_performance_sections():
     [
         ("timeouts", "read_timeout", 25),
         ("polling", "polling_interval", 120),
+        ("polling", "poll_slices", 2),
+        ("polling", "write_through_cache", True),
         ("rate_limiting", "inter_sensor_delay", 1.5),
+        ("rate_limiting", "request_budget", 30),
+        ("rate_limiting", "adaptive_rate_limiting", True),
+        ("rate_limiting", "write_combine_window", 0.0),
+        ("rate_limiting", "optimistic_climate", False),
     ],
 )
 async def test_options_step_saves_directly(step, field, value):
@@ -1,11 +1,12 @@
 """Tests for ComfoClime coordinators."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import aiohttp
 import pytest
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
+from custom_components.comfoclime.constants import PollTier
 from custom_components.comfoclime.coordinator import (
     ComfoClimeDashboardCoordinator,
     ComfoClimeDefinitionCoordinator,
@@ -14,14 +15,21 @@ from custom_components.comfoclime.coordinator import (
     ComfoClimeTelemetryCoordinator,
     ComfoClimeThermalprofileCoordinator,
 )
+from custom_components.comfoclime.infrastructure import (
+    AccessTracker,
+    PollingScheduler,
+    RequestPriority,
+    request_priority,
+)
 from custom_components.comfoclime.models import (
     DashboardData,
+    DashboardUpdateResponse,
     DeviceDefinitionData,
     MonitoringPing,
-    PropertyReading,
     PropertyRegistryEntry,
-    TelemetryReading,
+    PropertyWriteRequest,
     TelemetryRegistryEntry,
+    TemperatureControlData,
     ThermalProfileData,
 )
 
@@ -50,24 +58,17 @@ async def test_telemetry_coordinator_concurrent_registration(hass_with_frame_hel
             signed=True,
             byte_count=2,
         )
-        # Return a TelemetryReading model
-        return TelemetryReading(
-            device_uuid=args[0] if args else kwargs["device_uuid"],
-            telemetry_id=args[1] if len(args) > 1 else kwargs["telemetry_id"],
-            raw_value=255,
-            faktor=kwargs.get("faktor", 0.1),
-            signed=kwargs.get("signed", False),
-            byte_count=kwargs.get("byte_count", 2),
-        )
+        return bytes([255, 0])
 
-    mock_api.async_read_telemetry_for_device = AsyncMock(side_effect=mock_read_telemetry)
+    mock_api.async_read_raw_telemetry_for_device = AsyncMock(side_effect=mock_read_telemetry)
 
     # This should not raise RuntimeError: dictionary changed size during iteration
     result = await coordinator._async_update_data()
 
     assert result is not None
     assert "device1" in result
-    assert result["device1"]["123"] == 25.5  # 255 * 0.1 = 25.5
+    coordinator.data = result
+    assert coordinator.get_telemetry_value("device1", "123", faktor=0.1, signed=False, byte_count=2) == 25.5
 
 
 @pytest.mark.asyncio
@@ -94,24 +95,17 @@ async def test_property_coordinator_concurrent_registration(hass_with_frame_help
             signed=True,
             byte_count=2,
         )
-        # Return a PropertyReading model
-        return PropertyReading(
-            device_uuid=args[0] if args else kwargs["device_uuid"],
-            path=args[1] if len(args) > 1 else kwargs["property_path"],
-            raw_value=100,
-            faktor=kwargs.get("faktor", 1.0),
-            signed=kwargs.get("signed", True),
-            byte_count=kwargs.get("byte_count", 2),
-        )
+        return bytes([100, 0])
 
-    mock_api.async_read_property_for_device = AsyncMock(side_effect=mock_read_property)
+    mock_api.async_read_raw_property_for_device = AsyncMock(side_effect=mock_read_property)
 
     # This should not raise RuntimeError: dictionary changed size during iteration
     result = await coordinator._async_update_data()
 
     assert result is not None
     assert "device1" in result
-    assert result["device1"]["29/1/10"] == 100.0
+    coordinator.data = result
+    assert coordinator.get_property_value("device1", "29/1/10", faktor=1.0, signed=True, byte_count=2) == 100.0
 
 
 @pytest.mark.asyncio
@@ -134,30 +128,21 @@ async def test_telemetry_coordinator_multiple_devices(hass_with_frame_helper, mo
         byte_count=1,
     )
 
-    # Mock API responses - return values that fit within the byte count
-    async def mock_read_telemetry(device_uuid, telemetry_id, **kwargs):
-        # Return a TelemetryReading model with realistic raw values
+    # Mock API responses - raw little-endian bytes
+    async def mock_read_telemetry(device_uuid, telemetry_id):
         raw_values = {"123": 123, "456": 456, "100": 100}
-        return TelemetryReading(
-            device_uuid=device_uuid,
-            telemetry_id=telemetry_id,
-            raw_value=raw_values.get(telemetry_id, 0),
-            faktor=kwargs.get("faktor", 1.0),
-            signed=kwargs.get("signed", False),
-            byte_count=kwargs.get("byte_count", 2),
-        )
+        return raw_values.get(telemetry_id, 0).to_bytes(2, "little")
 
-    mock_api.async_read_telemetry_for_device = AsyncMock(side_effect=mock_read_telemetry)
+    mock_api.async_read_raw_telemetry_for_device = AsyncMock(side_effect=mock_read_telemetry)
 
-    result = await coordinator._async_update_data()
+    coordinator.data = await coordinator._async_update_data()
 
-    assert result is not None
-    assert "device1" in result
-    assert "device2" in result
+    assert "device1" in coordinator.data
+    assert "device2" in coordinator.data
     # Values are scaled by faktor (1.0 and 2.0 respectively)
-    assert result["device1"]["123"] == 123.0  # 123 * 1.0
-    assert result["device1"]["456"] == 912.0  # 456 * 2.0
-    assert result["device2"]["100"] == 100.0  # 100 * 1.0 (fits in 1 byte)
+    assert coordinator.get_telemetry_value("device1", "123", signed=False, byte_count=2) == 123.0
+    assert coordinator.get_telemetry_value("device1", "456", faktor=2.0, signed=False, byte_count=2) == 912.0
+    assert coordinator.get_telemetry_value("device2", "100", signed=False, byte_count=1) == 100.0
 
 
 @pytest.mark.asyncio
@@ -189,30 +174,21 @@ async def test_property_coordinator_multiple_devices(hass_with_frame_helper, moc
     )
 
     # Mock API responses
-    async def mock_read_property(device_uuid, property_path, **kwargs):
-        # Return a PropertyReading model
-        return PropertyReading(
-            device_uuid=device_uuid,
-            path=property_path,
-            raw_value=len(property_path) * 10,
-            faktor=kwargs.get("faktor", 1.0),
-            signed=kwargs.get("signed", True),
-            byte_count=kwargs.get("byte_count", 2),
-        )
+    async def mock_read_property(device_uuid, property_path, byte_count=None):
+        return (len(property_path) * 10).to_bytes(2, "little")
 
-    mock_api.async_read_property_for_device = AsyncMock(side_effect=mock_read_property)
+    mock_api.async_read_raw_property_for_device = AsyncMock(side_effect=mock_read_property)
 
-    result = await coordinator._async_update_data()
+    coordinator.data = await coordinator._async_update_data()
 
-    assert result is not None
-    assert "device1" in result
-    assert "device2" in result
+    assert "device1" in coordinator.data
+    assert "device2" in coordinator.data
     # len("29/1/10") * 10 * 1.0 = 7 * 10 * 1.0 = 70.0
-    assert result["device1"]["29/1/10"] == 70.0
+    assert coordinator.get_property_value("device1", "29/1/10", byte_count=2) == 70.0
     # len("29/1/6") * 10 * 1.0 = 6 * 10 * 1.0 = 60.0
-    assert result["device1"]["29/1/6"] == 60.0
+    assert coordinator.get_property_value("device1", "29/1/6", byte_count=1) == 60.0
     # len("30/2/5") * 10 * 0.1 = 6 * 10 * 0.1 = 6.0
-    assert result["device2"]["30/2/5"] == 6.0
+    assert coordinator.get_property_value("device2", "30/2/5", faktor=0.1, signed=False, byte_count=2) == 6.0
 
 
 @pytest.mark.asyncio
@@ -228,27 +204,18 @@ async def test_telemetry_coordinator_error_handling(hass_with_frame_helper, mock
     )
 
     # Mock API to fail for specific telemetry
-    async def mock_read_telemetry(device_uuid, telemetry_id, **kwargs):
+    async def mock_read_telemetry(device_uuid, telemetry_id):
         if telemetry_id == "456":
             raise aiohttp.ClientError("Test error")
-        # Return a TelemetryReading model
-        return TelemetryReading(
-            device_uuid=device_uuid,
-            telemetry_id=telemetry_id,
-            raw_value=255,
-            faktor=kwargs.get("faktor", 1.0),
-            signed=kwargs.get("signed", False),
-            byte_count=kwargs.get("byte_count", 2),
-        )
+        return bytes([255, 0])
 
-    mock_api.async_read_telemetry_for_device = AsyncMock(side_effect=mock_read_telemetry)
+    mock_api.async_read_raw_telemetry_for_device = AsyncMock(side_effect=mock_read_telemetry)
 
-    result = await coordinator._async_update_data()
+    coordinator.data = await coordinator._async_update_data()
 
-    assert result is not None
-    assert "device1" in result
-    assert result["device1"]["123"] == 255.0
-    assert result["device1"]["456"] is None
+    assert "device1" in coordinator.data
+    assert coordinator.get_telemetry_value("device1", "123", byte_count=2) == 255.0
+    assert coordinator.get_telemetry_value("device1", "456", byte_count=2) is None
 
 
 @pytest.mark.asyncio
@@ -272,27 +239,18 @@ async def test_property_coordinator_error_handling(hass_with_frame_helper, mock_
     )
 
     # Mock API to fail for specific property
-    async def mock_read_property(device_uuid, property_path, **kwargs):
+    async def mock_read_property(device_uuid, property_path, byte_count=None):
         if property_path == "29/1/6":
             raise aiohttp.ClientError("Test error")
-        # Return a PropertyReading model
-        return PropertyReading(
-            device_uuid=device_uuid,
-            path=property_path,
-            raw_value=100,
-            faktor=kwargs.get("faktor", 1.0),
-            signed=kwargs.get("signed", True),
-            byte_count=kwargs.get("byte_count", 2),
-        )
+        return bytes([100, 0])
 
-    mock_api.async_read_property_for_device = AsyncMock(side_effect=mock_read_property)
+    mock_api.async_read_raw_property_for_device = AsyncMock(side_effect=mock_read_property)
 
-    result = await coordinator._async_update_data()
+    coordinator.data = await coordinator._async_update_data()
 
-    assert result is not None
-    assert "device1" in result
-    assert result["device1"]["29/1/10"] == 100.0
-    assert result["device1"]["29/1/6"] is None
+    assert "device1" in coordinator.data
+    assert coordinator.get_property_value("device1", "29/1/10", byte_count=2) == 100.0
+    assert coordinator.get_property_value("device1", "29/1/6", byte_count=1) is None
 
 
 @pytest.mark.asyncio
@@ -304,15 +262,19 @@ async def test_telemetry_coordinator_get_value(hass_with_frame_helper, mock_api)
     assert coordinator.get_telemetry_value("device1", "123") is None
 
     # Set data
+    scaled = TelemetryRegistryEntry(faktor=0.1, signed=True, byte_count=2)
+    default = TelemetryRegistryEntry()
     coordinator.data = {
-        "device1": {"123": 25.5, "456": 30.0},
-        "device2": {"789": 15.0},
+        "device1": {"123": {scaled: 25.5, default: 255}, "456": {default: 30.0}},
+        "device2": {"789": {default: 15.0}},
     }
 
     # Test retrieval
-    assert coordinator.get_telemetry_value("device1", "123") == 25.5
+    assert coordinator.get_telemetry_value("device1", "123", faktor=0.1, signed=True, byte_count=2) == 25.5
+    assert coordinator.get_telemetry_value("device1", "123") == 255
     assert coordinator.get_telemetry_value("device1", 456) == 30.0  # Test int conversion
     assert coordinator.get_telemetry_value("device2", "789") == 15.0
+    assert coordinator.get_telemetry_value("device1", "456", faktor=0.5) is None  # Not registered this way
     assert coordinator.get_telemetry_value("device1", "999") is None
     assert coordinator.get_telemetry_value("device3", "123") is None
 
@@ -326,14 +288,15 @@ async def test_property_coordinator_get_value(hass_with_frame_helper, mock_api):
     assert coordinator.get_property_value("device1", "29/1/10") is None
 
     # Set data
+    default = PropertyRegistryEntry()
     coordinator.data = {
-        "device1": {"29/1/10": 100, "29/1/6": 1},
-        "device2": {"30/2/5": 50},
+        "device1": {"29/1/10": {default: 100}, "29/1/6": {PropertyRegistryEntry(byte_count=1): 1}},
+        "device2": {"30/2/5": {default: 50}},
     }
 
     # Test retrieval
     assert coordinator.get_property_value("device1", "29/1/10") == 100
-    assert coordinator.get_property_value("device1", "29/1/6") == 1
+    assert coordinator.get_property_value("device1", "29/1/6", byte_count=1) == 1
     assert coordinator.get_property_value("device2", "30/2/5") == 50
     assert coordinator.get_property_value("device1", "99/9/9") is None
     assert coordinator.get_property_value("device3", "29/1/10") is None
@@ -502,6 +465,664 @@ async def test_definition_coordinator_custom_interval(hass_with_frame_helper, mo
     assert coordinator.devices == devices
 
 
+@pytest.mark.asyncio
+async def test_coordinators_polled_by_scheduler_have_no_own_timer(hass_with_frame_helper, mock_api):
+    """Test that coordinators given a scheduler register with it instead of running a timer."""
+    scheduler = PollingScheduler()
+    dashboard = ComfoClimeDashboardCoordinator(hass_with_frame_helper, mock_api, 60, scheduler=scheduler)
+    telemetry = ComfoClimeTelemetryCoordinator(hass_with_frame_helper, mock_api, [], 120, scheduler=scheduler)
+
+    assert dashboard.update_interval is None
+    assert telemetry.update_interval is None
+    assert [(source.name, source.interval) for source in scheduler._sources] == [
+        ("Dashboard", 60),
+        ("Telemetry", 120),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_paces_every_device_read(hass_with_frame_helper, mock_api):
+    """Test that each read of a scheduled coordinator waits for a budget slot."""
+    scheduler = PollingScheduler()
+    scheduler.pace = AsyncMock()
+    dashboard = ComfoClimeDashboardCoordinator(hass_with_frame_helper, mock_api, scheduler=scheduler)
+    telemetry = ComfoClimeTelemetryCoordinator(
+        hass_with_frame_helper, mock_api, [], sensor_delay=0, scheduler=scheduler
+    )
+    mock_api.async_read_raw_telemetry_for_device = AsyncMock(return_value=bytes([1, 0]))
+    await telemetry.register_telemetry("dev1", "100", byte_count=2)
+    await telemetry.register_telemetry("dev1", "200", byte_count=2)
+
+    await dashboard._async_update_data()
+    assert scheduler.pace.await_count == 1
+
+    await telemetry._async_update_data()
+    assert scheduler.pace.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_stable_telemetry_backs_off(hass_with_frame_helper, mock_api):
+    """Test that an unchanged telemetry value is read less often and reused meanwhile."""
+    coordinator = ComfoClimeTelemetryCoordinator(hass_with_frame_helper, mock_api, [], 60, sensor_delay=0)
+    mock_api.async_read_raw_telemetry_for_device = AsyncMock(return_value=bytes([42, 0]))
+    await coordinator.register_telemetry("dev1", "100", byte_count=2)
+
+    for _ in range(8):
+        coordinator.data = await coordinator._async_update_data()
+
+    # Read in cycles 1, 2, 4 and 8: the period doubles while the value is stable
+    assert mock_api.async_read_raw_telemetry_for_device.await_count == 4
+    assert coordinator.get_telemetry_value("dev1", "100", byte_count=2) == 42
+
+
+@pytest.mark.asyncio
+async def test_changed_telemetry_is_read_every_cycle_again(hass_with_frame_helper, mock_api):
+    """Test that a changed value resets its poll period."""
+    coordinator = ComfoClimeTelemetryCoordinator(hass_with_frame_helper, mock_api, [], 60, sensor_delay=0)
+    mock_api.async_read_raw_telemetry_for_device = AsyncMock(return_value=bytes([42, 0]))
+    await coordinator.register_telemetry("dev1", "100", byte_count=2)
+    for _ in range(4):
+        coordinator.data = await coordinator._async_update_data()
+    assert mock_api.async_read_raw_telemetry_for_device.await_count == 3
+
+    mock_api.async_read_raw_telemetry_for_device.return_value = bytes([43, 0])
+    for _ in range(5):
+        coordinator.data = await coordinator._async_update_data()
+
+    # The change is read in cycle 8 and the value read again in cycle 9, not 4 cycles later
+    assert mock_api.async_read_raw_telemetry_for_device.await_count == 5
+    assert coordinator.get_telemetry_value("dev1", "100", byte_count=2) == 43
+
+
+@pytest.mark.asyncio
+async def test_poll_period_limits(hass_with_frame_helper, mock_api):
+    """Test that min/max_poll_interval bound the period of a registered value."""
+    coordinator = ComfoClimePropertyCoordinator(hass_with_frame_helper, mock_api, [], 60, sensor_delay=0)
+    reads = 0
+
+    async def read(device_uuid, property_path, byte_count):
+        # 29/1/6 changes on every read, 29/1/7 never does
+        nonlocal reads
+        reads += 1
+        return bytes([reads if property_path == "29/1/6" else 1])
+
+    mock_api.async_read_raw_property_for_device = AsyncMock(side_effect=read)
+    await coordinator.register_property("dev1", "29/1/6", byte_count=1, min_poll_interval=120)
+    await coordinator.register_property("dev1", "29/1/7", byte_count=1, max_poll_interval=60)
+
+    for _ in range(6):
+        coordinator.data = await coordinator._async_update_data()
+
+    paths = [call.kwargs["property_path"] for call in mock_api.async_read_raw_property_for_device.await_args_list]
+    # Changing, but read every other cycle only
+    assert paths.count("29/1/6") == 3
+    # Stable, but never backs off beyond one cycle
+    assert paths.count("29/1/7") == 6
+
+
+@pytest.mark.asyncio
+async def test_user_refresh_reads_stable_values(hass_with_frame_helper, mock_api):
+    """Test that refreshes above POLL priority read values that are not due."""
+    coordinator = ComfoClimeTelemetryCoordinator(hass_with_frame_helper, mock_api, [], 60, sensor_delay=0)
+    mock_api.async_read_raw_telemetry_for_device = AsyncMock(return_value=bytes([42, 0]))
+    await coordinator.register_telemetry("dev1", "100", byte_count=2)
+    for _ in range(2):
+        coordinator.data = await coordinator._async_update_data()
+
+    with request_priority(RequestPriority.USER_READ):
+        coordinator.data = await coordinator._async_update_data()
+
+    assert mock_api.async_read_raw_telemetry_for_device.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_unregister_forgets_poll_period(hass_with_frame_helper, mock_api):
+    """Test that the poll period goes away with the last registration."""
+    coordinator = ComfoClimeTelemetryCoordinator(hass_with_frame_helper, mock_api, [])
+    await coordinator.register_telemetry("dev1", "100", byte_count=2)
+    await coordinator.register_telemetry("dev1", "100", faktor=0.1, byte_count=2)
+
+    await coordinator.unregister_telemetry("dev1", "100", byte_count=2)
+    assert "100" in coordinator._poll_periods["dev1"]
+
+    await coordinator.unregister_telemetry("dev1", "100", faktor=0.1, byte_count=2)
+    assert coordinator._poll_periods == {}
+
+
+@pytest.mark.asyncio
+async def test_poll_tiers(hass_with_frame_helper, mock_api):
+    """Test that each poll tier reads an unchanged value on its own schedule."""
+    coordinator = ComfoClimePropertyCoordinator(hass_with_frame_helper, mock_api, [], 60, sensor_delay=0)
+    mock_api.async_read_raw_property_for_device = AsyncMock(return_value=bytes([1]))
+    await coordinator.register_property("dev1", "1/1/1", byte_count=1, poll_tier=PollTier.FAST)
+    await coordinator.register_property("dev1", "1/1/2", byte_count=1)
+    await coordinator.register_property("dev1", "1/1/3", byte_count=1, poll_tier=PollTier.SLOW)
+    await coordinator.register_property("dev1", "1/1/4", byte_count=1, poll_tier=PollTier.STATIC)
+
+    for _ in range(12):
+        coordinator.data = await coordinator._async_update_data()
+
+    paths = [call.kwargs["property_path"] for call in mock_api.async_read_raw_property_for_device.await_args_list]
+    assert paths.count("1/1/1") == 12
+    # Cycles 1, 2, 4 and 8
+    assert paths.count("1/1/2") == 4
+    # Cycle 1 and, 10 minutes later, cycle 11
+    assert paths.count("1/1/3") == 2
+    assert paths.count("1/1/4") == 1
+    assert coordinator.get_property_value("dev1", "1/1/4", byte_count=1) == 1
+
+
+@pytest.mark.asyncio
+async def test_static_values_reread_after_write_refresh_and_reset(hass_with_frame_helper, mock_api):
+    """Test that a static value is read again after a write and after a device restart."""
+    coordinator = ComfoClimeTelemetryCoordinator(hass_with_frame_helper, mock_api, [], 60, sensor_delay=0)
+    mock_api.async_read_raw_telemetry_for_device = AsyncMock(return_value=bytes([42, 0]))
+    await coordinator.register_telemetry("dev1", "100", byte_count=2, poll_tier=PollTier.STATIC)
+    for _ in range(3):
+        coordinator.data = await coordinator._async_update_data()
+    assert mock_api.async_read_raw_telemetry_for_device.await_count == 1
+
+    # The refresh after a write runs at USER_READ priority
+    with request_priority(RequestPriority.USER_READ):
+        coordinator.data = await coordinator._async_update_data()
+    assert mock_api.async_read_raw_telemetry_for_device.await_count == 2
+
+    coordinator.reset_poll_periods()
+    for _ in range(3):
+        coordinator.data = await coordinator._async_update_data()
+    assert mock_api.async_read_raw_telemetry_for_device.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_sliced_polling_reads_registry_round_robin(hass_with_frame_helper, mock_api):
+    """Test that each update reads the next slice and reuses the other values."""
+    scheduler = PollingScheduler()
+    coordinator = ComfoClimeTelemetryCoordinator(
+        hass_with_frame_helper, mock_api, [], 60, sensor_delay=0, scheduler=scheduler, poll_slices=3
+    )
+    reads = 0
+
+    async def read(device_uuid, telemetry_id):
+        # Every read returns a new value, so no value is backed off
+        nonlocal reads
+        reads += 1
+        return bytes([reads, 0])
+
+    mock_api.async_read_raw_telemetry_for_device = AsyncMock(side_effect=read)
+    for telemetry_id in ("1", "2", "3", "4", "5", "6"):
+        await coordinator.register_telemetry("dev1", telemetry_id, byte_count=2)
+
+    # The first update reads every value that has never been read
+    coordinator.data = await coordinator._async_update_data()
+    assert mock_api.async_read_raw_telemetry_for_device.await_count == 6
+
+    read_ids = []
+    for _ in range(3):
+        mock_api.async_read_raw_telemetry_for_device.reset_mock()
+        coordinator.data = await coordinator._async_update_data()
+        read_ids.append(
+            [call.kwargs["telemetry_id"] for call in mock_api.async_read_raw_telemetry_for_device.await_args_list]
+        )
+
+    # Three updates per interval, each reading a third of the values
+    assert [source.interval for source in scheduler._sources] == [20]
+    assert sorted(telemetry_id for ids in read_ids for telemetry_id in ids) == ["1", "2", "3", "4", "5", "6"]
+    assert all(len(ids) == 2 for ids in read_ids)
+    assert coordinator.get_telemetry_value("dev1", "1", byte_count=2) is not None
+
+
+@pytest.mark.asyncio
+async def test_sliced_polling_reads_everything_for_user_refresh(hass_with_frame_helper, mock_api):
+    """Test that a refresh above POLL priority is not limited to one slice."""
+    coordinator = ComfoClimePropertyCoordinator(hass_with_frame_helper, mock_api, [], 60, sensor_delay=0, poll_slices=4)
+    mock_api.async_read_raw_property_for_device = AsyncMock(return_value=bytes([1]))
+    for path in ("1/1/1", "1/1/2", "1/1/3", "1/1/4"):
+        await coordinator.register_property("dev1", path, byte_count=1)
+    coordinator.data = await coordinator._async_update_data()
+    mock_api.async_read_raw_property_for_device.reset_mock()
+
+    with request_priority(RequestPriority.USER_READ):
+        coordinator.data = await coordinator._async_update_data()
+
+    assert mock_api.async_read_raw_property_for_device.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_values_are_published_per_device(hass_with_frame_helper, mock_api):
+    """Test that a device's entities are notified before the next device is read."""
+    coordinator = ComfoClimeTelemetryCoordinator(
+        hass_with_frame_helper, mock_api, [], sensor_delay=0, scheduler=PollingScheduler()
+    )
+    dev1_listener = MagicMock()
+    coordinator.async_add_listener(dev1_listener, ("dev1", "100"))
+    await coordinator.register_telemetry("dev1", "100", byte_count=2)
+    await coordinator.register_telemetry("dev2", "100", byte_count=2)
+
+    async def read(device_uuid, telemetry_id):
+        if device_uuid == "dev2":
+            # dev1 is already published while dev2 is read
+            dev1_listener.assert_called_once()
+            assert coordinator.get_telemetry_value("dev1", "100", byte_count=2) == 1
+        return bytes([1, 0])
+
+    mock_api.async_read_raw_telemetry_for_device = AsyncMock(side_effect=read)
+
+    await coordinator._async_update_data()
+
+    assert mock_api.async_read_raw_telemetry_for_device.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_only_entities_with_changed_values_are_notified(hass_with_frame_helper, mock_api):
+    """Test that unchanged values do not notify their entities."""
+    coordinator = ComfoClimePropertyCoordinator(
+        hass_with_frame_helper, mock_api, [], sensor_delay=0, scheduler=PollingScheduler()
+    )
+    changing, stable, other = MagicMock(), MagicMock(), MagicMock()
+    coordinator.async_add_listener(changing, ("dev1", "1/1/1"))
+    coordinator.async_add_listener(stable, ("dev1", "1/1/2"))
+    coordinator.async_add_listener(other)
+    await coordinator.register_property("dev1", "1/1/1", byte_count=1)
+    await coordinator.register_property("dev1", "1/1/2", byte_count=1)
+    reads = 0
+
+    async def read(device_uuid, property_path, byte_count):
+        nonlocal reads
+        reads += 1
+        return bytes([reads if property_path == "1/1/1" else 7])
+
+    mock_api.async_read_raw_property_for_device = AsyncMock(side_effect=read)
+
+    # First update: both values are new
+    coordinator.data = await coordinator._async_update_data()
+    coordinator.async_update_listeners()
+    assert (changing.call_count, stable.call_count, other.call_count) == (1, 1, 1)
+
+    coordinator.data = await coordinator._async_update_data()
+    coordinator.async_update_listeners()
+    assert (changing.call_count, stable.call_count, other.call_count) == (2, 1, 2)
+
+    # A confirmation refresh after a write notifies unchanged values, too
+    with request_priority(RequestPriority.USER_READ):
+        coordinator.data = await coordinator._async_update_data()
+    assert stable.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_new_registration_is_notified_of_known_value(hass_with_frame_helper, mock_api):
+    """Test that an entity registering for an already read value gets notified."""
+    coordinator = ComfoClimeTelemetryCoordinator(
+        hass_with_frame_helper, mock_api, [], sensor_delay=0, scheduler=PollingScheduler()
+    )
+    mock_api.async_read_raw_telemetry_for_device = AsyncMock(return_value=bytes([1, 0]))
+    await coordinator.register_telemetry("dev1", "100", byte_count=2)
+    coordinator.data = await coordinator._async_update_data()
+
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, ("dev1", "100"))
+    await coordinator.register_telemetry("dev1", "100", byte_count=2)
+    coordinator.data = await coordinator._async_update_data()
+
+    listener.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_pending_reads_only_new_registrations(hass_with_frame_helper, mock_api):
+    """Test that newly registered values are read and merged without a full update."""
+    coordinator = ComfoClimePropertyCoordinator(
+        hass_with_frame_helper, mock_api, [], sensor_delay=0, scheduler=PollingScheduler()
+    )
+    mock_api.async_read_raw_property_for_device = AsyncMock(return_value=bytes([5]))
+    await coordinator.register_property("dev1", "1/1/1", byte_count=1)
+    coordinator.data = await coordinator._async_update_data()
+    mock_api.async_read_raw_property_for_device.reset_mock()
+
+    known, new = MagicMock(), MagicMock()
+    coordinator.async_add_listener(known, ("dev1", "1/1/1"))
+    coordinator.async_add_listener(new, ("dev1", "1/1/2"))
+    await coordinator.register_property("dev1", "1/1/2", byte_count=1)
+    await coordinator.async_fetch_pending()
+
+    mock_api.async_read_raw_property_for_device.assert_awaited_once_with(
+        device_uuid="dev1", property_path="1/1/2", byte_count=1
+    )
+    assert coordinator.get_property_value("dev1", "1/1/1", byte_count=1) == 5
+    assert coordinator.get_property_value("dev1", "1/1/2", byte_count=1) == 5
+    new.assert_called_once()
+    known.assert_not_called()
+
+    # Nothing is pending anymore
+    await coordinator.async_fetch_pending()
+    assert mock_api.async_read_raw_property_for_device.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_pending_skips_values_read_by_an_update(hass_with_frame_helper, mock_api):
+    """Test that a value read by a full update in the meantime is not read again."""
+    coordinator = ComfoClimeTelemetryCoordinator(
+        hass_with_frame_helper, mock_api, [], sensor_delay=0, scheduler=PollingScheduler()
+    )
+    mock_api.async_read_raw_telemetry_for_device = AsyncMock(return_value=bytes([1, 0]))
+    await coordinator.register_telemetry("dev1", "100", byte_count=2)
+    coordinator.data = await coordinator._async_update_data()
+
+    await coordinator.async_fetch_pending()
+
+    assert mock_api.async_read_raw_telemetry_for_device.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_registration_window_reads_everything_in_one_sweep(hass_with_frame_helper, mock_api):
+    """Test that registrations during setup are read once, when the window closes."""
+    coordinator = ComfoClimeTelemetryCoordinator(
+        hass_with_frame_helper, mock_api, [], sensor_delay=0, scheduler=PollingScheduler()
+    )
+    mock_api.async_read_raw_telemetry_for_device = AsyncMock(return_value=bytes([1, 0]))
+    coordinator.open_registration_window()
+
+    for telemetry_id in ("100", "101", "102"):
+        await coordinator.register_telemetry("dev1", telemetry_id, byte_count=2)
+        await coordinator.async_fetch_pending()
+        await coordinator.async_request_refresh()
+    assert await coordinator._async_update_data() == {}
+    mock_api.async_read_raw_telemetry_for_device.assert_not_awaited()
+
+    await coordinator.async_close_registration_window()
+
+    assert mock_api.async_read_raw_telemetry_for_device.await_count == 3
+    assert coordinator.get_telemetry_value("dev1", "102", byte_count=2) == 1
+
+
+@pytest.mark.asyncio
+async def test_read_back_reads_only_the_written_value(hass_with_frame_helper, mock_api):
+    """Test that a read-back after a write reads and notifies only the written value."""
+    coordinator = ComfoClimePropertyCoordinator(
+        hass_with_frame_helper, mock_api, [], sensor_delay=0, scheduler=PollingScheduler()
+    )
+    mock_api.async_read_raw_property_for_device = AsyncMock(return_value=bytes([5]))
+    await coordinator.register_property("dev1", "1/1/1", byte_count=1)
+    await coordinator.register_property("dev1", "1/1/2", byte_count=1)
+    coordinator.data = await coordinator._async_update_data()
+    mock_api.async_read_raw_property_for_device = AsyncMock(return_value=bytes([9]))
+
+    written, other = MagicMock(), MagicMock()
+    coordinator.async_add_listener(written, ("dev1", "1/1/1"))
+    coordinator.async_add_listener(other, ("dev1", "1/1/2"))
+    with request_priority(RequestPriority.USER_READ):
+        await coordinator.async_read_back("dev1", "1/1/1")
+
+    mock_api.async_read_raw_property_for_device.assert_awaited_once_with(
+        device_uuid="dev1", property_path="1/1/1", byte_count=1
+    )
+    assert coordinator.get_property_value("dev1", "1/1/1", byte_count=1) == 9
+    assert coordinator.get_property_value("dev1", "1/1/2", byte_count=1) == 5
+    written.assert_called_once()
+    other.assert_not_called()
+
+    # Unregistered values are not read
+    await coordinator.async_read_back("dev1", "1/1/3")
+    assert mock_api.async_read_raw_property_for_device.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_read_back_keeps_the_previous_value(hass_with_frame_helper, mock_api):
+    """Test that a failed read-back leaves the value and a running update's read alone."""
+    coordinator = ComfoClimePropertyCoordinator(
+        hass_with_frame_helper, mock_api, [], sensor_delay=0, scheduler=PollingScheduler()
+    )
+    mock_api.async_read_raw_property_for_device = AsyncMock(return_value=bytes([5]))
+    await coordinator.register_property("dev1", "1/1/1", byte_count=1)
+    coordinator.data = await coordinator._async_update_data()
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, ("dev1", "1/1/1"))
+
+    mock_api.async_read_raw_property_for_device = AsyncMock(side_effect=TimeoutError)
+    await coordinator.async_read_back("dev1", "1/1/1")
+
+    assert coordinator.get_property_value("dev1", "1/1/1", byte_count=1) == 5
+    assert not coordinator._read_back
+    listener.assert_not_called()
+
+
+def _read_back_during_update(coordinator, trigger_device, read_back_device):
+    """Return a property read that reads back a value (as 9) while trigger_device is polled (as 5)."""
+    state = {"triggered": False, "reading_back": False}
+
+    async def read(device_uuid, property_path, byte_count):
+        if state["reading_back"]:
+            return bytes([9])
+        if device_uuid == trigger_device and not state["triggered"]:
+            state["triggered"] = state["reading_back"] = True
+            await coordinator.async_read_back(read_back_device, "1/1/1")
+            state["reading_back"] = False
+        return bytes([5])
+
+    return read
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("trigger_device", "read_back_device"),
+    [
+        # The read-back lands after its device was published
+        ("dev2", "dev1"),
+        # The read-back is for a device that is not published yet
+        ("dev1", "dev2"),
+    ],
+)
+async def test_read_back_during_update_is_kept(hass_with_frame_helper, mock_api, trigger_device, read_back_device):
+    """Test that an update running during a read-back does not replace it with its older read."""
+    coordinator = ComfoClimePropertyCoordinator(
+        hass_with_frame_helper, mock_api, [], sensor_delay=0, scheduler=PollingScheduler()
+    )
+    mock_api.async_read_raw_property_for_device = AsyncMock(return_value=bytes([5]))
+    await coordinator.register_property("dev1", "1/1/1", byte_count=1)
+    await coordinator.register_property("dev2", "1/1/1", byte_count=1)
+    coordinator.data = await coordinator._async_update_data()
+    mock_api.async_read_raw_property_for_device = AsyncMock(
+        side_effect=_read_back_during_update(coordinator, trigger_device, read_back_device)
+    )
+
+    # A user-requested refresh reads every value, stable ones included
+    with request_priority(RequestPriority.USER_READ):
+        coordinator.data = await coordinator._async_update_data()
+
+    assert coordinator.get_property_value(read_back_device, "1/1/1", byte_count=1) == 9
+    assert coordinator.get_property_value(trigger_device, "1/1/1", byte_count=1) == 5
+
+
+@pytest.mark.asyncio
+async def test_written_value_is_published_unconfirmed_until_read_back(hass_with_frame_helper, mock_api):
+    """Test that write-through publishes the written value before it is read back."""
+    coordinator = ComfoClimePropertyCoordinator(
+        hass_with_frame_helper, mock_api, [], sensor_delay=0, scheduler=PollingScheduler()
+    )
+    mock_api.write_through = True
+    mock_api.async_read_raw_property_for_device = AsyncMock(return_value=bytes([5]))
+    await coordinator.register_property("dev1", "1/1/1", faktor=0.1, byte_count=2)
+    coordinator.data = await coordinator._async_update_data()
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, ("dev1", "1/1/1"))
+
+    coordinator.publish_written_value(
+        PropertyWriteRequest(device_uuid="dev1", path="1/1/1", value=22.5, byte_count=2, faktor=0.1)
+    )
+
+    assert coordinator.get_property_value("dev1", "1/1/1", faktor=0.1, byte_count=2) == pytest.approx(22.5)
+    assert coordinator.is_value_unconfirmed("dev1", "1/1/1")
+    listener.assert_called_once()
+
+    mock_api.async_read_raw_property_for_device.return_value = bytes([225, 0])
+    await coordinator.async_read_back("dev1", "1/1/1")
+    assert not coordinator.is_value_unconfirmed("dev1", "1/1/1")
+    assert coordinator.get_property_value("dev1", "1/1/1", faktor=0.1, byte_count=2) == pytest.approx(22.5)
+
+
+@pytest.mark.asyncio
+async def test_written_value_published_during_update_is_kept(hass_with_frame_helper, mock_api):
+    """Test that an update running during a write keeps the unconfirmed written value."""
+    coordinator = ComfoClimePropertyCoordinator(
+        hass_with_frame_helper, mock_api, [], sensor_delay=0, scheduler=PollingScheduler()
+    )
+    mock_api.write_through = True
+    mock_api.async_read_raw_property_for_device = AsyncMock(return_value=bytes([5]))
+    await coordinator.register_property("dev1", "1/1/1", byte_count=1)
+    await coordinator.register_property("dev1", "1/1/2", byte_count=1)
+    coordinator.data = await coordinator._async_update_data()
+
+    async def read(device_uuid, property_path, byte_count):
+        if property_path == "1/1/1":
+            # The write completes while the update reads the old value
+            coordinator.publish_written_value(
+                PropertyWriteRequest(device_uuid="dev1", path="1/1/1", value=7, byte_count=1)
+            )
+        return bytes([5])
+
+    mock_api.async_read_raw_property_for_device = AsyncMock(side_effect=read)
+    with request_priority(RequestPriority.USER_READ):
+        coordinator.data = await coordinator._async_update_data()
+
+    assert coordinator.is_value_unconfirmed("dev1", "1/1/1")
+    assert coordinator.get_property_value("dev1", "1/1/1", byte_count=1) == 7
+    assert coordinator.get_property_value("dev1", "1/1/2", byte_count=1) == 5
+
+
+@pytest.mark.asyncio
+async def test_written_value_stays_unconfirmed_after_failed_read_back(hass_with_frame_helper, mock_api):
+    """Test that a failed read-back keeps the written value until an update reads it."""
+    coordinator = ComfoClimePropertyCoordinator(
+        hass_with_frame_helper, mock_api, [], sensor_delay=0, scheduler=PollingScheduler()
+    )
+    mock_api.write_through = True
+    mock_api.async_read_raw_property_for_device = AsyncMock(return_value=bytes([5]))
+    await coordinator.register_property("dev1", "1/1/1", byte_count=1)
+    coordinator.data = await coordinator._async_update_data()
+
+    coordinator.publish_written_value(PropertyWriteRequest(device_uuid="dev1", path="1/1/1", value=7, byte_count=1))
+    mock_api.async_read_raw_property_for_device = AsyncMock(side_effect=TimeoutError)
+    await coordinator.async_read_back("dev1", "1/1/1")
+
+    assert coordinator.is_value_unconfirmed("dev1", "1/1/1")
+    assert coordinator.get_property_value("dev1", "1/1/1", byte_count=1) == 7
+
+    # An update started after the write confirms it with what the device reports
+    mock_api.async_read_raw_property_for_device = AsyncMock(return_value=bytes([6]))
+    with request_priority(RequestPriority.USER_READ):
+        coordinator.data = await coordinator._async_update_data()
+
+    assert not coordinator.is_value_unconfirmed("dev1", "1/1/1")
+    assert coordinator.get_property_value("dev1", "1/1/1", byte_count=1) == 6
+
+
+@pytest.mark.asyncio
+async def test_optimistic_state_is_applied_compared_and_restored(hass_with_frame_helper, mock_api):
+    """Test applying an expected write result to nested model data and rolling it back."""
+    coordinator = ComfoClimeThermalprofileCoordinator(hass_with_frame_helper, mock_api)
+    coordinator.data = ThermalProfileData(temperature=TemperatureControlData(status=0, manual_temperature=22.0))
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, "temperature.manualTemperature")
+    update = {"temperature": {"manual_temperature": 23.5}}
+
+    previous = coordinator.async_apply_optimistic(update)
+
+    assert coordinator.data.temperature.manual_temperature == 23.5
+    assert coordinator.data.temperature.status == 0
+    assert coordinator.mismatches(update) == {}
+    listener.assert_called_once()
+
+    coordinator.async_restore_data(previous)
+    assert coordinator.mismatches(update) == {"temperature.manual_temperature": (23.5, 22.0)}
+    assert listener.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_dashboard_update_response_is_merged(hass_with_frame_helper, mock_api):
+    """Test that the state reported by a dashboard PUT is merged into the data."""
+    coordinator = ComfoClimeDashboardCoordinator(hass_with_frame_helper, mock_api)
+    coordinator.data = DashboardData(indoor_temperature=22.5, fan_speed=1, status=1)
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, "fanSpeed")
+
+    assert coordinator.async_apply_update_response(DashboardUpdateResponse(status=1, fanSpeed=3), {"fan_speed": 3})
+    assert coordinator.data.fan_speed == 3
+    assert coordinator.data.indoor_temperature == 22.5
+    listener.assert_called_once()
+
+    # A response without the written field is merged but does not replace the read
+    response = DashboardUpdateResponse(fanSpeed=2)
+    assert not coordinator.async_apply_update_response(response, {"fan_speed": 2, "season": 1})
+    assert coordinator.data.fan_speed == 2
+    assert not coordinator.async_apply_update_response(DashboardUpdateResponse(), {"fan_speed": 2})
+
+
+@pytest.mark.asyncio
+async def test_dashboard_entities_are_notified_only_when_their_key_changed(hass_with_frame_helper, mock_api):
+    """Test keyed dispatch and the suppressed update counter of a whole-response coordinator."""
+    access_tracker = AccessTracker()
+    coordinator = ComfoClimeDashboardCoordinator(
+        hass_with_frame_helper, mock_api, access_tracker=access_tracker, scheduler=PollingScheduler()
+    )
+    indoor, outdoor, climate = MagicMock(), MagicMock(), MagicMock()
+    coordinator.async_add_listener(indoor, "indoorTemperature")
+    coordinator.async_add_listener(outdoor, "outdoorTemperature")
+    coordinator.async_add_listener(climate)
+
+    coordinator.data = DashboardData(indoor_temperature=22.5, outdoor_temperature=15.0)
+    coordinator.async_update_listeners()
+    assert (indoor.call_count, outdoor.call_count, climate.call_count) == (1, 1, 1)
+
+    coordinator.data = DashboardData(indoor_temperature=23.0, outdoor_temperature=15.0)
+    coordinator.async_update_listeners()
+    assert (indoor.call_count, outdoor.call_count, climate.call_count) == (2, 1, 2)
+    assert coordinator.suppressed_updates == 1
+    assert access_tracker.get_suppressed_updates("Dashboard") == 1
+
+    # Losing availability notifies everybody
+    coordinator.last_update_success = False
+    coordinator.async_update_listeners()
+    assert (indoor.call_count, outdoor.call_count, climate.call_count) == (3, 2, 3)
+
+
+@pytest.mark.asyncio
+async def test_thermalprofile_entities_listen_to_nested_keys(hass_with_frame_helper, mock_api):
+    """Test that dotted keys are compared by their nested value."""
+    coordinator = ComfoClimeThermalprofileCoordinator(hass_with_frame_helper, mock_api, scheduler=PollingScheduler())
+    status, mode = MagicMock(), MagicMock()
+    coordinator.async_add_listener(status, "season.status")
+    coordinator.async_add_listener(mode, "season.season")
+
+    coordinator.data = ThermalProfileData(season={"status": 1, "season": 0})
+    coordinator.async_update_listeners()
+    coordinator.data = ThermalProfileData(season={"status": 1, "season": 2})
+    coordinator.async_update_listeners()
+
+    assert (status.call_count, mode.call_count) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_monitoring_coordinator_detects_reboot(hass_with_frame_helper, mock_api):
+    """Test that reboot listeners are called when the uptime starts over."""
+    coordinator = ComfoClimeMonitoringCoordinator(hass_with_frame_helper, mock_api)
+    listener = MagicMock()
+    coordinator.add_reboot_listener(listener)
+
+    pings = [
+        MonitoringPing(up_time_seconds=3600, timestamp=1705314600),
+        # One minute later, uptime (nearly) one minute higher
+        MonitoringPing(up_time_seconds=3658, timestamp=1705314660),
+        # Restarted two minutes ago
+        MonitoringPing(up_time_seconds=120, timestamp=1705314720),
+    ]
+    mock_api.async_get_monitoring_ping = AsyncMock(side_effect=pings)
+
+    await coordinator._async_update_data()
+    await coordinator._async_update_data()
+    listener.assert_not_called()
+
+    await coordinator._async_update_data()
+    listener.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_monitoring_coordinator_success(hass_with_frame_helper, mock_api):
     """Test monitoring coordinator successful data fetch."""
@@ -565,7 +1186,10 @@ class TestTelemetryCoordinatorRegistry:
         assert "device1" in coordinator._telemetry_registry
         assert "4145" in coordinator._telemetry_registry["device1"]
 
-        entry = coordinator._telemetry_registry["device1"]["4145"]
+        decoders = coordinator._telemetry_registry["device1"]["4145"]
+        assert len(decoders) == 1
+        entry, refcount = next(iter(decoders.items()))
+        assert refcount == 1
         assert isinstance(entry, TelemetryRegistryEntry)
         assert entry.faktor == 0.1
         assert entry.signed is True
@@ -620,7 +1244,10 @@ class TestPropertyCoordinatorRegistry:
         assert "device1" in coordinator._property_registry
         assert "29/1/10" in coordinator._property_registry["device1"]
 
-        entry = coordinator._property_registry["device1"]["29/1/10"]
+        decoders = coordinator._property_registry["device1"]["29/1/10"]
+        assert len(decoders) == 1
+        entry, refcount = next(iter(decoders.items()))
+        assert refcount == 1
         assert isinstance(entry, PropertyRegistryEntry)
         assert entry.faktor == 1.0
         assert entry.signed is True
@@ -705,7 +1332,7 @@ class TestPropertyCoordinatorRegistry:
             coordinator = ComfoClimeTelemetryCoordinator(
                 hass_with_frame_helper, mock_api, devices=[], circuit_breaker_threshold=3, circuit_breaker_cooldown=60
             )
-            mock_api.async_read_telemetry_for_device = AsyncMock(side_effect=aiohttp.ClientError("device down"))
+            mock_api.async_read_raw_telemetry_for_device = AsyncMock(side_effect=aiohttp.ClientError("device down"))
             await coordinator.register_telemetry("dev1", "100", faktor=1.0, signed=False, byte_count=1)
 
             # First two failures: counter increases, breaker still closed
@@ -735,11 +1362,11 @@ class TestPropertyCoordinatorRegistry:
             # Seed last data
             coordinator.data = {"dev1": {"100": 42.0}}
 
-            mock_api.async_read_telemetry_for_device = AsyncMock()
+            mock_api.async_read_raw_telemetry_for_device = AsyncMock()
             result = await coordinator._async_update_data()
 
             # Should return cached data without calling API
-            mock_api.async_read_telemetry_for_device.assert_not_called()
+            mock_api.async_read_raw_telemetry_for_device.assert_not_called()
             assert result == {"dev1": {"100": 42.0}}
 
         @pytest.mark.asyncio
@@ -752,11 +1379,7 @@ class TestPropertyCoordinatorRegistry:
             # Expired cooldown (breaker should auto-reset)
             coordinator._circuit_open_until = datetime.now(UTC) - timedelta(seconds=1)
 
-            mock_api.async_read_telemetry_for_device = AsyncMock(
-                return_value=TelemetryReading(
-                    device_uuid="dev1", telemetry_id="100", raw_value=100, faktor=0.1, signed=False, byte_count=2
-                )
-            )
+            mock_api.async_read_raw_telemetry_for_device = AsyncMock(return_value=bytes([100, 0]))
             await coordinator._async_update_data()
 
             # Failures reset because a successful read occurred
@@ -771,7 +1394,7 @@ class TestPropertyCoordinatorRegistry:
             coordinator = ComfoClimePropertyCoordinator(
                 hass_with_frame_helper, mock_api, devices=[], circuit_breaker_threshold=2, circuit_breaker_cooldown=120
             )
-            mock_api.async_read_property_for_device = AsyncMock(side_effect=aiohttp.ClientError("device down"))
+            mock_api.async_read_raw_property_for_device = AsyncMock(side_effect=aiohttp.ClientError("device down"))
             await coordinator.register_property("dev1", "22/1/9", faktor=0.1, signed=False, byte_count=2)
 
             await coordinator._async_update_data()
@@ -788,10 +1411,7 @@ class TestPropertyCoordinatorRegistry:
             from unittest.mock import patch
 
             coordinator = ComfoClimeTelemetryCoordinator(hass_with_frame_helper, mock_api, devices=[], sensor_delay=0.5)
-            mock_reading = TelemetryReading(
-                device_uuid="dev1", telemetry_id="100", raw_value=100, faktor=1.0, signed=False, byte_count=1
-            )
-            mock_api.async_read_telemetry_for_device = AsyncMock(return_value=mock_reading)
+            mock_api.async_read_raw_telemetry_for_device = AsyncMock(return_value=bytes([100]))
             await coordinator.register_telemetry("dev1", "100", faktor=1.0, signed=False, byte_count=1)
             await coordinator.register_telemetry("dev1", "200", faktor=1.0, signed=False, byte_count=1)
 
@@ -806,3 +1426,23 @@ class TestPropertyCoordinatorRegistry:
 
             # One sleep per sensor read
             assert sleep_calls.count(0.5) == 2
+
+        @pytest.mark.asyncio
+        async def test_sensor_delay_skipped_with_scheduler(self, hass_with_frame_helper, mock_api):
+            """Test that reads paced by a scheduler get no inter-sensor delay on top."""
+            from unittest.mock import patch
+
+            scheduler = PollingScheduler()
+            scheduler.pace = AsyncMock()
+            coordinator = ComfoClimeTelemetryCoordinator(
+                hass_with_frame_helper, mock_api, devices=[], sensor_delay=0.5, scheduler=scheduler
+            )
+            mock_api.async_read_raw_telemetry_for_device = AsyncMock(return_value=bytes([100]))
+            await coordinator.register_telemetry("dev1", "100", faktor=1.0, signed=False, byte_count=1)
+            await coordinator.register_telemetry("dev1", "200", faktor=1.0, signed=False, byte_count=1)
+
+            with patch("custom_components.comfoclime.coordinator.asyncio.sleep", new=AsyncMock()) as sleep:
+                await coordinator._async_update_data()
+
+            assert scheduler.pace.await_count == 2
+            sleep.assert_not_called()
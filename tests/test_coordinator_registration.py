@@ -33,9 +33,10 @@ def property_coordinator(hass):
 class TestTelemetryRegistry:
     async def test_register_then_unregister_empties_the_registry(self, telemetry_coordinator):
         await telemetry_coordinator.register_telemetry(DEVICE, "4193", faktor=0.1, signed=True, byte_count=2)
-        assert telemetry_coordinator._telemetry_registry[DEVICE]["4193"].byte_count == 2
+        (entry,) = telemetry_coordinator._telemetry_registry[DEVICE]["4193"]
+        assert entry.byte_count == 2
 
-        await telemetry_coordinator.unregister_telemetry(DEVICE, "4193")
+        await telemetry_coordinator.unregister_telemetry(DEVICE, "4193", faktor=0.1, signed=True, byte_count=2)
 
         assert DEVICE not in telemetry_coordinator._telemetry_registry
 
@@ -55,7 +56,7 @@ class TestTelemetryRegistry:
         assert set(telemetry_coordinator._telemetry_registry[DEVICE]) == {"4193"}
 
     async def test_unregistered_telemetry_is_not_fetched(self, telemetry_coordinator):
-        telemetry_coordinator.api.async_read_telemetry_for_device = AsyncMock(return_value=MagicMock(scaled_value=21.5))
+        telemetry_coordinator.api.async_read_raw_telemetry_for_device = AsyncMock(return_value=bytes([215, 0]))
         await telemetry_coordinator.register_telemetry(DEVICE, "4193")
         await telemetry_coordinator.register_telemetry(DEVICE, "4194")
         await telemetry_coordinator.unregister_telemetry(DEVICE, "4194")
@@ -64,7 +65,7 @@ class TestTelemetryRegistry:
 
         fetched = {
             call.kwargs["telemetry_id"]
-            for call in telemetry_coordinator.api.async_read_telemetry_for_device.call_args_list
+            for call in telemetry_coordinator.api.async_read_raw_telemetry_for_device.call_args_list
         }
         assert fetched == {"4193"}
 
@@ -76,25 +77,37 @@ class TestPropertyRegistryRefcounting:
         await property_coordinator.register_property(DEVICE, "23/1/4", faktor=0.1, signed=True, byte_count=2)
         await property_coordinator.register_property(DEVICE, "23/1/4", faktor=0.1, signed=True, byte_count=2)
 
-        await property_coordinator.unregister_property(DEVICE, "23/1/4")
+        await property_coordinator.unregister_property(DEVICE, "23/1/4", faktor=0.1, signed=True, byte_count=2)
         assert "23/1/4" in property_coordinator._property_registry[DEVICE], (
             "one entity still wants this property, so it must keep being polled"
         )
 
-        await property_coordinator.unregister_property(DEVICE, "23/1/4")
+        await property_coordinator.unregister_property(DEVICE, "23/1/4", faktor=0.1, signed=True, byte_count=2)
         assert DEVICE not in property_coordinator._property_registry
 
-    async def test_conflicting_parameters_keep_the_first_registration(self, property_coordinator, caplog):
-        """Disagreeing definitions must not silently overwrite each other."""
+    async def test_differing_parameters_share_one_read(self, property_coordinator):
+        """Entities decoding the same path differently each get their own value from a single read."""
+        property_coordinator.api.async_read_raw_property_for_device = AsyncMock(return_value=bytes([0xFF, 0xFF]))
         await property_coordinator.register_property(DEVICE, "23/1/4", faktor=0.1, signed=True, byte_count=2)
-        await property_coordinator.register_property(DEVICE, "23/1/4", faktor=1.0, signed=False, byte_count=1)
+        await property_coordinator.register_property(DEVICE, "23/1/4", faktor=1.0, signed=False, byte_count=2)
+        assert len(property_coordinator._property_registry[DEVICE]["23/1/4"]) == 2
+
+        property_coordinator.data = await property_coordinator._async_update_data()
+
+        property_coordinator.api.async_read_raw_property_for_device.assert_awaited_once()
+        assert property_coordinator.get_property_value(DEVICE, "23/1/4", faktor=0.1, signed=True, byte_count=2) == (
+            pytest.approx(-0.1)
+        )
+        assert property_coordinator.get_property_value(DEVICE, "23/1/4", faktor=1.0, signed=False, byte_count=2) == (
+            65535
+        )
 
-        entry = property_coordinator._property_registry[DEVICE]["23/1/4"]
-        assert (entry.faktor, entry.signed, entry.byte_count) == (0.1, True, 2)
-        assert "Conflicting decode parameters" in caplog.text
+        await property_coordinator.unregister_property(DEVICE, "23/1/4", faktor=0.1, signed=True, byte_count=2)
+        (entry,) = property_coordinator._property_registry[DEVICE]["23/1/4"]
+        assert (entry.faktor, entry.signed, entry.byte_count) == (1.0, False, 2)
 
     async def test_unregistered_property_is_not_fetched(self, property_coordinator):
-        property_coordinator.api.async_read_property_for_device = AsyncMock(return_value=MagicMock(scaled_value=1))
+        property_coordinator.api.async_read_raw_property_for_device = AsyncMock(return_value=bytes([1, 0]))
         await property_coordinator.register_property(DEVICE, "29/1/2")
         await property_coordinator.register_property(DEVICE, "29/1/3")
         await property_coordinator.unregister_property(DEVICE, "29/1/2")
@@ -103,7 +116,7 @@ class TestPropertyRegistryRefcounting:
 
         fetched = {
             call.kwargs["property_path"]
-            for call in property_coordinator.api.async_read_property_for_device.call_args_list
+            for call in property_coordinator.api.async_read_raw_property_for_device.call_args_list
         }
         assert fetched == {"29/1/3"}
 
@@ -137,14 +150,20 @@ class TestEntityLifecycle:
 
         assert telemetry_coordinator._telemetry_registry == {}
 
-    async def test_added_to_hass_registers_and_refreshes(self, telemetry_coordinator, mock_config_entry):
+    async def test_added_to_hass_registers_and_fetches_only_its_value(self, telemetry_coordinator, mock_config_entry):
         sensor = self._telemetry_sensor(telemetry_coordinator, mock_config_entry)
         telemetry_coordinator.async_request_refresh = AsyncMock()
+        telemetry_coordinator.api.async_read_raw_telemetry_for_device = AsyncMock(return_value=bytes([215, 0]))
 
         await sensor._async_register_data_source()
 
-        assert telemetry_coordinator._telemetry_registry[DEVICE]["4193"].faktor == 0.1
-        telemetry_coordinator.async_request_refresh.assert_awaited_once()
+        (entry,) = telemetry_coordinator._telemetry_registry[DEVICE]["4193"]
+        assert entry.faktor == 0.1
+        telemetry_coordinator.async_request_refresh.assert_not_awaited()
+        telemetry_coordinator.api.async_read_raw_telemetry_for_device.assert_awaited_once_with(
+            device_uuid=DEVICE, telemetry_id="4193"
+        )
+        assert telemetry_coordinator.get_telemetry_value(DEVICE, "4193", faktor=0.1, byte_count=2) == 21.5
 
     async def test_removal_unregisters(self, telemetry_coordinator, mock_config_entry):
         sensor = self._telemetry_sensor(telemetry_coordinator, mock_config_entry)
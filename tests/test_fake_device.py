@@ -0,0 +1,246 @@
+"""Tests for ComfoClimeAPI against the in-process fake device."""
+
+import asyncio
+import itertools
+from unittest.mock import MagicMock
+
+import aiohttp
+import pytest
+
+from custom_components.comfoclime.comfoclime_api import ComfoClimeAPI
+from custom_components.comfoclime.infrastructure import RequestPriority, request_priority
+from custom_components.comfoclime.models import DashboardUpdate, PropertyWriteRequest
+
+from .fake_device import FAKE_DEVICE_UUID, FAKE_SYSTEM_UUID, FAULT_TIMEOUT, FakeComfoClimeDevice
+
+
+@pytest.fixture
+async def fake_device():
+    """Start a fake device without artificial latency."""
+    async with FakeComfoClimeDevice() as device:
+        yield device
+
+
+@pytest.fixture
+async def fake_api(fake_device):
+    """ComfoClimeAPI pointed at the fake device with rate limiting disabled."""
+    api = ComfoClimeAPI(
+        fake_device.base_url,
+        min_request_interval=0,
+        write_cooldown=0,
+        cache_ttl=0,
+        max_retries=0,
+    )
+    api.hass = MagicMock()
+    api.hass.config.time_zone = "Europe/Berlin"
+    yield api
+    await api.close()
+
+
+class TestFakeDeviceEndpoints:
+    """Test the API client end-to-end against the fake device."""
+
+    @pytest.mark.asyncio
+    async def test_uuid_and_dashboard(self, fake_api, fake_device):
+        """Test UUID discovery and dashboard read."""
+        dashboard = await fake_api.async_get_dashboard_data()
+
+        assert fake_api.uuid == FAKE_SYSTEM_UUID
+        assert dashboard.indoor_temperature == 22.5
+        assert dashboard.fan_speed == 2
+        assert fake_device.stats.count("GET", "/monitoring/ping") == 1
+        assert fake_device.stats.count("GET", "/dashboard$") == 1
+
+    @pytest.mark.asyncio
+    async def test_connected_devices_and_thermal_profile(self, fake_api):
+        """Test devices list and thermal profile read."""
+        devices = await fake_api.async_get_connected_devices()
+        profile = await fake_api.async_get_thermal_profile()
+
+        assert [d.uuid for d in devices.devices] == [FAKE_DEVICE_UUID]
+        assert profile.heating_thermal_profile_season_data.comfort_temperature == 21.5
+
+    @pytest.mark.asyncio
+    async def test_telemetry_read(self, fake_api, fake_device):
+        """Test signed telemetry decoding from raw bytes."""
+        fake_device.set_telemetry(4145, [0x1E, 0xFF])  # -226 -> -22.6
+
+        reading = await fake_api.async_read_telemetry_for_device(FAKE_DEVICE_UUID, "4145", faktor=0.1, byte_count=2)
+
+        assert reading.scaled_value == pytest.approx(-22.6)
+
+    @pytest.mark.asyncio
+    async def test_property_write_then_read(self, fake_api, fake_device):
+        """Test that a property write is visible on the next read."""
+        request = PropertyWriteRequest(
+            device_uuid=FAKE_DEVICE_UUID, path="29/1/10", value=22.5, byte_count=2, signed=True, faktor=0.1
+        )
+
+        await fake_api.async_set_property_for_device(request=request)
+        reading = await fake_api.async_read_property_for_device(FAKE_DEVICE_UUID, "29/1/10", faktor=0.1, byte_count=2)
+
+        assert fake_device.property_writes == [(FAKE_DEVICE_UUID, "29/1/10", [225, 0])]
+        assert reading.scaled_value == pytest.approx(22.5)
+
+    @pytest.mark.asyncio
+    async def test_dashboard_write_and_reset(self, fake_api, fake_device):
+        """Test dashboard PUT and system reset."""
+        await fake_api.async_update_dashboard(DashboardUpdate(fan_speed=3))
+        await fake_api.async_reset_system()
+
+        assert fake_device.dashboard["fanSpeed"] == 3
+        assert "timestamp" in fake_device.dashboard_writes[0]
+        assert fake_device.reset_count == 1
+
+
+class TestFakeDeviceBehaviour:
+    """Test latency, serialization and fault injection."""
+
+    @pytest.mark.asyncio
+    async def test_single_request_mode_serializes(self):
+        """Test that single_request mode never serves two requests at once."""
+        async with FakeComfoClimeDevice(latency=0.02, single_request=True) as device:
+            async with aiohttp.ClientSession() as session:
+
+                async def fetch():
+                    async with session.get(f"{device.base_url}/monitoring/ping") as response:
+                        return response.status
+
+                statuses = await asyncio.gather(*(fetch() for _ in range(5)))
+
+        assert statuses == [200] * 5
+        assert device.stats.max_concurrency == 1
+        assert device.stats.duration >= 5 * 0.02
+        assert max(r.queue_time for r in device.stats.records) > 0
+
+    @pytest.mark.asyncio
+    async def test_injected_error_uses_on_error(self, fake_api, fake_device):
+        """Test that an injected 5xx is surfaced through the client error path."""
+        fake_api.uuid = FAKE_SYSTEM_UUID
+        fake_device.inject_fault(path="/thermalprofile$", status=503)
+
+        assert await fake_api.async_get_thermal_profile() == {}
+        # Fault is consumed, next call succeeds
+        profile = await fake_api.async_get_thermal_profile()
+        assert profile.temperature_profile == 0
+
+    @pytest.mark.asyncio
+    async def test_injected_timeout(self, fake_api, fake_device):
+        """Test that an injected stall triggers the client read timeout."""
+        fake_api.uuid = FAKE_SYSTEM_UUID
+        fake_api.read_timeout = 0.1
+        fake_device.timeout_delay = 1.0
+        fake_device.inject_fault(FAULT_TIMEOUT, path="/dashboard$", method="GET")
+
+        with pytest.raises(TimeoutError):
+            await fake_api.async_get_dashboard_data()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_are_coalesced(self):
+        """Test that concurrent identical reads hit the device only once."""
+        async with FakeComfoClimeDevice(latency=0.05, single_request=True) as device:
+            api = ComfoClimeAPI(device.base_url, min_request_interval=0, write_cooldown=0)
+            api.uuid = FAKE_SYSTEM_UUID
+            try:
+                results = await asyncio.gather(*(api.async_get_dashboard_data() for _ in range(4)))
+            finally:
+                await api.close()
+
+        assert all(r.fan_speed == 2 for r in results)
+        assert device.stats.count("GET", "/dashboard$") == 1
+        assert api._rate_limiter.coalesced_requests == 3
+
+    @pytest.mark.asyncio
+    async def test_user_read_not_coalesced_with_poll(self):
+        """Test that a user read does not join a queued poll of the same URL."""
+        async with FakeComfoClimeDevice(latency=0.05, single_request=True) as device:
+            api = ComfoClimeAPI(device.base_url, min_request_interval=0, write_cooldown=0)
+            api.uuid = FAKE_SYSTEM_UUID
+
+            async def user_read():
+                with request_priority(RequestPriority.USER_READ):
+                    return await api.async_get_dashboard_data()
+
+            try:
+                await asyncio.gather(api.async_get_dashboard_data(), user_read())
+            finally:
+                await api.close()
+
+        assert device.stats.count("GET", "/dashboard$") == 2
+        assert api._rate_limiter.coalesced_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_reads_proceed_while_write_backs_off(self, fake_api, fake_device):
+        """Test that a failing write releases the device between retries."""
+        fake_api.uuid = FAKE_SYSTEM_UUID
+        fake_api.max_retries = 1
+        fake_device.inject_fault(path="/dashboard$", method="PUT", status=503)
+
+        write = asyncio.create_task(fake_api.async_update_dashboard(DashboardUpdate(fan_speed=1)))
+        # Wait until the first attempt has failed and the write is backing off
+        await fake_device.stats.wait_for("PUT", "/dashboard$")
+        await fake_api.async_get_dashboard_data()
+        await write
+
+        sequence = [(r.method, r.status) for r in fake_device.stats.records]
+        assert sequence == [("PUT", 503), ("GET", 200), ("PUT", 200)]
+        assert fake_device.dashboard["fanSpeed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_min_request_interval_is_enforced_at_device(self):
+        """Test that concurrent reads and writes never arrive faster than the interval."""
+        async with FakeComfoClimeDevice(latency=0.01) as device:
+            api = ComfoClimeAPI(device.base_url, min_request_interval=0.05, write_cooldown=0.1, cache_ttl=0)
+            api.uuid = FAKE_SYSTEM_UUID
+            api.hass = MagicMock()
+            api.hass.config.time_zone = "UTC"
+            try:
+                await asyncio.gather(
+                    *(api.async_read_telemetry_for_device(FAKE_DEVICE_UUID, str(i)) for i in range(8)),
+                    api.async_update_dashboard(DashboardUpdate(fan_speed=1)),
+                    *(api.async_read_property_for_device(FAKE_DEVICE_UUID, f"29/1/{i}") for i in range(1, 5)),
+                )
+            finally:
+                await api.close()
+
+        starts = sorted(r.received for r in device.stats.records)
+        assert len(starts) == 13
+        # Small tolerance for timer granularity
+        assert min(b - a for a, b in itertools.pairwise(starts)) >= 0.045
+
+    @pytest.mark.asyncio
+    async def test_adaptive_rate_control_follows_device_health(self, fake_device):
+        """Test that device errors widen the request interval and healthy responses narrow it."""
+        api = ComfoClimeAPI(
+            fake_device.base_url,
+            min_request_interval=0.05,
+            write_cooldown=0,
+            cache_ttl=0,
+            max_retries=0,
+            adaptive_rate_limiting=True,
+            adaptive_min_interval=0.05,
+            adaptive_max_interval=1.0,
+        )
+        api.uuid = FAKE_SYSTEM_UUID
+        fake_device.inject_fault(path="/thermalprofile$", status=503, count=2)
+        try:
+            await api.async_get_thermal_profile()
+            first_backoff = api.rate_control_state()["request_interval"]
+            await api.async_get_thermal_profile()
+            second_backoff = api.rate_control_state()["request_interval"]
+            await api.async_get_thermal_profile()
+        finally:
+            await api.close()
+
+        state = api.rate_control_state()
+        assert first_backoff == pytest.approx(0.1)
+        assert second_backoff == pytest.approx(0.2)
+        assert state["request_interval"] == pytest.approx(0.19)
+        assert 0 < state["error_rate"] < 1
+
+    def test_unknown_fault_kind_rejected(self):
+        """Test that unknown fault kinds are rejected."""
+        device = FakeComfoClimeDevice()
+
+        with pytest.raises(ValueError, match="Unknown fault kind"):
+            device.inject_fault("explode")
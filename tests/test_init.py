@@ -91,6 +91,10 @@ async def test_async_setup_entry(
                                 # Verify setup was successful
                                 assert result is True
 
+                                # Registrations during platform setup are read in one sweep
+                                mock_tl_coord_instance.open_registration_window.assert_called_once()
+                                mock_prop_coord_instance.open_registration_window.assert_called_once()
+
                                 # Verify data was stored in hass.data
                             assert "comfoclime" in mock_hass.data
                             assert "test_entry_id" in mock_hass.data["comfoclime"]
@@ -226,6 +230,27 @@ async def test_async_setup_entry_with_float_max_retries(
                                 assert isinstance(def_coord_args[3], int)
                                 assert def_coord_args[3] == 240
 
+                                # All coordinators are polled by one shared scheduler
+                                schedulers = {
+                                    id(coord.call_args.kwargs["scheduler"])
+                                    for coord in (
+                                        mock_db_coord,
+                                        mock_tp_coord,
+                                        mock_mon_coord,
+                                        mock_tl_coord,
+                                        mock_prop_coord,
+                                        mock_def_coord,
+                                    )
+                                }
+                                assert len(schedulers) == 1
+                                scheduler = mock_db_coord.call_args.kwargs["scheduler"]
+                                assert scheduler.request_budget == 60.0
+
+                                # Its timer runs as a background task of the entry
+                                polling = mock_config_entry.async_create_background_task.call_args[0][1]
+                                assert polling.cr_code is scheduler.run.__func__.__code__
+                                polling.close()
+
 
 @pytest.mark.asyncio
 async def test_async_unload_entry(mock_hass, mock_config_entry):
@@ -206,19 +206,25 @@ class TestTelemetryReading:
             TelemetryReading(device_uuid="abc123", telemetry_id="10", raw_value=100, byte_count=3)
 
     def test_telemetry_from_cached_value(self):
-        """Test telemetry reconstruction from cached scaled value."""
+        """Test telemetry decoding from cached raw bytes."""
         reading = TelemetryReading.from_cached_value(
             device_uuid="abc123",
             telemetry_id="10",
-            cached_value=25.0,
+            cached_value=bytes([0xFA, 0xFF]),
             faktor=0.1,
             signed=True,
             byte_count=2,
         )
 
         assert reading is not None
-        assert reading.raw_value == 250
-        assert reading.scaled_value == 25.0
+        assert reading.raw_value == 0xFFFA
+        assert reading.scaled_value == pytest.approx(-0.6)
+
+    def test_telemetry_from_cached_value_rejects_non_bytes(self):
+        """Test that only cached raw bytes are decoded."""
+        reading = TelemetryReading.from_cached_value(device_uuid="abc123", telemetry_id="10", cached_value=None)
+
+        assert reading is None
 
     def test_telemetry_from_raw_bytes(self):
         """Test telemetry parsing from raw bytes."""
@@ -274,11 +280,11 @@ class TestPropertyReading:
             PropertyReading(device_uuid="abc123", path="", raw_value=100)
 
     def test_property_from_cached_value(self):
-        """Test property reconstruction from cached value."""
+        """Test property decoding from cached raw bytes."""
         reading = PropertyReading.from_cached_value(
             device_uuid="abc123",
             path="29/1/10",
-            cached_value=50.0,
+            cached_value=bytes([100, 0]),
             faktor=0.5,
             signed=True,
             byte_count=2,
@@ -304,7 +310,22 @@ class TestPropertyReadResult:
         )
 
         assert result.reading is not None
-        assert result.cache_value == 100.0
+        assert result.reading.scaled_value == 100.0
+        assert result.cache_value == bytes([100])
+
+    def test_property_read_result_signed_negative(self):
+        """Test that negative signed properties decode and cache their raw bytes."""
+        result = PropertyReadResult.from_raw_bytes(
+            device_uuid="abc123",
+            path="29/1/10",
+            data=[0xFB, 0xFF],
+            faktor=0.1,
+            signed=True,
+            byte_count=2,
+        )
+
+        assert result.reading.scaled_value == pytest.approx(-0.5)
+        assert result.cache_value == bytes([0xFB, 0xFF])
 
     def test_property_read_result_string(self):
         """Test string property parsing from raw bytes."""
@@ -321,6 +342,35 @@ class TestPropertyReadResult:
         assert result.cache_value == "AB"
 
 
+class TestRegistryEntryDecode:
+    """Tests for decoding one raw read with several registry entries."""
+
+    def test_telemetry_entries_decode_same_bytes_differently(self):
+        """Test that each telemetry entry applies its own parameters to shared bytes."""
+        data = bytes([0xFB, 0xFF])
+
+        assert TelemetryRegistryEntry(faktor=0.1, signed=True, byte_count=2).decode(data) == pytest.approx(-0.5)
+        assert TelemetryRegistryEntry(faktor=1.0, signed=False, byte_count=2).decode(data) == 65531
+        assert TelemetryRegistryEntry(faktor=1.0, signed=False, byte_count=1).decode(data) == 0xFB
+
+    def test_telemetry_entry_decode_without_data(self):
+        """Test that a missing read decodes to None."""
+        assert TelemetryRegistryEntry().decode(None) is None
+        assert TelemetryRegistryEntry().decode(b"") is None
+
+    def test_property_entry_decode_numeric(self):
+        """Test numeric property decoding, with byte count taken from the data if unset."""
+        assert PropertyRegistryEntry(faktor=0.5, signed=False, byte_count=1).decode(bytes([10])) == 5.0
+        assert PropertyRegistryEntry(signed=True).decode(bytes([0xFF, 0xFF])) == -1
+
+    def test_property_entry_decode_string(self):
+        """Test that text properties are only returned to entries expecting text."""
+        assert PropertyRegistryEntry(byte_count=3).decode("AB") == "AB"
+        assert PropertyRegistryEntry().decode("AB") == "AB"
+        assert PropertyRegistryEntry(byte_count=2).decode("AB") is None
+        assert PropertyRegistryEntry(byte_count=3).decode(bytes([65, 0, 66])) == "AB"
+
+
 class TestPropertyWriteRequest:
     """Tests for PropertyWriteRequest conversion helpers."""
 
@@ -1062,6 +1112,13 @@ class TestDashboardUpdateResponse:
         response = DashboardUpdateResponse()
 
         assert response.status == 200
+        assert response.dashboard_state() == {}
+
+    def test_dashboard_update_response_state(self):
+        """Test reading the reported dashboard state from a response."""
+        response = DashboardUpdateResponse(status=0, fanSpeed=3, indoorTemperature=6552.0, timestamp="now")
+
+        assert response.dashboard_state() == {"status": 0, "fan_speed": 3, "indoor_temperature": -1.6}
 
 
 class TestThermalProfileUpdateResponse:
@@ -1,6 +1,6 @@
 """Tests for ComfoClime number entities."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -8,6 +8,7 @@ from custom_components.comfoclime.entities.number_definitions import (
     NumberDefinition,
     PropertyNumberDefinition,
 )
+from custom_components.comfoclime.infrastructure import DEBOUNCED
 from custom_components.comfoclime.models import (
     PropertyWriteRequest,
     SeasonData,
@@ -340,7 +341,9 @@ class TestComfoClimePropertyNumber:
         number._handle_coordinator_update()
 
         assert number.native_value == 75
-        mock_property_coordinator.get_property_value.assert_called_once_with("test-device-uuid", "29/1/20")
+        mock_property_coordinator.get_property_value.assert_called_once_with(
+            "test-device-uuid", "29/1/20", faktor=1.0, signed=False, byte_count=1
+        )
 
     @pytest.mark.asyncio
     async def test_property_number_async_set_value(
@@ -385,6 +388,48 @@ class TestComfoClimePropertyNumber:
                 faktor=1.0,
             )
         )
+        mock_property_coordinator.publish_written_value.assert_called_once_with(
+            mock_api.async_set_property_for_device.call_args.kwargs["request"]
+        )
+        mock_property_coordinator.async_read_back.assert_awaited_once_with("test-device-uuid", "29/1/20")
+        mock_property_coordinator.async_request_refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_property_number_superseded_write_skips_read_back(
+        self,
+        mock_hass,
+        mock_property_coordinator,
+        mock_api,
+        mock_device,
+        mock_config_entry,
+    ):
+        """Test that a value replaced by a later one while dragging is neither published nor read back."""
+        config = PropertyNumberDefinition(
+            property="29/1/20",
+            name="Fan Speed Setpoint",
+            translation_key="fan_speed_setpoint",
+            min=0,
+            max=100,
+            step=5,
+            unit="%",
+        )
+        mock_api.async_debounced_write = AsyncMock(return_value=DEBOUNCED)
+
+        number = ComfoClimePropertyNumber(
+            hass=mock_hass,
+            coordinator=mock_property_coordinator,
+            api=mock_api,
+            config=config,
+            device=mock_device,
+            entry=mock_config_entry,
+        )
+
+        await number.async_set_native_value(80)
+
+        assert mock_api.async_debounced_write.call_args[0][0] == "property:test-device-uuid:29/1/20"
+        mock_api.async_set_property_for_device.assert_not_called()
+        mock_property_coordinator.publish_written_value.assert_not_called()
+        mock_property_coordinator.async_read_back.assert_not_awaited()
 
     def test_property_number_device_info(
         self,
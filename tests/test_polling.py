@@ -0,0 +1,257 @@
+"""Tests for the device-wide polling scheduler."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.comfoclime.infrastructure import (
+    AdaptivePollPeriod,
+    PollingScheduler,
+    RequestPriority,
+    request_priority,
+)
+
+
+class TestAdaptivePollPeriod:
+    """Test the per-value poll period."""
+
+    @staticmethod
+    def _due_cycles(period, values):
+        """Return the cycles (from 1) in which the value was read."""
+        due = []
+        for cycle, value in enumerate(values, start=1):
+            if period.tick():
+                due.append(cycle)
+                period.observe(value)
+        return due
+
+    def test_stable_value_backs_off_to_ceiling(self):
+        """Test that the period doubles while the value is unchanged, up to the ceiling."""
+        period = AdaptivePollPeriod(ceiling=4)
+
+        assert self._due_cycles(period, [7] * 16) == [1, 2, 4, 8, 12, 16]
+
+    def test_change_resets_to_floor(self):
+        """Test that a changed value is read every cycle again."""
+        period = AdaptivePollPeriod(ceiling=8)
+        assert self._due_cycles(period, [7] * 4) == [1, 2, 4]
+
+        # Cycle 8 reads the change, cycle 9 reads it again
+        assert self._due_cycles(period, [8] * 5) == [4, 5]
+
+    def test_failed_read_stays_due(self):
+        """Test that a value without observe() (read failed) is due on the next cycle."""
+        period = AdaptivePollPeriod(ceiling=8)
+        assert period.tick()
+        assert period.tick()
+
+    def test_from_intervals(self):
+        """Test that intervals in seconds are converted to whole cycles."""
+        period = AdaptivePollPeriod.from_intervals(60, min_interval=90, max_interval=900)
+        assert (period.floor, period.ceiling) == (2, 15)
+
+        default = AdaptivePollPeriod.from_intervals(60)
+        assert (default.floor, default.ceiling) == (1, 1)
+
+    def test_tighten_adopts_shorter_limits(self):
+        """Test that a second registration can only shorten the period."""
+        period = AdaptivePollPeriod(floor=2, ceiling=16)
+        self._due_cycles(period, [7] * 8)
+
+        period.tighten(AdaptivePollPeriod(floor=1, ceiling=2))
+
+        assert (period.floor, period.ceiling, period.period) == (1, 2, 2)
+        assert self._due_cycles(period, [7] * 4) == [2, 4]
+
+    def test_static_value_is_read_once(self):
+        """Test that a static value is only due until it was read."""
+        period = AdaptivePollPeriod(static=True)
+        assert period.tick()
+        assert period.tick()
+
+        assert self._due_cycles(period, [7] * 5) == [1]
+
+    def test_reset_makes_value_due(self):
+        """Test that reset() rereads a backed-off or static value on the next cycle."""
+        stable = AdaptivePollPeriod(ceiling=8)
+        static = AdaptivePollPeriod(static=True)
+        self._due_cycles(stable, [7] * 4)
+        self._due_cycles(static, [7] * 4)
+
+        stable.reset()
+        static.reset()
+
+        assert stable.tick()
+        assert static.tick()
+        assert stable.period == 1
+
+    def test_tighten_with_non_static_registration(self):
+        """Test that a static value is polled again once a non-static entity uses it."""
+        period = AdaptivePollPeriod(ceiling=8, static=True)
+        self._due_cycles(period, [7])
+
+        period.tighten(AdaptivePollPeriod(ceiling=2))
+
+        assert not period.static
+        assert self._due_cycles(period, [7] * 4) == [1, 3]
+
+
+class TestPace:
+    """Test the shared request budget."""
+
+    def test_spacing_follows_budget(self):
+        """Test that the budget in requests/min sets the spacing between reads."""
+        assert PollingScheduler(request_budget=60).spacing == 1.0
+        assert PollingScheduler(request_budget=120).spacing == 0.5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_are_spread(self):
+        """Test that concurrent reads get consecutive slots one spacing apart."""
+        scheduler = PollingScheduler(request_budget=60)
+        delays = []
+
+        async def record_sleep(delay):
+            delays.append(delay)
+
+        with patch("custom_components.comfoclime.infrastructure.polling.asyncio.sleep", side_effect=record_sleep):
+            await asyncio.gather(*(scheduler.pace() for _ in range(4)))
+
+        # The first read goes immediately, the others wait 1, 2 and 3 slots
+        assert sorted(delays) == pytest.approx([1.0, 2.0, 3.0], abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_idle_budget_is_not_saved_up(self):
+        """Test that slots unused while idle do not allow a later burst."""
+        scheduler = PollingScheduler(request_budget=600)
+
+        await scheduler.pace()
+        await asyncio.sleep(0.3)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await scheduler.pace()
+        await scheduler.pace()
+
+        assert loop.time() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_user_reads_bypass_budget(self):
+        """Test that reads above POLL priority are not paced."""
+        scheduler = PollingScheduler(request_budget=1)
+        await scheduler.pace()
+
+        with request_priority(RequestPriority.USER_READ):
+            await asyncio.wait_for(scheduler.pace(), timeout=0.1)
+
+
+class TestRun:
+    """Test the shared polling timer."""
+
+    @staticmethod
+    async def _run_for(scheduler, seconds):
+        task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(seconds)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    @pytest.mark.asyncio
+    async def test_sources_refresh_at_their_intervals(self):
+        """Test that each source is refreshed at its own interval."""
+        scheduler = PollingScheduler()
+        calls = {"fast": 0, "slow": 0}
+
+        async def refresh(name):
+            calls[name] += 1
+
+        scheduler.add_source("fast", 0.05, lambda: refresh("fast"))
+        scheduler.add_source("slow", 0.2, lambda: refresh("slow"))
+
+        await self._run_for(scheduler, 0.43)
+
+        # fast first fires at 0.025s, slow at 0.2s
+        assert 7 <= calls["fast"] <= 9
+        assert calls["slow"] == 2
+
+    @pytest.mark.asyncio
+    async def test_first_refreshes_are_staggered(self):
+        """Test that sources with equal intervals do not fire together."""
+        scheduler = PollingScheduler()
+        loop = asyncio.get_running_loop()
+        fired = {}
+
+        def record(name):
+            async def refresh():
+                fired.setdefault(name, loop.time())
+
+            return refresh
+
+        for name in ("a", "b", "c"):
+            scheduler.add_source(name, 0.3, record(name))
+
+        start = loop.time()
+        await self._run_for(scheduler, 0.35)
+
+        offsets = [fired[name] - start for name in ("a", "b", "c")]
+        assert offsets == pytest.approx([0.1, 0.2, 0.3], abs=0.04)
+
+    @pytest.mark.asyncio
+    async def test_running_refresh_is_not_overlapped(self):
+        """Test that a source still refreshing skips its turn."""
+        scheduler = PollingScheduler()
+        started = 0
+
+        async def slow_refresh():
+            nonlocal started
+            started += 1
+            await asyncio.sleep(0.25)
+
+        scheduler.add_source("slow", 0.05, slow_refresh)
+
+        # Refreshes start at 0.05s and once the first ended (0.30s or 0.35s)
+        await self._run_for(scheduler, 0.4)
+
+        assert started == 2
+
+    @pytest.mark.asyncio
+    async def test_failing_refresh_does_not_stop_polling(self):
+        """Test that an exception in one refresh keeps the timer running."""
+        scheduler = PollingScheduler()
+        calls = 0
+
+        async def failing_refresh():
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("boom")
+
+        scheduler.add_source("failing", 0.05, failing_refresh)
+
+        await self._run_for(scheduler, 0.18)
+
+        assert calls >= 3
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_running_refreshes(self):
+        """Test that stopping the timer cancels refreshes in flight."""
+        scheduler = PollingScheduler()
+        cancelled = asyncio.Event()
+
+        async def long_refresh():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        scheduler.add_source("long", 0.05, long_refresh)
+
+        await self._run_for(scheduler, 0.1)
+        await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_run_without_sources_returns(self):
+        """Test that a scheduler without sources does not idle forever."""
+        await asyncio.wait_for(PollingScheduler().run(), timeout=0.1)
@@ -0,0 +1,180 @@
+"""Tests for the priority request scheduler."""
+
+import asyncio
+
+import pytest
+
+from custom_components.comfoclime.infrastructure import (
+    RequestPriority,
+    RequestScheduler,
+    current_request_priority,
+    request_priority,
+)
+
+
+async def _queue(scheduler, priority, order, label):
+    """Acquire a slot, record the grant order and release."""
+    async with scheduler.slot(priority):
+        order.append(label)
+
+
+class TestRequestPriorityContext:
+    """Test the request_priority context variable."""
+
+    def test_default_is_poll(self):
+        """Test that reads default to background polling."""
+        assert current_request_priority() == RequestPriority.POLL
+
+    def test_context_sets_and_restores(self):
+        """Test that the context manager sets and restores the priority."""
+        with request_priority(RequestPriority.USER_READ):
+            assert current_request_priority() == RequestPriority.USER_READ
+        assert current_request_priority() == RequestPriority.POLL
+
+    @pytest.mark.asyncio
+    async def test_context_inherited_by_tasks(self):
+        """Test that tasks created inside the context inherit the priority."""
+
+        async def read_priority():
+            return current_request_priority()
+
+        with request_priority(RequestPriority.USER_READ):
+            task = asyncio.create_task(read_priority())
+
+        assert await task == RequestPriority.USER_READ
+
+
+class TestRequestScheduler:
+    """Test RequestScheduler ordering."""
+
+    @pytest.mark.asyncio
+    async def test_free_slot_is_granted_immediately(self):
+        """Test that an idle scheduler grants the slot without queuing."""
+        scheduler = RequestScheduler()
+
+        async with scheduler.slot(RequestPriority.POLL):
+            assert scheduler.locked()
+            assert scheduler.pending() == 0
+
+        assert not scheduler.locked()
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        """Test that writes beat user reads, which beat polling."""
+        scheduler = RequestScheduler()
+        order = []
+
+        await scheduler.acquire(RequestPriority.POLL)
+        tasks = [
+            asyncio.create_task(_queue(scheduler, RequestPriority.POLL, order, "poll")),
+            asyncio.create_task(_queue(scheduler, RequestPriority.USER_READ, order, "read")),
+            asyncio.create_task(_queue(scheduler, RequestPriority.WRITE, order, "write")),
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.has_pending_writes()
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["write", "read", "poll"]
+
+    @pytest.mark.asyncio
+    async def test_fifo_within_class(self):
+        """Test FIFO order inside one priority class."""
+        scheduler = RequestScheduler()
+        order = []
+
+        await scheduler.acquire(RequestPriority.WRITE)
+        tasks = [asyncio.create_task(_queue(scheduler, RequestPriority.POLL, order, i)) for i in range(5)]
+        await asyncio.sleep(0)
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_new_request_does_not_overtake_queue(self):
+        """Test that a request arriving while others are queued has to queue too."""
+        scheduler = RequestScheduler()
+        order = []
+
+        await scheduler.acquire(RequestPriority.POLL)
+        write = asyncio.create_task(_queue(scheduler, RequestPriority.WRITE, order, "write"))
+        await asyncio.sleep(0)
+        scheduler.release()
+        # The slot was handed to the queued write, so this poll must wait
+        await _queue(scheduler, RequestPriority.POLL, order, "poll")
+        await write
+
+        assert order == ["write", "poll"]
+
+    @pytest.mark.asyncio
+    async def test_starvation_protection(self):
+        """Test that a long-waiting poll is served before newer writes."""
+        scheduler = RequestScheduler(starvation_timeout=0.05)
+        order = []
+
+        await scheduler.acquire(RequestPriority.WRITE)
+        poll = asyncio.create_task(_queue(scheduler, RequestPriority.POLL, order, "poll"))
+        await asyncio.sleep(0.06)
+        write = asyncio.create_task(_queue(scheduler, RequestPriority.WRITE, order, "write"))
+        await asyncio.sleep(0)
+        scheduler.release()
+        await asyncio.gather(poll, write)
+
+        assert order == ["poll", "write"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_skipped(self):
+        """Test that a cancelled waiter does not block the queue."""
+        scheduler = RequestScheduler()
+        order = []
+
+        await scheduler.acquire(RequestPriority.POLL)
+        cancelled = asyncio.create_task(_queue(scheduler, RequestPriority.WRITE, order, "cancelled"))
+        waiting = asyncio.create_task(_queue(scheduler, RequestPriority.POLL, order, "poll"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        scheduler.release()
+        await waiting
+
+        assert order == ["poll"]
+        assert not scheduler.locked()
+
+    @pytest.mark.asyncio
+    async def test_waiter_cancelled_while_slot_is_released(self):
+        """Test that a waiter cancelled in the tick the slot is released does not leave it busy."""
+        scheduler = RequestScheduler()
+        order = []
+
+        await scheduler.acquire(RequestPriority.POLL)
+        cancelled = asyncio.create_task(_queue(scheduler, RequestPriority.WRITE, order, "cancelled"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        scheduler.release()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        assert order == []
+        assert not scheduler.locked()
+        assert scheduler.pending() == 0
+        await asyncio.wait_for(_queue(scheduler, RequestPriority.POLL, order, "poll"), timeout=1)
+        assert order == ["poll"]
+
+    @pytest.mark.asyncio
+    async def test_write_not_queued_behind_polling_cycle(self):
+        """Test that a write waits for at most one in-flight poll, not the whole cycle."""
+        scheduler = RequestScheduler()
+        order = []
+
+        async def poll(i):
+            async with scheduler.slot(RequestPriority.POLL):
+                await asyncio.sleep(0.01)
+                order.append(f"poll{i}")
+
+        polls = [asyncio.create_task(poll(i)) for i in range(10)]
+        await asyncio.sleep(0.005)
+        await _queue(scheduler, RequestPriority.WRITE, order, "write")
+        await asyncio.gather(*polls)
+
+        assert order.index("write") == 1
@@ -299,7 +299,9 @@ class TestComfoClimePropertySelect:
         select._handle_coordinator_update()
 
         assert select.current_option == "manual"
-        mock_property_coordinator.get_property_value.assert_called_once_with("test-device-uuid", "29/1/15")
+        mock_property_coordinator.get_property_value.assert_called_once_with(
+            "test-device-uuid", "29/1/15", faktor=1.0, signed=False, byte_count=1
+        )
 
     @pytest.mark.asyncio
     async def test_property_select_option(
@@ -341,6 +343,11 @@ class TestComfoClimePropertySelect:
                 faktor=1.0,
             )
         )
+        mock_property_coordinator.publish_written_value.assert_called_once_with(
+            mock_api.async_set_property_for_device.call_args.kwargs["request"]
+        )
+        mock_property_coordinator.async_read_back.assert_awaited_once_with("test-device-uuid", "29/1/15")
+        mock_property_coordinator.async_request_refresh.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -9,6 +9,7 @@ from custom_components.comfoclime.models import DashboardData, DeviceDefinitionD
 from custom_components.comfoclime.sensor import (
     ComfoClimeDefinitionSensor,
     ComfoClimePropertySensor,
+    ComfoClimeRateControlSensor,
     ComfoClimeSensor,
     ComfoClimeTelemetrySensor,
     async_setup_entry,
@@ -40,6 +41,8 @@ class TestComfoClimeSensor:
         assert sensor._attr_device_class == "temperature"
         assert sensor._attr_state_class == "measurement"
         assert sensor._attr_unique_id == "test_entry_id_dashboard_indoorTemperature"
+        # Notified only when the indoor temperature changed
+        assert sensor.coordinator_context == "indoorTemperature"
 
     def test_sensor_state_update(self, mock_hass, mock_coordinator, mock_api, mock_device, mock_config_entry):
         """Test sensor state update from coordinator."""
@@ -229,6 +232,8 @@ class TestComfoClimeTelemetrySensor:
         assert sensor._signed is True
         assert sensor._byte_count == 2
         assert sensor._attr_unique_id == "test_entry_id_telemetry_123"
+        # Notified only when telemetry 123 of its device was read
+        assert sensor.coordinator_context == ("test-device-uuid", "123")
 
     def test_telemetry_sensor_update(self, mock_hass, mock_telemetry_coordinator, mock_device, mock_config_entry):
         """Test telemetry sensor update from coordinator."""
@@ -254,7 +259,9 @@ class TestComfoClimeTelemetrySensor:
         sensor._handle_coordinator_update()
 
         assert sensor._state == 25.5
-        mock_telemetry_coordinator.get_telemetry_value.assert_called_once_with("test-device-uuid", "123")
+        mock_telemetry_coordinator.get_telemetry_value.assert_called_once_with(
+            "test-device-uuid", "123", faktor=1.0, signed=True, byte_count=None
+        )
 
     def test_telemetry_sensor_update_with_override_uuid(
         self, mock_hass, mock_telemetry_coordinator, mock_device, mock_config_entry
@@ -283,7 +290,9 @@ class TestComfoClimeTelemetrySensor:
         sensor._handle_coordinator_update()
 
         # Should use override_uuid
-        mock_telemetry_coordinator.get_telemetry_value.assert_called_once_with(override_uuid, "456")
+        mock_telemetry_coordinator.get_telemetry_value.assert_called_once_with(
+            override_uuid, "456", faktor=1.0, signed=True, byte_count=None
+        )
 
     def test_telemetry_sensor_negative_temperature(
         self, mock_hass, mock_telemetry_coordinator, mock_device, mock_config_entry
@@ -322,7 +331,9 @@ class TestComfoClimeTelemetrySensor:
 
         # Verify negative temperature is correctly read
         assert sensor._state == -5.5
-        mock_telemetry_coordinator.get_telemetry_value.assert_called_once_with("test-device-uuid", "4145")
+        mock_telemetry_coordinator.get_telemetry_value.assert_called_once_with(
+            "test-device-uuid", "4145", faktor=0.1, signed=True, byte_count=2
+        )
 
     def test_telemetry_sensor_extra_state_attributes(
         self, mock_hass, mock_telemetry_coordinator, mock_device, mock_config_entry
@@ -399,7 +410,9 @@ class TestComfoClimePropertySensor:
         sensor._handle_coordinator_update()
 
         assert sensor._state == 230
-        mock_property_coordinator.get_property_value.assert_called_once_with("test-device-uuid", "29/1/10")
+        mock_property_coordinator.get_property_value.assert_called_once_with(
+            "test-device-uuid", "29/1/10", faktor=1.0, signed=True, byte_count=None
+        )
 
     def test_property_sensor_update_with_mapping(
         self, mock_hass, mock_property_coordinator, mock_device, mock_config_entry
@@ -691,3 +704,50 @@ class TestComfoClimeDefinitionSensor:
         attrs = sensor.extra_state_attributes
         assert attrs["data_source"] == "definition"
         assert attrs["last_update"] == "2024-01-15T10:30:00+00:00"
+
+
+class TestComfoClimeRateControlSensor:
+    """Test ComfoClimeRateControlSensor class."""
+
+    @pytest.mark.asyncio
+    async def test_rate_control_sensor_reads_learned_interval(self, mock_device, mock_config_entry):
+        """Test that the sensor reports the API's learned request interval."""
+        api = MagicMock()
+        api.rate_control_state.return_value = {"request_interval": 1.25, "error_rate": 0.1}
+
+        sensor = ComfoClimeRateControlSensor(
+            api=api,
+            metric="request_interval",
+            name="Adaptive Request Interval",
+            translation_key="adaptive_request_interval",
+            unit="s",
+            device_class="duration",
+            state_class="measurement",
+            entity_category="diagnostic",
+            device=mock_device,
+            entry=mock_config_entry,
+        )
+        await sensor.async_update()
+
+        assert sensor.native_value == 1.25
+        assert sensor.unique_id == "test_entry_id_rate_control_request_interval"
+        assert sensor.should_poll is True
+
+    @pytest.mark.asyncio
+    async def test_rate_control_sensor_reports_error_rate_in_percent(self, mock_device, mock_config_entry):
+        """Test that the error rate fraction is exposed as a percentage."""
+        api = MagicMock()
+        api.rate_control_state.return_value = {"error_rate": 0.25}
+
+        sensor = ComfoClimeRateControlSensor(
+            api=api,
+            metric="error_rate",
+            name="API Error Rate",
+            translation_key="api_error_rate",
+            unit="%",
+            device=mock_device,
+            entry=mock_config_entry,
+        )
+        await sensor.async_update()
+
+        assert sensor.native_value == pytest.approx(25.0)
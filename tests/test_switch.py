@@ -203,7 +203,7 @@ class TestComfoClimeSwitch:
         )
 
         switch.hass = mock_hass
-        mock_thermalprofile_coordinator.async_request_refresh = AsyncMock()
+        mock_thermalprofile_coordinator.async_refresh = AsyncMock()
         mock_api.async_update_thermal_profile = AsyncMock()
 
         await switch.async_turn_on()
@@ -237,7 +237,7 @@ class TestComfoClimeSwitch:
         )
 
         switch.hass = mock_hass
-        mock_thermalprofile_coordinator.async_request_refresh = AsyncMock()
+        mock_thermalprofile_coordinator.async_refresh = AsyncMock()
         mock_api.async_update_thermal_profile = AsyncMock()
 
         await switch.async_turn_off()
@@ -266,7 +266,7 @@ class TestComfoClimeSwitch:
         )
 
         switch.hass = mock_hass
-        mock_coordinator.async_request_refresh = AsyncMock()
+        mock_coordinator.async_refresh = AsyncMock()
         mock_api.async_update_dashboard = AsyncMock()
 
         await switch.async_turn_on()
@@ -295,7 +295,7 @@ class TestComfoClimeSwitch:
         )
 
         switch.hass = mock_hass
-        mock_coordinator.async_request_refresh = AsyncMock()
+        mock_coordinator.async_refresh = AsyncMock()
         mock_api.async_update_dashboard = AsyncMock()
 
         await switch.async_turn_off()
@@ -165,6 +165,60 @@ class TestDashboardUpdateRetry:
         assert mock_session.put.call_count == 1
 
 
+class TestWriteDeadline:
+    """Test jittered backoff and the per-write deadline."""
+
+    def test_retry_backoff_is_jittered_and_bounded(self):
+        """Test that backoff stays within [delay/2, delay] and respects the cap."""
+        from custom_components.comfoclime.infrastructure.api import DEFAULT_RETRY_BACKOFF_MAX, retry_backoff
+
+        for attempt in range(6):
+            delay = min(DEFAULT_RETRY_BACKOFF_MAX, 2 ** (attempt + 1))
+            for _ in range(20):
+                assert delay / 2 <= retry_backoff(attempt) <= delay
+
+    @pytest.mark.asyncio
+    async def test_deadline_stops_retries(self):
+        """Test that no retry is attempted when the backoff would exceed the deadline."""
+        api = ComfoClimeAPI("http://192.168.1.100", write_deadline=0.5)
+        api.uuid = "test-uuid"
+        api.hass = MagicMock()
+        api.hass.config.time_zone = "Europe/Berlin"
+
+        timeout_response = AsyncMock()
+        timeout_response.__aenter__ = AsyncMock(side_effect=TimeoutError())
+
+        mock_session = AsyncMock()
+        mock_session.put = MagicMock(return_value=timeout_response)
+
+        with patch.object(api, "_get_session", AsyncMock(return_value=mock_session)):
+            with pytest.raises(asyncio.TimeoutError):
+                await api.async_update_dashboard(DashboardUpdate(fan_speed=1))
+
+        # Minimum backoff (1s) is longer than the deadline, so only one attempt is made
+        assert mock_session.put.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_attempt_timeout_capped_by_deadline(self):
+        """Test that a single attempt never gets more time than the write deadline."""
+        api = ComfoClimeAPI("http://192.168.1.100", write_timeout=30, write_deadline=5)
+        api.uuid = "test-uuid"
+        api.hass = MagicMock()
+        api.hass.config.time_zone = "Europe/Berlin"
+
+        mock_response = AsyncMock()
+        mock_response.json = AsyncMock(return_value={"status": "ok"})
+        mock_response.raise_for_status = MagicMock()
+
+        mock_session = AsyncMock()
+        mock_session.put = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response)))
+
+        with patch.object(api, "_get_session", AsyncMock(return_value=mock_session)):
+            await api.async_update_dashboard(DashboardUpdate(fan_speed=1))
+
+        assert mock_session.put.call_args.kwargs["timeout"].total <= 5
+
+
 class TestThermalProfileUpdateRetry:
     """Test retry logic for thermal profile updates."""
 
@@ -292,26 +346,28 @@ class TestCancelledErrorPropagation:
             await task
 
     @pytest.mark.asyncio
-    async def test_yield_to_writes_propagates_cancelled_error(self):
-        """Test that CancelledError from asyncio.sleep in yield_to_writes is propagated."""
-        from custom_components.comfoclime.infrastructure import RateLimiterCache
+    async def test_scheduler_wait_propagates_cancelled_error(self):
+        """Test that CancelledError while queued in the scheduler is propagated."""
+        from custom_components.comfoclime.infrastructure import RequestPriority, RequestScheduler
 
-        rate_limiter = RateLimiterCache()
+        scheduler = RequestScheduler()
 
-        # Signal a pending write to force yield_to_writes to sleep
-        rate_limiter.signal_write_pending()
+        # Occupy the slot so the next request has to queue
+        await scheduler.acquire(RequestPriority.WRITE)
 
-        async def test_yield():
-            await rate_limiter.yield_to_writes()
+        async def test_queue():
+            async with scheduler.slot(RequestPriority.POLL):
+                pass
 
-        # Create a task and cancel it while it's sleeping
-        task = asyncio.create_task(test_yield())
-        await asyncio.sleep(0.05)  # Give it time to start sleeping
+        # Create a task and cancel it while it's queued
+        task = asyncio.create_task(test_queue())
+        await asyncio.sleep(0.05)  # Give it time to queue
         task.cancel()
 
-        # The task should raise CancelledError
+        # The task should raise CancelledError and leave the queue
         with pytest.raises(asyncio.CancelledError):
             await task
+        assert scheduler.pending() == 0
 
     @pytest.mark.asyncio
     async def test_api_get_propagates_cancelled_error_from_rate_limiter(self):